@@ -25,6 +25,7 @@ export const listTable = query({
       v.literal("contexts"),
       v.literal("conversations"),
       v.literal("factHistory"),
+      v.literal("factHistoryRollups"),
       v.literal("facts"),
       v.literal("governanceEnforcement"),
       v.literal("governancePolicies"),
@@ -60,6 +61,7 @@ export const deleteRecord = mutation({
       v.literal("contexts"),
       v.literal("conversations"),
       v.literal("factHistory"),
+      v.literal("factHistoryRollups"),
       v.literal("facts"),
       v.literal("governanceEnforcement"),
       v.literal("governancePolicies"),
@@ -76,6 +78,7 @@ export const deleteRecord = mutation({
       v.id("contexts"),
       v.id("conversations"),
       v.id("factHistory"),
+      v.id("factHistoryRollups"),
       v.id("facts"),
       v.id("governanceEnforcement"),
       v.id("governancePolicies"),
@@ -106,6 +109,7 @@ export const clearTable = mutation({
       v.literal("contexts"),
       v.literal("conversations"),
       v.literal("factHistory"),
+      v.literal("factHistoryRollups"),
       v.literal("facts"),
       v.literal("governanceEnforcement"),
       v.literal("governancePolicies"),
@@ -154,6 +158,7 @@ export const countTable = query({
       v.literal("contexts"),
       v.literal("conversations"),
       v.literal("factHistory"),
+      v.literal("factHistoryRollups"),
       v.literal("facts"),
       v.literal("governanceEnforcement"),
       v.literal("governancePolicies"),
@@ -185,6 +190,7 @@ export const getAllCounts = query({
       "contexts",
       "conversations",
       "factHistory",
+      "factHistoryRollups",
       "facts",
       "governanceEnforcement",
       "governancePolicies",
@@ -5,8 +5,10 @@
  * Multi-agent task delegation with shared context
  */
 
-import { ConvexError, v } from "convex/values";
-import { mutation, query } from "./_generated/server";
+import { paginationOptsValidator } from "convex/server";
+import { ConvexError, ObjectType, v } from "convex/values";
+import { Doc } from "./_generated/dataModel";
+import { mutation, query, QueryCtx } from "./_generated/server";
 
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 // Backward Compatibility Helpers
@@ -630,103 +632,145 @@ async function buildContextChain(ctx: any, context: any) {
   };
 }
 
+/**
+ * Filters shared by list and listPage
+ */
+const listFilterArgs = {
+  memorySpaceId: v.optional(v.string()),
+  tenantId: v.optional(v.string()), // Multi-tenancy: scope to tenant
+  userId: v.optional(v.string()),
+  status: v.optional(
+    v.union(
+      v.literal("active"),
+      v.literal("completed"),
+      v.literal("cancelled"),
+      v.literal("blocked"),
+    ),
+  ),
+  parentId: v.optional(v.string()),
+  rootId: v.optional(v.string()),
+  depth: v.optional(v.number()),
+};
+
+type ListFilterArgs = ObjectType<typeof listFilterArgs>;
+
+/**
+ * Use best index based on available filters
+ */
+function listIndexQuery(ctx: QueryCtx, args: ListFilterArgs) {
+  if (args.tenantId && args.memorySpaceId) {
+    // Tenant + space - use composite index
+    return ctx.db
+      .query("contexts")
+      .withIndex("by_tenant_space", (q) =>
+        q
+          .eq("tenantId", args.tenantId!)
+          .eq("memorySpaceId", args.memorySpaceId!),
+      );
+  }
+  if (args.tenantId) {
+    // Tenant only
+    return ctx.db
+      .query("contexts")
+      .withIndex("by_tenantId", (q) => q.eq("tenantId", args.tenantId!));
+  }
+  if (args.memorySpaceId && args.status) {
+    return ctx.db
+      .query("contexts")
+      .withIndex("by_memorySpace_status", (q) =>
+        q.eq("memorySpaceId", args.memorySpaceId!).eq("status", args.status!),
+      );
+  }
+  if (args.memorySpaceId) {
+    return ctx.db
+      .query("contexts")
+      .withIndex("by_memorySpace", (q) =>
+        q.eq("memorySpaceId", args.memorySpaceId!),
+      );
+  }
+  if (args.status) {
+    return ctx.db
+      .query("contexts")
+      .withIndex("by_status", (q) => q.eq("status", args.status!));
+  }
+  if (args.parentId) {
+    return ctx.db
+      .query("contexts")
+      .withIndex("by_parentId", (q) => q.eq("parentId", args.parentId!));
+  }
+  if (args.rootId) {
+    return ctx.db
+      .query("contexts")
+      .withIndex("by_rootId", (q) => q.eq("rootId", args.rootId!));
+  }
+  return ctx.db.query("contexts").order("desc");
+}
+
+/**
+ * Post-filters the chosen index does not cover
+ */
+function applyListFilters(
+  contexts: Doc<"contexts">[],
+  args: ListFilterArgs,
+): Doc<"contexts">[] {
+  // SECURITY: For non-tenant queries, filter out tenant-owned records
+  if (!args.tenantId) {
+    contexts = contexts.filter((c) => !c.tenantId);
+  }
+
+  // Apply remaining filters
+  if (args.userId) {
+    contexts = contexts.filter((c) => c.userId === args.userId);
+  }
+
+  if (args.depth !== undefined) {
+    contexts = contexts.filter((c) => c.depth === args.depth);
+  }
+
+  // Apply status filter if not already indexed
+  if (args.status && !(args.memorySpaceId && args.status)) {
+    contexts = contexts.filter((c) => c.status === args.status);
+  }
+
+  return contexts;
+}
+
 /**
  * List contexts with filters
  */
 export const list = query({
   args: {
-    memorySpaceId: v.optional(v.string()),
-    tenantId: v.optional(v.string()), // Multi-tenancy: scope to tenant
-    userId: v.optional(v.string()),
-    status: v.optional(
-      v.union(
-        v.literal("active"),
-        v.literal("completed"),
-        v.literal("cancelled"),
-        v.literal("blocked"),
-      ),
-    ),
-    parentId: v.optional(v.string()),
-    rootId: v.optional(v.string()),
-    depth: v.optional(v.number()),
+    ...listFilterArgs,
     limit: v.optional(v.number()),
   },
   handler: async (ctx, args) => {
-    let contexts;
-
-    // Use best index based on available filters
-    if (args.tenantId && args.memorySpaceId) {
-      // Tenant + space - use composite index
-      contexts = await ctx.db
-        .query("contexts")
-        .withIndex("by_tenant_space", (q) =>
-          q
-            .eq("tenantId", args.tenantId!)
-            .eq("memorySpaceId", args.memorySpaceId!),
-        )
-        .take(args.limit || 100);
-    } else if (args.tenantId) {
-      // Tenant only
-      contexts = await ctx.db
-        .query("contexts")
-        .withIndex("by_tenantId", (q) => q.eq("tenantId", args.tenantId!))
-        .take(args.limit || 100);
-    } else if (args.memorySpaceId && args.status) {
-      contexts = await ctx.db
-        .query("contexts")
-        .withIndex("by_memorySpace_status", (q) =>
-          q.eq("memorySpaceId", args.memorySpaceId!).eq("status", args.status!),
-        )
-        .take(args.limit || 100);
-    } else if (args.memorySpaceId) {
-      contexts = await ctx.db
-        .query("contexts")
-        .withIndex("by_memorySpace", (q) =>
-          q.eq("memorySpaceId", args.memorySpaceId!),
-        )
-        .take(args.limit || 100);
-    } else if (args.status) {
-      contexts = await ctx.db
-        .query("contexts")
-        .withIndex("by_status", (q) => q.eq("status", args.status!))
-        .take(args.limit || 100);
-    } else if (args.parentId) {
-      contexts = await ctx.db
-        .query("contexts")
-        .withIndex("by_parentId", (q) => q.eq("parentId", args.parentId!))
-        .take(args.limit || 100);
-    } else if (args.rootId) {
-      contexts = await ctx.db
-        .query("contexts")
-        .withIndex("by_rootId", (q) => q.eq("rootId", args.rootId!))
-        .take(args.limit || 100);
-    } else {
-      contexts = await ctx.db
-        .query("contexts")
-        .order("desc")
-        .take(args.limit || 100);
-    }
-
-    // SECURITY: For non-tenant queries, filter out tenant-owned records
-    if (!args.tenantId) {
-      contexts = contexts.filter((c) => !c.tenantId);
-    }
+    const contexts = await listIndexQuery(ctx, args).take(args.limit || 100);
 
-    // Apply remaining filters
-    if (args.userId) {
-      contexts = contexts.filter((c) => c.userId === args.userId);
-    }
-
-    if (args.depth !== undefined) {
-      contexts = contexts.filter((c) => c.depth === args.depth);
-    }
+    return applyListFilters(contexts, args);
+  },
+});
 
-    // Apply status filter if not already indexed
-    if (args.status && !(args.memorySpaceId && args.status)) {
-      contexts = contexts.filter((c) => c.status === args.status);
-    }
+/**
+ * List contexts one page at a time (cursor pagination)
+ *
+ * Takes the same filters as list, applied per page (pages may be shorter
+ * than numItems), so bulk consumers can walk every matching context.
+ */
+export const listPage = query({
+  args: {
+    ...listFilterArgs,
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const result = await listIndexQuery(ctx, args).paginate(
+      args.paginationOpts,
+    );
 
-    return contexts;
+    return {
+      page: applyListFilters(result.page, args),
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
   },
 });
 
@@ -6,8 +6,10 @@
  * Two types: user-agent, agent-agent (Collaboration Mode)
  */
 
-import { ConvexError, v } from "convex/values";
-import { mutation, query } from "./_generated/server";
+import { paginationOptsValidator } from "convex/server";
+import { ConvexError, ObjectType, v } from "convex/values";
+import { Doc } from "./_generated/dataModel";
+import { mutation, query, QueryCtx } from "./_generated/server";
 
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 // Mutations (Write Operations)
@@ -581,26 +583,164 @@ export const get = query({
   },
 });
 
+/**
+ * Filters shared by list and listPage (everything but paging and sorting)
+ */
+const listFilterArgs = {
+  type: v.optional(v.union(v.literal("user-agent"), v.literal("agent-agent"))),
+  userId: v.optional(v.string()),
+  memorySpaceId: v.optional(v.string()), // Filter by memory space
+  tenantId: v.optional(v.string()), // Multi-tenancy: filter by tenant
+  participantId: v.optional(v.string()), // Hive Mode tracking
+  createdBefore: v.optional(v.number()),
+  createdAfter: v.optional(v.number()),
+  updatedBefore: v.optional(v.number()),
+  updatedAfter: v.optional(v.number()),
+  lastMessageBefore: v.optional(v.number()),
+  lastMessageAfter: v.optional(v.number()),
+  messageCountMin: v.optional(v.number()),
+  messageCountMax: v.optional(v.number()),
+};
+
+type ListFilterArgs = ObjectType<typeof listFilterArgs>;
+
+/**
+ * Pick the most selective index for a conversation listing
+ */
+function listIndexQuery(ctx: QueryCtx, args: ListFilterArgs) {
+  // Prioritize tenant + space (best for multi-tenancy)
+  if (args.tenantId && args.memorySpaceId) {
+    return ctx.db
+      .query("conversations")
+      .withIndex("by_tenant_space", (q) =>
+        q
+          .eq("tenantId", args.tenantId!)
+          .eq("memorySpaceId", args.memorySpaceId!),
+      );
+  }
+  if (args.tenantId) {
+    // Tenant only - get all tenant's conversations
+    return ctx.db
+      .query("conversations")
+      .withIndex("by_tenantId", (q) => q.eq("tenantId", args.tenantId!));
+  }
+  if (args.memorySpaceId && args.userId) {
+    // memorySpace + user (common query pattern)
+    return ctx.db
+      .query("conversations")
+      .withIndex("by_memorySpace_user", (q) =>
+        q
+          .eq("memorySpaceId", args.memorySpaceId!)
+          .eq("participants.userId", args.userId),
+      );
+  }
+  if (args.memorySpaceId) {
+    // Memory space only (Hive Mode: all conversations in space)
+    return ctx.db
+      .query("conversations")
+      .withIndex("by_memorySpace", (q) =>
+        q.eq("memorySpaceId", args.memorySpaceId!),
+      );
+  }
+  if (args.userId) {
+    return ctx.db
+      .query("conversations")
+      .withIndex("by_user", (q) => q.eq("participants.userId", args.userId));
+  }
+  if (args.type) {
+    return ctx.db
+      .query("conversations")
+      .withIndex("by_type", (q) => q.eq("type", args.type!));
+  }
+  return ctx.db.query("conversations");
+}
+
+/**
+ * Post-filters the chosen index does not cover
+ */
+function applyListFilters(
+  conversations: Doc<"conversations">[],
+  args: ListFilterArgs,
+): Doc<"conversations">[] {
+  // Post-filter by userId when tenant indexes are used (security-critical!)
+  // The by_tenant_space and by_tenantId indexes don't include userId,
+  // so we must filter to prevent cross-user data leakage within a tenant.
+  if (args.userId && args.tenantId) {
+    conversations = conversations.filter(
+      (c) => c.participants.userId === args.userId,
+    );
+  }
+
+  // Post-filter by type if needed (when using other indexes)
+  // The by_type index is only used when tenantId, memorySpaceId, and userId are all absent.
+  // If any of those are provided, a different index is used and type must be post-filtered.
+  if (args.type && (args.tenantId || args.memorySpaceId || args.userId)) {
+    conversations = conversations.filter((c) => c.type === args.type);
+  }
+
+  if (args.participantId) {
+    conversations = conversations.filter(
+      (c) => c.participantId === args.participantId,
+    );
+  }
+  if (args.createdBefore !== undefined) {
+    conversations = conversations.filter(
+      (c) => c.createdAt < args.createdBefore!,
+    );
+  }
+  if (args.createdAfter !== undefined) {
+    conversations = conversations.filter(
+      (c) => c.createdAt > args.createdAfter!,
+    );
+  }
+  if (args.updatedBefore !== undefined) {
+    conversations = conversations.filter(
+      (c) => c.updatedAt < args.updatedBefore!,
+    );
+  }
+  if (args.updatedAfter !== undefined) {
+    conversations = conversations.filter(
+      (c) => c.updatedAt > args.updatedAfter!,
+    );
+  }
+  if (args.lastMessageBefore !== undefined) {
+    conversations = conversations.filter((c) => {
+      const lastMsgTime =
+        c.messages.length > 0
+          ? c.messages[c.messages.length - 1].timestamp
+          : c.createdAt;
+      return lastMsgTime < args.lastMessageBefore!;
+    });
+  }
+  if (args.lastMessageAfter !== undefined) {
+    conversations = conversations.filter((c) => {
+      const lastMsgTime =
+        c.messages.length > 0
+          ? c.messages[c.messages.length - 1].timestamp
+          : c.createdAt;
+      return lastMsgTime > args.lastMessageAfter!;
+    });
+  }
+  if (args.messageCountMin !== undefined) {
+    conversations = conversations.filter(
+      (c) => c.messageCount >= args.messageCountMin!,
+    );
+  }
+  if (args.messageCountMax !== undefined) {
+    conversations = conversations.filter(
+      (c) => c.messageCount <= args.messageCountMax!,
+    );
+  }
+
+  return conversations;
+}
+
 /**
  * List conversations with filters and pagination metadata
  */
 export const list = query({
   args: {
-    type: v.optional(
-      v.union(v.literal("user-agent"), v.literal("agent-agent")),
-    ),
-    userId: v.optional(v.string()),
-    memorySpaceId: v.optional(v.string()), // Filter by memory space
-    tenantId: v.optional(v.string()), // Multi-tenancy: filter by tenant
-    participantId: v.optional(v.string()), // Hive Mode tracking
-    createdBefore: v.optional(v.number()),
-    createdAfter: v.optional(v.number()),
-    updatedBefore: v.optional(v.number()),
-    updatedAfter: v.optional(v.number()),
-    lastMessageBefore: v.optional(v.number()),
-    lastMessageAfter: v.optional(v.number()),
-    messageCountMin: v.optional(v.number()),
-    messageCountMax: v.optional(v.number()),
+    ...listFilterArgs,
     limit: v.optional(v.number()),
     offset: v.optional(v.number()),
     sortBy: v.optional(
@@ -619,126 +759,10 @@ export const list = query({
     const offset = args.offset || 0;
 
     // Apply filters using indexes
-    let conversations;
-
-    // Prioritize tenant + space (best for multi-tenancy)
-    if (args.tenantId && args.memorySpaceId) {
-      conversations = await ctx.db
-        .query("conversations")
-        .withIndex("by_tenant_space", (q) =>
-          q
-            .eq("tenantId", args.tenantId!)
-            .eq("memorySpaceId", args.memorySpaceId!),
-        )
-        .collect();
-    } else if (args.tenantId) {
-      // Tenant only - get all tenant's conversations
-      conversations = await ctx.db
-        .query("conversations")
-        .withIndex("by_tenantId", (q) => q.eq("tenantId", args.tenantId!))
-        .collect();
-    } else if (args.memorySpaceId && args.userId) {
-      // memorySpace + user (common query pattern)
-      conversations = await ctx.db
-        .query("conversations")
-        .withIndex("by_memorySpace_user", (q) =>
-          q
-            .eq("memorySpaceId", args.memorySpaceId!)
-            .eq("participants.userId", args.userId),
-        )
-        .collect();
-    } else if (args.memorySpaceId) {
-      // Memory space only (Hive Mode: all conversations in space)
-      conversations = await ctx.db
-        .query("conversations")
-        .withIndex("by_memorySpace", (q) =>
-          q.eq("memorySpaceId", args.memorySpaceId!),
-        )
-        .collect();
-    } else if (args.userId) {
-      conversations = await ctx.db
-        .query("conversations")
-        .withIndex("by_user", (q) => q.eq("participants.userId", args.userId))
-        .collect();
-    } else if (args.type) {
-      conversations = await ctx.db
-        .query("conversations")
-        .withIndex("by_type", (q) => q.eq("type", args.type!))
-        .collect();
-    } else {
-      conversations = await ctx.db.query("conversations").collect();
-    }
-
-    // Post-filter by userId when tenant indexes are used (security-critical!)
-    // The by_tenant_space and by_tenantId indexes don't include userId,
-    // so we must filter to prevent cross-user data leakage within a tenant.
-    if (args.userId && args.tenantId) {
-      conversations = conversations.filter(
-        (c) => c.participants.userId === args.userId,
-      );
-    }
-
-    // Post-filter by type if needed (when using other indexes)
-    // The by_type index is only used when tenantId, memorySpaceId, and userId are all absent.
-    // If any of those are provided, a different index is used and type must be post-filtered.
-    if (args.type && (args.tenantId || args.memorySpaceId || args.userId)) {
-      conversations = conversations.filter((c) => c.type === args.type);
-    }
-
-    // Apply additional filters
-    if (args.participantId) {
-      conversations = conversations.filter(
-        (c) => c.participantId === args.participantId,
-      );
-    }
-    if (args.createdBefore !== undefined) {
-      conversations = conversations.filter(
-        (c) => c.createdAt < args.createdBefore!,
-      );
-    }
-    if (args.createdAfter !== undefined) {
-      conversations = conversations.filter(
-        (c) => c.createdAt > args.createdAfter!,
-      );
-    }
-    if (args.updatedBefore !== undefined) {
-      conversations = conversations.filter(
-        (c) => c.updatedAt < args.updatedBefore!,
-      );
-    }
-    if (args.updatedAfter !== undefined) {
-      conversations = conversations.filter(
-        (c) => c.updatedAt > args.updatedAfter!,
-      );
-    }
-    if (args.lastMessageBefore !== undefined) {
-      conversations = conversations.filter((c) => {
-        const lastMsgTime =
-          c.messages.length > 0
-            ? c.messages[c.messages.length - 1].timestamp
-            : c.createdAt;
-        return lastMsgTime < args.lastMessageBefore!;
-      });
-    }
-    if (args.lastMessageAfter !== undefined) {
-      conversations = conversations.filter((c) => {
-        const lastMsgTime =
-          c.messages.length > 0
-            ? c.messages[c.messages.length - 1].timestamp
-            : c.createdAt;
-        return lastMsgTime > args.lastMessageAfter!;
-      });
-    }
-    if (args.messageCountMin !== undefined) {
-      conversations = conversations.filter(
-        (c) => c.messageCount >= args.messageCountMin!,
-      );
-    }
-    if (args.messageCountMax !== undefined) {
-      conversations = conversations.filter(
-        (c) => c.messageCount <= args.messageCountMax!,
-      );
-    }
+    const conversations = applyListFilters(
+      await listIndexQuery(ctx, args).collect(),
+      args,
+    );
 
     // Get total before pagination
     const total = conversations.length;
@@ -797,6 +821,37 @@ export const list = query({
   },
 });
 
+/**
+ * List conversations one page at a time (cursor pagination)
+ *
+ * Takes the same filters as list, applied per page (pages may be shorter
+ * than numItems). Pages follow index order rather than a sort key, so bulk
+ * consumers can walk every conversation without loading them all at once.
+ */
+export const listPage = query({
+  args: {
+    ...listFilterArgs,
+    includeMessages: v.optional(v.boolean()),
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const result = await listIndexQuery(ctx, args).paginate(
+      args.paginationOpts,
+    );
+
+    const page = applyListFilters(result.page, args);
+
+    return {
+      page:
+        args.includeMessages === false
+          ? page.map((c) => ({ ...c, messages: [] }))
+          : page,
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
+  },
+});
+
 /**
  * Count conversations
  */
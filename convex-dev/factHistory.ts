@@ -5,8 +5,279 @@
  * Records CREATE, UPDATE, SUPERSEDE, and DELETE actions on facts.
  */
 
+import { paginationOptsValidator } from "convex/server";
 import { v } from "convex/values";
-import { mutation, query } from "./_generated/server";
+import { Doc } from "./_generated/dataModel";
+import { mutation, MutationCtx, query, QueryCtx } from "./_generated/server";
+
+// ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+// Daily Rollups
+// ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Each day's counts are split over shards picked by fact, so concurrent
+// logEvent calls rarely patch the same rollup row. Reads sum the shards.
+const ROLLUP_SHARDS = 8;
+
+type FactChangeAction = Doc<"factHistory">["action"];
+
+type ActionCounts = Record<FactChangeAction, number>;
+
+type RolledUpEvent = Pick<
+  Doc<"factHistory">,
+  "factId" | "memorySpaceId" | "timestamp" | "action"
+>;
+
+function dayStart(timestamp: number): number {
+  return Math.floor(timestamp / DAY_MS) * DAY_MS;
+}
+
+function emptyCounts(): ActionCounts {
+  return { CREATE: 0, UPDATE: 0, SUPERSEDE: 0, DELETE: 0 };
+}
+
+function rollupShard(factId: string): number {
+  let hash = 0;
+  for (let i = 0; i < factId.length; i++) {
+    hash = (hash * 31 + factId.charCodeAt(i)) >>> 0;
+  }
+  return hash % ROLLUP_SHARDS;
+}
+
+/**
+ * Timestamp from which a space's rollups cover every event
+ *
+ * Events before it (logged before rollups existed, or not yet recounted by
+ * rebuildRollups) are counted from raw events. Infinity when the space has
+ * no rollups at all.
+ */
+async function rollupsValidSince(
+  ctx: QueryCtx,
+  memorySpaceId: string,
+): Promise<number> {
+  const marker = await ctx.db
+    .query("factHistoryRollupMarkers")
+    .withIndex("by_memorySpace", (q) => q.eq("memorySpaceId", memorySpaceId))
+    .first();
+  return marker?.validSince ?? Infinity;
+}
+
+async function setRollupsValidSince(
+  ctx: MutationCtx,
+  memorySpaceId: string,
+  validSince: number,
+): Promise<void> {
+  const marker = await ctx.db
+    .query("factHistoryRollupMarkers")
+    .withIndex("by_memorySpace", (q) => q.eq("memorySpaceId", memorySpaceId))
+    .first();
+
+  if (marker) {
+    await ctx.db.patch(marker._id, { validSince });
+  } else {
+    await ctx.db.insert("factHistoryRollupMarkers", {
+      memorySpaceId,
+      validSince,
+    });
+  }
+}
+
+/**
+ * Add (or with a negative delta, remove) events to a space's daily rollup
+ */
+async function bumpRollup(
+  ctx: MutationCtx,
+  event: RolledUpEvent,
+  delta: number,
+): Promise<void> {
+  const day = dayStart(event.timestamp);
+  const shard = rollupShard(event.factId);
+  const rollup = await ctx.db
+    .query("factHistoryRollups")
+    .withIndex("by_memorySpace_day", (q) =>
+      q
+        .eq("memorySpaceId", event.memorySpaceId)
+        .eq("day", day)
+        .eq("shard", shard),
+    )
+    .first();
+
+  if (rollup) {
+    await ctx.db.patch(rollup._id, {
+      actionCounts: {
+        ...rollup.actionCounts,
+        [event.action]: Math.max(0, rollup.actionCounts[event.action] + delta),
+      },
+      totalEvents: Math.max(0, rollup.totalEvents + delta),
+      updatedAt: Date.now(),
+    });
+  } else if (delta > 0) {
+    await ctx.db.insert("factHistoryRollups", {
+      memorySpaceId: event.memorySpaceId,
+      day,
+      shard,
+      actionCounts: { ...emptyCounts(), [event.action]: delta },
+      totalEvents: delta,
+      updatedAt: Date.now(),
+    });
+  }
+}
+
+/**
+ * Add events to the rollups, one bump per day, action and shard
+ */
+async function rollUpEvents(
+  ctx: MutationCtx,
+  events: Doc<"factHistory">[],
+  sign: 1 | -1,
+): Promise<void> {
+  const deltas = new Map<string, { event: Doc<"factHistory">; count: number }>();
+  for (const event of events) {
+    const key = [
+      event.memorySpaceId,
+      dayStart(event.timestamp),
+      event.action,
+      rollupShard(event.factId),
+    ].join("|");
+    const entry = deltas.get(key);
+    deltas.set(key, { event, count: (entry?.count ?? 0) + 1 + (event.compacted ?? 0) });
+  }
+
+  for (const { event, count } of deltas.values()) {
+    await bumpRollup(ctx, event, sign * count);
+  }
+}
+
+/**
+ * Remove explicitly erased events from the rollups
+ *
+ * Retention purges and compaction keep the counts (the activity happened);
+ * GDPR erasure removes it. Events before a space's marker were never rolled
+ * up, so they are skipped.
+ */
+async function unrollEvents(
+  ctx: MutationCtx,
+  events: Doc<"factHistory">[],
+): Promise<void> {
+  const validSince = new Map<string, number>();
+  for (const event of events) {
+    if (!validSince.has(event.memorySpaceId)) {
+      validSince.set(
+        event.memorySpaceId,
+        await rollupsValidSince(ctx, event.memorySpaceId),
+      );
+    }
+  }
+
+  await rollUpEvents(
+    ctx,
+    events.filter((e) => e.timestamp >= validSince.get(e.memorySpaceId)!),
+    -1,
+  );
+}
+
+/**
+ * Count a space's events by action between two inclusive timestamps
+ *
+ * Whole days come from the rollups; only the partial days at either edge of
+ * the range, and events before the space's rollup marker, are counted from
+ * raw events. Once rollups cover the range the cost is O(days) plus the
+ * events of at most two days.
+ */
+async function countEvents(
+  ctx: QueryCtx,
+  memorySpaceId: string,
+  after: number | undefined,
+  before: number | undefined,
+): Promise<ActionCounts & { total: number }> {
+  const counts = { ...emptyCounts(), total: 0 };
+
+  const addRaw = async (from: number | undefined, to: number | undefined) => {
+    const events = await ctx.db
+      .query("factHistory")
+      .withIndex("by_memorySpace_timestamp", (q) => {
+        const space = q.eq("memorySpaceId", memorySpaceId);
+        if (from !== undefined && to !== undefined) {
+          return space.gte("timestamp", from).lt("timestamp", to);
+        }
+        if (from !== undefined) {
+          return space.gte("timestamp", from);
+        }
+        if (to !== undefined) {
+          return space.lt("timestamp", to);
+        }
+        return space;
+      })
+      .collect();
+    for (const event of events) {
+      // A compacted UPDATE stands in for the events folded into it
+      const weight = 1 + (event.compacted ?? 0);
+      counts[event.action] += weight;
+      counts.total += weight;
+    }
+  };
+
+  // Events before the marker have no rollups
+  const validSince = await rollupsValidSince(ctx, memorySpaceId);
+  if (after === undefined || after < validSince) {
+    const rawEnd =
+      before === undefined ? validSince : Math.min(before + 1, validSince);
+    await addRaw(after, Number.isFinite(rawEnd) ? rawEnd : undefined);
+    if (rawEnd < validSince || !Number.isFinite(validSince)) {
+      return counts;
+    }
+    after = validSince;
+  }
+
+  // Full days are [firstDay, endDay)
+  const firstDay =
+    after === undefined
+      ? undefined
+      : after === dayStart(after)
+        ? after
+        : dayStart(after) + DAY_MS;
+  const endDay = before === undefined ? undefined : dayStart(before + 1);
+
+  if (firstDay !== undefined && endDay !== undefined && firstDay >= endDay) {
+    // The range sits inside one or two partial days
+    await addRaw(after, before! + 1);
+    return counts;
+  }
+
+  const rollups = await ctx.db
+    .query("factHistoryRollups")
+    .withIndex("by_memorySpace_day", (q) => {
+      const space = q.eq("memorySpaceId", memorySpaceId);
+      if (firstDay !== undefined && endDay !== undefined) {
+        return space.gte("day", firstDay).lt("day", endDay);
+      }
+      if (firstDay !== undefined) {
+        return space.gte("day", firstDay);
+      }
+      if (endDay !== undefined) {
+        return space.lt("day", endDay);
+      }
+      return space;
+    })
+    .collect();
+
+  for (const rollup of rollups) {
+    for (const action of Object.keys(rollup.actionCounts) as FactChangeAction[]) {
+      counts[action] += rollup.actionCounts[action];
+    }
+    counts.total += rollup.totalEvents;
+  }
+
+  if (firstDay !== undefined && after !== undefined && after < firstDay) {
+    await addRaw(after, firstDay);
+  }
+  if (endDay !== undefined) {
+    await addRaw(endDay, before! + 1);
+  }
+
+  return counts;
+}
 
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 // Mutations (Write Operations)
@@ -64,6 +335,21 @@ export const logEvent = mutation({
       timestamp: now,
     });
 
+    // The first rolled-up event marks where the space's rollups begin
+    if ((await rollupsValidSince(ctx, args.memorySpaceId)) === Infinity) {
+      await setRollupsValidSince(ctx, args.memorySpaceId, now);
+    }
+    await bumpRollup(
+      ctx,
+      {
+        factId: args.factId,
+        memorySpaceId: args.memorySpaceId,
+        timestamp: now,
+        action: args.action,
+      },
+      1,
+    );
+
     return { eventId, _id };
   },
 });
@@ -84,6 +370,7 @@ export const deleteByFactId = mutation({
     for (const event of events) {
       await ctx.db.delete(event._id);
     }
+    await unrollEvents(ctx, events);
 
     return { deleted: events.length };
   },
@@ -105,6 +392,7 @@ export const deleteByUserId = mutation({
     for (const event of events) {
       await ctx.db.delete(event._id);
     }
+    await unrollEvents(ctx, events);
 
     return { deleted: events.length };
   },
@@ -129,12 +417,35 @@ export const deleteByMemorySpace = mutation({
       await ctx.db.delete(event._id);
     }
 
+    const rollups = await ctx.db
+      .query("factHistoryRollups")
+      .withIndex("by_memorySpace_day", (q) =>
+        q.eq("memorySpaceId", args.memorySpaceId),
+      )
+      .collect();
+    for (const rollup of rollups) {
+      await ctx.db.delete(rollup._id);
+    }
+
+    const marker = await ctx.db
+      .query("factHistoryRollupMarkers")
+      .withIndex("by_memorySpace", (q) =>
+        q.eq("memorySpaceId", args.memorySpaceId),
+      )
+      .first();
+    if (marker) {
+      await ctx.db.delete(marker._id);
+    }
+
     return { deleted: events.length };
   },
 });
 
 /**
  * Purge old history events (retention policy)
+ *
+ * Daily rollups are kept, so activity counts outlive the raw events (except
+ * events from before the space's rollup marker, which only exist raw).
  */
 export const purgeOldEvents = mutation({
   args: {
@@ -172,6 +483,133 @@ export const purgeOldEvents = mutation({
   },
 });
 
+/**
+ * Compact old history events (retention policy)
+ *
+ * Walks one page of a space's events older than `olderThan`. For every fact
+ * with old UPDATE events, only the latest one is kept: it takes over the
+ * oldest folded value as oldValue and counts the folded events in
+ * `compacted`. CREATE, SUPERSEDE and DELETE events are never touched, so
+ * supersession chains stay intact. Rollup counts are unchanged.
+ */
+export const compactEvents = mutation({
+  args: {
+    memorySpaceId: v.string(),
+    olderThan: v.number(),
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const result = await ctx.db
+      .query("factHistory")
+      .withIndex("by_memorySpace_timestamp", (q) =>
+        q
+          .eq("memorySpaceId", args.memorySpaceId)
+          .lt("timestamp", args.olderThan),
+      )
+      .paginate(args.paginationOpts);
+
+    const factIds = new Set(
+      result.page.filter((e) => e.action === "UPDATE").map((e) => e.factId),
+    );
+
+    let deleted = 0;
+    for (const factId of factIds) {
+      const updates = (
+        await ctx.db
+          .query("factHistory")
+          .withIndex("by_factId", (q) => q.eq("factId", factId))
+          .collect()
+      )
+        .filter(
+          (e) =>
+            e.action === "UPDATE" &&
+            e.memorySpaceId === args.memorySpaceId &&
+            e.timestamp < args.olderThan,
+        )
+        .sort((a, b) => a.timestamp - b.timestamp);
+
+      if (updates.length < 2) {
+        continue;
+      }
+
+      const latest = updates[updates.length - 1];
+      const folded = updates.slice(0, -1);
+      for (const event of folded) {
+        await ctx.db.delete(event._id);
+      }
+
+      await ctx.db.patch(latest._id, {
+        oldValue: folded[0].oldValue ?? latest.oldValue,
+        compacted:
+          (latest.compacted ?? 0) +
+          folded.reduce((sum, e) => sum + 1 + (e.compacted ?? 0), 0),
+      });
+      deleted += folded.length;
+    }
+
+    return {
+      deleted,
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
+  },
+});
+
+/**
+ * Rebuild a space's daily rollups from its stored events
+ *
+ * Call with no cursor to start: existing rollups are cleared and
+ * `rebuildStartedAt` is returned. Pass it back with each cursor; only events
+ * before it are counted, since later ones are already rolled up by logEvent.
+ * Until the last page, the rollup marker sits at `rebuildStartedAt` so counts
+ * read older events raw. Events removed by retention purges cannot be
+ * recounted.
+ */
+export const rebuildRollups = mutation({
+  args: {
+    memorySpaceId: v.string(),
+    rebuildStartedAt: v.optional(v.number()),
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    let startedAt = args.rebuildStartedAt;
+    if (startedAt === undefined || args.paginationOpts.cursor === null) {
+      startedAt = Date.now();
+      const rollups = await ctx.db
+        .query("factHistoryRollups")
+        .withIndex("by_memorySpace_day", (q) =>
+          q.eq("memorySpaceId", args.memorySpaceId),
+        )
+        .collect();
+      for (const rollup of rollups) {
+        await ctx.db.delete(rollup._id);
+      }
+      await setRollupsValidSince(ctx, args.memorySpaceId, startedAt);
+    }
+
+    const result = await ctx.db
+      .query("factHistory")
+      .withIndex("by_memorySpace_timestamp", (q) =>
+        q
+          .eq("memorySpaceId", args.memorySpaceId)
+          .lt("timestamp", startedAt!),
+      )
+      .paginate(args.paginationOpts);
+
+    await rollUpEvents(ctx, result.page, 1);
+    if (result.isDone) {
+      await setRollupsValidSince(ctx, args.memorySpaceId, 0);
+    }
+
+    return {
+      counted: result.page.length,
+      rebuildStartedAt: startedAt,
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
+  },
+});
+
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 // Queries (Read Operations)
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -267,6 +705,8 @@ export const getChangesByTimeRange = query({
 
 /**
  * Count changes by action type
+ *
+ * Served from the daily rollups, plus raw events for partial edge days.
  */
 export const countByAction = query({
   args: {
@@ -275,35 +715,87 @@ export const countByAction = query({
     before: v.optional(v.number()),
   },
   handler: async (ctx, args) => {
-    let events = await ctx.db
-      .query("factHistory")
-      .withIndex("by_memorySpace", (q) =>
-        q.eq("memorySpaceId", args.memorySpaceId),
-      )
-      .collect();
-
-    // Apply time filters
-    if (args.after !== undefined) {
-      events = events.filter((e) => e.timestamp >= args.after!);
-    }
-    if (args.before !== undefined) {
-      events = events.filter((e) => e.timestamp <= args.before!);
-    }
+    return await countEvents(ctx, args.memorySpaceId, args.after, args.before);
+  },
+});
 
-    // Count by action
-    const counts = {
-      CREATE: 0,
-      UPDATE: 0,
-      SUPERSEDE: 0,
-      DELETE: 0,
-      total: events.length,
+/**
+ * Get per-day activity counts (oldest day first)
+ *
+ * Served from the rollups; days before the space's rollup marker are
+ * counted from raw events.
+ */
+export const getDailyActivity = query({
+  args: {
+    memorySpaceId: v.string(),
+    days: v.optional(v.number()), // Default 30 days, including today
+  },
+  handler: async (ctx, args) => {
+    const days = args.days ?? 30;
+    const since = dayStart(Date.now()) - (days - 1) * DAY_MS;
+    const byDay = new Map<
+      number,
+      { actionCounts: ActionCounts; totalEvents: number }
+    >();
+    const add = (day: number, action: FactChangeAction, count: number) => {
+      const entry = byDay.get(day) ?? {
+        actionCounts: emptyCounts(),
+        totalEvents: 0,
+      };
+      entry.actionCounts[action] += count;
+      entry.totalEvents += count;
+      byDay.set(day, entry);
     };
 
-    for (const event of events) {
-      counts[event.action]++;
+    // Days up to and including the marker's day are counted raw; the
+    // marker day's rollup only holds part of it
+    const validSince = await rollupsValidSince(ctx, args.memorySpaceId);
+    const rollupsFrom = Number.isFinite(validSince)
+      ? validSince === dayStart(validSince)
+        ? validSince
+        : dayStart(validSince) + DAY_MS
+      : Infinity;
+
+    if (rollupsFrom > since) {
+      const events = await ctx.db
+        .query("factHistory")
+        .withIndex("by_memorySpace_timestamp", (q) => {
+          const range = q
+            .eq("memorySpaceId", args.memorySpaceId)
+            .gte("timestamp", since);
+          return Number.isFinite(rollupsFrom)
+            ? range.lt("timestamp", rollupsFrom)
+            : range;
+        })
+        .collect();
+      for (const event of events) {
+        const weight = 1 + (event.compacted ?? 0);
+        add(dayStart(event.timestamp), event.action, weight);
+      }
     }
 
-    return counts;
+    if (Number.isFinite(rollupsFrom)) {
+      const rollups = await ctx.db
+        .query("factHistoryRollups")
+        .withIndex("by_memorySpace_day", (q) =>
+          q
+            .eq("memorySpaceId", args.memorySpaceId)
+            .gte("day", Math.max(since, rollupsFrom)),
+        )
+        .collect();
+      for (const rollup of rollups) {
+        for (const action of Object.keys(
+          rollup.actionCounts,
+        ) as FactChangeAction[]) {
+          add(rollup.day, action, rollup.actionCounts[action]);
+        }
+      }
+    }
+
+    return [...byDay.entries()]
+      .sort(([a], [b]) => a - b)
+      .filter(([, entry]) => entry.totalEvents > 0)
+      .map(([day, entry]) => ({ day, ...entry }));
   },
 });
 
@@ -354,30 +846,27 @@ export const getSupersessionChain = query({
 
 /**
  * Get recent activity summary
+ *
+ * Event counts come from the daily rollups. Distinct facts and participants
+ * cannot be rolled up; they need a scan of the window's raw events, so they
+ * are only counted when includeUniques is true (otherwise reported as 0).
  */
 export const getActivitySummary = query({
   args: {
     memorySpaceId: v.string(),
     hours: v.optional(v.number()), // Default 24 hours
+    includeUniques: v.optional(v.boolean()), // Default false
   },
   handler: async (ctx, args) => {
     const hours = args.hours ?? 24;
     const since = Date.now() - hours * 60 * 60 * 1000;
 
-    const events = await ctx.db
-      .query("factHistory")
-      .withIndex("by_memorySpace_timestamp", (q) =>
-        q.eq("memorySpaceId", args.memorySpaceId).gte("timestamp", since),
-      )
-      .collect();
-
-    // Count by action
-    const actionCounts = {
-      CREATE: 0,
-      UPDATE: 0,
-      SUPERSEDE: 0,
-      DELETE: 0,
-    };
+    const { total, ...actionCounts } = await countEvents(
+      ctx,
+      args.memorySpaceId,
+      since,
+      undefined,
+    );
 
     // Track unique facts modified
     const factsModified = new Set<string>();
@@ -385,14 +874,22 @@ export const getActivitySummary = query({
     // Track participants
     const participants = new Set<string>();
 
-    for (const event of events) {
-      actionCounts[event.action]++;
-      factsModified.add(event.factId);
-      if (event.participantId) {
-        participants.add(event.participantId);
-      }
-      if (event.userId) {
-        participants.add(event.userId);
+    if (args.includeUniques === true) {
+      const events = await ctx.db
+        .query("factHistory")
+        .withIndex("by_memorySpace_timestamp", (q) =>
+          q.eq("memorySpaceId", args.memorySpaceId).gte("timestamp", since),
+        )
+        .collect();
+
+      for (const event of events) {
+        factsModified.add(event.factId);
+        if (event.participantId) {
+          participants.add(event.participantId);
+        }
+        if (event.userId) {
+          participants.add(event.userId);
+        }
       }
     }
 
@@ -402,7 +899,7 @@ export const getActivitySummary = query({
         since: new Date(since).toISOString(),
         until: new Date().toISOString(),
       },
-      totalEvents: events.length,
+      totalEvents: total,
       actionCounts,
       uniqueFactsModified: factsModified.size,
       activeParticipants: participants.size,
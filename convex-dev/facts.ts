@@ -5,8 +5,56 @@
  * Structured knowledge with relationships
  */
 
-import { ConvexError, v } from "convex/values";
-import { mutation, query } from "./_generated/server";
+import { paginationOptsValidator } from "convex/server";
+import { ConvexError, ObjectType, v } from "convex/values";
+import { Doc } from "./_generated/dataModel";
+import { internal } from "./_generated/api";
+import { action, internalQuery, mutation, query } from "./_generated/server";
+import { chunkWatermarks } from "./graphSync";
+
+/**
+ * Strip the embedding from a fact returned by a read
+ *
+ * Embeddings are large and only semantic deduplication needs them, so reads
+ * leave them out unless the caller opts in (includeEmbedding).
+ */
+function withoutEmbedding<T extends { embedding?: number[] }>(
+  fact: T,
+): Omit<T, "embedding"> {
+  const { embedding: _embedding, ...rest } = fact;
+  return rest;
+}
+
+/**
+ * Vector search scope keys of a current fact
+ *
+ * Convex vector filters only match single fields by equality, so the scope
+ * semanticSearch filters on is stored pre-combined: scopeKey for one user's
+ * facts of a type, typeScopeKey for a type across users. Superseded facts
+ * drop both keys (NO_SCOPE_KEYS) so vector search never returns them.
+ */
+function factScopeKeys(fact: {
+  memorySpaceId: string;
+  userId?: string;
+  factType: string;
+}) {
+  return {
+    scopeKey: `${fact.memorySpaceId}|${fact.userId ?? ""}|${fact.factType}`,
+    typeScopeKey: `${fact.memorySpaceId}|${fact.factType}`,
+  };
+}
+
+const NO_SCOPE_KEYS = { scopeKey: undefined, typeScopeKey: undefined };
+
+const FACT_TYPES = [
+  "preference",
+  "identity",
+  "knowledge",
+  "relationship",
+  "event",
+  "observation",
+  "custom",
+] as const;
 
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 // Mutations (Write Operations)
@@ -75,6 +123,10 @@ export const store = mutation({
         }),
       ),
     ), // Subject-predicate-object triples for graph
+    embedding: v.optional(v.array(v.float64())), // For semantic dedup / conflicts
+    // Slot key (computed by the SDK's predicate classifier)
+    normalizedSubject: v.optional(v.string()),
+    predicateClass: v.optional(v.string()),
   },
   handler: async (ctx, args) => {
     const now = Date.now();
@@ -104,6 +156,10 @@ export const store = mutation({
       semanticContext: args.semanticContext,
       entities: args.entities,
       relations: args.relations,
+      embedding: args.embedding,
+      normalizedSubject: args.normalizedSubject,
+      predicateClass: args.predicateClass,
+      ...factScopeKeys(args),
       version: 1,
       supersededBy: undefined,
       supersedes: undefined,
@@ -202,6 +258,15 @@ export const update = mutation({
       entities: args.entities !== undefined ? args.entities : existing.entities,
       relations:
         args.relations !== undefined ? args.relations : existing.relations,
+      // Embedding only stays valid while the statement is unchanged
+      embedding:
+        args.fact === undefined || args.fact === existing.fact
+          ? existing.embedding
+          : undefined,
+      // Subject and predicate are unchanged, so the slot carries over
+      normalizedSubject: existing.normalizedSubject,
+      predicateClass: existing.predicateClass,
+      ...factScopeKeys(existing),
       version: existing.version + 1,
       supersedes: existing.factId, // Link to previous
       supersededBy: undefined,
@@ -213,6 +278,7 @@ export const update = mutation({
     await ctx.db.patch(existing._id, {
       supersededBy: newFactId,
       validUntil: now,
+      ...NO_SCOPE_KEYS,
     });
 
     return await ctx.db.get(_id);
@@ -297,6 +363,7 @@ export const supersede = mutation({
     await ctx.db.patch(oldFact._id, {
       supersededBy: args.newFactId,
       validUntil: now,
+      ...NO_SCOPE_KEYS,
       updatedAt: now,
     });
 
@@ -328,6 +395,7 @@ export const updateInPlace = mutation({
     tags: v.optional(v.array(v.string())),
     validUntil: v.optional(v.number()),
     metadata: v.optional(v.any()),
+    embedding: v.optional(v.array(v.float64())), // Embedding of the new text
     // Enrichment fields
     category: v.optional(v.string()),
     searchAliases: v.optional(v.array(v.string())),
@@ -373,7 +441,14 @@ export const updateInPlace = mutation({
       updatedAt: now,
     };
 
-    if (args.fact !== undefined) updates.fact = args.fact;
+    if (args.fact !== undefined && args.fact !== existing.fact) {
+      updates.fact = args.fact;
+      // The old vector describes the old text: replace it, or clear it so
+      // semantic search never matches on stale content
+      updates.embedding = args.embedding;
+    } else if (args.embedding !== undefined) {
+      updates.embedding = args.embedding;
+    }
     if (args.confidence !== undefined) updates.confidence = args.confidence;
     if (args.tags !== undefined) updates.tags = args.tags;
     if (args.validUntil !== undefined) updates.validUntil = args.validUntil;
@@ -392,6 +467,152 @@ export const updateInPlace = mutation({
   },
 });
 
+/**
+ * Apply belief revision decisions for a batch of new facts in one transaction
+ *
+ * Ops run in order. A target is either an existing fact (targetFactId) or the
+ * fact produced by an earlier op in the batch (targetOp). Targets superseded
+ * earlier in the batch resolve to their current successor, so several new
+ * facts in one slot form a chain instead of overwriting each other's links.
+ */
+export const applyRevisions = mutation({
+  args: {
+    memorySpaceId: v.string(),
+    ops: v.array(
+      v.object({
+        action: v.union(
+          v.literal("ADD"),
+          v.literal("UPDATE"),
+          v.literal("SUPERSEDE"),
+          v.literal("NONE"),
+        ),
+        fact: v.object({
+          participantId: v.optional(v.string()),
+          userId: v.optional(v.string()),
+          fact: v.string(),
+          factType: v.union(
+            v.literal("preference"),
+            v.literal("identity"),
+            v.literal("knowledge"),
+            v.literal("relationship"),
+            v.literal("event"),
+            v.literal("observation"),
+            v.literal("custom"),
+          ),
+          subject: v.optional(v.string()),
+          predicate: v.optional(v.string()),
+          object: v.optional(v.string()),
+          confidence: v.number(),
+          tags: v.array(v.string()),
+          embedding: v.optional(v.array(v.float64())),
+          normalizedSubject: v.optional(v.string()),
+          predicateClass: v.optional(v.string()),
+        }),
+        targetFactId: v.optional(v.string()),
+        targetOp: v.optional(v.number()), // Index of an earlier op
+      }),
+    ),
+  },
+  handler: async (ctx, args) => {
+    const results: Array<{ fact: any; superseded: any[] }> = [];
+
+    const byFactId = async (factId: string) =>
+      await ctx.db
+        .query("facts")
+        .withIndex("by_factId", (q) => q.eq("factId", factId))
+        .first();
+
+    const resolveTarget = async (op: (typeof args.ops)[number]) => {
+      let target =
+        op.targetOp !== undefined
+          ? (results[op.targetOp]?.fact ?? null)
+          : op.targetFactId !== undefined
+            ? await byFactId(op.targetFactId)
+            : null;
+
+      if (target && target.memorySpaceId !== args.memorySpaceId) {
+        throw new ConvexError("PERMISSION_DENIED");
+      }
+
+      // Follow supersessions made earlier in this batch
+      for (
+        let hops = 0;
+        target?.supersededBy && hops < args.ops.length;
+        hops++
+      ) {
+        target = await byFactId(target.supersededBy);
+      }
+      return target;
+    };
+
+    const insertFact = async (fact: (typeof args.ops)[number]["fact"]) => {
+      const now = Date.now();
+      const factId = `fact-${now}-${Math.random().toString(36).substring(2, 11)}`;
+      const _id = await ctx.db.insert("facts", {
+        factId,
+        memorySpaceId: args.memorySpaceId,
+        ...fact,
+        ...factScopeKeys({ ...fact, memorySpaceId: args.memorySpaceId }),
+        sourceType: "conversation",
+        validFrom: now,
+        version: 1,
+        createdAt: now,
+        updatedAt: now,
+      });
+      return (await ctx.db.get(_id))!;
+    };
+
+    for (const op of args.ops) {
+      const target = await resolveTarget(op);
+      const now = Date.now();
+
+      if (op.action === "NONE") {
+        results.push({ fact: target, superseded: [] });
+      } else if (op.action === "UPDATE" && target) {
+        // Keep the slot key consistent with the triple it was computed from
+        const slot =
+          op.fact.normalizedSubject !== undefined &&
+          op.fact.predicateClass !== undefined
+            ? {
+                subject: op.fact.subject,
+                predicate: op.fact.predicate,
+                object: op.fact.object,
+                normalizedSubject: op.fact.normalizedSubject,
+                predicateClass: op.fact.predicateClass,
+              }
+            : {};
+        await ctx.db.patch(target._id, {
+          fact: op.fact.fact,
+          confidence: op.fact.confidence,
+          tags: op.fact.tags,
+          embedding: op.fact.embedding, // Cleared when the new text has none
+          ...slot,
+          updatedAt: now,
+        });
+        results.push({ fact: await ctx.db.get(target._id), superseded: [] });
+      } else if (op.action === "SUPERSEDE" && target) {
+        const created = await insertFact(op.fact);
+        await ctx.db.patch(target._id, {
+          supersededBy: created.factId,
+          validUntil: now,
+          ...NO_SCOPE_KEYS,
+          updatedAt: now,
+        });
+        await ctx.db.patch(created._id, { supersedes: target.factId });
+        results.push({
+          fact: await ctx.db.get(created._id),
+          superseded: [await ctx.db.get(target._id)],
+        });
+      } else {
+        // ADD, or UPDATE/SUPERSEDE whose target no longer exists
+        results.push({ fact: await insertFact(op.fact), superseded: [] });
+      }
+    }
+
+    return results;
+  },
+});
+
 /**
  * Delete many facts matching filters
  */
@@ -470,60 +691,161 @@ export const get = query({
       return null; // Cross-tenant access denied (silent)
     }
 
-    return fact;
+    return withoutEmbedding(fact);
   },
 });
 
+/**
+ * Filters shared by list and listPage (everything but paging and sorting)
+ */
+const listFilterArgs = {
+  tenantId: v.optional(v.string()), // Multi-tenancy: SaaS platform isolation
+  // Fact-specific filters
+  factType: v.optional(
+    v.union(
+      v.literal("preference"),
+      v.literal("identity"),
+      v.literal("knowledge"),
+      v.literal("relationship"),
+      v.literal("event"),
+      v.literal("observation"),
+      v.literal("custom"),
+    ),
+  ),
+  subject: v.optional(v.string()),
+  predicate: v.optional(v.string()),
+  object: v.optional(v.string()),
+  minConfidence: v.optional(v.number()),
+  confidence: v.optional(v.number()), // Exact match
+  // Universal filters
+  userId: v.optional(v.string()),
+  participantId: v.optional(v.string()),
+  tags: v.optional(v.array(v.string())),
+  tagMatch: v.optional(v.union(v.literal("any"), v.literal("all"))),
+  sourceType: v.optional(
+    v.union(
+      v.literal("conversation"),
+      v.literal("system"),
+      v.literal("tool"),
+      v.literal("manual"),
+      v.literal("a2a"),
+    ),
+  ),
+  createdBefore: v.optional(v.number()),
+  createdAfter: v.optional(v.number()),
+  updatedBefore: v.optional(v.number()),
+  updatedAfter: v.optional(v.number()),
+  version: v.optional(v.number()),
+  includeSuperseded: v.optional(v.boolean()),
+  validAt: v.optional(v.number()),
+  metadata: v.optional(v.any()),
+};
+
+/**
+ * Apply list filters to facts of one memory space
+ */
+function applyListFilters(
+  facts: Doc<"facts">[],
+  args: ObjectType<typeof listFilterArgs>,
+): Doc<"facts">[] {
+  // Filter out superseded by default
+  if (!args.includeSuperseded) {
+    facts = facts.filter((f) => f.supersededBy === undefined);
+  }
+
+  // Tenant isolation filter (apply early for security)
+  if (args.tenantId) {
+    facts = facts.filter((f) => f.tenantId === args.tenantId);
+  }
+
+  // Apply universal filters
+  if (args.factType) {
+    facts = facts.filter((f) => f.factType === args.factType);
+  }
+  if (args.subject !== undefined) {
+    facts = facts.filter((f) => f.subject === args.subject);
+  }
+  if (args.predicate !== undefined) {
+    facts = facts.filter((f) => f.predicate === args.predicate);
+  }
+  if (args.object !== undefined) {
+    facts = facts.filter((f) => f.object === args.object);
+  }
+  if (args.userId !== undefined) {
+    facts = facts.filter((f) => f.userId === args.userId);
+  }
+  if (args.participantId !== undefined) {
+    facts = facts.filter((f) => f.participantId === args.participantId);
+  }
+  if (args.minConfidence !== undefined) {
+    facts = facts.filter((f) => f.confidence >= args.minConfidence!);
+  }
+  if (args.confidence !== undefined) {
+    facts = facts.filter((f) => f.confidence === args.confidence);
+  }
+  if (args.sourceType !== undefined) {
+    facts = facts.filter((f) => f.sourceType === args.sourceType);
+  }
+  if (args.tags && args.tags.length > 0) {
+    if (args.tagMatch === "all") {
+      facts = facts.filter((f) =>
+        args.tags!.every((tag) => f.tags.includes(tag)),
+      );
+    } else {
+      // "any" is default
+      facts = facts.filter((f) =>
+        args.tags!.some((tag) => f.tags.includes(tag)),
+      );
+    }
+  }
+  if (args.createdAfter !== undefined) {
+    facts = facts.filter((f) => f.createdAt >= args.createdAfter!);
+  }
+  if (args.createdBefore !== undefined) {
+    facts = facts.filter((f) => f.createdAt <= args.createdBefore!);
+  }
+  if (args.updatedAfter !== undefined) {
+    facts = facts.filter((f) => f.updatedAt >= args.updatedAfter!);
+  }
+  if (args.updatedBefore !== undefined) {
+    facts = facts.filter((f) => f.updatedAt <= args.updatedBefore!);
+  }
+  if (args.version !== undefined) {
+    facts = facts.filter((f) => f.version === args.version);
+  }
+  if (args.validAt !== undefined) {
+    facts = facts.filter((f) => {
+      const isValid =
+        (!f.validFrom || f.validFrom <= args.validAt!) &&
+        (!f.validUntil || f.validUntil > args.validAt!);
+      return isValid;
+    });
+  }
+  if (args.metadata !== undefined) {
+    facts = facts.filter((f) => {
+      if (!f.metadata) return false;
+      // Match all provided metadata fields
+      return Object.entries(args.metadata as Record<string, any>).every(
+        ([key, value]) => f.metadata[key] === value,
+      );
+    });
+  }
+
+  return facts;
+}
+
 /**
  * List facts with filters
  */
 export const list = query({
   args: {
     memorySpaceId: v.string(),
-    tenantId: v.optional(v.string()), // Multi-tenancy: SaaS platform isolation
-    // Fact-specific filters
-    factType: v.optional(
-      v.union(
-        v.literal("preference"),
-        v.literal("identity"),
-        v.literal("knowledge"),
-        v.literal("relationship"),
-        v.literal("event"),
-        v.literal("observation"),
-        v.literal("custom"),
-      ),
-    ),
-    subject: v.optional(v.string()),
-    predicate: v.optional(v.string()),
-    object: v.optional(v.string()),
-    minConfidence: v.optional(v.number()),
-    confidence: v.optional(v.number()), // Exact match
-    // Universal filters
-    userId: v.optional(v.string()),
-    participantId: v.optional(v.string()),
-    tags: v.optional(v.array(v.string())),
-    tagMatch: v.optional(v.union(v.literal("any"), v.literal("all"))),
-    sourceType: v.optional(
-      v.union(
-        v.literal("conversation"),
-        v.literal("system"),
-        v.literal("tool"),
-        v.literal("manual"),
-        v.literal("a2a"),
-      ),
-    ),
-    createdBefore: v.optional(v.number()),
-    createdAfter: v.optional(v.number()),
-    updatedBefore: v.optional(v.number()),
-    updatedAfter: v.optional(v.number()),
-    version: v.optional(v.number()),
-    includeSuperseded: v.optional(v.boolean()),
-    validAt: v.optional(v.number()),
-    metadata: v.optional(v.any()),
+    ...listFilterArgs,
     limit: v.optional(v.number()),
     offset: v.optional(v.number()),
     sortBy: v.optional(v.string()),
     sortOrder: v.optional(v.union(v.literal("asc"), v.literal("desc"))),
+    includeEmbedding: v.optional(v.boolean()), // Only semantic dedup needs it
   },
   handler: async (ctx, args) => {
     let facts = await ctx.db
@@ -533,88 +855,7 @@ export const list = query({
       )
       .collect();
 
-    // Filter out superseded by default
-    if (!args.includeSuperseded) {
-      facts = facts.filter((f) => f.supersededBy === undefined);
-    }
-
-    // Tenant isolation filter (apply early for security)
-    if (args.tenantId) {
-      facts = facts.filter((f) => f.tenantId === args.tenantId);
-    }
-
-    // Apply universal filters
-    if (args.factType) {
-      facts = facts.filter((f) => f.factType === args.factType);
-    }
-    if (args.subject !== undefined) {
-      facts = facts.filter((f) => f.subject === args.subject);
-    }
-    if (args.predicate !== undefined) {
-      facts = facts.filter((f) => f.predicate === args.predicate);
-    }
-    if (args.object !== undefined) {
-      facts = facts.filter((f) => f.object === args.object);
-    }
-    if (args.userId !== undefined) {
-      facts = facts.filter((f) => f.userId === args.userId);
-    }
-    if (args.participantId !== undefined) {
-      facts = facts.filter((f) => f.participantId === args.participantId);
-    }
-    if (args.minConfidence !== undefined) {
-      facts = facts.filter((f) => f.confidence >= args.minConfidence!);
-    }
-    if (args.confidence !== undefined) {
-      facts = facts.filter((f) => f.confidence === args.confidence);
-    }
-    if (args.sourceType !== undefined) {
-      facts = facts.filter((f) => f.sourceType === args.sourceType);
-    }
-    if (args.tags && args.tags.length > 0) {
-      if (args.tagMatch === "all") {
-        facts = facts.filter((f) =>
-          args.tags!.every((tag) => f.tags.includes(tag)),
-        );
-      } else {
-        // "any" is default
-        facts = facts.filter((f) =>
-          args.tags!.some((tag) => f.tags.includes(tag)),
-        );
-      }
-    }
-    if (args.createdAfter !== undefined) {
-      facts = facts.filter((f) => f.createdAt >= args.createdAfter!);
-    }
-    if (args.createdBefore !== undefined) {
-      facts = facts.filter((f) => f.createdAt <= args.createdBefore!);
-    }
-    if (args.updatedAfter !== undefined) {
-      facts = facts.filter((f) => f.updatedAt >= args.updatedAfter!);
-    }
-    if (args.updatedBefore !== undefined) {
-      facts = facts.filter((f) => f.updatedAt <= args.updatedBefore!);
-    }
-    if (args.version !== undefined) {
-      facts = facts.filter((f) => f.version === args.version);
-    }
-    if (args.validAt !== undefined) {
-      facts = facts.filter((f) => {
-        const isValid =
-          (!f.validFrom || f.validFrom <= args.validAt!) &&
-          (!f.validUntil || f.validUntil > args.validAt!);
-        return isValid;
-      });
-    }
-    if (args.metadata !== undefined) {
-      facts = facts.filter((f) => {
-        if (!f.metadata) return false;
-        // Match all provided metadata fields
-        return Object.entries(args.metadata as Record<string, any>).every(
-          ([key, value]) => f.metadata[key] === value,
-        );
-      });
-    }
+    facts = applyListFilters(facts, args);
 
     // Apply sorting (safe - only if facts exist and sortBy is valid)
     if (args.sortBy && facts.length > 0) {
@@ -646,10 +887,371 @@ export const list = query({
     facts =
       limit !== undefined ? facts.slice(offset, limit) : facts.slice(offset);
 
+    return args.includeEmbedding ? facts : facts.map(withoutEmbedding);
+  },
+});
+
+/**
+ * List facts in a memory space one page at a time (cursor pagination)
+ *
+ * Pages walk the whole space in stable index order so bulk consumers can
+ * resume from a saved cursor. Takes the same filters as list (superseded
+ * facts are excluded unless includeSuperseded is set); they are applied per
+ * page, so pages may be shorter than numItems.
+ */
+export const listPage = query({
+  args: {
+    memorySpaceId: v.string(),
+    ...listFilterArgs, // createdAfter/createdBefore are inclusive
+    includeEmbedding: v.optional(v.boolean()),
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const result = await ctx.db
+      .query("facts")
+      .withIndex("by_memorySpace_created", (q) => {
+        const space = q.eq("memorySpaceId", args.memorySpaceId);
+        if (args.createdAfter !== undefined && args.createdBefore !== undefined) {
+          return space
+            .gte("createdAt", args.createdAfter)
+            .lte("createdAt", args.createdBefore);
+        }
+        if (args.createdAfter !== undefined) {
+          return space.gte("createdAt", args.createdAfter);
+        }
+        if (args.createdBefore !== undefined) {
+          return space.lte("createdAt", args.createdBefore);
+        }
+        return space;
+      })
+      .paginate(args.paginationOpts);
+
+    const page = applyListFilters(result.page, args);
+
+    return {
+      page: args.includeEmbedding ? page : page.map(withoutEmbedding),
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
+  },
+});
+
+/**
+ * Per-chunk watermarks of one page of a memory space's facts
+ *
+ * Same chunking as memories:chunkDigests; used by graph reconciliation to
+ * find the chunks whose graph copy drifted.
+ */
+export const chunkDigests = query({
+  args: {
+    memorySpaceId: v.string(),
+    tenantId: v.optional(v.string()),
+    includeSuperseded: v.optional(v.boolean()),
+    chunkMs: v.number(),
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const result = await ctx.db
+      .query("facts")
+      .withIndex("by_memorySpace_created", (q) =>
+        q.eq("memorySpaceId", args.memorySpaceId),
+      )
+      .paginate(args.paginationOpts);
+
+    let page = result.page;
+    if (!args.includeSuperseded) {
+      page = page.filter((f) => f.supersededBy === undefined);
+    }
+    if (args.tenantId) {
+      page = page.filter((f) => f.tenantId === args.tenantId);
+    }
+
+    return {
+      page: chunkWatermarks(page, args.chunkMs),
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
+  },
+});
+
+/**
+ * Semantic search over fact embeddings (top-k, filtered, thresholded)
+ *
+ * Used by semantic deduplication and belief revision to get scored
+ * candidates in one call instead of listing facts and embedding them
+ * client-side. Runs as an action because vector search is only available
+ * there; hits are hydrated by getSemanticHits. The user and fact type scope
+ * is applied inside the vector index (factScopeKeys), so other users' facts
+ * never crowd out the top-k. Superseded facts are never returned.
+ */
+export const semanticSearch = action({
+  args: {
+    memorySpaceId: v.string(),
+    embedding: v.array(v.float64()),
+    tenantId: v.optional(v.string()),
+    userId: v.optional(v.string()),
+    factType: v.optional(
+      v.union(
+        v.literal("preference"),
+        v.literal("identity"),
+        v.literal("knowledge"),
+        v.literal("relationship"),
+        v.literal("event"),
+        v.literal("observation"),
+        v.literal("custom"),
+      ),
+    ),
+    minScore: v.optional(v.number()), // Minimum cosine similarity (0-1)
+    limit: v.optional(v.number()),
+  },
+  handler: async (ctx, args): Promise<any[]> => {
+    const limit = Math.min(args.limit || 5, 256);
+    const keys = (args.factType ? [args.factType] : FACT_TYPES).map((factType) =>
+      factScopeKeys({
+        memorySpaceId: args.memorySpaceId,
+        userId: args.userId,
+        factType,
+      }),
+    );
+
+    const hits = (
+      await ctx.vectorSearch("facts", "by_embedding", {
+        vector: args.embedding,
+        limit,
+        filter: (q) =>
+          q.or(
+            ...keys.map((key) =>
+              args.userId !== undefined
+                ? q.eq("scopeKey", key.scopeKey)
+                : q.eq("typeScopeKey", key.typeScopeKey),
+            ),
+          ),
+      })
+    ).filter((hit) => args.minScore === undefined || hit._score >= args.minScore);
+
+    if (hits.length === 0) {
+      return [];
+    }
+
+    const facts: any[] = await ctx.runQuery(internal.facts.getSemanticHits, {
+      ids: hits.map((hit) => hit._id),
+      tenantId: args.tenantId,
+    });
+    const scores = new Map(hits.map((hit) => [hit._id, hit._score]));
+
+    return facts
+      .map((f) => ({ ...f, _score: scores.get(f._id) ?? 0 }))
+      .sort((a, b) => b._score - a._score);
+  },
+});
+
+/**
+ * Load the facts behind vector search hits (semanticSearch helper)
+ *
+ * Scope is already enforced by the vector filter; hits removed between the
+ * search and this query, or outside the caller's tenant, are dropped.
+ */
+export const getSemanticHits = internalQuery({
+  args: {
+    ids: v.array(v.id("facts")),
+    tenantId: v.optional(v.string()),
+  },
+  handler: async (ctx, args) => {
+    const facts = [];
+
+    for (const id of args.ids) {
+      const f = await ctx.db.get(id);
+      if (
+        f &&
+        f.supersededBy === undefined &&
+        (!args.tenantId || f.tenantId === args.tenantId)
+      ) {
+        facts.push(withoutEmbedding(f));
+      }
+    }
+
     return facts;
   },
 });
 
+/**
+ * Attach embeddings to existing facts (backfill for semantic search)
+ */
+export const setEmbeddings = mutation({
+  args: {
+    memorySpaceId: v.string(),
+    items: v.array(
+      v.object({
+        factId: v.string(),
+        embedding: v.array(v.float64()),
+      }),
+    ),
+  },
+  handler: async (ctx, args) => {
+    let updated = 0;
+
+    for (const item of args.items) {
+      const fact = await ctx.db
+        .query("facts")
+        .withIndex("by_factId", (q) => q.eq("factId", item.factId))
+        .first();
+
+      if (!fact || fact.memorySpaceId !== args.memorySpaceId) {
+        continue;
+      }
+
+      await ctx.db.patch(fact._id, {
+        embedding: item.embedding,
+        ...(fact.supersededBy === undefined ? factScopeKeys(fact) : {}),
+      });
+      updated++;
+    }
+
+    return { updated };
+  },
+});
+
+/**
+ * Store vector search scope keys on facts written before they existed
+ *
+ * Facts without keys are invisible to semanticSearch; superseded facts are
+ * skipped since they stay out of scope.
+ */
+export const setScopeKeys = mutation({
+  args: {
+    memorySpaceId: v.string(),
+    factIds: v.array(v.string()),
+  },
+  handler: async (ctx, args) => {
+    let updated = 0;
+
+    for (const factId of args.factIds) {
+      const fact = await ctx.db
+        .query("facts")
+        .withIndex("by_factId", (q) => q.eq("factId", factId))
+        .first();
+
+      if (
+        !fact ||
+        fact.memorySpaceId !== args.memorySpaceId ||
+        fact.supersededBy !== undefined
+      ) {
+        continue;
+      }
+
+      await ctx.db.patch(fact._id, factScopeKeys(fact));
+      updated++;
+    }
+
+    return { updated };
+  },
+});
+
+/**
+ * Current facts occupying a slot (normalized subject + predicate class)
+ */
+export const queryBySlot = query({
+  args: {
+    memorySpaceId: v.string(),
+    normalizedSubject: v.string(),
+    predicateClass: v.string(),
+    userId: v.optional(v.string()),
+    tenantId: v.optional(v.string()),
+    limit: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    let q = ctx.db
+      .query("facts")
+      .withIndex("by_slot", (q) =>
+        q
+          .eq("memorySpaceId", args.memorySpaceId)
+          .eq("normalizedSubject", args.normalizedSubject)
+          .eq("predicateClass", args.predicateClass)
+          .eq("supersededBy", undefined),
+      );
+
+    if (args.userId !== undefined) {
+      q = q.filter((f) => f.eq(f.field("userId"), args.userId));
+    }
+    if (args.tenantId !== undefined) {
+      q = q.filter((f) => f.eq(f.field("tenantId"), args.tenantId));
+    }
+
+    return (await q.take(args.limit ?? 100)).map(withoutEmbedding);
+  },
+});
+
+/**
+ * Whether a memory space still has current facts without slot keys
+ *
+ * Such facts (written before slot keys were stored, not yet backfilled)
+ * are invisible to queryBySlot, so slot matching falls back to a subject
+ * scan while this is true. Facts without subject or predicate never get a
+ * slot key and are ignored.
+ */
+export const hasUnslotted = query({
+  args: {
+    memorySpaceId: v.string(),
+  },
+  handler: async (ctx, args) => {
+    const unslotted = await ctx.db
+      .query("facts")
+      .withIndex("by_slot", (q) =>
+        q
+          .eq("memorySpaceId", args.memorySpaceId)
+          .eq("normalizedSubject", undefined),
+      )
+      .filter((q) =>
+        q.and(
+          q.eq(q.field("supersededBy"), undefined),
+          q.neq(q.field("subject"), undefined),
+          q.neq(q.field("predicate"), undefined),
+        ),
+      )
+      .first();
+
+    return unslotted !== null;
+  },
+});
+
+/**
+ * Attach slot keys to existing facts (backfill for slot lookup)
+ */
+export const setSlots = mutation({
+  args: {
+    memorySpaceId: v.string(),
+    items: v.array(
+      v.object({
+        factId: v.string(),
+        normalizedSubject: v.string(),
+        predicateClass: v.string(),
+      }),
+    ),
+  },
+  handler: async (ctx, args) => {
+    let updated = 0;
+
+    for (const item of args.items) {
+      const fact = await ctx.db
+        .query("facts")
+        .withIndex("by_factId", (q) => q.eq("factId", item.factId))
+        .first();
+
+      if (!fact || fact.memorySpaceId !== args.memorySpaceId) {
+        continue;
+      }
+
+      await ctx.db.patch(fact._id, {
+        normalizedSubject: item.normalizedSubject,
+        predicateClass: item.predicateClass,
+      });
+      updated++;
+    }
+
+    return { updated };
+  },
+});
+
 /**
  * Count facts
  */
@@ -964,7 +1566,7 @@ export const search = query({
         ? filtered.slice(offset, limit)
         : filtered.slice(offset);
 
-    return filtered;
+    return filtered.map(withoutEmbedding);
   },
 });
 
@@ -1022,7 +1624,7 @@ export const getHistory = query({
       }
     }
 
-    return history; // Already in chronological order
+    return history.map(withoutEmbedding); // Already in chronological order
   },
 });
 
@@ -1189,7 +1791,7 @@ export const queryBySubject = query({
     facts =
       limit !== undefined ? facts.slice(offset, limit) : facts.slice(offset);
 
-    return facts;
+    return facts.map(withoutEmbedding);
   },
 });
 
@@ -1353,7 +1955,7 @@ export const queryByRelationship = query({
     facts =
       limit !== undefined ? facts.slice(offset, limit) : facts.slice(offset);
 
-    return facts;
+    return facts.map(withoutEmbedding);
   },
 });
 
@@ -1396,7 +1998,7 @@ export const exportFacts = query({
     if (args.format === "json") {
       return {
         format: "json",
-        data: JSON.stringify(facts, null, 2),
+        data: JSON.stringify(facts.map(withoutEmbedding), null, 2),
         count: facts.length,
         exportedAt,
       };
@@ -1499,6 +2101,7 @@ export const consolidate = mutation({
         await ctx.db.patch(fact._id, {
           supersededBy: args.keepFactId,
           validUntil: now,
+          ...NO_SCOPE_KEYS,
         });
       }
     }
@@ -1593,7 +2196,7 @@ export const findByStructure = query({
 
     // Apply limit
     const limit = args.limit ?? 10;
-    return facts.slice(0, limit);
+    return facts.slice(0, limit).map(withoutEmbedding);
   },
 });
 
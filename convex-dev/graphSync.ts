@@ -8,6 +8,61 @@
 import { v } from "convex/values";
 import { mutation, query } from "./_generated/server";
 
+// ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+// Reconciliation Helpers
+// ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+/**
+ * Watermarks of one chunk of entities (bucketed by createdAt)
+ *
+ * The graph computes the same values from its nodes, so a chunk whose
+ * watermarks match on both sides does not need to be compared entity by
+ * entity.
+ */
+export interface ChunkWatermark {
+  chunk: number; // floor(createdAt / chunkMs)
+  count: number;
+  maxUpdatedAt: number;
+  updatedOffsetSum: number; // Sum of (updatedAt - createdAt)
+  versionSum: number;
+  createdOffsetSum: number; // Sum of (createdAt - chunk start), exact in float64
+}
+
+/**
+ * Aggregate entities into per-chunk watermarks
+ */
+export function chunkWatermarks(
+  entities: {
+    createdAt: number;
+    updatedAt?: number;
+    version?: number;
+  }[],
+  chunkMs: number,
+): ChunkWatermark[] {
+  const chunks = new Map<number, ChunkWatermark>();
+
+  for (const entity of entities) {
+    const chunk = Math.floor(entity.createdAt / chunkMs);
+    const entry = chunks.get(chunk) ?? {
+      chunk,
+      count: 0,
+      maxUpdatedAt: 0,
+      updatedOffsetSum: 0,
+      versionSum: 0,
+      createdOffsetSum: 0,
+    };
+    entry.count += 1;
+    const updatedAt = entity.updatedAt ?? entity.createdAt;
+    entry.maxUpdatedAt = Math.max(entry.maxUpdatedAt, updatedAt);
+    entry.updatedOffsetSum += updatedAt - entity.createdAt;
+    entry.versionSum += entity.version ?? 1;
+    entry.createdOffsetSum += entity.createdAt - chunk * chunkMs;
+    chunks.set(chunk, entry);
+  }
+
+  return [...chunks.values()];
+}
+
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 // Mutations (Write Operations)
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -5,8 +5,10 @@
  * Types: kb-article, policy, audit-log, feedback, user, etc.
  */
 
-import { ConvexError, v } from "convex/values";
-import { mutation, query } from "./_generated/server";
+import { paginationOptsValidator } from "convex/server";
+import { ConvexError, ObjectType, v } from "convex/values";
+import { Doc } from "./_generated/dataModel";
+import { mutation, query, QueryCtx } from "./_generated/server";
 
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 // Mutations (Write Operations)
@@ -315,64 +317,89 @@ export const getHistory = query({
   },
 });
 
+/**
+ * Filters shared by list and listPage (everything but paging and sorting)
+ */
+const listFilterArgs = {
+  type: v.optional(v.string()),
+  userId: v.optional(v.string()),
+  tenantId: v.optional(v.string()), // Multi-tenancy: SaaS platform isolation
+  createdAfter: v.optional(v.number()),
+  createdBefore: v.optional(v.number()),
+  updatedAfter: v.optional(v.number()),
+  updatedBefore: v.optional(v.number()),
+};
+
+type ListFilterArgs = ObjectType<typeof listFilterArgs>;
+
+/**
+ * Query on the index matching the primary filter
+ */
+function listIndexQuery(ctx: QueryCtx, args: ListFilterArgs) {
+  if (args.type) {
+    return ctx.db
+      .query("immutable")
+      .withIndex("by_type", (q) => q.eq("type", args.type!));
+  }
+  if (args.userId) {
+    return ctx.db
+      .query("immutable")
+      .withIndex("by_userId", (q) => q.eq("userId", args.userId));
+  }
+  return ctx.db.query("immutable");
+}
+
+/**
+ * Post-filters the chosen index does not cover
+ */
+function applyListFilters(
+  entries: Doc<"immutable">[],
+  args: ListFilterArgs,
+): Doc<"immutable">[] {
+  // Tenant isolation filter (apply early for efficiency)
+  if (args.tenantId) {
+    entries = entries.filter((e) => e.tenantId === args.tenantId);
+  }
+
+  // Post-filter by userId if both type and userId specified
+  if (args.userId && args.type) {
+    entries = entries.filter((e) => e.userId === args.userId);
+  }
+
+  // Apply date filters
+  if (args.createdAfter !== undefined) {
+    entries = entries.filter((e) => e.createdAt > args.createdAfter!);
+  }
+  if (args.createdBefore !== undefined) {
+    entries = entries.filter((e) => e.createdAt < args.createdBefore!);
+  }
+  if (args.updatedAfter !== undefined) {
+    entries = entries.filter((e) => e.updatedAt > args.updatedAfter!);
+  }
+  if (args.updatedBefore !== undefined) {
+    entries = entries.filter((e) => e.updatedAt < args.updatedBefore!);
+  }
+
+  return entries;
+}
+
 /**
  * List immutable entries with filters, sorting, and pagination
  */
 export const list = query({
   args: {
-    type: v.optional(v.string()),
-    userId: v.optional(v.string()),
-    tenantId: v.optional(v.string()), // Multi-tenancy: SaaS platform isolation
+    ...listFilterArgs,
     limit: v.optional(v.number()),
     offset: v.optional(v.number()),
-    createdAfter: v.optional(v.number()),
-    createdBefore: v.optional(v.number()),
-    updatedAfter: v.optional(v.number()),
-    updatedBefore: v.optional(v.number()),
     sortBy: v.optional(v.string()),
     sortOrder: v.optional(v.string()),
   },
   handler: async (ctx, args) => {
     // Collect all entries matching the primary filter first
-    let entries;
-
-    if (args.type) {
-      entries = await ctx.db
-        .query("immutable")
-        .withIndex("by_type", (q) => q.eq("type", args.type!))
-        .collect();
-    } else if (args.userId) {
-      entries = await ctx.db
-        .query("immutable")
-        .withIndex("by_userId", (q) => q.eq("userId", args.userId))
-        .collect();
-    } else {
-      entries = await ctx.db.query("immutable").collect();
-    }
-
-    // Tenant isolation filter (apply early for efficiency)
-    if (args.tenantId) {
-      entries = entries.filter((e) => e.tenantId === args.tenantId);
-    }
-
-    // Post-filter by userId if both type and userId specified
-    if (args.userId && args.type) {
-      entries = entries.filter((e) => e.userId === args.userId);
-    }
-
-    // Apply date filters
-    if (args.createdAfter !== undefined) {
-      entries = entries.filter((e) => e.createdAt > args.createdAfter!);
-    }
-    if (args.createdBefore !== undefined) {
-      entries = entries.filter((e) => e.createdAt < args.createdBefore!);
-    }
-    if (args.updatedAfter !== undefined) {
-      entries = entries.filter((e) => e.updatedAt > args.updatedAfter!);
-    }
-    if (args.updatedBefore !== undefined) {
-      entries = entries.filter((e) => e.updatedAt < args.updatedBefore!);
-    }
+    let entries = applyListFilters(
+      await listIndexQuery(ctx, args).collect(),
+      args,
+    );
 
     // Sort entries
     const sortBy = args.sortBy || "createdAt";
@@ -412,6 +439,30 @@ export const list = query({
   },
 });
 
+/**
+ * List immutable entries one page at a time (cursor pagination)
+ *
+ * Takes the same filters as list, applied per page (pages may be shorter
+ * than numItems), so bulk consumers can walk every matching entry.
+ */
+export const listPage = query({
+  args: {
+    ...listFilterArgs,
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const result = await listIndexQuery(ctx, args).paginate(
+      args.paginationOpts,
+    );
+
+    return {
+      page: applyListFilters(result.page, args),
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
+  },
+});
+
 /**
  * Search immutable entries by text query
  */
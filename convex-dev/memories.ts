@@ -5,8 +5,32 @@
  * References Layer 1 stores for full context
  */
 
+import { paginationOptsValidator } from "convex/server";
 import { ConvexError, v } from "convex/values";
 import { mutation, query } from "./_generated/server";
+import { chunkWatermarks } from "./graphSync";
+
+// ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+// Partial Content Checksums
+// ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+const FNV_OFFSET_BASIS = 0x811c9dc5;
+const FNV_PRIME = 0x01000193;
+
+/**
+ * Extend a 32-bit FNV-1a checksum over the UTF-16 code units of `text`
+ *
+ * Extending the checksum of a prefix with a suffix gives the checksum of the
+ * whole string, so appends only hash the new text. Must match
+ * content_checksum() in the Python SDK.
+ */
+function extendChecksum(checksum: number, text: string): number {
+  let hash = checksum;
+  for (let i = 0; i < text.length; i++) {
+    hash = Math.imul(hash ^ text.charCodeAt(i), FNV_PRIME) >>> 0;
+  }
+  return hash;
+}
 
 // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 // Mutations (Write Operations)
@@ -164,7 +188,7 @@ export const storePartialMemory = mutation({
 
 /**
  * Update a partial memory (for streaming)
- * Updates content and metadata during streaming
+ * Rewrites the full content and metadata during streaming
  */
 export const updatePartialMemory = mutation({
   args: {
@@ -182,19 +206,77 @@ export const updatePartialMemory = mutation({
       throw new ConvexError("MEMORY_NOT_FOUND");
     }
 
+    const checksum = extendChecksum(FNV_OFFSET_BASIS, args.content);
+
     await ctx.db.patch(memory._id, {
       content: args.content,
       updatedAt: Date.now(),
       partialMetadata: args.metadata,
+      partialChecksum: checksum,
+    });
+
+    return { success: true, contentLength: args.content.length, checksum };
+  },
+});
+
+/**
+ * Append to a partial memory (for streaming)
+ *
+ * Sends only the text streamed since the last update. The append is applied
+ * only if the stored content is still exactly what the client last wrote:
+ * its length must equal `offset` and its checksum `baseChecksum`. Otherwise
+ * nothing is written and `applied: false` tells the client to fall back to
+ * a full rewrite with updatePartialMemory.
+ */
+export const appendPartialMemory = mutation({
+  args: {
+    memoryId: v.string(),
+    offset: v.number(), // Stored content length (UTF-16 code units) the delta follows
+    baseChecksum: v.number(),
+    delta: v.string(),
+    metadata: v.any(),
+  },
+  handler: async (ctx, args) => {
+    const memory = await ctx.db
+      .query("memories")
+      .withIndex("by_memoryId", (q) => q.eq("memoryId", args.memoryId))
+      .first();
+
+    if (!memory) {
+      throw new ConvexError("MEMORY_NOT_FOUND");
+    }
+
+    if (
+      !memory.isPartial ||
+      memory.content.length !== args.offset ||
+      memory.partialChecksum !== args.baseChecksum
+    ) {
+      return {
+        applied: false,
+        contentLength: memory.content.length,
+        checksum: memory.partialChecksum,
+      };
+    }
+
+    const checksum = extendChecksum(args.baseChecksum, args.delta);
+    const content = memory.content + args.delta;
+
+    await ctx.db.patch(memory._id, {
+      content,
+      updatedAt: Date.now(),
+      partialMetadata: args.metadata,
+      partialChecksum: checksum,
     });
 
-    return { success: true };
+    return { applied: true, contentLength: content.length, checksum };
   },
 });
 
 /**
  * Finalize a partial memory (for streaming)
- * Marks memory as complete and removes partial flag
+ * Marks memory as complete and removes partial flag. When the conversation
+ * messages and ownership are passed, the partial memory is promoted in place
+ * to the agent's conversation memory and returned.
  */
 export const finalizePartialMemory = mutation({
   args: {
@@ -202,6 +284,14 @@ export const finalizePartialMemory = mutation({
     content: v.string(),
     embedding: v.optional(v.array(v.float64())),
     metadata: v.any(),
+    // Promotion to the final conversation memory (all optional)
+    messageIds: v.optional(v.array(v.string())),
+    agentId: v.optional(v.string()),
+    sourceUserId: v.optional(v.string()),
+    sourceUserName: v.optional(v.string()),
+    messageRole: v.optional(
+      v.union(v.literal("user"), v.literal("agent"), v.literal("system")),
+    ),
   },
   handler: async (ctx, args) => {
     const memory = await ctx.db
@@ -225,9 +315,40 @@ export const finalizePartialMemory = mutation({
       isPartial: false,
       tags: finalTags,
       partialMetadata: args.metadata,
+      partialChecksum: undefined,
+      ...(args.messageIds !== undefined && memory.conversationRef
+        ? {
+            conversationRef: {
+              conversationId: memory.conversationRef.conversationId,
+              messageIds: args.messageIds,
+            },
+          }
+        : {}),
+      ...(args.agentId !== undefined ? { agentId: args.agentId } : {}),
+      ...(args.sourceUserId !== undefined
+        ? { sourceUserId: args.sourceUserId }
+        : {}),
+      ...(args.sourceUserName !== undefined
+        ? { sourceUserName: args.sourceUserName }
+        : {}),
+      ...(args.messageRole !== undefined
+        ? { messageRole: args.messageRole }
+        : {}),
     });
 
-    return { success: true };
+    // Return the final memory without the streaming bookkeeping fields
+    const finalized = await ctx.db.get(memory._id);
+    if (!finalized) {
+      throw new ConvexError("MEMORY_NOT_FOUND");
+    }
+    const {
+      isPartial: _isPartial,
+      partialMetadata: _partialMetadata,
+      partialChecksum: _partialChecksum,
+      ...finalMemory
+    } = finalized;
+
+    return { success: true, memory: finalMemory };
   },
 });
 
@@ -527,6 +648,104 @@ export const list = query({
   },
 });
 
+/**
+ * List memories in a memory space one page at a time (cursor pagination)
+ *
+ * Unlike list(), pages walk the whole space in stable index order, so bulk
+ * consumers (graph sync, exports) can resume from a saved cursor.
+ */
+export const listPage = query({
+  args: {
+    memorySpaceId: v.string(),
+    tenantId: v.optional(v.string()),
+    userId: v.optional(v.string()),
+    participantId: v.optional(v.string()),
+    sourceType: v.optional(
+      v.union(
+        v.literal("conversation"),
+        v.literal("system"),
+        v.literal("tool"),
+        v.literal("a2a"),
+        v.literal("fact-extraction"),
+      ),
+    ),
+    createdAfter: v.optional(v.number()), // Inclusive
+    createdBefore: v.optional(v.number()), // Inclusive
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const result = await ctx.db
+      .query("memories")
+      .withIndex("by_memorySpace_created", (q) => {
+        const space = q.eq("memorySpaceId", args.memorySpaceId);
+        if (args.createdAfter !== undefined && args.createdBefore !== undefined) {
+          return space
+            .gte("createdAt", args.createdAfter)
+            .lte("createdAt", args.createdBefore);
+        }
+        if (args.createdAfter !== undefined) {
+          return space.gte("createdAt", args.createdAfter);
+        }
+        if (args.createdBefore !== undefined) {
+          return space.lte("createdAt", args.createdBefore);
+        }
+        return space;
+      })
+      .paginate(args.paginationOpts);
+
+    // Filters apply per page, so pages may be shorter than numItems
+    const page = result.page.filter(
+      (m) =>
+        (!args.tenantId || m.tenantId === args.tenantId) &&
+        (!args.userId || m.userId === args.userId) &&
+        (!args.participantId || m.participantId === args.participantId) &&
+        (!args.sourceType || m.sourceType === args.sourceType),
+    );
+
+    return {
+      page,
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
+  },
+});
+
+/**
+ * Per-chunk watermarks of one page of a memory space (graph reconciliation)
+ *
+ * Memories are bucketed by createdAt into chunks of `chunkMs`. Each chunk
+ * reports its count, newest updatedAt and timestamp/version sums, which is
+ * enough to tell whether the graph copy of the chunk drifted without
+ * transferring the memories themselves. Pages of the same chunk are merged
+ * by the caller.
+ */
+export const chunkDigests = query({
+  args: {
+    memorySpaceId: v.string(),
+    tenantId: v.optional(v.string()),
+    chunkMs: v.number(),
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const result = await ctx.db
+      .query("memories")
+      .withIndex("by_memorySpace_created", (q) =>
+        q.eq("memorySpaceId", args.memorySpaceId),
+      )
+      .paginate(args.paginationOpts);
+
+    const page = args.tenantId
+      ? result.page.filter((m) => m.tenantId === args.tenantId)
+      : result.page;
+
+    return {
+      page: chunkWatermarks(page, args.chunkMs),
+      isDone: result.isDone,
+      continueCursor: result.continueCursor,
+    };
+  },
+});
+
 /**
  * Count memories
  */
@@ -275,6 +275,7 @@ export default defineSchema({
     // Streaming support (NEW - for progressive storage)
     isPartial: v.optional(v.boolean()), // Flag for in-progress streaming memories
     partialMetadata: v.optional(v.any()), // Metadata for partial/streaming memories
+    partialChecksum: v.optional(v.number()), // FNV-1a of partial content, for delta appends
   })
     .index("by_memorySpace", ["memorySpaceId"]) // NEW: Memory space's memories
     .index("by_memoryId", ["memoryId"]) // Unique lookup
@@ -389,6 +390,17 @@ export default defineSchema({
     validFrom: v.optional(v.number()),
     validUntil: v.optional(v.number()),
 
+    // Semantic matching (dedup / belief revision candidates)
+    embedding: v.optional(v.array(v.float64())),
+
+    // Slot key (belief revision): normalized subject + predicate class
+    normalizedSubject: v.optional(v.string()),
+    predicateClass: v.optional(v.string()),
+
+    // Vector search scope (current facts only, see facts.ts factScopeKeys)
+    scopeKey: v.optional(v.string()), // memorySpaceId|userId|factType
+    typeScopeKey: v.optional(v.string()), // memorySpaceId|factType
+
     // Versioning (creates immutable chain)
     version: v.number(),
     supersededBy: v.optional(v.string()), // factId of newer version
@@ -400,14 +412,26 @@ export default defineSchema({
   })
     .index("by_factId", ["factId"]) // Unique lookup
     .index("by_memorySpace", ["memorySpaceId"]) // Memory space's facts
+    .index("by_memorySpace_created", ["memorySpaceId", "createdAt"]) // Chronological chunks
     .index("by_tenantId", ["tenantId"]) // Tenant's facts
     .index("by_tenant_space", ["tenantId", "memorySpaceId"]) // Tenant + space
     .index("by_memorySpace_subject", ["memorySpaceId", "subject"]) // Entity-centric queries
     .index("by_participantId", ["participantId"]) // Hive Mode tracking
     .index("by_userId", ["userId"]) // GDPR cascade
+    .index("by_slot", [
+      "memorySpaceId",
+      "normalizedSubject",
+      "predicateClass",
+      "supersededBy",
+    ]) // Slot conflict lookup (current facts only)
     .searchIndex("by_content", {
       searchField: "fact",
       filterFields: ["memorySpaceId", "tenantId", "factType"],
+    })
+    .vectorIndex("by_embedding", {
+      vectorField: "embedding",
+      dimensions: 1536, // Default: OpenAI text-embedding-3-small
+      filterFields: ["scopeKey", "typeScopeKey"],
     }),
 
   // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -453,6 +477,9 @@ export default defineSchema({
     participantId: v.optional(v.string()), // Participant who triggered
     conversationId: v.optional(v.string()), // Conversation context
 
+    // Compaction
+    compacted: v.optional(v.number()), // Intermediate UPDATE events folded into this one
+
     // Timestamps
     timestamp: v.number(),
   })
@@ -464,6 +491,27 @@ export default defineSchema({
     .index("by_userId", ["userId"]) // GDPR cascade
     .index("by_timestamp", ["timestamp"]), // Chronological
 
+  // Per-space, per-day action counts, maintained as history events are logged
+  factHistoryRollups: defineTable({
+    memorySpaceId: v.string(),
+    day: v.number(), // Start of the UTC day (ms)
+    shard: v.number(), // Spreads concurrent writes; reads sum a day's shards
+    actionCounts: v.object({
+      CREATE: v.number(),
+      UPDATE: v.number(),
+      SUPERSEDE: v.number(),
+      DELETE: v.number(),
+    }),
+    totalEvents: v.number(),
+    updatedAt: v.number(),
+  }).index("by_memorySpace_day", ["memorySpaceId", "day", "shard"]),
+
+  // Where each space's rollups start covering every event (older: raw only)
+  factHistoryRollupMarkers: defineTable({
+    memorySpaceId: v.string(),
+    validSince: v.number(), // Timestamp (ms); 0 once fully rebuilt
+  }).index("by_memorySpace", ["memorySpaceId"]),
+
   // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
   // Memory Spaces Registry (Hive/Collaboration Mode Management)
   // ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -53,6 +53,8 @@ from .facts import (
     DeduplicationConfig,
     DeduplicationStrategy,
     DuplicateResult,
+    EmbeddingCache,
+    EmbeddingCacheStats,
     FactCandidate,
     FactDeduplicationService,
     StoreFactWithDedupOptions,
@@ -98,9 +100,11 @@ from .types import (
     AuthContext,
     AuthContextParams,
     AuthMethod,
+    BatchSyncCheckpoint,
     BatchSyncError,
     BatchSyncLimits,
     BatchSyncOptions,
+    BatchSyncProgress,
     BatchSyncResult,
     BatchSyncStats,
     # Governance
@@ -182,6 +186,9 @@ from .types import (
     GraphPath,
     GraphQuery,
     GraphQueryResult,
+    GraphReconcileOptions,
+    GraphReconcileResult,
+    GraphReconcileSpaceReport,
     GraphSyncWorkerOptions,
     ImmutableEntry,
     ImmutablePolicy,
@@ -202,7 +209,9 @@ from .types import (
     ListConversationsFilter,
     ListConversationsResult,
     ListFactsFilter,
+    ListFactsPageResult,
     ListImmutableFilter,
+    ListMemoriesPageResult,
     ListMemorySpacesFilter,
     ListMemorySpacesResult,
     ListMutableFilter,
@@ -411,6 +420,7 @@ __all__ = [
     "MutableRef",
     "StoreMemoryInput",
     "SearchOptions",
+    "ListMemoriesPageResult",
     # Layer 3 Types
     "FactRecord",
     "StoreFactParams",
@@ -419,6 +429,7 @@ __all__ = [
     "CountFactsFilter",
     "DeleteManyFactsParams",
     "ListFactsFilter",
+    "ListFactsPageResult",
     "QueryByRelationshipFilter",
     "QueryBySubjectFilter",
     "SearchFactsOptions",
@@ -426,6 +437,8 @@ __all__ = [
     "DeduplicationConfig",
     "DeduplicationStrategy",
     "DuplicateResult",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
     "FactCandidate",
     "FactDeduplicationService",
     "StoreFactWithDedupOptions",
@@ -561,6 +574,11 @@ __all__ = [
     "BatchSyncStats",
     "BatchSyncError",
     "BatchSyncResult",
+    "BatchSyncProgress",
+    "BatchSyncCheckpoint",
+    "GraphReconcileOptions",
+    "GraphReconcileSpaceReport",
+    "GraphReconcileResult",
     "SchemaVerificationResult",
     # Errors
     "CortexError",
@@ -0,0 +1,67 @@
+"""
+Cursor pagination helpers for Cortex SDK
+
+Turns a Convex ``listPage``-style query into an async iterator that holds at
+most two pages in memory: the page being consumed and the next one, which is
+prefetched while the caller processes the current page.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[Optional[str]], Awaitable[Dict[str, Any]]]
+
+
+async def iterate_pages(
+    fetch_page: PageFetcher,
+    convert: Callable[[Dict[str, Any]], T],
+    limit: Optional[int] = None,
+) -> AsyncIterator[T]:
+    """
+    Iterate over every item of a cursor-paginated query.
+
+    Args:
+        fetch_page: Fetches the raw page for a cursor (None for the first
+            page) and returns ``{"page", "continueCursor", "isDone"}``
+        convert: Converts one raw item
+        limit: Stop after this many items (None for all)
+
+    Yields:
+        Converted items in page order
+
+    Example:
+        >>> async for fact in iterate_pages(fetch, to_fact_record):
+        ...     process(fact)
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    yielded = 0
+    pending: Optional["asyncio.Future[Dict[str, Any]]"] = asyncio.ensure_future(fetch_page(None))
+
+    try:
+        while pending is not None:
+            result = await pending
+            pending = None
+
+            # Prefetch the next page while the caller works through this one
+            cursor = result.get("continueCursor")
+            if not result.get("isDone", True) and cursor:
+                pending = asyncio.ensure_future(fetch_page(cursor))
+
+            for raw in result.get("page", []):
+                yield convert(raw)
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+    finally:
+        if pending is not None:
+            if pending.done():
+                # Retrieve the exception so it is not logged as unhandled
+                if not pending.cancelled():
+                    pending.exception()
+            else:
+                pending.cancel()
+
@@ -46,6 +46,27 @@ def camel_to_snake(name: str) -> str:
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
 
+def snake_to_camel(name: str) -> str:
+    """
+    Convert snake_case to camelCase.
+
+    Leading underscores (e.g. ``_id``) are preserved.
+
+    Args:
+        name: snake_case string
+
+    Returns:
+        camelCase string
+
+    Example:
+        >>> snake_to_camel("memory_space_id")
+        "memorySpaceId"
+    """
+    prefix = name[: len(name) - len(name.lstrip("_"))]
+    head, *rest = name.lstrip("_").split("_")
+    return prefix + head + "".join(part.capitalize() for part in rest)
+
+
 def convert_convex_response(data: Any) -> Any:
     """
     Convert Convex response to Python-friendly format.
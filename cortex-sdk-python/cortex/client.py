@@ -16,7 +16,7 @@ from .a2a import A2AAPI
 from .agents import AgentsAPI
 from .contexts import ContextsAPI
 from .conversations import ConversationsAPI
-from .facts import FactsAPI
+from .facts import EmbeddingCache, FactsAPI
 from .governance import GovernanceAPI
 from .immutable import ImmutableAPI
 from .memory import MemoryAPI
@@ -270,12 +270,15 @@ class Cortex:
         self.vector = VectorAPI(
             self.client, self.graph_adapter, self._resilience, self._auth_context
         )
+        # One embedding cache for every fact service (dedup, belief revision)
+        self._embedding_cache = EmbeddingCache()
         self.facts = FactsAPI(
-            self.client, self.graph_adapter, self._resilience, self._auth_context
+            self.client, self.graph_adapter, self._resilience, self._auth_context,
+            embedding_cache=self._embedding_cache,
         )
         self.memory = MemoryAPI(
             self.client, self.graph_adapter, self._resilience, self._llm_config,
-            self._auth_context
+            self._auth_context, embedding_cache=self._embedding_cache,
         )
         self.contexts = ContextsAPI(
             self.client, self.graph_adapter, self._resilience, self._auth_context
@@ -4,8 +4,9 @@ Cortex SDK - Contexts API
 Coordination Layer: Context chain management for multi-agent workflow coordination
 """
 
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, cast
 
+from .._pagination import iterate_pages
 from .._utils import convert_convex_response, filter_none_values
 from ..errors import CortexError, ErrorCode  # noqa: F401
 from ..types import (
@@ -78,6 +79,29 @@ class ContextsAPI:
         """Get tenant_id from auth context (for multi-tenancy)."""
         return self._auth_context.tenant_id if self._auth_context else None
 
+    @staticmethod
+    def _context_from_raw(ctx: Any) -> Context:
+        """Construct a Context from a raw Convex record."""
+        return Context(
+            id=ctx.get("contextId"),
+            memory_space_id=ctx.get("memorySpaceId"),
+            purpose=ctx.get("purpose"),
+            status=ctx.get("status"),
+            depth=ctx.get("depth", 0),
+            child_ids=ctx.get("childIds", []),
+            participants=ctx.get("participants", []),
+            data=ctx.get("data", {}),
+            created_at=ctx.get("createdAt"),
+            updated_at=ctx.get("updatedAt"),
+            version=ctx.get("version", 1),
+            root_id=ctx.get("rootId"),
+            parent_id=ctx.get("parentId"),
+            user_id=ctx.get("userId"),
+            conversation_ref=ctx.get("conversationRef"),
+            completed_at=ctx.get("completedAt"),
+            granted_access=ctx.get("grantedAccess"),
+        )
+
     async def create(
         self, params: ContextInput, options: Optional[CreateContextOptions] = None
     ) -> Context:
@@ -505,29 +529,7 @@ class ContextsAPI:
         else:
             contexts_list = result.get("contexts", [])
 
-        # Manually construct contexts
-        contexts = [
-            Context(
-                id=ctx.get("contextId"),
-                memory_space_id=ctx.get("memorySpaceId"),
-                purpose=ctx.get("purpose"),
-                status=ctx.get("status"),
-                depth=ctx.get("depth", 0),
-                child_ids=ctx.get("childIds", []),
-                participants=ctx.get("participants", []),
-                data=ctx.get("data", {}),
-                created_at=ctx.get("createdAt"),
-                updated_at=ctx.get("updatedAt"),
-                version=ctx.get("version", 1),
-                root_id=ctx.get("rootId"),
-                parent_id=ctx.get("parentId"),
-                user_id=ctx.get("userId"),
-                conversation_ref=ctx.get("conversationRef"),
-                completed_at=ctx.get("completedAt"),
-                granted_access=ctx.get("grantedAccess"),
-            )
-            for ctx in contexts_list
-        ]
+        contexts = [self._context_from_raw(ctx) for ctx in contexts_list]
 
         # Return in expected format
         if isinstance(result, list):
@@ -536,6 +538,73 @@ class ContextsAPI:
             result["contexts"] = contexts
             return cast(Dict[str, Any], result)
 
+    def iter(
+        self,
+        memory_space_id: Optional[str] = None,
+        status: Optional[ContextStatus] = None,
+        user_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        root_id: Optional[str] = None,
+        page_size: int = 500,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Context]:
+        """
+        Iterate over every matching context using cursor pagination.
+
+        The next page is fetched while the caller processes the current one,
+        so at most two pages are held in memory however many contexts match.
+
+        Args:
+            memory_space_id: Filter by memory space
+            status: Filter by status
+            user_id: Filter by user ID
+            parent_id: Filter by parent context
+            root_id: Filter by root context
+            page_size: Maximum contexts scanned per page
+            limit: Stop after this many contexts
+
+        Returns:
+            Async iterator of contexts
+
+        Example:
+            >>> async for context in cortex.contexts.iter(memory_space_id='space-1'):
+            ...     process(context)
+        """
+        if memory_space_id is not None:
+            validate_required_string(memory_space_id, "memory_space_id")
+
+        if status is not None:
+            validate_status(status)
+
+        validate_limit(page_size, "page_size")
+
+        if limit is not None and limit < 0:
+            raise ContextsValidationError(
+                f"limit must be >= 0, got {limit}",
+                "INVALID_RANGE",
+                "limit",
+            )
+
+        args = filter_none_values({
+            "memorySpaceId": memory_space_id,
+            "tenantId": self._tenant_id,
+            "status": status,
+            "userId": user_id,
+            "parentId": parent_id,
+            "rootId": root_id,
+        })
+
+        async def fetch_page(cursor: Optional[str]) -> Any:
+            return await self._execute_with_resilience(
+                lambda: self.client.query(
+                    "contexts:listPage",
+                    {**args, "paginationOpts": {"numItems": page_size, "cursor": cursor}},
+                ),
+                "contexts:listPage",
+            )
+
+        return iterate_pages(fetch_page, self._context_from_raw, limit=limit)
+
     async def count(
         self,
         memory_space_id: Optional[str] = None,
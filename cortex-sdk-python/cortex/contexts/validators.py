@@ -202,35 +202,36 @@ def validate_depth(depth: int) -> None:
         )
 
 
-def validate_limit(limit: int) -> None:
+def validate_limit(limit: int, field_name: str = "limit") -> None:
     """
     Validates limit value (must be > 0 and <= 1000).
 
     Args:
         limit: Limit value to validate
+        field_name: Name of the field being validated
 
     Raises:
         ContextsValidationError: If limit is invalid
     """
     if not isinstance(limit, (int, float)):
         raise ContextsValidationError(
-            "limit must be a number",
+            f"{field_name} must be a number",
             "INVALID_RANGE",
-            "limit",
+            field_name,
         )
 
     if limit <= 0:
         raise ContextsValidationError(
-            f"limit must be > 0, got {limit}",
+            f"{field_name} must be > 0, got {limit}",
             "INVALID_RANGE",
-            "limit",
+            field_name,
         )
 
     if limit > 1000:
         raise ContextsValidationError(
-            f"limit must be <= 1000, got {limit}",
+            f"{field_name} must be <= 1000, got {limit}",
             "INVALID_RANGE",
-            "limit",
+            field_name,
         )
 
 
@@ -7,8 +7,9 @@ Layer 1a: ACID-compliant immutable conversation storage
 import random
 import string
 import time
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 
+from .._pagination import iterate_pages
 from .._utils import convert_convex_response, filter_none_values
 from ..errors import CortexError, ErrorCode  # noqa: F401
 from ..types import (
@@ -304,6 +305,47 @@ class ConversationsAPI:
 
         return Conversation(**convert_convex_response(result))
 
+    def _validate_list_filter(self, filter: Optional[ListConversationsFilter]) -> None:
+        """Validate the filter shared by list() and iter()."""
+        # All fields optional, validate only if provided
+        if filter and filter.type is not None:
+            validate_conversation_type(filter.type)
+        if filter and filter.limit is not None:
+            validate_limit(filter.limit)
+        if filter and filter.offset is not None:
+            validate_offset(filter.offset)
+        if filter and filter.sort_order is not None:
+            validate_sort_order(filter.sort_order)
+
+    def _list_filter_args(self, filter: Optional[ListConversationsFilter]) -> Dict[str, Any]:
+        """Convex arguments for a list filter, without paging and sorting."""
+        # Handle message_count filter
+        message_count_min: Optional[int] = None
+        message_count_max: Optional[int] = None
+        if filter:
+            if filter.message_count is not None:
+                message_count_min = filter.message_count
+                message_count_max = filter.message_count
+            else:
+                message_count_min = filter.message_count_min
+                message_count_max = filter.message_count_max
+
+        return {
+            "tenantId": self._tenant_id,  # Multi-tenancy support
+            "type": filter.type if filter else None,
+            "userId": filter.user_id if filter else None,
+            "memorySpaceId": filter.memory_space_id if filter else None,
+            "participantId": filter.participant_id if filter else None,
+            "createdBefore": filter.created_before if filter else None,
+            "createdAfter": filter.created_after if filter else None,
+            "updatedBefore": filter.updated_before if filter else None,
+            "updatedAfter": filter.updated_after if filter else None,
+            "lastMessageBefore": filter.last_message_before if filter else None,
+            "lastMessageAfter": filter.last_message_after if filter else None,
+            "messageCountMin": message_count_min,
+            "messageCountMax": message_count_max,
+        }
+
     async def list(
         self,
         filter: Optional[ListConversationsFilter] = None,
@@ -363,44 +405,13 @@ class ConversationsAPI:
                 offset=offset,
             )
 
-        # All fields optional, validate only if provided
-        if filter and filter.type is not None:
-            validate_conversation_type(filter.type)
-        if filter and filter.limit is not None:
-            validate_limit(filter.limit)
-        if filter and filter.offset is not None:
-            validate_offset(filter.offset)
-        if filter and filter.sort_order is not None:
-            validate_sort_order(filter.sort_order)
-
-        # Handle message_count filter
-        message_count_min: Optional[int] = None
-        message_count_max: Optional[int] = None
-        if filter:
-            if filter.message_count is not None:
-                message_count_min = filter.message_count
-                message_count_max = filter.message_count
-            else:
-                message_count_min = filter.message_count_min
-                message_count_max = filter.message_count_max
+        self._validate_list_filter(filter)
 
         result = await self._execute_with_resilience(
             lambda: self.client.query(
                 "conversations:list",
                 filter_none_values({
-                    "tenantId": self._tenant_id,  # Multi-tenancy support
-                    "type": filter.type if filter else None,
-                    "userId": filter.user_id if filter else None,
-                    "memorySpaceId": filter.memory_space_id if filter else None,
-                    "participantId": filter.participant_id if filter else None,
-                    "createdBefore": filter.created_before if filter else None,
-                    "createdAfter": filter.created_after if filter else None,
-                    "updatedBefore": filter.updated_before if filter else None,
-                    "updatedAfter": filter.updated_after if filter else None,
-                    "lastMessageBefore": filter.last_message_before if filter else None,
-                    "lastMessageAfter": filter.last_message_after if filter else None,
-                    "messageCountMin": message_count_min,
-                    "messageCountMax": message_count_max,
+                    **self._list_filter_args(filter),
                     "limit": filter.limit if filter else None,
                     "offset": filter.offset if filter else None,
                     "sortBy": filter.sort_by if filter else None,
@@ -426,6 +437,64 @@ class ConversationsAPI:
             has_more=result.get("hasMore", False) if isinstance(result, dict) else False,
         )
 
+    def iter(
+        self,
+        filter: Optional[ListConversationsFilter] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Conversation]:
+        """
+        Iterate over every conversation matching a filter using cursor pagination.
+
+        Takes the same filters as list(), but yields conversations page by
+        page in index order and prefetches the next page while the caller
+        processes the current one, so memory use stays flat regardless of
+        how many conversations match. ``filter.limit`` caps the number of
+        conversations yielded; offset and sorting are not supported.
+
+        Args:
+            filter: Optional filter (as for list())
+            page_size: Maximum conversations scanned per page
+
+        Returns:
+            Async iterator of conversations
+
+        Example:
+            >>> async for conversation in cortex.conversations.iter(
+            ...     ListConversationsFilter(memory_space_id='space-123', include_messages=False)
+            ... ):
+            ...     process(conversation)
+        """
+        self._validate_list_filter(filter)
+        validate_limit(page_size, "page_size")
+
+        for field_name in ("offset", "sort_by", "sort_order"):
+            if filter and getattr(filter, field_name):
+                raise ConversationValidationError(
+                    f"{field_name} is not supported by iter(); conversations are yielded in index order",
+                    "INVALID_FILTER",
+                    field_name,
+                )
+
+        args = filter_none_values({
+            **self._list_filter_args(filter),
+            "includeMessages": filter.include_messages if filter else None,
+        })
+
+        async def fetch_page(cursor: Optional[str]) -> Any:
+            return await self._execute_with_resilience(
+                lambda: self.client.query(
+                    "conversations:listPage",
+                    {**args, "paginationOpts": {"numItems": page_size, "cursor": cursor}},
+                ),
+                "conversations:listPage",
+            )
+
+        return iterate_pages(
+            fetch_page,
+            lambda conv: Conversation(**convert_convex_response(conv)),
+            limit=filter.limit if filter else None,
+        )
+
     async def count(
         self,
         filter: Optional[CountConversationsFilter] = None,
@@ -4,13 +4,27 @@ Cortex SDK - Facts API
 Layer 3: Structured knowledge extraction and storage
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union, cast
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 
+from .._pagination import iterate_pages
 from .._utils import convert_convex_response, filter_none_values
 from ..errors import CortexError, ErrorCode  # noqa: F401
 from ..types import (
     AuthContext,
+    ChunkDigestPageResult,
+    ChunkWatermark,
     CountFactsFilter,
     DeleteFactOptions,
     DeleteFactResult,
@@ -19,6 +33,7 @@ from ..types import (
     FactRecord,
     FactType,
     ListFactsFilter,
+    ListFactsPageResult,
     QueryByRelationshipFilter,
     QueryBySubjectFilter,
     SearchFactsOptions,
@@ -34,6 +49,7 @@ from .belief_revision import (
     ConflictCandidate,
     ConflictCheckResult,
     LLMResolutionConfigOptions,
+    PartialRevisionError,
     ReviseParams,
     ReviseResult,
     SemanticMatchingConfigOptions,
@@ -47,26 +63,35 @@ from .deduplication import (
     FactDeduplicationService,
     StoreWithDedupResult,
 )
+from .embedding_cache import EmbeddingCache, EmbeddingCacheStats
 from .history import (
     ActionCounts,
     ActivitySummary,
     ChangeFilter,
+    DailyActivity,
     FactChangeEvent,
     FactChangePipeline,
     FactHistoryService,
     LogEventParams,
     SupersessionChainEntry,
 )
+from .normalization import normalize_fact_text, normalize_predicate, normalize_subject
+from .resolution_rules import (
+    SINGLE_VALUED_PREDICATE_CLASSES,
+    ConflictDecisionCache,
+    ResolutionMetrics,
+    ResolutionRuleEngine,
+)
 from .slot_matching import (
     DEFAULT_PREDICATE_CLASSES,
+    PredicateClassifier,
     SlotConflictResult,
     SlotMatch,
     SlotMatchingConfig,
     SlotMatchingService,
     classify_predicate,
     extract_slot,
-    normalize_predicate,
-    normalize_subject,
+    merge_predicate_classes,
 )
 from .validators import (
     FactsValidationError,
@@ -76,6 +101,7 @@ from .validators import (
     validate_export_format,
     validate_fact_id_format,
     validate_fact_type,
+    validate_limit,
     validate_memory_space_id,
     validate_metadata,
     validate_non_negative_integer,
@@ -117,6 +143,7 @@ class FactsAPI:
         auth_context: Optional[AuthContext] = None,
         llm_client: Optional[BeliefRevisionLLMClient] = None,
         belief_revision_config: Optional[BeliefRevisionConfig] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ) -> None:
         """
         Initialize Facts API.
@@ -128,12 +155,15 @@ class FactsAPI:
             auth_context: Optional auth context for multi-tenancy
             llm_client: Optional LLM client for belief revision
             belief_revision_config: Optional belief revision configuration
+            embedding_cache: Optional embedding cache; one cache is shared by
+                deduplication, belief revision and backfill_embeddings
         """
         self.client = client
         self.graph_adapter = graph_adapter
         self._resilience = resilience
         self._auth_context = auth_context
-        self._dedup_service = FactDeduplicationService(client)
+        self._embedding_cache = embedding_cache if embedding_cache is not None else EmbeddingCache()
+        self._dedup_service = FactDeduplicationService(client, self._embedding_cache)
         self._llm_client = llm_client
         self._history_service = FactHistoryService(client, resilience)
 
@@ -145,6 +175,7 @@ class FactsAPI:
             llm_client,
             graph_adapter,
             belief_revision_config,
+            embedding_cache=self._embedding_cache,
         )
 
     @property
@@ -160,6 +191,15 @@ class FactsAPI:
             return await self._resilience.execute(operation, operation_name)
         return await operation()
 
+    def _slot_fields(self, params: StoreFactParams) -> Dict[str, str]:
+        """Slot key persisted with a fact (explicit values win over computed ones)."""
+        slot = self._belief_revision_service.get_slot(params.subject, params.predicate)
+        normalized_subject = params.normalized_subject or (slot.subject if slot else None)
+        predicate_class = params.predicate_class or (slot.predicate_class if slot else None)
+        if not normalized_subject or not predicate_class:
+            return {}
+        return {"normalizedSubject": normalized_subject, "predicateClass": predicate_class}
+
     async def store(
         self, params: StoreFactParams, options: Optional[StoreFactOptions] = None
     ) -> FactRecord:
@@ -244,6 +284,8 @@ class FactsAPI:
                         if params.relations
                         else None
                     ),
+                    "embedding": params.embedding,
+                    **self._slot_fields(params),
                 }),
             ),
             "facts:store",
@@ -379,7 +421,11 @@ class FactsAPI:
                 },
             )
 
-        # No duplicate found - store new fact
+        # No duplicate found - store new fact (with the embedding computed
+        # for the semantic check, so it is indexed for future searches)
+        if duplicate_result.candidate_embedding and not params.embedding:
+            params = replace(params, embedding=duplicate_result.candidate_embedding)
+
         stored_fact = await self.store(
             params,
             StoreFactOptions(sync_to_graph=opts.sync_to_graph),
@@ -426,33 +472,8 @@ class FactsAPI:
 
         return FactRecord(**convert_convex_response(result))
 
-    async def list(
-        self,
-        filter: ListFactsFilter,
-    ) -> List[FactRecord]:
-        """
-        List facts with comprehensive universal filters (v0.9.1+).
-
-        Args:
-            filter: Comprehensive filter options with 25+ parameters
-
-        Returns:
-            List of fact records
-
-        Example:
-            >>> from cortex.types import ListFactsFilter
-            >>> facts = await cortex.facts.list(
-            ...     ListFactsFilter(
-            ...         memory_space_id='agent-1',
-            ...         user_id='user-123',  # GDPR filtering
-            ...         fact_type='preference',
-            ...         min_confidence=80,
-            ...         tags=['important'],
-            ...         sort_by='confidence',
-            ...         sort_order='desc'
-            ...     )
-            ... )
-        """
+    def _validate_list_filter(self, filter: ListFactsFilter) -> None:
+        """Validate the filter shared by list() and iter()."""
         validate_memory_space_id(filter.memory_space_id)
 
         if filter.fact_type is not None:
@@ -492,30 +513,65 @@ class FactsAPI:
         if filter.metadata is not None:
             validate_metadata(filter.metadata)
 
+    def _list_filter_args(self, filter: ListFactsFilter) -> Dict[str, Any]:
+        """Convex arguments for a list filter, without paging and sorting."""
+        return {
+            "memorySpaceId": filter.memory_space_id,
+            "factType": filter.fact_type,
+            "subject": filter.subject,
+            "predicate": filter.predicate,
+            "object": filter.object,
+            "minConfidence": filter.min_confidence,
+            "confidence": filter.confidence,
+            "userId": filter.user_id,
+            "participantId": filter.participant_id,
+            "tags": filter.tags,
+            "tagMatch": filter.tag_match,
+            "sourceType": filter.source_type,
+            "createdBefore": int(filter.created_before.timestamp() * 1000) if filter.created_before else None,
+            "createdAfter": int(filter.created_after.timestamp() * 1000) if filter.created_after else None,
+            "updatedBefore": int(filter.updated_before.timestamp() * 1000) if filter.updated_before else None,
+            "updatedAfter": int(filter.updated_after.timestamp() * 1000) if filter.updated_after else None,
+            "version": filter.version,
+            "includeSuperseded": filter.include_superseded,
+            "validAt": int(filter.valid_at.timestamp() * 1000) if filter.valid_at else None,
+            "metadata": filter.metadata,
+        }
+
+    async def list(
+        self,
+        filter: ListFactsFilter,
+    ) -> List[FactRecord]:
+        """
+        List facts with comprehensive universal filters (v0.9.1+).
+
+        Args:
+            filter: Comprehensive filter options with 25+ parameters
+
+        Returns:
+            List of fact records
+
+        Example:
+            >>> from cortex.types import ListFactsFilter
+            >>> facts = await cortex.facts.list(
+            ...     ListFactsFilter(
+            ...         memory_space_id='agent-1',
+            ...         user_id='user-123',  # GDPR filtering
+            ...         fact_type='preference',
+            ...         min_confidence=80,
+            ...         tags=['important'],
+            ...         sort_by='confidence',
+            ...         sort_order='desc'
+            ...     )
+            ... )
+        """
+        self._validate_list_filter(filter)
+
         result = await self._execute_with_resilience(
             lambda: self.client.query(
                 "facts:list",
                 filter_none_values({
-                    "memorySpaceId": filter.memory_space_id,
-                    "factType": filter.fact_type,
-                    "subject": filter.subject,
-                    "predicate": filter.predicate,
-                    "object": filter.object,
-                    "minConfidence": filter.min_confidence,
-                    "confidence": filter.confidence,
-                    "userId": filter.user_id,
-                    "participantId": filter.participant_id,
-                    "tags": filter.tags,
-                    "tagMatch": filter.tag_match,
-                    "sourceType": filter.source_type,
-                    "createdBefore": int(filter.created_before.timestamp() * 1000) if filter.created_before else None,
-                    "createdAfter": int(filter.created_after.timestamp() * 1000) if filter.created_after else None,
-                    "updatedBefore": int(filter.updated_before.timestamp() * 1000) if filter.updated_before else None,
-                    "updatedAfter": int(filter.updated_after.timestamp() * 1000) if filter.updated_after else None,
-                    "version": filter.version,
-                    "includeSuperseded": filter.include_superseded,
-                    "validAt": int(filter.valid_at.timestamp() * 1000) if filter.valid_at else None,
-                    "metadata": filter.metadata,
+                    **self._list_filter_args(filter),
                     "limit": filter.limit,
                     "offset": filter.offset,
                     "sortBy": filter.sort_by,
@@ -527,6 +583,173 @@ class FactsAPI:
 
         return [FactRecord(**convert_convex_response(fact)) for fact in result]
 
+    async def list_page(
+        self,
+        memory_space_id: str,
+        cursor: Optional[str] = None,
+        page_size: int = 500,
+        include_superseded: bool = False,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        include_embedding: bool = False,
+    ) -> ListFactsPageResult:
+        """
+        List one page of a memory space's facts using cursor pagination.
+
+        Pages cover the whole memory space (or the createdAt window) in
+        creation order. Pass ``continue_cursor`` from the previous page until
+        ``is_done`` is True.
+
+        Args:
+            memory_space_id: Memory space ID
+            cursor: Cursor from the previous page (None for the first page)
+            page_size: Maximum facts scanned per page
+            include_superseded: Include superseded facts
+            created_after: Only facts created at or after this time (ms)
+            created_before: Only facts created at or before this time (ms)
+            include_embedding: Return each fact's embedding (omitted by default)
+
+        Returns:
+            Page of facts with the cursor for the next page
+
+        Example:
+            >>> page = await cortex.facts.list_page('agent-1', page_size=200)
+            >>> while not page.is_done:
+            ...     page = await cortex.facts.list_page('agent-1', page.continue_cursor)
+        """
+        validate_memory_space_id(memory_space_id)
+        validate_limit(page_size, "page_size")
+
+        result = await self._execute_with_resilience(
+            lambda: self.client.query(
+                "facts:listPage",
+                filter_none_values({
+                    "memorySpaceId": memory_space_id,
+                    "tenantId": self._tenant_id,
+                    "includeSuperseded": include_superseded,
+                    "createdAfter": created_after,
+                    "createdBefore": created_before,
+                    "includeEmbedding": include_embedding or None,
+                    "paginationOpts": {"numItems": page_size, "cursor": cursor},
+                }),
+            ),
+            "facts:listPage",
+        )
+
+        return ListFactsPageResult(
+            facts=[FactRecord(**convert_convex_response(fact)) for fact in result["page"]],
+            continue_cursor=result.get("continueCursor"),
+            is_done=bool(result.get("isDone", True)),
+        )
+
+    def iter(
+        self,
+        filter: ListFactsFilter,
+        page_size: int = 500,
+    ) -> AsyncIterator[FactRecord]:
+        """
+        Iterate over every fact matching a filter using cursor pagination.
+
+        Takes the same filters as list(), but walks the memory space page by
+        page in creation order and prefetches the next page while the caller
+        processes the current one, so memory use stays flat regardless of
+        space size. ``filter.limit`` caps the number of facts yielded; offset
+        and sorting are not supported.
+
+        Args:
+            filter: Filter options (as for list())
+            page_size: Maximum facts scanned per page
+
+        Returns:
+            Async iterator of fact records
+
+        Example:
+            >>> async for fact in cortex.facts.iter(
+            ...     ListFactsFilter(memory_space_id='agent-1', user_id='user-123')
+            ... ):
+            ...     process(fact)
+        """
+        self._validate_list_filter(filter)
+        validate_limit(page_size, "page_size")
+
+        for field_name in ("offset", "sort_by", "sort_order"):
+            if getattr(filter, field_name):
+                raise FactsValidationError(
+                    f"{field_name} is not supported by iter(); facts are yielded in creation order",
+                    "INVALID_FILTER",
+                    field_name,
+                )
+
+        args = filter_none_values({
+            **self._list_filter_args(filter),
+            "tenantId": self._tenant_id,
+        })
+
+        async def fetch_page(cursor: Optional[str]) -> Any:
+            return await self._execute_with_resilience(
+                lambda: self.client.query(
+                    "facts:listPage",
+                    {**args, "paginationOpts": {"numItems": page_size, "cursor": cursor}},
+                ),
+                "facts:listPage",
+            )
+
+        return iterate_pages(
+            fetch_page,
+            lambda fact: FactRecord(**convert_convex_response(fact)),
+            limit=filter.limit,
+        )
+
+    async def chunk_digests(
+        self,
+        memory_space_id: str,
+        chunk_ms: int,
+        cursor: Optional[str] = None,
+        page_size: int = 500,
+        include_superseded: bool = False,
+    ) -> ChunkDigestPageResult:
+        """
+        Per-chunk watermarks for one page of a memory space's facts.
+
+        Facts are bucketed by createdAt into ``chunk_ms`` windows; each chunk
+        reports its count, newest updatedAt and timestamp/version sums
+        without transferring the facts. A chunk can span pages, so callers
+        merge chunks with the same number.
+
+        Args:
+            memory_space_id: Memory space ID
+            chunk_ms: Chunk window in milliseconds
+            cursor: Cursor from the previous page (None for the first page)
+            page_size: Maximum facts scanned per page
+            include_superseded: Include superseded facts
+
+        Returns:
+            Chunk watermarks with the cursor for the next page
+        """
+        validate_memory_space_id(memory_space_id)
+        validate_limit(chunk_ms, "chunk_ms")
+        validate_limit(page_size, "page_size")
+
+        result = await self._execute_with_resilience(
+            lambda: self.client.query(
+                "facts:chunkDigests",
+                filter_none_values({
+                    "memorySpaceId": memory_space_id,
+                    "tenantId": self._tenant_id,
+                    "includeSuperseded": include_superseded,
+                    "chunkMs": chunk_ms,
+                    "paginationOpts": {"numItems": page_size, "cursor": cursor},
+                }),
+            ),
+            "facts:chunkDigests",
+        )
+
+        return ChunkDigestPageResult(
+            chunks=[ChunkWatermark(**convert_convex_response(c)) for c in result["page"]],
+            continue_cursor=result.get("continueCursor"),
+            is_done=bool(result.get("isDone", True)),
+        )
+
     async def search(
         self,
         memory_space_id: str,
@@ -1261,6 +1484,154 @@ class FactsAPI:
 
         return cast(Dict[str, Any], result)
 
+    async def backfill_embeddings(
+        self,
+        memory_space_id: str,
+        generate_embedding: Optional[Callable[[str], Awaitable[List[float]]]] = None,
+        generate_embeddings: Optional[Callable[[List[str]], Awaitable[List[List[float]]]]] = None,
+        page_size: int = 100,
+        embedding_model: Optional[str] = None,
+    ) -> int:
+        """
+        Embed facts stored without an embedding so vector search covers them.
+
+        Facts written before embeddings were persisted are invisible to
+        server-side semantic deduplication. This walks the memory space page
+        by page, embeds facts that have no embedding (one batch per page when
+        ``generate_embeddings`` is given) and writes them back. Current facts
+        embedded before vector search scope keys existed get their keys too.
+
+        Args:
+            memory_space_id: Memory space ID
+            generate_embedding: Single-text embedding function
+            generate_embeddings: Optional batch embedding function
+            page_size: Facts per page
+            embedding_model: Embedding model identifier (cache namespace)
+
+        Returns:
+            Number of facts that received an embedding
+
+        Example:
+            >>> updated = await cortex.facts.backfill_embeddings(
+            ...     'agent-1', generate_embedding=embed
+            ... )
+        """
+        validate_memory_space_id(memory_space_id)
+        if generate_embedding is None and generate_embeddings is None:
+            raise CortexError(
+                ErrorCode.INVALID_INPUT,
+                "generate_embedding or generate_embeddings is required",
+            )
+
+        updated = 0
+        cursor: Optional[str] = None
+        while True:
+            page = await self.list_page(
+                memory_space_id, cursor, page_size, include_embedding=True
+            )
+            pending = [fact for fact in page.facts if not fact.embedding]
+
+            if pending:
+                embeddings = await self._embedding_cache.get_many(
+                    [fact.fact for fact in pending],
+                    generate_embedding=generate_embedding,
+                    generate_embeddings=generate_embeddings,
+                    model=embedding_model,
+                )
+                items = [
+                    {"factId": fact.fact_id, "embedding": embedding}
+                    for fact, embedding in zip(pending, embeddings)
+                ]
+                result = await self._execute_with_resilience(
+                    lambda: self.client.mutation(
+                        "facts:setEmbeddings",
+                        {"memorySpaceId": memory_space_id, "items": items},
+                    ),
+                    "facts:setEmbeddings",
+                )
+                updated += int((result or {}).get("updated", len(items)))
+
+            unscoped = [
+                fact.fact_id
+                for fact in page.facts
+                if fact.embedding and not fact.scope_key and not fact.superseded_by
+            ]
+            if unscoped:
+                await self._execute_with_resilience(
+                    lambda: self.client.mutation(
+                        "facts:setScopeKeys",
+                        {"memorySpaceId": memory_space_id, "factIds": unscoped},
+                    ),
+                    "facts:setScopeKeys",
+                )
+
+            if page.is_done or not page.continue_cursor:
+                return updated
+            cursor = page.continue_cursor
+
+    async def backfill_slots(
+        self,
+        memory_space_id: str,
+        page_size: int = 500,
+        recompute: bool = False,
+    ) -> int:
+        """
+        Store slot keys on facts written before slots were persisted.
+
+        Slot conflict lookup uses the stored ``normalized_subject`` and
+        ``predicate_class``; while a space has facts without them, slot
+        matching falls back to a slower subject scan. This walks the memory
+        space page by page and writes slot keys computed with the configured
+        predicate classes, one mutation per page.
+
+        Args:
+            memory_space_id: Memory space ID
+            page_size: Facts per page
+            recompute: Also rewrite existing slot keys (e.g. after changing
+                predicate classes)
+
+        Returns:
+            Number of facts whose slot key was written
+
+        Example:
+            >>> updated = await cortex.facts.backfill_slots('agent-1')
+        """
+        validate_memory_space_id(memory_space_id)
+
+        updated = 0
+        cursor: Optional[str] = None
+        while True:
+            page = await self.list_page(memory_space_id, cursor, page_size, include_superseded=True)
+
+            items = []
+            for fact in page.facts:
+                slot = self._belief_revision_service.get_slot(fact.subject, fact.predicate)
+                if not slot:
+                    continue
+                if not recompute and fact.normalized_subject and fact.predicate_class:
+                    continue
+                if (fact.normalized_subject, fact.predicate_class) == (slot.subject, slot.predicate_class):
+                    continue
+                items.append({
+                    "factId": fact.fact_id,
+                    "normalizedSubject": slot.subject,
+                    "predicateClass": slot.predicate_class,
+                })
+
+            if items:
+                result = await self._execute_with_resilience(
+                    lambda: self.client.mutation(
+                        "facts:setSlots",
+                        {"memorySpaceId": memory_space_id, "items": items},
+                    ),
+                    "facts:setSlots",
+                )
+                updated += int((result or {}).get("updated", len(items)))
+
+            if page.is_done or not page.continue_cursor:
+                return updated
+            cursor = page.continue_cursor
+
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Belief Revision Methods
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1291,6 +1662,7 @@ class FactsAPI:
             llm_client or self._llm_client,
             self.graph_adapter,
             config,
+            embedding_cache=self._embedding_cache,
         )
 
     def has_belief_revision(self) -> bool:
@@ -1310,6 +1682,35 @@ class FactsAPI:
         """
         return self._belief_revision_service is not None
 
+    def get_resolution_metrics(self) -> Optional[ResolutionMetrics]:
+        """
+        Counts of belief-revision conflict resolutions by how they were served.
+
+        Returns:
+            ResolutionMetrics (rules, cache hits, LLM, defaults), or None when
+            belief revision is not configured
+
+        Example:
+            >>> metrics = cortex.facts.get_resolution_metrics()
+            >>> print(metrics.rules, metrics.cache_hits, metrics.llm_calls)
+        """
+        if not self._belief_revision_service:
+            return None
+        return self._belief_revision_service.get_resolution_metrics()
+
+    def get_embedding_cache_stats(self) -> EmbeddingCacheStats:
+        """
+        Counters of the embedding cache shared by deduplication and belief revision.
+
+        Returns:
+            EmbeddingCacheStats (hits, misses, evictions, expirations, batches)
+
+        Example:
+            >>> stats = cortex.facts.get_embedding_cache_stats()
+            >>> print(f"{stats.hit_rate:.0%} of fact embeddings served from cache")
+        """
+        return self._embedding_cache.stats
+
     async def revise(self, params: ReviseParams) -> ReviseResult:
         """
         Evaluate a new fact and determine the appropriate action using belief revision.
@@ -1354,6 +1755,49 @@ class FactsAPI:
 
         return await self._belief_revision_service.revise(params)
 
+    async def revise_many(self, params_list: List[ReviseParams]) -> List[ReviseResult]:
+        """
+        Run belief revision for several new facts at once.
+
+        Intended for all facts extracted from one turn: candidate lookups
+        run concurrently, facts in the batch are checked against each other,
+        conflicts are resolved with one LLM call and decisions are written
+        in one batch.
+
+        Args:
+            params_list: Revise parameters for each new fact, in order
+
+        Returns:
+            ReviseResult per input, in order
+
+        Raises:
+            ValueError: If belief revision is not configured
+            PartialRevisionError: If writing failed after some facts were
+                stored (``results`` holds the stored ones)
+
+        Example:
+            >>> results = await cortex.facts.revise_many([
+            ...     ReviseParams(memory_space_id="space-1", fact=ConflictCandidate(
+            ...         fact="User lives in Paris", subject="user-123",
+            ...         predicate="lives in", object="Paris", confidence=90)),
+            ...     ReviseParams(memory_space_id="space-1", fact=ConflictCandidate(
+            ...         fact="User works at Acme", subject="user-123",
+            ...         predicate="works at", object="Acme", confidence=90)),
+            ... ])
+        """
+        if not self._belief_revision_service:
+            raise ValueError(
+                "Belief revision is not configured. Call configure_belief_revision() first "
+                "or provide an llm_client when initializing FactsAPI."
+            )
+
+        for params in params_list:
+            validate_memory_space_id(params.memory_space_id)
+            validate_required_string(params.fact.fact, "fact")
+            validate_confidence(params.fact.confidence, "confidence")
+
+        return await self._belief_revision_service.revise_many(params_list)
+
     async def check_conflicts(self, params: ReviseParams) -> ConflictCheckResult:
         """
         Check for conflicts without executing (preview mode).
@@ -1548,7 +1992,7 @@ class FactsAPI:
         return await self._history_service.get_supersession_chain(fact_id)
 
     async def get_activity_summary(
-        self, memory_space_id: str, hours: int = 24
+        self, memory_space_id: str, hours: int = 24, include_uniques: bool = False
     ) -> ActivitySummary:
         """
         Get activity summary for a time period.
@@ -1556,6 +2000,8 @@ class FactsAPI:
         Args:
             memory_space_id: Memory space to query
             hours: Number of hours to look back (default: 24)
+            include_uniques: Count unique facts and participants, which needs
+                a scan of the window's events (default: False)
 
         Returns:
             Activity summary with counts and statistics
@@ -1567,7 +2013,54 @@ class FactsAPI:
         """
         validate_memory_space_id(memory_space_id)
 
-        return await self._history_service.get_activity_summary(memory_space_id, hours)
+        return await self._history_service.get_activity_summary(
+            memory_space_id, hours, include_uniques
+        )
+
+    async def get_daily_activity(
+        self, memory_space_id: str, days: int = 30
+    ) -> List[DailyActivity]:
+        """
+        Get per-day change counts for a memory space.
+
+        Args:
+            memory_space_id: Memory space to query
+            days: Number of days to look back, including today (default: 30)
+
+        Returns:
+            Daily activity, oldest day first (days without events are omitted)
+
+        Example:
+            >>> for day in await cortex.facts.get_daily_activity("space-1", 7):
+            ...     print(day.day, day.total_events)
+        """
+        validate_memory_space_id(memory_space_id)
+
+        return await self._history_service.get_daily_activity(memory_space_id, days)
+
+    async def compact_history(
+        self, memory_space_id: str, older_than: datetime
+    ) -> Dict[str, int]:
+        """
+        Collapse old intermediate UPDATE events in the change history.
+
+        Supersession chains and activity counts are preserved.
+
+        Args:
+            memory_space_id: Memory space to compact
+            older_than: Only compact events before this date
+
+        Returns:
+            Dict with number of events deleted
+
+        Example:
+            >>> await cortex.facts.compact_history(
+            ...     "space-1", datetime.now() - timedelta(days=90)
+            ... )
+        """
+        validate_memory_space_id(memory_space_id)
+
+        return await self._history_service.compact(memory_space_id, older_than)
 
 
 __all__ = [
@@ -1581,13 +2074,20 @@ __all__ = [
     "FactDeduplicationService",
     "StoreWithDedupResult",
     "StoreFactWithDedupOptions",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
     # Belief revision exports
+    "ConflictDecisionCache",
+    "ResolutionMetrics",
+    "ResolutionRuleEngine",
+    "SINGLE_VALUED_PREDICATE_CLASSES",
     "BeliefRevisionConfig",
     "BeliefRevisionLLMClient",
     "BeliefRevisionService",
     "ConflictCandidate",
     "ConflictCheckResult",
     "LLMResolutionConfigOptions",
+    "PartialRevisionError",
     "ReviseParams",
     "ReviseResult",
     "SemanticMatchingConfigOptions",
@@ -1596,6 +2096,7 @@ __all__ = [
     "ActionCounts",
     "ActivitySummary",
     "ChangeFilter",
+    "DailyActivity",
     "FactChangeEvent",
     "FactChangePipeline",
     "FactHistoryService",
@@ -1603,12 +2104,16 @@ __all__ = [
     "SupersessionChainEntry",
     # Slot matching exports
     "DEFAULT_PREDICATE_CLASSES",
+    "PredicateClassifier",
     "SlotConflictResult",
     "SlotMatch",
     "SlotMatchingConfig",
     "SlotMatchingService",
     "classify_predicate",
     "extract_slot",
+    "merge_predicate_classes",
+    # Normalization exports
+    "normalize_fact_text",
     "normalize_predicate",
     "normalize_subject",
 ]
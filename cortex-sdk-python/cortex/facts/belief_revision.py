@@ -13,20 +13,46 @@ Pipeline flow:
 6. Sync to graph
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Callable, Coroutine, Dict, List, Literal, Optional, Protocol
+import asyncio
+from dataclasses import dataclass, field, replace
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 from .conflict_prompts import (
     ConflictAction,
     ConflictCandidate,
     ConflictDecision,
+    build_batch_conflict_resolution_prompt,
     build_conflict_resolution_prompt,
     get_default_decision,
+    parse_batch_conflict_decisions,
     parse_conflict_decision,
     validate_conflict_decision,
 )
 from .deduplication import DeduplicationConfig, FactDeduplicationService
-from .slot_matching import SlotConflictResult, SlotMatchingConfig, SlotMatchingService
+from .embedding_cache import EmbeddingCache
+from .resolution_rules import (
+    ConflictDecisionCache,
+    ResolutionMetrics,
+    ResolutionRuleEngine,
+    ResolutionSource,
+)
+from .slot_matching import (
+    SlotConflictResult,
+    SlotMatch,
+    SlotMatchingConfig,
+    SlotMatchingService,
+)
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # LLM Client Protocol
@@ -97,6 +123,9 @@ class SemanticMatchingConfigOptions:
     generate_embedding: Optional[Callable[[str], Coroutine[Any, Any, List[float]]]] = None
     """Embedding function for semantic search"""
 
+    embedding_model: Optional[str] = None
+    """Identifier of the embedding model (embedding cache namespace)"""
+
 
 @dataclass
 class LLMResolutionConfigOptions:
@@ -108,6 +137,15 @@ class LLMResolutionConfigOptions:
     model: Optional[str] = None
     """Custom model to use"""
 
+    fast_path_rules: bool = True
+    """Decide trivially decidable conflicts with deterministic rules (no LLM call)"""
+
+    cache_size: int = 1000
+    """Cached LLM decisions (0 disables the cache)"""
+
+    cache_ttl_seconds: Optional[float] = 3600.0
+    """Lifetime of cached LLM decisions (None = no expiry)"""
+
 
 @dataclass
 class HistoryConfigOptions:
@@ -136,6 +174,10 @@ class BeliefRevisionConfig:
     history: Optional[HistoryConfigOptions] = None
     """History logging configuration"""
 
+    concurrent_stages: Optional[bool] = None
+    """Start the slot, semantic and subject+type lookups at once and cancel
+    the lower-priority ones after a hit (default off: one stage at a time)"""
+
 
 @dataclass
 class ReviseParams:
@@ -170,6 +212,9 @@ class PipelineStageResult:
     decision: Optional[ConflictAction] = None
     """Decision made (for LLM stage)"""
 
+    source: Optional[ResolutionSource] = None
+    """How the decision was made: rules, cache, llm or default (for LLM stage)"""
+
 
 @dataclass
 class ReviseResult:
@@ -225,6 +270,29 @@ class ConflictCheckResult:
     """Recommendation reason"""
 
 
+BATCH_FACT_PREFIX = "batch-"
+"""ID prefix for earlier facts of the same batch shown as conflict candidates."""
+
+
+class PartialRevisionError(Exception):
+    """
+    A batched revision failed after writing only some of its facts.
+
+    Attributes:
+        results: ReviseResult for each fact that was written, None for the
+            rest (retry only those)
+        error: The failure that stopped the batch
+    """
+
+    def __init__(self, results: List[Optional["ReviseResult"]], error: Exception) -> None:
+        written = sum(1 for result in results if result is not None)
+        super().__init__(
+            f"Belief revision failed after {written} of {len(results)} facts were written: {error}"
+        )
+        self.results = results
+        self.error = error
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # BeliefRevisionService
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -266,6 +334,7 @@ class BeliefRevisionService:
         llm_client: Optional[BeliefRevisionLLMClient] = None,
         graph_adapter: Optional[Any] = None,
         config: Optional[BeliefRevisionConfig] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ) -> None:
         """
         Initialize the belief revision service.
@@ -275,6 +344,8 @@ class BeliefRevisionService:
             llm_client: Optional LLM client for conflict resolution
             graph_adapter: Optional graph database adapter
             config: Optional configuration
+            embedding_cache: Optional embedding cache shared with other
+                services (a private cache is created when omitted)
         """
         self._client = client
         self._llm_client = llm_client
@@ -289,7 +360,16 @@ class BeliefRevisionService:
         self._slot_matcher = SlotMatchingService(client, slot_config)
 
         # Initialize deduplication service (for semantic matching)
-        self._dedup_service = FactDeduplicationService(client)
+        self._dedup_service = FactDeduplicationService(client, embedding_cache)
+
+        # Stage 3 fast paths: deterministic rules and cached LLM decisions
+        self._rules = ResolutionRuleEngine(self.get_slot)
+        llm_config = self._config.llm_resolution or LLMResolutionConfigOptions()
+        self._decision_cache = ConflictDecisionCache(
+            max_entries=llm_config.cache_size,
+            ttl_seconds=llm_config.cache_ttl_seconds,
+        )
+        self._metrics = ResolutionMetrics()
 
     async def revise(self, params: ReviseParams) -> ReviseResult:
         """
@@ -301,65 +381,24 @@ class BeliefRevisionService:
         Returns:
             ReviseResult with action taken and resulting fact
         """
-        pipeline_result: Dict[str, PipelineStageResult] = {}
-        candidates: List[Any] = []
+        params = self._own_params(params)
         action: ConflictAction = "ADD"
         target_fact: Optional[Any] = None
         reason = "No conflicts found - adding new fact"
         confidence = 100
 
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Stage 1: Slot Matching (Fast Path)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        slot_enabled = self._config.slot_matching.enabled if self._config.slot_matching else True
-        if slot_enabled:
-            slot_result = await self._find_slot_conflicts(params)
-            pipeline_result["slot_matching"] = PipelineStageResult(
-                executed=True,
-                matched=slot_result.has_conflict,
-                fact_ids=[self._get_fact_id(f) for f in slot_result.conflicting_facts],
-            )
-
-            if slot_result.has_conflict:
-                candidates = slot_result.conflicting_facts
-
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Stage 2: Semantic Matching (if no slot matches)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        semantic_enabled = self._config.semantic_matching.enabled if self._config.semantic_matching else True
-        if len(candidates) == 0 and semantic_enabled:
-            semantic_result = await self._find_semantic_conflicts(params)
-            pipeline_result["semantic_matching"] = PipelineStageResult(
-                executed=True,
-                matched=len(semantic_result) > 0,
-                fact_ids=[self._get_fact_id(r["fact"]) for r in semantic_result],
-            )
-
-            if semantic_result:
-                candidates = [r["fact"] for r in semantic_result]
-
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Stage 2.5: Subject + FactType Matching (if no candidates yet)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        if len(candidates) == 0:
-            subject_type_candidates = await self._find_subject_type_conflicts(params)
-            pipeline_result["subject_type_matching"] = PipelineStageResult(
-                executed=True,
-                matched=len(subject_type_candidates) > 0,
-                fact_ids=[self._get_fact_id(f) for f in subject_type_candidates],
-            )
-
-            if subject_type_candidates:
-                candidates = subject_type_candidates
+        # Stages 1-2.5: slot, semantic and subject+type candidate matching
+        candidates, pipeline_result = await self._gather_candidates(params)
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # Stage 3: LLM Resolution (if candidates found)
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         if candidates:
-            decision = await self._resolve_with_llm(params.fact, candidates)
+            decision, source = await self._resolve(params.fact, candidates)
             pipeline_result["llm_resolution"] = PipelineStageResult(
                 executed=True,
                 decision=decision.action,
+                source=source,
             )
 
             action = decision.action
@@ -375,6 +414,7 @@ class BeliefRevisionService:
             # Handle UPDATE with merged fact
             if action == "UPDATE" and decision.merged_fact and target_fact:
                 params.fact.fact = decision.merged_fact
+                params.fact.embedding = None  # Embedded the pre-merge text
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # Stage 4: Execute Decision
@@ -405,25 +445,31 @@ class BeliefRevisionService:
         Returns:
             ConflictCheckResult with conflict details and recommended action
         """
+        params = self._own_params(params)
         slot_conflicts: List[Any] = []
         semantic_conflicts: List[SemanticConflict] = []
 
-        # Check slot conflicts
+        async def no_lookup() -> None:
+            return None
+
+        # Both checks always run, so they run concurrently
         slot_enabled = self._config.slot_matching.enabled if self._config.slot_matching else True
-        if slot_enabled:
-            slot_result = await self._find_slot_conflicts(params)
-            if slot_result.has_conflict:
-                slot_conflicts.extend(slot_result.conflicting_facts)
+        semantic_enabled = self._config.semantic_matching.enabled if self._config.semantic_matching else True
+        slot_result, semantic_result = await asyncio.gather(
+            self._find_slot_conflicts(params) if slot_enabled else no_lookup(),
+            self._find_semantic_conflicts(params) if semantic_enabled else no_lookup(),
+        )
+
+        # Check slot conflicts
+        if slot_result is not None and slot_result.has_conflict:
+            slot_conflicts.extend(slot_result.conflicting_facts)
 
         # Check semantic conflicts
-        semantic_enabled = self._config.semantic_matching.enabled if self._config.semantic_matching else True
-        if semantic_enabled:
-            semantic_result = await self._find_semantic_conflicts(params)
-            for r in semantic_result:
-                semantic_conflicts.append(SemanticConflict(
-                    fact=r["fact"],
-                    score=r["score"],
-                ))
+        for r in semantic_result or []:
+            semantic_conflicts.append(SemanticConflict(
+                fact=r["fact"],
+                score=r["score"],
+            ))
 
         # Get recommended action
         all_candidates = slot_conflicts + [c.fact for c in semantic_conflicts]
@@ -433,7 +479,7 @@ class BeliefRevisionService:
         reason = "No conflicts found"
 
         if unique_candidates:
-            decision = await self._resolve_with_llm(params.fact, unique_candidates)
+            decision, _ = await self._resolve(params.fact, unique_candidates)
             recommended_action = decision.action
             reason = decision.reason
 
@@ -445,21 +491,195 @@ class BeliefRevisionService:
             reason=reason,
         )
 
+    async def revise_many(self, params_list: List[ReviseParams]) -> List[ReviseResult]:
+        """
+        Revise several new facts together (e.g. all facts from one turn).
+
+        Candidate lookups for every fact run concurrently and identical
+        lookups are shared. Earlier facts of the batch are added as
+        candidates for later facts in the same slot or subject+type, so
+        conflicts inside the batch are resolved too. All facts with
+        candidates are resolved with one consolidated LLM prompt and every
+        decision is applied with one batched write.
+
+        Args:
+            params_list: Revise parameters in extraction order (one memory space)
+
+        Returns:
+            ReviseResult per input, in order
+
+        Raises:
+            PartialRevisionError: If writing failed after some facts were stored
+        """
+        if not params_list:
+            return []
+        params_list = [self._own_params(p) for p in params_list]
+        if len(params_list) == 1 or len({p.memory_space_id for p in params_list}) > 1:
+            revised: List[Optional[ReviseResult]] = []
+            for params in params_list:
+                try:
+                    revised.append(await self.revise(params))
+                except Exception as error:
+                    if not revised:
+                        raise
+                    revised.extend([None] * (len(params_list) - len(revised)))
+                    raise PartialRevisionError(revised, error) from error
+            return [result for result in revised if result is not None]
+
+        # Stages 1-2.5 for all facts at once, sharing identical lookups
+        shared: Dict[Any, "asyncio.Future[Any]"] = {}
+        gathered = await asyncio.gather(
+            *(self._gather_candidates(p, shared) for p in params_list)
+        )
+        candidates_list = [list(candidates) for candidates, _ in gathered]
+        pipelines = [pipeline for _, pipeline in gathered]
+
+        self._add_batch_candidates(params_list, candidates_list, pipelines)
+
+        # Stage 3: one LLM resolution for every fact with candidates
+        to_resolve = [i for i, candidates in enumerate(candidates_list) if candidates]
+        resolved = await self._resolve_many(
+            [(params_list[i].fact, candidates_list[i]) for i in to_resolve]
+        )
+        decisions: List[Optional[ConflictDecision]] = [None] * len(params_list)
+        for i, (decision, source) in zip(to_resolve, resolved):
+            decisions[i] = decision
+            pipelines[i]["llm_resolution"] = PipelineStageResult(
+                executed=True,
+                decision=decision.action,
+                source=source,
+            )
+            target_ids = {self._get_fact_id(f) for f in candidates_list[i]}
+            if decision.action == "UPDATE" and decision.merged_fact and decision.target_fact_id in target_ids:
+                params_list[i].fact.fact = decision.merged_fact
+                params_list[i].fact.embedding = None
+
+        # Stage 4: apply all decisions
+        executed, failure = await self._execute_many(params_list, decisions, candidates_list)
+
+        results: List[Optional[ReviseResult]] = []
+        for outcome, execution, pipeline in zip(decisions, executed, pipelines):
+            if execution is None:
+                results.append(None)
+                continue
+            results.append(ReviseResult(
+                action=outcome.action if outcome else "ADD",
+                fact=execution["fact"],
+                superseded=execution["superseded"],
+                reason=outcome.reason if outcome else "No conflicts found - adding new fact",
+                confidence=outcome.confidence if outcome else 100,
+                pipeline=pipeline,
+            ))
+        if failure is not None:
+            raise PartialRevisionError(results, failure) from failure
+        return [result for result in results if result is not None]
+
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Private: Pipeline Stages
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-    async def _find_slot_conflicts(self, params: ReviseParams) -> SlotConflictResult:
+    @staticmethod
+    def _own_params(params: ReviseParams) -> ReviseParams:
+        """Copy params so the pipeline can fill in the fact (embedding, merged
+        text) without touching the caller's objects."""
+        return replace(params, fact=replace(params.fact))
+
+    async def _gather_candidates(
+        self,
+        params: ReviseParams,
+        shared: Optional[Dict[Any, "asyncio.Future[Any]"]] = None,
+    ) -> Tuple[List[Any], Dict[str, PipelineStageResult]]:
+        """
+        Stages 1-2.5: collect existing facts that may conflict with the new fact.
+
+        Args:
+            params: Revise parameters
+            shared: Optional per-batch map of in-flight lookups, so facts in
+                one batch with the same slot or subject reuse one query
+
+        Returns:
+            (candidates, pipeline stage results)
+        """
+        slot_enabled = self._config.slot_matching.enabled if self._config.slot_matching else True
+        semantic_enabled = self._config.semantic_matching.enabled if self._config.semantic_matching else True
+
+        # (pipeline key, lookup, candidates of its result) in priority order;
+        # the first stage with candidates wins, later stages are skipped
+        # (or cancelled in concurrent mode) and not reported
+        stages: List[Tuple[str, Callable[[], Awaitable[Any]], Callable[[Any], List[Any]]]] = []
+        if slot_enabled:
+            # Stage 1: Slot Matching (Fast Path)
+            stages.append((
+                "slot_matching",
+                lambda: self._find_slot_conflicts(params, shared),
+                lambda result: list(result.conflicting_facts) if result.has_conflict else [],
+            ))
+        if semantic_enabled:
+            # Stage 2: Semantic Matching
+            stages.append((
+                "semantic_matching",
+                lambda: self._find_semantic_conflicts(params),
+                lambda result: [r["fact"] for r in result],
+            ))
+        # Stage 2.5: Subject + FactType Matching
+        stages.append((
+            "subject_type_matching",
+            lambda: self._find_subject_type_conflicts(params, shared),
+            lambda result: list(result),
+        ))
+
+        # Concurrent mode starts every lookup now instead of after a miss
+        tasks: List[Optional["asyncio.Future[Any]"]] = [
+            asyncio.ensure_future(lookup()) if self._config.concurrent_stages else None
+            for _, lookup, _ in stages
+        ]
+
+        pipeline_result: Dict[str, PipelineStageResult] = {}
+        candidates: List[Any] = []
+        try:
+            for (name, lookup, candidates_of), task in zip(stages, tasks):
+                candidates = candidates_of(await (task if task is not None else lookup()))
+                pipeline_result[name] = PipelineStageResult(
+                    executed=True,
+                    matched=len(candidates) > 0,
+                    fact_ids=[self._get_fact_id(f) for f in candidates],
+                )
+                if candidates:
+                    break
+        finally:
+            for task in tasks:
+                if task is None:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # A skipped stage's failure is not an error
+
+        return candidates, pipeline_result
+
+    async def _find_slot_conflicts(
+        self,
+        params: ReviseParams,
+        shared: Optional[Dict[Any, "asyncio.Future[Any]"]] = None,
+    ) -> SlotConflictResult:
         """Stage 1: Find slot-based conflicts."""
-        return await self._slot_matcher.find_slot_conflicts(
-            {
-                "subject": params.fact.subject,
-                "predicate": params.fact.predicate,
-                "object": params.fact.object,
-            },
-            params.memory_space_id,
-            params.user_id,
+        slot = self.get_slot(params.fact.subject, params.fact.predicate)
+        result: SlotConflictResult = await self._shared_lookup(
+            shared,
+            ("slot", params.memory_space_id, params.user_id, slot.subject, slot.predicate_class)
+            if slot
+            else None,
+            lambda: self._slot_matcher.find_slot_conflicts(
+                {
+                    "subject": params.fact.subject,
+                    "predicate": params.fact.predicate,
+                    "object": params.fact.object,
+                },
+                params.memory_space_id,
+                params.user_id,
+            ),
         )
+        return result
 
     async def _find_semantic_conflicts(
         self, params: ReviseParams
@@ -467,15 +687,18 @@ class BeliefRevisionService:
         """Stage 2: Find semantic conflicts."""
         threshold = 0.7
         generate_embedding = None
+        embedding_model = None
 
         if self._config.semantic_matching:
             threshold = self._config.semantic_matching.threshold
             generate_embedding = self._config.semantic_matching.generate_embedding
+            embedding_model = self._config.semantic_matching.embedding_model
 
         config = DeduplicationConfig(
             strategy="semantic" if generate_embedding else "structural",
             similarity_threshold=threshold,
             generate_embedding=generate_embedding,
+            embedding_model=embedding_model,
         )
 
         from .deduplication import FactCandidate
@@ -495,6 +718,10 @@ class BeliefRevisionService:
             params.user_id,
         )
 
+        # Keep the embedding so the stored fact is indexed without re-embedding
+        if result.candidate_embedding and not params.fact.embedding:
+            params.fact.embedding = result.candidate_embedding
+
         if result.is_duplicate and result.existing_fact:
             return [
                 {
@@ -505,7 +732,11 @@ class BeliefRevisionService:
 
         return []
 
-    async def _find_subject_type_conflicts(self, params: ReviseParams) -> List[Any]:
+    async def _find_subject_type_conflicts(
+        self,
+        params: ReviseParams,
+        shared: Optional[Dict[Any, "asyncio.Future[Any]"]] = None,
+    ) -> List[Any]:
         """
         Stage 2.5: Find conflicts by subject + factType.
 
@@ -522,30 +753,70 @@ class BeliefRevisionService:
             return []
 
         # Query facts with same subject AND factType
-        facts = await self._client.query(
-            "facts:list",
-            filter_none_values({
-                "memorySpaceId": params.memory_space_id,
-                "userId": params.user_id,
-                "subject": params.fact.subject,
-                "factType": params.fact.fact_type,
-                "includeSuperseded": False,
-                "limit": 20,  # Reasonable limit for LLM processing
-            }),
+        facts = await self._shared_lookup(
+            shared,
+            (
+                "subject_type",
+                params.memory_space_id,
+                params.user_id,
+                params.fact.subject,
+                params.fact.fact_type,
+            ),
+            lambda: self._client.query(
+                "facts:list",
+                filter_none_values({
+                    "memorySpaceId": params.memory_space_id,
+                    "userId": params.user_id,
+                    "subject": params.fact.subject,
+                    "factType": params.fact.fact_type,
+                    "includeSuperseded": False,
+                    "limit": 20,  # Reasonable limit for LLM processing
+                }),
+            ),
         )
 
         return facts or []
 
+    async def _resolve(
+        self,
+        new_fact: ConflictCandidate,
+        existing_facts: List[Any],
+    ) -> Tuple[ConflictDecision, ResolutionSource]:
+        """Stage 3: Resolve conflict with rules, cached decisions, then the LLM."""
+        local = self._resolve_locally(new_fact, existing_facts)
+        if local is None:
+            local = await self._resolve_with_llm(new_fact, existing_facts)
+        self._metrics.record(local[1])
+        return local
+
+    def _resolve_locally(
+        self,
+        new_fact: ConflictCandidate,
+        existing_facts: List[Any],
+    ) -> Optional[Tuple[ConflictDecision, ResolutionSource]]:
+        """Decide without an LLM call: fast-path rules, then the decision cache."""
+        llm_config = self._config.llm_resolution or LLMResolutionConfigOptions()
+        if llm_config.fast_path_rules:
+            decision, rule = self._rules.decide(new_fact, existing_facts)
+            if decision is not None and rule is not None:
+                self._metrics.rule_hits[rule] = self._metrics.rule_hits.get(rule, 0) + 1
+                return decision, "rules"
+
+        cached = self._decision_cache.get(self._decision_cache.key(new_fact, existing_facts))
+        if cached is not None:
+            return cached, "cache"
+        return None
+
     async def _resolve_with_llm(
         self,
         new_fact: ConflictCandidate,
         existing_facts: List[Any],
-    ) -> ConflictDecision:
+    ) -> Tuple[ConflictDecision, ResolutionSource]:
         """Stage 3: Resolve conflict with LLM."""
         # If LLM is disabled or unavailable, use default heuristics
         llm_enabled = self._config.llm_resolution.enabled if self._config.llm_resolution else True
         if not llm_enabled or not self._llm_client:
-            return get_default_decision(new_fact, existing_facts)
+            return get_default_decision(new_fact, existing_facts), "default"
 
         try:
             # Build prompt
@@ -556,6 +827,7 @@ class BeliefRevisionService:
 
             # Call LLM
             model = self._config.llm_resolution.model if self._config.llm_resolution else None
+            self._metrics.llm_calls += 1
             response = await self._llm_client.complete(
                 system=prompt_result.system,
                 prompt=prompt_result.user,
@@ -572,14 +844,213 @@ class BeliefRevisionService:
                 print(
                     f"[Cortex] LLM decision validation failed: {validation.error}. Falling back to default."
                 )
-                return get_default_decision(new_fact, existing_facts)
+                return get_default_decision(new_fact, existing_facts), "default"
 
-            return decision
+            self._decision_cache.put(self._decision_cache.key(new_fact, existing_facts), decision)
+            return decision, "llm"
         except Exception as error:
             print(
                 f"[Cortex] LLM conflict resolution failed: {error}. Falling back to default."
             )
-            return get_default_decision(new_fact, existing_facts)
+            return get_default_decision(new_fact, existing_facts), "default"
+
+    def _add_batch_candidates(
+        self,
+        params_list: List[ReviseParams],
+        candidates_list: List[List[Any]],
+        pipelines: List[Dict[str, PipelineStageResult]],
+    ) -> None:
+        """Add earlier facts of the batch as candidates for later related facts."""
+        keys = []
+        for params in params_list:
+            slot = self.get_slot(params.fact.subject, params.fact.predicate)
+            subject = (params.fact.subject or "").strip().lower()
+            keys.append((
+                (slot.subject, slot.predicate_class) if slot else None,
+                (subject, params.fact.fact_type) if subject and params.fact.fact_type else None,
+                params.fact.fact.strip().lower(),
+            ))
+
+        for j in range(1, len(params_list)):
+            slot_j, subject_type_j, text_j = keys[j]
+            earlier = [
+                i
+                for i in range(j)
+                if (slot_j and keys[i][0] == slot_j)
+                or (subject_type_j and keys[i][1] == subject_type_j)
+                or keys[i][2] == text_j
+            ]
+            if not earlier:
+                continue
+
+            batch_facts = [self._batch_fact(i, params_list[i]) for i in earlier]
+            candidates_list[j].extend(batch_facts)
+            pipelines[j]["batch_matching"] = PipelineStageResult(
+                executed=True,
+                matched=True,
+                fact_ids=[f["factId"] for f in batch_facts],
+            )
+
+    @staticmethod
+    def _batch_fact(index: int, params: ReviseParams) -> Dict[str, Any]:
+        """An earlier fact of the batch in existing-fact form."""
+        return {
+            "factId": f"{BATCH_FACT_PREFIX}{index}",
+            "fact": params.fact.fact,
+            "factType": params.fact.fact_type,
+            "subject": params.fact.subject,
+            "predicate": params.fact.predicate,
+            "object": params.fact.object,
+            "confidence": params.fact.confidence,
+        }
+
+    async def _resolve_many(
+        self,
+        items: List[Tuple[ConflictCandidate, List[Any]]],
+    ) -> List[Tuple[ConflictDecision, ResolutionSource]]:
+        """Stage 3 for a batch: local fast paths, then one LLM call for the rest."""
+        results: List[Optional[Tuple[ConflictDecision, ResolutionSource]]] = [
+            self._resolve_locally(new_fact, existing) for new_fact, existing in items
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if len(pending) == 1:
+            results[pending[0]] = await self._resolve_with_llm(*items[pending[0]])
+        elif pending:
+            resolved = await self._resolve_many_with_llm([items[i] for i in pending])
+            for i, result in zip(pending, resolved):
+                results[i] = result
+
+        final = [result for result in results if result is not None]
+        for _, source in final:
+            self._metrics.record(source)
+        return final
+
+    async def _resolve_many_with_llm(
+        self,
+        items: List[Tuple[ConflictCandidate, List[Any]]],
+    ) -> List[Tuple[ConflictDecision, ResolutionSource]]:
+        """One LLM call for several facts, per-fact fallback to heuristics."""
+        llm_enabled = self._config.llm_resolution.enabled if self._config.llm_resolution else True
+        if not llm_enabled or not self._llm_client:
+            return [(get_default_decision(new_fact, existing), "default") for new_fact, existing in items]
+
+        try:
+            prompt_result = build_batch_conflict_resolution_prompt(items)
+            model = self._config.llm_resolution.model if self._config.llm_resolution else None
+            self._metrics.llm_calls += 1
+            response = await self._llm_client.complete(
+                system=prompt_result.system,
+                prompt=prompt_result.user,
+                model=model,
+                response_format="json",
+            )
+            parsed = parse_batch_conflict_decisions(response, len(items))
+        except Exception as error:
+            print(
+                f"[Cortex] Batch LLM conflict resolution failed: {error}. Falling back to default."
+            )
+            parsed = [None] * len(items)
+
+        results: List[Tuple[ConflictDecision, ResolutionSource]] = []
+        for (new_fact, existing), decision in zip(items, parsed):
+            if decision is None or not validate_conflict_decision(decision, existing).valid:
+                results.append((get_default_decision(new_fact, existing), "default"))
+                continue
+            self._decision_cache.put(self._decision_cache.key(new_fact, existing), decision)
+            results.append((decision, "llm"))
+        return results
+
+    async def _execute_many(
+        self,
+        params_list: List[ReviseParams],
+        decisions: List[Optional[ConflictDecision]],
+        candidates_list: List[List[Any]],
+    ) -> Tuple[List[Optional[Dict[str, Any]]], Optional[Exception]]:
+        """
+        Stage 4 for a batch: apply every decision in one write.
+
+        Returns:
+            (execution per fact, None where not written; error that stopped
+            the writes, if any)
+        """
+        from .._utils import filter_none_values
+
+        ops = []
+        for params, decision in zip(params_list, decisions):
+            op: Dict[str, Any] = {
+                "action": decision.action if decision else "ADD",
+                "fact": filter_none_values({
+                    "participantId": params.participant_id,
+                    "userId": params.user_id,
+                    "fact": params.fact.fact,
+                    "factType": params.fact.fact_type or "custom",
+                    "subject": params.fact.subject,
+                    "predicate": params.fact.predicate,
+                    "object": params.fact.object,
+                    "confidence": params.fact.confidence,
+                    "tags": params.fact.tags or [],
+                    "embedding": params.fact.embedding,
+                    **self._slot_fields(params.fact.subject, params.fact.predicate),
+                }),
+            }
+            target_id = decision.target_fact_id if decision else None
+            if target_id and target_id.startswith(BATCH_FACT_PREFIX):
+                op["targetOp"] = int(target_id[len(BATCH_FACT_PREFIX):])
+            elif target_id:
+                op["targetFactId"] = target_id
+            ops.append(op)
+
+        try:
+            applied = await self._client.mutation(
+                "facts:applyRevisions",
+                {"memorySpaceId": params_list[0].memory_space_id, "ops": ops},
+            )
+        except Exception as error:
+            print(f"[Cortex] Batched revision write failed: {error}. Applying decisions one by one.")
+            return await self._execute_sequentially(params_list, decisions, candidates_list)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for params, result in zip(params_list, applied):
+            if result.get("fact") is None:
+                results.append({"fact": self._skipped_fact(params), "superseded": []})
+            else:
+                results.append({"fact": result["fact"], "superseded": list(result.get("superseded") or [])})
+        return results, None
+
+    async def _execute_sequentially(
+        self,
+        params_list: List[ReviseParams],
+        decisions: List[Optional[ConflictDecision]],
+        candidates_list: List[List[Any]],
+    ) -> Tuple[List[Optional[Dict[str, Any]]], Optional[Exception]]:
+        """
+        Apply batch decisions with one write per fact (backends without applyRevisions).
+
+        Stops at the first failed write, since later decisions may target
+        facts written earlier in the batch.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        for params, decision, candidates in zip(params_list, decisions, candidates_list):
+            target_fact: Optional[Any] = None
+            target_id = decision.target_fact_id if decision else None
+            if target_id and target_id.startswith(BATCH_FACT_PREFIX):
+                earlier = (results[int(target_id[len(BATCH_FACT_PREFIX):])] or {}).get("fact")
+                target_fact = None if isinstance(earlier, dict) and earlier.get("skipped") else earlier
+            elif target_id:
+                target_fact = next(
+                    (f for f in candidates if self._get_fact_id(f) == target_id), None
+                )
+
+            try:
+                results.append(await self._execute_decision(
+                    decision.action if decision else "ADD",
+                    params,
+                    target_fact,
+                    decision.reason if decision else "No conflicts found - adding new fact",
+                ))
+            except Exception as error:
+                return results + [None] * (len(params_list) - len(results)), error
+        return results, None
 
     async def _execute_decision(
         self,
@@ -602,15 +1073,7 @@ class BeliefRevisionService:
             # but didn't specify which existing fact. Return a placeholder result.
             # This can happen when the LLM detects a duplicate concept without
             # identifying the exact existing fact ID.
-            return {
-                "fact": {
-                    "fact_id": None,
-                    "fact": params.fact.fact,
-                    "skipped": True,
-                    "reason": "Fact already captured in knowledge base (NONE action)",
-                },
-                "superseded": [],
-            }
+            return {"fact": self._skipped_fact(params), "superseded": []}
 
         if action == "UPDATE":
             if target_fact:
@@ -622,6 +1085,7 @@ class BeliefRevisionService:
                         "memorySpaceId": params.memory_space_id,
                         "factId": fact_id,
                         "fact": params.fact.fact,
+                        "embedding": params.fact.embedding,
                         "confidence": params.fact.confidence,
                         "tags": params.fact.tags,
                     }),
@@ -645,6 +1109,8 @@ class BeliefRevisionService:
                         "confidence": params.fact.confidence,
                         "sourceType": "conversation",
                         "tags": params.fact.tags or [],
+                        "embedding": params.fact.embedding,
+                        **self._slot_fields(params.fact.subject, params.fact.predicate),
                     }),
                 )
 
@@ -680,6 +1146,8 @@ class BeliefRevisionService:
                 "confidence": params.fact.confidence,
                 "sourceType": "conversation",
                 "tags": params.fact.tags or [],
+                "embedding": params.fact.embedding,
+                **self._slot_fields(params.fact.subject, params.fact.predicate),
             }),
         )
         return {"fact": new_fact, "superseded": []}
@@ -688,6 +1156,39 @@ class BeliefRevisionService:
     # Private: Utilities
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+    @staticmethod
+    async def _shared_lookup(
+        shared: Optional[Dict[Any, "asyncio.Future[Any]"]],
+        key: Optional[Tuple[Any, ...]],
+        lookup: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run ``lookup`` once per key within a batch (always when not batching)."""
+        if shared is None or key is None:
+            return await lookup()
+        future = shared.get(key)
+        if future is None:
+            future = asyncio.ensure_future(lookup())
+            shared[key] = future
+        # Shielded: a cancelled stage must not cancel other facts' lookup
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def _skipped_fact(params: ReviseParams) -> Dict[str, Any]:
+        """Placeholder result for a NONE decision without a target fact."""
+        return {
+            "fact_id": None,
+            "fact": params.fact.fact,
+            "skipped": True,
+            "reason": "Fact already captured in knowledge base (NONE action)",
+        }
+
+    def _slot_fields(self, subject: Optional[str], predicate: Optional[str]) -> Dict[str, str]:
+        """Slot key fields persisted with a new fact."""
+        slot = self.get_slot(subject, predicate)
+        if not slot:
+            return {}
+        return {"normalizedSubject": slot.subject, "predicateClass": slot.predicate_class}
+
     def _get_fact_id(self, fact: Any) -> str:
         """Get fact ID from a fact object or dict."""
         if isinstance(fact, dict):
@@ -705,10 +1206,22 @@ class BeliefRevisionService:
                 result.append(f)
         return result
 
+    def get_slot(self, subject: Optional[str], predicate: Optional[str]) -> Optional[SlotMatch]:
+        """Slot key for a subject/predicate under the configured predicate classes."""
+        return self._slot_matcher.get_slot(subject, predicate)
+
     def get_config(self) -> BeliefRevisionConfig:
         """Get the current configuration."""
         return self._config
 
+    def get_resolution_metrics(self) -> ResolutionMetrics:
+        """Counts of conflict resolutions served by rules, cache, LLM and defaults."""
+        return self._metrics
+
+    def clear_decision_cache(self) -> None:
+        """Drop cached LLM conflict decisions."""
+        self._decision_cache.clear()
+
     def update_config(self, config: BeliefRevisionConfig) -> None:
         """Update configuration."""
         # Merge configs
@@ -725,10 +1238,17 @@ class BeliefRevisionService:
 
         if config.llm_resolution:
             self._config.llm_resolution = config.llm_resolution
+            self._decision_cache = ConflictDecisionCache(
+                max_entries=config.llm_resolution.cache_size,
+                ttl_seconds=config.llm_resolution.cache_ttl_seconds,
+            )
 
         if config.history:
             self._config.history = config.history
 
+        if config.concurrent_stages is not None:
+            self._config.concurrent_stages = config.concurrent_stages
+
         # Reinitialize slot matcher if predicate classes changed
         if config.slot_matching and config.slot_matching.predicate_classes:
             slot_config = SlotMatchingConfig(
@@ -751,6 +1271,8 @@ __all__ = [
     "ConflictCheckResult",
     "SemanticConflict",
     "BeliefRevisionService",
+    "BATCH_FACT_PREFIX",
+    "PartialRevisionError",
     # Re-exports from conflict_prompts
     "ConflictAction",
     "ConflictDecision",
@@ -66,6 +66,9 @@ class ConflictCandidate:
     tags: Optional[List[str]] = None
     """Tags for categorization"""
 
+    embedding: Optional[List[float]] = None
+    """Embedding of the fact text (filled in by semantic matching)"""
+
 
 @dataclass
 class PromptOptions:
@@ -233,26 +236,20 @@ def build_system_prompt(options: Optional[PromptOptions] = None) -> str:
     return prompt
 
 
-def build_user_prompt(
-    new_fact: ConflictCandidate,
-    existing_facts: List[Any],
-    options: Optional[PromptOptions] = None,
-) -> str:
-    """
-    Build the user prompt with the new fact and existing facts.
+USER_TASK_SECTION = """## Your Task
 
-    Args:
-        new_fact: The candidate fact to evaluate
-        existing_facts: List of existing facts to compare against
-        options: Optional prompt options
+Analyze the new fact against the existing facts and determine the appropriate action.
+Return ONLY a valid JSON object with your decision."""
 
-    Returns:
-        Complete user prompt string
-    """
-    max_facts = options.max_existing_facts if options else 10
-    facts_to_include = existing_facts[:max_facts]
+BATCH_TASK_SECTION = """## Your Task
 
-    prompt = f"""## New Fact to Evaluate
+Analyze each of the {count} new facts against its existing facts and determine the appropriate action.
+Return ONLY a valid JSON object with a "decisions" array, one entry per new fact."""
+
+
+def _new_fact_section(new_fact: ConflictCandidate, heading: str) -> str:
+    """Format the new fact under ``heading`` (shared by single and batch prompts)."""
+    return f"""{heading}
 
 Fact: "{new_fact.fact}"
 Type: {new_fact.fact_type or "unknown"}
@@ -261,13 +258,22 @@ Predicate: {new_fact.predicate or "unknown"}
 Object: {new_fact.object or "unknown"}
 Confidence: {new_fact.confidence}
 Tags: {", ".join(new_fact.tags) if new_fact.tags else "none"}
+"""
 
-## Existing Facts
 
-"""
+def _existing_facts_section(
+    existing_facts: List[Any],
+    heading: str,
+    options: Optional[PromptOptions] = None,
+) -> str:
+    """Format the existing facts under ``heading`` (shared by single and batch prompts)."""
+    max_facts = options.max_existing_facts if options else 10
+    facts_to_include = existing_facts[:max_facts]
+
+    section = f"{heading}\n\n"
 
     if not facts_to_include:
-        prompt += "No existing facts found.\n"
+        section += "No existing facts found.\n"
     else:
         for index, fact in enumerate(facts_to_include, 1):
             # Handle both dict and object access
@@ -289,7 +295,7 @@ Tags: {", ".join(new_fact.tags) if new_fact.tags else "none"}
             else:
                 created_str = "unknown"
 
-            prompt += f"""{index}. [ID: {fact_id}] "{fact_text}"
+            section += f"""{index}. [ID: {fact_id}] "{fact_text}"
    Type: {fact_type}
    Subject: {subject}
    Predicate: {predicate}
@@ -299,12 +305,31 @@ Tags: {", ".join(new_fact.tags) if new_fact.tags else "none"}
 
 """
 
-    prompt += """## Your Task
+    return section
 
-Analyze the new fact against the existing facts and determine the appropriate action.
-Return ONLY a valid JSON object with your decision."""
 
-    return prompt
+def build_user_prompt(
+    new_fact: ConflictCandidate,
+    existing_facts: List[Any],
+    options: Optional[PromptOptions] = None,
+) -> str:
+    """
+    Build the user prompt with the new fact and existing facts.
+
+    Args:
+        new_fact: The candidate fact to evaluate
+        existing_facts: List of existing facts to compare against
+        options: Optional prompt options
+
+    Returns:
+        Complete user prompt string
+    """
+    return (
+        _new_fact_section(new_fact, "## New Fact to Evaluate")
+        + "\n"
+        + _existing_facts_section(existing_facts, "## Existing Facts", options)
+        + USER_TASK_SECTION
+    )
 
 
 def _get_attr(obj: Any, snake_attr: str, camel_attr: Optional[str], default: Any) -> Any:
@@ -356,6 +381,54 @@ def build_conflict_resolution_prompt(
     )
 
 
+BATCH_OUTPUT_INSTRUCTIONS = """## Batch Mode
+
+Several new facts are evaluated at once. Decide each one independently
+against its own existing facts. Existing facts with a "batch-" ID are other
+new facts from the same batch that come earlier; they may be targeted like
+any other fact.
+
+Return a JSON object with one decision per new fact:
+{
+  "decisions": [
+    {"index": 1, "action": "...", "targetFactId": ..., "reason": "...", "mergedFact": ..., "confidence": 0-100}
+  ]
+}"""
+
+
+def build_batch_conflict_resolution_prompt(
+    items: List[Any],
+    options: Optional[PromptOptions] = None,
+) -> ConflictResolutionPrompt:
+    """
+    Build one prompt resolving conflicts for several new facts.
+
+    Args:
+        items: (new_fact, existing_facts) pairs, numbered from 1 in order
+        options: Optional prompt options
+
+    Returns:
+        ConflictResolutionPrompt with system and user prompts
+    """
+    sections = [
+        (
+            _new_fact_section(new_fact, f"## New Fact {index}")
+            + "\n"
+            + _existing_facts_section(
+                existing_facts, f"### Existing Facts for New Fact {index}", options
+            )
+        ).rstrip()
+        for index, (new_fact, existing_facts) in enumerate(items, 1)
+    ]
+
+    user = "\n\n".join(sections) + "\n\n" + BATCH_TASK_SECTION.format(count=len(items))
+
+    return ConflictResolutionPrompt(
+        system=build_system_prompt(options) + "\n\n" + BATCH_OUTPUT_INSTRUCTIONS,
+        user=user,
+    )
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Response Parsing
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -401,6 +474,51 @@ def parse_conflict_decision(response: str) -> ConflictDecision:
         raise ValueError(f"Failed to parse JSON: {e}")
 
 
+def parse_batch_conflict_decisions(response: str, count: int) -> List[Optional[ConflictDecision]]:
+    """
+    Parse a batch LLM response into one decision per new fact.
+
+    Entries that are missing or malformed come back as None so callers can
+    fall back for those facts only.
+
+    Args:
+        response: The LLM response string
+        count: Number of new facts in the batch
+
+    Returns:
+        Decisions in batch order (None where unavailable)
+
+    Raises:
+        ValueError: If no decisions array can be found
+    """
+    json_match = re.search(r"\{[\s\S]*\}", response)
+    if not json_match:
+        raise ValueError("No JSON object found in response")
+
+    try:
+        parsed = json.loads(json_match.group(0))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse JSON: {e}")
+
+    entries = parsed.get("decisions") if isinstance(parsed, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError("Response has no decisions array")
+
+    decisions: List[Optional[ConflictDecision]] = [None] * count
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            continue
+        index = entry.get("index", position + 1)
+        if not isinstance(index, int) or not 1 <= index <= count:
+            continue
+        try:
+            decisions[index - 1] = parse_conflict_decision(json.dumps(entry))
+        except ValueError:
+            continue
+
+    return decisions
+
+
 @dataclass
 class ValidationResult:
     """Result of conflict decision validation."""
@@ -582,7 +700,9 @@ __all__ = [
     "build_system_prompt",
     "build_user_prompt",
     "build_conflict_resolution_prompt",
+    "build_batch_conflict_resolution_prompt",
     "parse_conflict_decision",
+    "parse_batch_conflict_decisions",
     "validate_conflict_decision",
     "get_default_decision",
 ]
@@ -10,10 +10,12 @@ Python implementation matching TypeScript src/facts/deduplication.ts
 """
 
 import math
-import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Union
 
+from .embedding_cache import EmbeddingCache, cosine_similarities
+from .normalization import normalize_fact_text
+
 # Type alias for deduplication strategy
 DeduplicationStrategy = Literal["none", "exact", "structural", "semantic"]
 
@@ -42,6 +44,18 @@ class DeduplicationConfig:
     Required when strategy is 'semantic', otherwise ignored.
     """
 
+    generate_embeddings: Optional[Callable[[List[str]], Awaitable[List[List[float]]]]] = None
+    """
+    Optional batch embedding function. When set, embeddings missing from
+    the cache are generated in one call instead of one call per fact.
+    """
+
+    embedding_model: Optional[str] = None
+    """
+    Identifier of the embedding model (e.g. "text-embedding-3-small").
+    Namespaces the embedding cache; set a distinct value per model.
+    """
+
 
 @dataclass
 class FactCandidate:
@@ -75,6 +89,9 @@ class DuplicateResult:
     should_update: Optional[bool] = None
     """Whether the new fact has higher confidence than existing."""
 
+    candidate_embedding: Optional[List[float]] = None
+    """Embedding of the candidate (semantic strategy), reusable when storing it."""
+
 
 @dataclass
 class StoreWithDedupResult:
@@ -95,18 +112,6 @@ class StoreWithDedupResult:
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
-def normalize_fact_text(text: str) -> str:
-    """Normalize fact text for exact matching."""
-    result = text.lower().strip()
-    # Remove punctuation
-    result = re.sub(r"[.,!?;:'\"]+", "", result)
-    # Remove common words
-    result = re.sub(r"\b(the|a|an|is|are|was|were|be|been|being)\b", "", result, flags=re.IGNORECASE)
-    # Collapse whitespace AFTER word removal to handle gaps left by removed words
-    result = re.sub(r"\s+", " ", result)
-    return result.strip()
-
-
 def cosine_similarity(a: List[float], b: List[float]) -> float:
     """Calculate cosine similarity between two vectors."""
     if len(a) != len(b):
@@ -153,14 +158,20 @@ class FactDeduplicationService:
         ```
     """
 
-    def __init__(self, client: Any) -> None:
+    SEMANTIC_TOP_K = 5
+    """Candidates requested from server-side vector search."""
+
+    def __init__(self, client: Any, embedding_cache: Optional[EmbeddingCache] = None) -> None:
         """
         Initialize the deduplication service.
 
         Args:
             client: Convex client instance
+            embedding_cache: Optional shared embedding cache (a private
+                cache is created when omitted)
         """
         self.client = client
+        self.embedding_cache = embedding_cache if embedding_cache is not None else EmbeddingCache()
 
     async def find_duplicate(
         self,
@@ -234,6 +245,15 @@ class FactDeduplicationService:
                 config.generate_embedding,
                 config.similarity_threshold,
                 user_id,
+                config.generate_embeddings,
+                config.embedding_model,
+            )
+
+            candidate_embedding = await self.embedding_cache.get_many(
+                [candidate.fact],
+                generate_embedding=config.generate_embedding,
+                generate_embeddings=config.generate_embeddings,
+                model=config.embedding_model,
             )
 
             if semantic_match:
@@ -243,8 +263,13 @@ class FactDeduplicationService:
                     similarity_score=semantic_match["score"],
                     matched_by="semantic",
                     should_update=candidate.confidence > semantic_match["fact"].confidence,
+                    candidate_embedding=candidate_embedding[0],
                 )
 
+            return DuplicateResult(
+                is_duplicate=False, candidate_embedding=candidate_embedding[0]
+            )
+
         return DuplicateResult(is_duplicate=False)
 
     async def _find_structural_match(
@@ -327,16 +352,90 @@ class FactDeduplicationService:
         generate_embedding: Callable[[str], Awaitable[List[float]]],
         threshold: float,
         user_id: Optional[str] = None,
+        generate_embeddings: Optional[Callable[[List[str]], Awaitable[List[List[float]]]]] = None,
+        embedding_model: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a semantically similar fact using embeddings.
+
+        Runs one top-k vector search over indexed fact embeddings (the
+        ``facts:semanticSearch`` action, filtered by memory space, user and
+        fact type, thresholded server-side). Backends where the action is
+        unavailable fall back to listing facts and scoring them against
+        cached embeddings.
+        """
+        from .._utils import convert_convex_response, filter_none_values
+        from ..types import FactRecord
+
+        candidate_embedding = (
+            await self.embedding_cache.get_many(
+                [candidate.fact],
+                generate_embedding=generate_embedding,
+                generate_embeddings=generate_embeddings,
+                model=embedding_model,
+            )
+        )[0]
+
+        try:
+            scored = await self.client.action(
+                "facts:semanticSearch",
+                filter_none_values({
+                    "memorySpaceId": memory_space_id,
+                    "embedding": candidate_embedding,
+                    "userId": user_id,
+                    "factType": candidate.fact_type,
+                    "minScore": threshold,
+                    "limit": self.SEMANTIC_TOP_K,
+                }),
+            )
+        except Exception:
+            return await self._find_semantic_match_by_listing(
+                candidate,
+                candidate_embedding,
+                memory_space_id,
+                generate_embedding,
+                threshold,
+                user_id,
+                generate_embeddings,
+                embedding_model,
+            )
+
+        best_match: Optional[Dict[str, Any]] = None
+        for fact_data in scored or []:
+            score = fact_data.get("_score")
+            if score is None or score < threshold:
+                continue
+            if not best_match or score > best_match["score"]:
+                converted = convert_convex_response(fact_data)
+                converted.pop("_score", None)
+                best_match = {"fact": FactRecord(**converted), "score": score}
+
+        return best_match
+
+    async def _find_semantic_match_by_listing(
+        self,
+        candidate: FactCandidate,
+        candidate_embedding: List[float],
+        memory_space_id: str,
+        generate_embedding: Callable[[str], Awaitable[List[float]]],
+        threshold: float,
+        user_id: Optional[str] = None,
+        generate_embeddings: Optional[Callable[[List[str]], Awaitable[List[List[float]]]]] = None,
+        embedding_model: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Find a semantically similar fact using embeddings."""
-        # Generate embedding for candidate fact
-        candidate_embedding = await generate_embedding(candidate.fact)
+        """
+        Client-side fallback: list recent facts and score them locally.
 
+        Existing fact embeddings come from the embedding cache; only misses
+        are generated (in one batch when ``generate_embeddings`` is set),
+        and all candidates are scored with one vectorized similarity call.
+        """
         # Build query parameters
         query_params: Dict[str, Any] = {
             "memorySpaceId": memory_space_id,
             "factType": candidate.fact_type,
             "limit": 50,  # Limit for performance
+            "includeEmbedding": True,  # Reads omit embeddings by default
         }
         if user_id:
             query_params["userId"] = user_id
@@ -350,18 +449,24 @@ class FactDeduplicationService:
         from .._utils import convert_convex_response
         from ..types import FactRecord
 
-        best_match: Optional[Dict[str, Any]] = None
-
-        # Compare with each existing fact
-        for fact_data in facts:
-            fact = FactRecord(**convert_convex_response(fact_data))
-
-            # Generate embedding for existing fact
-            existing_embedding = await generate_embedding(fact.fact)
-
-            # Calculate similarity
-            score = cosine_similarity(candidate_embedding, existing_embedding)
+        existing = [FactRecord(**convert_convex_response(f)) for f in facts]
+
+        # Stored embeddings are used as-is; only the rest go through the cache
+        unembedded = [fact.fact for fact in existing if not fact.embedding]
+        generated = dict(zip(
+            unembedded,
+            await self.embedding_cache.get_many(
+                unembedded,
+                generate_embedding=generate_embedding,
+                generate_embeddings=generate_embeddings,
+                model=embedding_model,
+            ) if unembedded else [],
+        ))
+        embeddings = [fact.embedding or generated[fact.fact] for fact in existing]
+        scores = cosine_similarities(candidate_embedding, embeddings)
 
+        best_match: Optional[Dict[str, Any]] = None
+        for fact, score in zip(existing, scores):
             if score >= threshold:
                 if not best_match or score > best_match["score"]:
                     best_match = {"fact": fact, "score": score}
@@ -408,11 +513,7 @@ class FactDeduplicationService:
 
         # Add fallback embedding function if not provided
         if config.generate_embedding is None and fallback_embedding is not None:
-            config = DeduplicationConfig(
-                strategy=config.strategy,
-                similarity_threshold=config.similarity_threshold,
-                generate_embedding=fallback_embedding,
-            )
+            config = replace(config, generate_embedding=fallback_embedding)
 
         # Fallback from semantic to structural if no embedding function
         if config.strategy == "semantic" and config.generate_embedding is None:
@@ -420,11 +521,7 @@ class FactDeduplicationService:
                 "[Cortex] Semantic deduplication requested but no generate_embedding "
                 "function available. Falling back to structural strategy."
             )
-            return DeduplicationConfig(
-                strategy="structural",
-                similarity_threshold=config.similarity_threshold,
-                generate_embedding=config.generate_embedding,
-            )
+            return replace(config, strategy="structural")
 
         return config
 
@@ -0,0 +1,258 @@
+"""
+Cortex SDK - Fact Embedding Cache
+
+Content-hash keyed embedding cache with LRU eviction and TTL, batched
+embedding generation for cache misses, and vectorized cosine similarity
+(NumPy when installed, pure Python otherwise).
+
+Used by semantic deduplication so existing facts are embedded once per
+process instead of on every duplicate check.
+"""
+
+import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+# NumPy is optional - used for matrix similarity when installed
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None  # type: ignore[assignment]
+
+EmbedFn = Callable[[str], Awaitable[List[float]]]
+BatchEmbedFn = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+DEFAULT_EMBEDDING_MODEL = "default"
+"""Cache namespace used when no embedding model identifier is configured."""
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Types
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Embedding cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    batches: int = 0
+    """Number of generation rounds for cache misses."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0-1)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# EmbeddingCache
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class EmbeddingCache:
+    """
+    LRU + TTL embedding cache keyed by content hash.
+
+    Entries are namespaced by an embedding model identifier (e.g.
+    "text-embedding-3-small"), so one cache can be shared by every service
+    that embeds with the same model, and switching models never returns
+    vectors from another embedding space.
+
+    Example:
+        ```python
+        cache = EmbeddingCache(max_entries=5000, ttl_seconds=3600)
+        vectors = await cache.get_many(
+            ["User likes tea", "User lives in Paris"],
+            generate_embedding=embed_fn,
+            model="text-embedding-3-small",
+        )
+        print(cache.stats.hit_rate)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: Optional[float] = 3600.0,
+        max_concurrency: int = 8,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached embeddings before LRU eviction
+            ttl_seconds: Entry lifetime (None = no expiry)
+            max_concurrency: Parallel single-text calls when no batch
+                embedding function is available
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_concurrency = max(1, max_concurrency)
+        self.stats = EmbeddingCacheStats()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, List[float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Stable hash of the text being embedded."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _key(self, text: str, model: Optional[str]) -> Tuple[str, str]:
+        return (model or DEFAULT_EMBEDDING_MODEL, self.content_hash(text))
+
+    def get(self, text: str, model: Optional[str] = None) -> Optional[List[float]]:
+        """Cached embedding of ``text`` by ``model`` or None (counts as hit/miss)."""
+        key = self._key(text, model)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        stored_at, embedding = entry
+        if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return embedding
+
+    def put(self, text: str, embedding: List[float], model: Optional[str] = None) -> None:
+        """Store an embedding, evicting least recently used entries."""
+        key = self._key(text, model)
+        self._entries[key] = (time.monotonic(), embedding)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached embeddings."""
+        self._entries.clear()
+
+    async def get_many(
+        self,
+        texts: Sequence[str],
+        generate_embedding: Optional[EmbedFn] = None,
+        generate_embeddings: Optional[BatchEmbedFn] = None,
+        model: Optional[str] = None,
+    ) -> List[List[float]]:
+        """
+        Embeddings for ``texts``, generating only the cache misses.
+
+        Misses are generated with one ``generate_embeddings`` call when a
+        batch function is given, otherwise with bounded-concurrency calls
+        to ``generate_embedding``. Duplicate texts are embedded once.
+
+        Args:
+            texts: Texts to embed
+            generate_embedding: Single-text embedding function
+            generate_embeddings: Optional batch embedding function
+            model: Embedding model identifier (cache namespace); use a
+                distinct value per model
+
+        Returns:
+            Embeddings in the same order as ``texts``
+        """
+        if generate_embedding is None and generate_embeddings is None:
+            raise ValueError("generate_embedding or generate_embeddings is required")
+
+        results: Dict[str, List[float]] = {}
+        missing: List[str] = []
+
+        for text in dict.fromkeys(texts):
+            cached = self.get(text, model)
+            if cached is None:
+                missing.append(text)
+            else:
+                results[text] = cached
+
+        if missing:
+            self.stats.batches += 1
+            if generate_embeddings is not None:
+                generated = await generate_embeddings(missing)
+            else:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                embed = generate_embedding
+
+                async def _embed(text: str) -> List[float]:
+                    async with semaphore:
+                        return await embed(text)  # type: ignore[misc]
+
+                generated = await asyncio.gather(*(_embed(t) for t in missing))
+
+            for text, embedding in zip(missing, generated):
+                self.put(text, embedding, model)
+                results[text] = embedding
+
+        return [results[text] for text in texts]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Vectorized Similarity
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def cosine_similarities(query: List[float], candidates: List[List[float]]) -> List[float]:
+    """
+    Cosine similarity of ``query`` against every candidate vector.
+
+    Uses one NumPy matrix-vector product when NumPy is installed and a
+    pure-Python loop otherwise. Zero vectors score 0.0.
+
+    Args:
+        query: Query embedding
+        candidates: Candidate embeddings (same dimension as query)
+
+    Returns:
+        Similarity per candidate, in order
+    """
+    if not candidates:
+        return []
+
+    dimension = len(query)
+    for candidate in candidates:
+        if len(candidate) != dimension:
+            raise ValueError(f"Embedding dimension mismatch: {dimension} vs {len(candidate)}")
+
+    if HAS_NUMPY:
+        matrix = np.asarray(candidates, dtype=np.float64)
+        vector = np.asarray(query, dtype=np.float64)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector)
+        dots = matrix @ vector
+        similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+        return [float(s) for s in similarities]
+
+    query_norm = math.sqrt(sum(x * x for x in query))
+    scores: List[float] = []
+    for candidate in candidates:
+        magnitude = query_norm * math.sqrt(sum(x * x for x in candidate))
+        if magnitude == 0:
+            scores.append(0.0)
+        else:
+            scores.append(sum(a * b for a, b in zip(query, candidate)) / magnitude)
+    return scores
+
+
+__all__ = [
+    "DEFAULT_EMBEDDING_MODEL",
+    "HAS_NUMPY",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "cosine_similarities",
+]
@@ -80,6 +80,9 @@ class FactChangeEvent:
     conversation_id: Optional[str] = None
     """Conversation ID if applicable"""
 
+    compacted: int = 0
+    """Number of earlier UPDATE events folded into this one by compaction"""
+
 
 @dataclass
 class LogEventParams:
@@ -192,6 +195,20 @@ class ActivitySummary:
     """Number of active participants"""
 
 
+@dataclass
+class DailyActivity:
+    """Rolled-up event counts for one UTC day."""
+
+    day: int
+    """Start of the UTC day (Unix timestamp in ms)"""
+
+    total_events: int
+    """Total number of events"""
+
+    action_counts: ActionCounts
+    """Counts by action type"""
+
+
 @dataclass
 class SupersessionChainEntry:
     """Supersession chain entry."""
@@ -464,13 +481,19 @@ class FactHistoryService:
         self,
         memory_space_id: str,
         hours: int = 24,
+        include_uniques: bool = False,
     ) -> ActivitySummary:
         """
         Get activity summary for a time period.
 
+        Event counts are served from daily rollups. Unique facts and
+        participants need a scan of the window's events, so they are only
+        counted with ``include_uniques=True`` (otherwise reported as 0).
+
         Args:
             memory_space_id: Memory space to query
             hours: Number of hours to look back (default: 24)
+            include_uniques: Count unique facts and participants (default: False)
 
         Returns:
             Activity summary
@@ -481,6 +504,7 @@ class FactHistoryService:
                 {
                     "memorySpaceId": memory_space_id,
                     "hours": hours,
+                    "includeUniques": include_uniques,
                 },
             ),
             "factHistory:getActivitySummary",
@@ -506,6 +530,49 @@ class FactHistoryService:
             active_participants=result.get("activeParticipants", 0),
         )
 
+    async def get_daily_activity(
+        self,
+        memory_space_id: str,
+        days: int = 30,
+    ) -> List[DailyActivity]:
+        """
+        Get per-day event counts.
+
+        Served from the rollups; days before the space's rollups began are
+        counted from raw events. Days without events are omitted.
+
+        Args:
+            memory_space_id: Memory space to query
+            days: Number of days to look back, including today (default: 30)
+
+        Returns:
+            Daily activity, oldest day first
+        """
+        result = await self._execute_with_resilience(
+            lambda: self._client.query(
+                "factHistory:getDailyActivity",
+                {
+                    "memorySpaceId": memory_space_id,
+                    "days": days,
+                },
+            ),
+            "factHistory:getDailyActivity",
+        )
+
+        return [
+            DailyActivity(
+                day=r.get("day", 0),
+                total_events=r.get("totalEvents", 0),
+                action_counts=ActionCounts(
+                    CREATE=r.get("actionCounts", {}).get("CREATE", 0),
+                    UPDATE=r.get("actionCounts", {}).get("UPDATE", 0),
+                    SUPERSEDE=r.get("actionCounts", {}).get("SUPERSEDE", 0),
+                    DELETE=r.get("actionCounts", {}).get("DELETE", 0),
+                ),
+            )
+            for r in (result or [])
+        ]
+
     async def delete_by_fact_id(self, fact_id: str) -> Dict[str, int]:
         """
         Delete history for a fact (GDPR cascade).
@@ -604,6 +671,96 @@ class FactHistoryService:
             "remaining": result.get("remaining", 0),
         }
 
+    async def compact(
+        self,
+        memory_space_id: str,
+        older_than: datetime,
+        page_size: int = 500,
+    ) -> Dict[str, int]:
+        """
+        Collapse old intermediate UPDATE events (retention policy).
+
+        For each fact, UPDATE events before ``older_than`` are folded into the
+        latest one, which keeps the earliest old value and records how many
+        events it replaced. CREATE, SUPERSEDE and DELETE events are kept, so
+        supersession chains are unaffected, and daily rollup counts do not
+        change.
+
+        Args:
+            memory_space_id: Memory space to compact
+            older_than: Only compact events before this date
+            page_size: Events scanned per mutation (default: 500)
+
+        Returns:
+            Dict with number of events deleted
+        """
+        deleted = 0
+        cursor: Optional[str] = None
+
+        while True:
+            result = await self._execute_with_resilience(
+                lambda: self._client.mutation(
+                    "factHistory:compactEvents",
+                    {
+                        "memorySpaceId": memory_space_id,
+                        "olderThan": int(older_than.timestamp() * 1000),
+                        "paginationOpts": {"numItems": page_size, "cursor": cursor},
+                    },
+                ),
+                "factHistory:compactEvents",
+            )
+            deleted += result.get("deleted", 0)
+            cursor = result.get("continueCursor")
+            if result.get("isDone", True) or not cursor:
+                break
+
+        return {"deleted": deleted}
+
+    async def rebuild_rollups(
+        self,
+        memory_space_id: str,
+        page_size: int = 500,
+    ) -> Dict[str, int]:
+        """
+        Rebuild a memory space's daily rollups from its stored events.
+
+        Counts for history logged before rollups existed are read from raw
+        events until this runs. Events already removed by
+        ``purge_old_events`` cannot be recounted.
+
+        Args:
+            memory_space_id: Memory space to rebuild
+            page_size: Events counted per mutation (default: 500)
+
+        Returns:
+            Dict with number of events counted
+        """
+        from .._utils import filter_none_values
+
+        counted = 0
+        cursor: Optional[str] = None
+        started_at: Optional[int] = None
+
+        while True:
+            result = await self._execute_with_resilience(
+                lambda: self._client.mutation(
+                    "factHistory:rebuildRollups",
+                    filter_none_values({
+                        "memorySpaceId": memory_space_id,
+                        "rebuildStartedAt": started_at,
+                        "paginationOpts": {"numItems": page_size, "cursor": cursor},
+                    }),
+                ),
+                "factHistory:rebuildRollups",
+            )
+            counted += result.get("counted", 0)
+            started_at = result.get("rebuildStartedAt")
+            cursor = result.get("continueCursor")
+            if result.get("isDone", True) or not cursor:
+                break
+
+        return {"counted": counted}
+
     def _parse_event(self, data: Dict[str, Any]) -> FactChangeEvent:
         """Parse a raw event dict into a FactChangeEvent."""
         pipeline_data = data.get("pipeline")
@@ -631,6 +788,7 @@ class FactHistoryService:
             user_id=data.get("userId"),
             participant_id=data.get("participantId"),
             conversation_id=data.get("conversationId"),
+            compacted=data.get("compacted", 0),
         )
 
 
@@ -643,6 +801,7 @@ __all__ = [
     "TimeRange",
     "ActionCounts",
     "ActivitySummary",
+    "DailyActivity",
     "SupersessionChainEntry",
     "FactHistoryService",
 ]
@@ -0,0 +1,129 @@
+"""
+Cortex SDK - Fact Text Normalization
+
+Shared normalization for fact text, subjects and predicates, used by the
+exact dedup path, slot matching and in-stream fact keys. Each helper makes a
+single pass over the lowercased string (punctuation is stripped with a
+translation table and stopwords are dropped with a set lookup), and results
+are memoized because extracted facts repeat the same strings constantly.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Tables
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+PUNCTUATION = ".,!?;:'\""
+"""Characters removed from fact text and predicates"""
+
+STOPWORDS = frozenset({"the", "a", "an", "is", "are", "was", "were", "be", "been", "being"})
+"""Words dropped from fact text before exact matching"""
+
+NORMALIZATION_CACHE_SIZE = 8192
+"""Distinct strings memoized per helper"""
+
+_STRIP_PUNCTUATION = str.maketrans("", "", PUNCTUATION)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Normalizers
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def normalize_fact_text(text: str) -> str:
+    """
+    Normalize fact text for exact matching.
+
+    Lowercases, removes punctuation and stopwords, and collapses whitespace.
+    Stopwords are matched as whole whitespace-separated tokens.
+
+    Args:
+        text: The fact text
+
+    Returns:
+        Normalized fact text
+
+    Example:
+        >>> normalize_fact_text("The user is a Vegetarian.")
+        'user vegetarian'
+    """
+    tokens = text.lower().translate(_STRIP_PUNCTUATION).split()
+    return " ".join([token for token in tokens if token not in STOPWORDS])
+
+
+def normalize_subject(subject: Optional[str]) -> str:
+    """
+    Normalize a subject string for matching.
+
+    Args:
+        subject: The subject string to normalize
+
+    Returns:
+        Normalized subject string (lowercase, trimmed, collapsed whitespace)
+    """
+    if not subject:
+        return ""
+    return _normalize_subject(subject)
+
+
+def normalize_predicate(predicate: Optional[str]) -> str:
+    """
+    Normalize a predicate string for classification.
+
+    Args:
+        predicate: The predicate string to normalize
+
+    Returns:
+        Normalized predicate string (lowercase, trimmed, no punctuation)
+    """
+    if not predicate:
+        return ""
+    return _normalize_predicate(predicate)
+
+
+def fact_key(fact: str, subject: Optional[str] = None) -> str:
+    """
+    Key for in-memory deduplication of extracted facts.
+
+    Args:
+        fact: The fact text
+        subject: Optional subject, kept distinct from the text
+
+    Returns:
+        ``"<subject>::<text>"`` when a subject is given, else the text
+    """
+    normalized = normalize_fact_text(fact)
+    return f"{_normalize_subject(subject)}::{normalized}" if subject else normalized
+
+
+def clear_normalization_caches() -> None:
+    """Drop all memoized normalization results."""
+    normalize_fact_text.cache_clear()
+    _normalize_subject.cache_clear()
+    _normalize_predicate.cache_clear()
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def _normalize_subject(subject: str) -> str:
+    return " ".join(subject.lower().split())
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def _normalize_predicate(predicate: str) -> str:
+    # Whitespace is collapsed before punctuation is removed, as it always was
+    return " ".join(predicate.lower().split()).translate(_STRIP_PUNCTUATION)
+
+
+__all__ = [
+    "PUNCTUATION",
+    "STOPWORDS",
+    "NORMALIZATION_CACHE_SIZE",
+    "normalize_fact_text",
+    "normalize_subject",
+    "normalize_predicate",
+    "fact_key",
+    "clear_normalization_caches",
+]
@@ -0,0 +1,315 @@
+"""
+Cortex SDK - Conflict Resolution Fast Paths
+
+Deterministic rules that decide trivially decidable conflicts without an
+LLM call, a cache of LLM decisions keyed by a canonical hash of the new
+fact and its candidates, and counters for how each resolution was served.
+
+Rules (first match wins):
+1. Identical normalized text  -> NONE (duplicate), UPDATE when the new
+   fact has higher confidence
+2. Same slot, same object     -> NONE (already captured), UPDATE when the
+   new fact has higher confidence
+3. Same single-valued slot, different object, newer than the stored
+   fact                       -> SUPERSEDE the most recent fact in the slot
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Literal, Optional, Tuple
+
+from .conflict_prompts import ConflictCandidate, ConflictDecision
+from .normalization import normalize_fact_text, normalize_subject
+from .slot_matching import SlotMatch
+
+ResolutionSource = Literal["rules", "cache", "llm", "default"]
+
+SlotFn = Callable[[Optional[str], Optional[str]], Optional[SlotMatch]]
+
+# Predicate classes that hold one value per subject at a time. Multi-valued
+# classes (education, language, hobbies, ...) accumulate instead.
+SINGLE_VALUED_PREDICATE_CLASSES: FrozenSet[str] = frozenset({
+    "favorite_color",
+    "location",
+    "employment",
+    "age",
+    "name",
+    "relationship_status",
+    "contact_preference",
+    "addressing_preference",
+    "timezone",
+})
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Types
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+@dataclass
+class ResolutionMetrics:
+    """Counters for how conflict resolutions were served."""
+
+    rules: int = 0
+    """Resolutions decided by deterministic rules."""
+
+    cache_hits: int = 0
+    """Resolutions served from the LLM decision cache."""
+
+    llm: int = 0
+    """Resolutions decided by the LLM."""
+
+    llm_calls: int = 0
+    """LLM requests made (a batch prompt resolves several facts in one)."""
+
+    defaults: int = 0
+    """Resolutions decided by the default heuristics (LLM disabled or failed)."""
+
+    rule_hits: Dict[str, int] = field(default_factory=dict)
+    """Resolutions per rule name."""
+
+    @property
+    def total(self) -> int:
+        """All resolutions."""
+        return self.rules + self.cache_hits + self.llm + self.defaults
+
+    def record(self, source: ResolutionSource, count: int = 1) -> None:
+        """Count ``count`` resolutions served by ``source``."""
+        if source == "rules":
+            self.rules += count
+        elif source == "cache":
+            self.cache_hits += count
+        elif source == "llm":
+            self.llm += count
+        else:
+            self.defaults += count
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Helpers
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def _get_attr(obj: Any, snake: str, camel: Optional[str] = None) -> Any:
+    """Read a field from a FactRecord or a raw Convex dict."""
+    if isinstance(obj, dict):
+        value = obj.get(camel or snake)
+        return obj.get(snake) if value is None else value
+    value = getattr(obj, snake, None)
+    return getattr(obj, camel, None) if value is None and camel else value
+
+
+def _fact_timestamp(fact: Any) -> Optional[float]:
+    """When a stored fact became true (validFrom, else createdAt)."""
+    for snake, camel in (("valid_from", "validFrom"), ("created_at", "createdAt")):
+        value = _get_attr(fact, snake, camel)
+        if isinstance(value, (int, float)):
+            return float(value)
+    return None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Rule Engine
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class ResolutionRuleEngine:
+    """
+    Decide trivially decidable conflicts locally.
+
+    Returns None when no rule applies so the caller can ask the LLM.
+
+    Example:
+        >>> engine = ResolutionRuleEngine(slot_matcher.get_slot)
+        >>> decision, rule = engine.decide(new_fact, candidates)
+    """
+
+    def __init__(
+        self,
+        get_slot: SlotFn,
+        single_valued_classes: FrozenSet[str] = SINGLE_VALUED_PREDICATE_CLASSES,
+    ) -> None:
+        """
+        Initialize the rule engine.
+
+        Args:
+            get_slot: Slot key for a subject/predicate (configured classes)
+            single_valued_classes: Predicate classes holding one value at a time
+        """
+        self._get_slot = get_slot
+        self._single_valued = single_valued_classes
+
+    def decide(
+        self,
+        new_fact: ConflictCandidate,
+        existing_facts: List[Any],
+        now: Optional[float] = None,
+    ) -> Tuple[Optional[ConflictDecision], Optional[str]]:
+        """
+        Apply the rules to a new fact and its candidates.
+
+        Args:
+            new_fact: The new fact
+            existing_facts: Conflict candidates
+            now: Timestamp of the new fact in ms (defaults to the current time)
+
+        Returns:
+            (decision, rule name), or (None, None) when no rule applies
+        """
+        if not existing_facts:
+            return None, None
+
+        # Rule 1: identical normalized text
+        new_text = normalize_fact_text(new_fact.fact)
+        for existing in existing_facts:
+            text = _get_attr(existing, "fact")
+            if new_text and text and normalize_fact_text(text) == new_text:
+                return self._duplicate(new_fact, existing, "Identical fact already stored"), "identical_text"
+
+        slot = self._get_slot(new_fact.subject, new_fact.predicate)
+        if slot is None:
+            return None, None
+        in_slot = [
+            f for f in existing_facts
+            if self._get_slot(_get_attr(f, "subject"), _get_attr(f, "predicate")) == slot
+        ]
+        if not in_slot:
+            return None, None
+
+        # Rule 2: same slot, same object
+        new_object = normalize_subject(new_fact.object)
+        if new_object:
+            for existing in in_slot:
+                if normalize_subject(_get_attr(existing, "object")) == new_object:
+                    return self._duplicate(
+                        new_fact, existing, f"Same {slot.predicate_class} value already stored"
+                    ), "same_object"
+
+        # Rule 3: single-valued slot with a newer value
+        if slot.predicate_class not in self._single_valued or not new_object:
+            return None, None
+        timestamps = [_fact_timestamp(f) for f in in_slot]
+        if any(ts is None for ts in timestamps):
+            # Unstored candidates (e.g. earlier facts of a batch) need the LLM
+            return None, None
+        newest_ts, newest = max(zip(timestamps, in_slot), key=lambda pair: pair[0] or 0.0)
+        current = now if now is not None else time.time() * 1000
+        if newest_ts is not None and newest_ts < current:
+            return self._decision(
+                "SUPERSEDE", newest, f"Newer {slot.predicate_class} value replaces the stored one"
+            ), "single_valued_slot"
+        return None, None
+
+    @classmethod
+    def _duplicate(cls, new_fact: ConflictCandidate, existing: Any, reason: str) -> ConflictDecision:
+        """NONE for a restated fact, UPDATE when it raises the confidence."""
+        if new_fact.confidence > (_get_attr(existing, "confidence") or 0):
+            return cls._decision("UPDATE", existing, f"{reason} - raising confidence")
+        return cls._decision("NONE", existing, reason)
+
+    @staticmethod
+    def _decision(action: Any, target: Any, reason: str) -> ConflictDecision:
+        return ConflictDecision(
+            action=action,
+            target_fact_id=_get_attr(target, "fact_id", "factId"),
+            reason=reason,
+            merged_fact=None,
+            confidence=100,
+        )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Decision Cache
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class ConflictDecisionCache:
+    """
+    LRU + TTL cache of LLM conflict decisions.
+
+    Keys hash the new fact and the candidate IDs with their versions, so a
+    candidate that changes (new version, update in place) misses the cache.
+
+    Example:
+        >>> cache = ConflictDecisionCache(max_entries=1000)
+        >>> key = cache.key(new_fact, candidates)
+        >>> decision = cache.get(key)
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: Optional[float] = 3600.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached decisions before LRU eviction
+            ttl_seconds: Entry lifetime (None = no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, ConflictDecision]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(new_fact: ConflictCandidate, existing_facts: List[Any]) -> str:
+        """Canonical hash of (new fact, candidate IDs + versions)."""
+        candidates = sorted(
+            (
+                str(_get_attr(f, "fact_id", "factId") or ""),
+                # Unstored candidates have no version; their text identifies them
+                str(_get_attr(f, "version") or _get_attr(f, "updated_at", "updatedAt") or _get_attr(f, "fact") or ""),
+            )
+            for f in existing_facts
+        )
+        payload = json.dumps(
+            {
+                "fact": new_fact.fact.strip(),
+                "type": new_fact.fact_type,
+                "subject": new_fact.subject,
+                "predicate": new_fact.predicate,
+                "object": new_fact.object,
+                "confidence": new_fact.confidence,
+                "candidates": candidates,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ConflictDecision]:
+        """Cached decision for ``key`` or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, decision = entry
+        if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return decision
+
+    def put(self, key: str, decision: ConflictDecision) -> None:
+        """Store a decision, evicting least recently used entries."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), decision)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached decisions."""
+        self._entries.clear()
+
+
+__all__ = [
+    "ConflictDecisionCache",
+    "ResolutionMetrics",
+    "ResolutionRuleEngine",
+    "ResolutionSource",
+    "SINGLE_VALUED_PREDICATE_CLASSES",
+]
@@ -10,7 +10,10 @@ obvious conflicts before more expensive semantic/LLM processing.
 
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .normalization import normalize_predicate, normalize_subject
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Types
@@ -233,45 +236,150 @@ DEFAULT_PREDICATE_CLASSES: Dict[str, List[str]] = {
 }
 
 
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# Utility Functions
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+class PredicateClassifier:
+    """
+    Predicate classes compiled into a single regex.
+
+    Classification returns the highest-priority class (class order, as
+    listed) with any pattern contained in the normalized predicate - the
+    same first-match-wins result as testing every pattern of every class
+    in turn, in one pass over the predicate.
 
+    All patterns are compiled into one prefix-trie alternation inside a
+    lookahead, so ``finditer`` reports the longest pattern starting at
+    each position. Every pattern that is a prefix of that match also
+    matches there, so each pattern carries the best priority among its
+    prefixes. Results are memoized per raw predicate.
 
-def normalize_subject(subject: Optional[str]) -> str:
+    Example:
+        >>> classifier = PredicateClassifier(DEFAULT_PREDICATE_CLASSES)
+        >>> classifier.classify("Lives in")
+        'location'
     """
-    Normalize a subject string for matching.
 
-    Args:
-        subject: The subject string to normalize
+    def __init__(self, classes: Dict[str, List[str]], cache_size: int = 4096) -> None:
+        """
+        Compile predicate classes.
 
-    Returns:
-        Normalized subject string (lowercase, trimmed, collapsed whitespace)
-    """
-    if not subject:
-        return ""
-    return re.sub(r"\s+", " ", subject.lower().strip())
+        Args:
+            classes: Slot class name to patterns, in priority order
+            cache_size: Memoized predicates (0 disables memoization)
+        """
+        self._class_names = list(classes)
+        priorities: Dict[str, int] = {}
+        for index, patterns in enumerate(classes.values()):
+            for pattern in patterns:
+                priorities.setdefault(pattern.lower(), index)
+
+        # A match also covers every pattern that is a prefix of it
+        self._priorities = {
+            pattern: min(p for other, p in priorities.items() if pattern.startswith(other))
+            for pattern in priorities
+        }
+        self._always_matches = self._priorities.get("")
+        trie = self._trie_pattern([p for p in priorities if p])
+        self._regex = re.compile(f"(?=({trie}))") if trie else None
+
+        if cache_size > 0:
+            self.classify = lru_cache(maxsize=cache_size)(self._classify)  # type: ignore[method-assign]
+
+    @staticmethod
+    def _trie_pattern(patterns: List[str]) -> str:
+        """Regex alternation factored into a prefix trie (longest match wins)."""
+        trie: Dict[str, Any] = {}
+        for pattern in patterns:
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        def build(node: Dict[str, Any]) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            # Greedy optional: prefer the longer pattern, fall back to this one
+            return f"(?:{body})?" if "" in node else body
+
+        return build(trie)
+
+    def classify(self, predicate: Optional[str]) -> str:
+        """
+        Classify a predicate into a slot class.
+
+        Args:
+            predicate: The predicate to classify
+
+        Returns:
+            The slot class name, or the normalized predicate if no class matches
+        """
+        return self._classify(predicate)
 
+    def _classify(self, predicate: Optional[str]) -> str:
+        if not predicate:
+            return "unknown"
 
-def normalize_predicate(predicate: Optional[str]) -> str:
+        normalized = normalize_predicate(predicate)
+        best = self._always_matches
+        if self._regex is not None:
+            for match in self._regex.finditer(normalized):
+                priority = self._priorities[match.group(1)]
+                if best is None or priority < best:
+                    best = priority
+                    if best == 0:
+                        break
+
+        # No class match - return normalized predicate as fallback
+        return self._class_names[best] if best is not None else normalized
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Utility Functions
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def merge_predicate_classes(
+    custom_classes: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, List[str]]:
     """
-    Normalize a predicate string for classification.
+    Merge custom predicate classes into the defaults.
+
+    Arrays are merged, not replaced: custom patterns come first (higher
+    priority) within an existing class, and new classes are appended.
 
     Args:
-        predicate: The predicate string to normalize
+        custom_classes: Optional custom predicate classes
 
     Returns:
-        Normalized predicate string (lowercase, trimmed, no punctuation)
+        Merged predicate classes in priority order
     """
-    if not predicate:
-        return ""
-    # Lowercase and trim
-    normalized = predicate.lower().strip()
-    # Collapse whitespace
-    normalized = re.sub(r"\s+", " ", normalized)
-    # Remove punctuation
-    normalized = re.sub(r"[.,!?;:'\"]+", "", normalized)
-    return normalized
+    if not custom_classes:
+        return DEFAULT_PREDICATE_CLASSES
+
+    classes = dict(DEFAULT_PREDICATE_CLASSES)
+    for key, patterns in custom_classes.items():
+        if key in classes:
+            classes[key] = patterns + classes[key]
+        else:
+            classes[key] = patterns
+    return classes
+
+
+@lru_cache(maxsize=32)
+def _compiled_classifier(
+    frozen_classes: Optional[Tuple[Tuple[str, Tuple[str, ...]], ...]],
+) -> "PredicateClassifier":
+    custom = {key: list(patterns) for key, patterns in frozen_classes} if frozen_classes else None
+    return PredicateClassifier(merge_predicate_classes(custom))
+
+
+def _classifier_for(custom_classes: Optional[Dict[str, List[str]]]) -> "PredicateClassifier":
+    """Shared compiled classifier for the defaults merged with ``custom_classes``."""
+    if not custom_classes:
+        return _compiled_classifier(None)
+    return _compiled_classifier(
+        tuple((key, tuple(patterns)) for key, patterns in custom_classes.items())
+    )
 
 
 def classify_predicate(
@@ -288,32 +396,7 @@ def classify_predicate(
     Returns:
         The slot class name, or the normalized predicate if no class matches
     """
-    if not predicate:
-        return "unknown"
-
-    normalized = normalize_predicate(predicate)
-
-    # Merge default and custom classes (arrays are merged, not replaced)
-    if custom_classes:
-        classes = dict(DEFAULT_PREDICATE_CLASSES)
-        for key, patterns in custom_classes.items():
-            if key in classes:
-                # Merge arrays - custom patterns come first (higher priority)
-                classes[key] = patterns + classes[key]
-            else:
-                # New slot class
-                classes[key] = patterns
-    else:
-        classes = DEFAULT_PREDICATE_CLASSES
-
-    # Check each class for a match
-    for class_name, patterns in classes.items():
-        for pattern in patterns:
-            if pattern.lower() in normalized:
-                return class_name
-
-    # No class match - return normalized predicate as fallback
-    return normalized
+    return _classifier_for(custom_classes).classify(predicate)
 
 
 def extract_slot(
@@ -384,6 +467,27 @@ class SlotMatchingService:
         """
         self._client = client
         self._custom_classes = config.predicate_classes if config else None
+        self._classifier = PredicateClassifier(merge_predicate_classes(self._custom_classes))
+        self._slot_key = lru_cache(maxsize=4096)(self._compute_slot_key)
+        # Spaces known to have slot keys on every current fact
+        self._slotted_spaces: Set[str] = set()
+
+    def _compute_slot_key(
+        self, subject: Optional[str], predicate: Optional[str]
+    ) -> Optional[Tuple[str, str]]:
+        normalized_subject = normalize_subject(subject)
+        if not normalized_subject or not predicate:
+            return None
+        return normalized_subject, self._classifier.classify(predicate)
+
+    def _extract_slot(
+        self, subject: Optional[str], predicate: Optional[str]
+    ) -> Optional[SlotMatch]:
+        """extract_slot() with this service's compiled classes, memoized per (subject, predicate)."""
+        key = self._slot_key(subject, predicate)
+        if key is None:
+            return None
+        return SlotMatch(subject=key[0], predicate_class=key[1])
 
     async def find_slot_conflicts(
         self,
@@ -403,10 +507,9 @@ class SlotMatchingService:
             SlotConflictResult with conflict status and any conflicting facts
         """
         # Extract slot from candidate
-        slot = extract_slot(
+        slot = self._extract_slot(
             candidate.get("subject"),
             candidate.get("predicate"),
-            self._custom_classes,
         )
 
         # If we can't extract a slot, no conflict detection possible
@@ -416,7 +519,18 @@ class SlotMatchingService:
                 conflicting_facts=[],
             )
 
-        # Query for facts with the same subject
+        # Indexed lookup of current facts stored with this slot key
+        slot_facts = await self._query_by_slot(memory_space_id, slot, user_id)
+        current = [fact for fact in slot_facts or [] if not self._is_superseded(fact)]
+        if slot_facts is not None and not await self._has_unslotted(memory_space_id):
+            return SlotConflictResult(
+                has_conflict=len(current) > 0,
+                slot=slot,
+                conflicting_facts=current,
+            )
+
+        # Backend without slot keys, or facts not backfilled yet: classify
+        # the subject's facts client-side
         subject_facts = await self._query_by_subject(
             memory_space_id,
             candidate.get("subject") or "",
@@ -426,26 +540,96 @@ class SlotMatchingService:
         # Filter to facts in the same slot class
         conflicting_facts = []
         for fact in subject_facts:
-            fact_slot = extract_slot(
+            fact_slot = self._extract_slot(
                 getattr(fact, "subject", None) or fact.get("subject") if isinstance(fact, dict) else None,
                 getattr(fact, "predicate", None) or fact.get("predicate") if isinstance(fact, dict) else None,
-                self._custom_classes,
             )
 
             if fact_slot and fact_slot.predicate_class == slot.predicate_class:
-                # Check if fact is not superseded
-                superseded_by = getattr(fact, "superseded_by", None) or (
-                    fact.get("supersededBy") if isinstance(fact, dict) else None
-                )
-                if superseded_by is None:
+                if not self._is_superseded(fact):
                     conflicting_facts.append(fact)
 
+        # Keep indexed hits the subject scan missed (e.g. other subject spelling)
+        seen = {self._fact_id(fact) for fact in conflicting_facts}
+        conflicting_facts.extend(fact for fact in current if self._fact_id(fact) not in seen)
+
         return SlotConflictResult(
             has_conflict=len(conflicting_facts) > 0,
             slot=slot,
             conflicting_facts=conflicting_facts,
         )
 
+    @staticmethod
+    def _fact_id(fact: Any) -> Optional[str]:
+        return fact.get("factId") if isinstance(fact, dict) else getattr(fact, "fact_id", None)
+
+    @staticmethod
+    def _is_superseded(fact: Any) -> bool:
+        superseded_by = getattr(fact, "superseded_by", None) or (
+            fact.get("supersededBy") if isinstance(fact, dict) else None
+        )
+        return superseded_by is not None
+
+    async def _query_by_slot(
+        self,
+        memory_space_id: str,
+        slot: SlotMatch,
+        user_id: Optional[str] = None,
+    ) -> Optional[List[Any]]:
+        """
+        Query current facts stored with a slot key.
+
+        Args:
+            memory_space_id: Memory space to search in
+            slot: Slot to look up
+            user_id: Optional user ID filter
+
+        Returns:
+            Facts in the slot, or None if the backend has no slot index
+        """
+        try:
+            from .._utils import filter_none_values
+
+            facts = await self._client.query(
+                "facts:queryBySlot",
+                filter_none_values({
+                    "memorySpaceId": memory_space_id,
+                    "normalizedSubject": slot.subject,
+                    "predicateClass": slot.predicate_class,
+                    "userId": user_id,
+                    "limit": 100,
+                }),
+            )
+            return list(facts or [])
+        except Exception:
+            return None
+
+    async def _has_unslotted(self, memory_space_id: str) -> bool:
+        """
+        Whether the space may still have current facts without slot keys.
+
+        New facts are always stored with slot keys, so once a space reports
+        none (e.g. after ``FactsAPI.backfill_slots``) the answer is cached.
+
+        Args:
+            memory_space_id: Memory space to check
+
+        Returns:
+            True unless the backend confirms every current fact has a slot key
+        """
+        if memory_space_id in self._slotted_spaces:
+            return False
+        try:
+            unslotted = await self._client.query(
+                "facts:hasUnslotted", {"memorySpaceId": memory_space_id}
+            )
+        except Exception:
+            return True
+        if unslotted is False:
+            self._slotted_spaces.add(memory_space_id)
+            return False
+        return True
+
     async def _query_by_subject(
         self,
         memory_space_id: str,
@@ -496,7 +680,7 @@ class SlotMatchingService:
         Returns:
             SlotMatch if extraction successful, None otherwise
         """
-        return extract_slot(subject, predicate, self._custom_classes)
+        return self._extract_slot(subject, predicate)
 
     def same_slot(
         self,
@@ -513,16 +697,8 @@ class SlotMatchingService:
         Returns:
             True if both facts are in the same slot
         """
-        slot1 = extract_slot(
-            fact1.get("subject"),
-            fact1.get("predicate"),
-            self._custom_classes,
-        )
-        slot2 = extract_slot(
-            fact2.get("subject"),
-            fact2.get("predicate"),
-            self._custom_classes,
-        )
+        slot1 = self._extract_slot(fact1.get("subject"), fact1.get("predicate"))
+        slot2 = self._extract_slot(fact2.get("subject"), fact2.get("predicate"))
 
         if not slot1 or not slot2:
             return False
@@ -559,6 +735,8 @@ __all__ = [
     "SlotMatchingConfig",
     "SlotConflictResult",
     "DEFAULT_PREDICATE_CLASSES",
+    "PredicateClassifier",
+    "merge_predicate_classes",
     "normalize_subject",
     "normalize_predicate",
     "classify_predicate",
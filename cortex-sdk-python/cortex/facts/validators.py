@@ -297,6 +297,31 @@ def validate_non_negative_integer(
         )
 
 
+def validate_limit(limit: Union[int, float], field_name: str = "limit") -> None:
+    """
+    Validates limit is positive integer >= 1 (page sizes, batch sizes).
+
+    Args:
+        limit: Limit value to validate
+        field_name: Name of the field being validated
+
+    Raises:
+        FactsValidationError: If limit is invalid
+    """
+    if limit is None:
+        raise FactsValidationError(
+            f"{field_name} must be a valid number", "INVALID_ARRAY", field_name
+        )
+    validate_non_negative_integer(limit, field_name)
+
+    if limit < 1:
+        raise FactsValidationError(
+            f"{field_name} must be a positive integer >= 1, got {limit}",
+            "INVALID_ARRAY",
+            field_name,
+        )
+
+
 def validate_pagination(limit: Optional[int] = None, offset: Optional[int] = None) -> None:
     """
     Validates pagination parameters.
@@ -30,6 +30,21 @@ from .orphan_detection import (
     create_deletion_context,
     delete_with_orphan_cleanup,
     detect_orphan,
+    detect_orphans,
+)
+
+# Node/edge specs shared by per-entity and batch sync
+from .sync_specs import (
+    EdgeSpec,
+    NodeRef,
+    enriched_entity_node,
+    entity_node,
+    fact_edges,
+    fact_entity_nodes,
+    fact_node,
+    id_node,
+    memory_edges,
+    memory_node,
 )
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -96,13 +111,7 @@ async def ensure_user_node(user_id: str, adapter: GraphAdapter) -> str:
         >>> node_id = await ensure_user_node("user-123", adapter)
     """
     return await adapter.merge_node(
-        GraphNode(
-            label="User",
-            properties={
-                "userId": user_id,
-                "createdAt": int(time.time() * 1000),
-            },
-        ),
+        id_node("User", "userId", user_id, int(time.time() * 1000)),
         {"userId": user_id},
     )
 
@@ -124,13 +133,7 @@ async def ensure_agent_node(agent_id: str, adapter: GraphAdapter) -> str:
         >>> node_id = await ensure_agent_node("agent-123", adapter)
     """
     return await adapter.merge_node(
-        GraphNode(
-            label="Agent",
-            properties={
-                "agentId": agent_id,
-                "createdAt": int(time.time() * 1000),
-            },
-        ),
+        id_node("Agent", "agentId", agent_id, int(time.time() * 1000)),
         {"agentId": agent_id},
     )
 
@@ -152,13 +155,7 @@ async def ensure_participant_node(participant_id: str, adapter: GraphAdapter) ->
         >>> node_id = await ensure_participant_node("participant-123", adapter)
     """
     return await adapter.merge_node(
-        GraphNode(
-            label="Participant",
-            properties={
-                "participantId": participant_id,
-                "createdAt": int(time.time() * 1000),
-            },
-        ),
+        id_node("Participant", "participantId", participant_id, int(time.time() * 1000)),
         {"participantId": participant_id},
     )
 
@@ -186,14 +183,7 @@ async def ensure_entity_node(
         >>> node_id = await ensure_entity_node("John", "subject", adapter)
     """
     return await adapter.merge_node(
-        GraphNode(
-            label="Entity",
-            properties={
-                "name": entity_name,
-                "type": entity_type,
-                "createdAt": int(time.time() * 1000),
-            },
-        ),
+        entity_node(entity_name, entity_type, int(time.time() * 1000)),
         {"name": entity_name},
     )
 
@@ -227,23 +217,44 @@ async def ensure_enriched_entity_node(
         ...     "Alex", "preferred_name", "Alexander Johnson", adapter
         ... )
     """
-    now = int(time.time() * 1000)
     return await adapter.merge_node(
-        GraphNode(
-            label="Entity",
-            properties={
-                "name": entity_name,
-                "type": entity_type,
-                "entityType": entity_type,
-                "fullValue": full_value,
-                "createdAt": now,
-                "updatedAt": now,
-            },
-        ),
+        enriched_entity_node(entity_name, entity_type, full_value, int(time.time() * 1000)),
         {"name": entity_name},
     )
 
 
+async def _write_edge_spec(
+    spec: EdgeSpec,
+    node_id: str,
+    adapter: GraphAdapter,
+    known: Dict[NodeRef, str],
+) -> None:
+    """Create one spec'd edge from ``node_id`` (or the spec's source node)."""
+
+    async def _resolve(ref: NodeRef, node: Optional[GraphNode]) -> Optional[str]:
+        if ref not in known:
+            if node is not None:
+                known[ref] = await adapter.merge_node(node, {ref.key: ref.value})
+            else:
+                nodes = await adapter.find_nodes(ref.label, {ref.key: ref.value}, 1)
+                if not nodes or nodes[0].id is None:
+                    return None
+                known[ref] = nodes[0].id
+        return known[ref]
+
+    from_node = node_id if spec.source is None else await _resolve(spec.source, None)
+    to_node = await _resolve(spec.target, spec.target_node)
+    if from_node and to_node:
+        await adapter.create_edge(
+            GraphEdge(
+                type=spec.type,
+                from_node=from_node,
+                to_node=to_node,
+                properties=spec.properties,
+            )
+        )
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Sync Functions - Memory to Graph
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -265,27 +276,7 @@ async def sync_memory_to_graph(memory: Dict[str, Any], adapter: GraphAdapter) ->
     Example:
         >>> node_id = await sync_memory_to_graph(memory, graph_adapter)
     """
-    node = GraphNode(
-        label="Memory",
-        properties={
-            "memoryId": memory["memoryId"],
-            "memorySpaceId": memory["memorySpaceId"],
-            "participantId": memory.get("participantId"),
-            "userId": memory.get("userId"),
-            "agentId": memory.get("agentId"),
-            "content": memory["content"][:200],  # Truncate for graph
-            "contentType": memory.get("contentType"),
-            "sourceType": memory["sourceType"],
-            "sourceUserId": memory.get("sourceUserId"),
-            "importance": memory["importance"],
-            "tags": memory.get("tags", []),
-            "version": memory.get("version", 1),
-            "createdAt": memory["createdAt"],
-            "updatedAt": memory.get("updatedAt", memory["createdAt"]),
-        },
-    )
-
-    return await adapter.merge_node(node, {"memoryId": memory["memoryId"]})
+    return await adapter.merge_node(memory_node(memory), {"memoryId": memory["memoryId"]})
 
 
 async def sync_memory_relationships(
@@ -302,118 +293,17 @@ async def sync_memory_relationships(
     - SOURCED_FROM relationships to Fact (if immutableRef exists)
     - STORED_BY relationships to Participant (Hive Mode)
 
+    The edges come from ``sync_specs.memory_edges``, shared with batch sync.
+
     Args:
         memory: Memory entry
         node_id: Memory node ID in graph
         adapter: Graph database adapter
     """
-    now = int(time.time() * 1000)
-
-    # conversationRef → REFERENCES edge
-    if memory.get("conversationRef"):
-        try:
-            conv_nodes = await adapter.find_nodes(
-                "Conversation",
-                {"conversationId": memory["conversationRef"]["conversationId"]},
-                1,
-            )
-            if conv_nodes:
-                await adapter.create_edge(
-                    GraphEdge(
-                        type="REFERENCES",
-                        from_node=node_id,
-                        to_node=conv_nodes[0].id,  # type: ignore[arg-type]
-                        properties={
-                            "messageIds": memory["conversationRef"].get("messageIds", []),
-                            "createdAt": memory.get("createdAt", now),
-                        },
-                    )
-                )
-        except Exception:
-            pass
-
-    # userId → RELATES_TO edge
-    if memory.get("userId"):
-        try:
-            user_node_id = await ensure_user_node(memory["userId"], adapter)
-            await adapter.create_edge(
-                GraphEdge(
-                    type="RELATES_TO",
-                    from_node=node_id,
-                    to_node=user_node_id,
-                    properties={"createdAt": memory.get("createdAt", now)},
-                )
-            )
-        except Exception:
-            pass
-
-    # agentId → RELATES_TO edge
-    if memory.get("agentId"):
-        try:
-            agent_node_id = await ensure_agent_node(memory["agentId"], adapter)
-            await adapter.create_edge(
-                GraphEdge(
-                    type="RELATES_TO",
-                    from_node=node_id,
-                    to_node=agent_node_id,
-                    properties={"createdAt": memory.get("createdAt", now)},
-                )
-            )
-        except Exception:
-            pass
-
-    # MemorySpace → IN_SPACE edge
-    try:
-        space_nodes = await adapter.find_nodes(
-            "MemorySpace", {"memorySpaceId": memory["memorySpaceId"]}, 1
-        )
-        if space_nodes:
-            await adapter.create_edge(
-                GraphEdge(
-                    type="IN_SPACE",
-                    from_node=node_id,
-                    to_node=space_nodes[0].id,  # type: ignore[arg-type]
-                    properties={"createdAt": memory.get("createdAt", now)},
-                )
-            )
-    except Exception:
-        pass
-
-    # immutableRef (Fact) → SOURCED_FROM edge
-    if memory.get("immutableRef") and memory["immutableRef"].get("type") == "fact":
+    known: Dict[NodeRef, str] = {}
+    for spec in memory_edges(memory, int(time.time() * 1000)):
         try:
-            fact_node_id = await find_graph_node_id(
-                "Fact", memory["immutableRef"]["id"], adapter
-            )
-            if fact_node_id:
-                await adapter.create_edge(
-                    GraphEdge(
-                        type="SOURCED_FROM",
-                        from_node=node_id,
-                        to_node=fact_node_id,
-                        properties={
-                            "version": memory["immutableRef"].get("version"),
-                            "createdAt": memory.get("createdAt", now),
-                        },
-                    )
-                )
-        except Exception:
-            pass
-
-    # Participant relationship (Hive Mode)
-    if memory.get("participantId"):
-        try:
-            participant_node_id = await ensure_participant_node(
-                memory["participantId"], adapter
-            )
-            await adapter.create_edge(
-                GraphEdge(
-                    type="STORED_BY",
-                    from_node=node_id,
-                    to_node=participant_node_id,
-                    properties={"createdAt": memory.get("createdAt", now)},
-                )
-            )
+            await _write_edge_spec(spec, node_id, adapter, known)
         except Exception:
             pass
 
@@ -649,29 +539,7 @@ async def sync_fact_to_graph(fact: Dict[str, Any], adapter: GraphAdapter) -> str
     Returns:
         Node ID in graph
     """
-    node = GraphNode(
-        label="Fact",
-        properties={
-            "factId": fact["factId"],
-            "memorySpaceId": fact["memorySpaceId"],
-            "participantId": fact.get("participantId"),
-            "fact": fact["fact"],
-            "factType": fact["factType"],
-            "subject": fact.get("subject"),
-            "predicate": fact.get("predicate"),
-            "object": fact.get("object"),
-            "confidence": fact["confidence"],
-            "sourceType": fact.get("sourceType"),
-            "tags": fact.get("tags", []),
-            "version": fact.get("version", 1),
-            "supersededBy": fact.get("supersededBy"),
-            "supersedes": fact.get("supersedes"),
-            "createdAt": fact["createdAt"],
-            "updatedAt": fact.get("updatedAt", fact["createdAt"]),
-        },
-    )
-
-    return await adapter.merge_node(node, {"factId": fact["factId"]})
+    return await adapter.merge_node(fact_node(fact), {"factId": fact["factId"]})
 
 
 async def sync_fact_relationships(
@@ -689,228 +557,29 @@ async def sync_fact_relationships(
     - SUPERSEDES / SUPERSEDED_BY relationships (fact versioning)
     - EXTRACTED_BY relationships to Participant (Hive Mode)
 
+    Nodes and edges come from ``sync_specs.fact_entity_nodes`` and
+    ``sync_specs.fact_edges``, shared with batch sync.
+
     Args:
         fact: Fact data
         node_id: Fact node ID in graph
         adapter: Graph database adapter
     """
     now = int(time.time() * 1000)
-    entity_node_ids: Dict[str, str] = {}
-
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # Sync enriched entities from bullet-proof extraction
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    if fact.get("entities"):
-        for entity in fact["entities"]:
-            try:
-                entity_node_id = await ensure_enriched_entity_node(
-                    entity["name"],
-                    entity["type"],
-                    entity.get("fullValue"),
-                    adapter,
-                )
-                entity_node_ids[entity["name"].lower()] = entity_node_id
+    known: Dict[NodeRef, str] = {}
 
-                # Create MENTIONS relationship from Fact to Entity
-                await adapter.create_edge(
-                    GraphEdge(
-                        type="MENTIONS",
-                        from_node=node_id,
-                        to_node=entity_node_id,
-                        properties={
-                            "role": entity["type"],
-                            "fullValue": entity.get("fullValue"),
-                            "createdAt": fact.get("createdAt", now),
-                        },
-                    )
-                )
-            except Exception:
-                pass
-
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # Sync enriched relations from bullet-proof extraction
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    if fact.get("relations"):
-        for relation in fact["relations"]:
-            try:
-                # Get or create subject and object entity nodes
-                subject_key = relation["subject"].lower()
-                if subject_key not in entity_node_ids:
-                    entity_node_ids[subject_key] = await ensure_entity_node(
-                        relation["subject"], "subject", adapter
-                    )
-
-                object_key = relation["object"].lower()
-                if object_key not in entity_node_ids:
-                    entity_node_ids[object_key] = await ensure_entity_node(
-                        relation["object"], "object", adapter
-                    )
-
-                # Create relationship edge with predicate as type
-                relationship_type = relation["predicate"].upper().replace(" ", "_")
-                await adapter.create_edge(
-                    GraphEdge(
-                        type=relationship_type,
-                        from_node=entity_node_ids[subject_key],
-                        to_node=entity_node_ids[object_key],
-                        properties={
-                            "factId": fact["factId"],
-                            "confidence": fact["confidence"],
-                            "category": fact.get("category"),
-                            "createdAt": fact.get("createdAt", now),
-                        },
-                    )
-                )
-            except Exception:
-                pass
-
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # Legacy: Create Entity nodes from subject/object fields (fallback)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    if fact.get("subject") and fact["subject"].lower() not in entity_node_ids:
-        try:
-            subject_node_id = await ensure_entity_node(
-                fact["subject"], "subject", adapter
-            )
-            await adapter.create_edge(
-                GraphEdge(
-                    type="MENTIONS",
-                    from_node=node_id,
-                    to_node=subject_node_id,
-                    properties={
-                        "role": "subject",
-                        "createdAt": fact.get("createdAt", now),
-                    },
-                )
-            )
-        except Exception:
-            pass
-
-    if fact.get("object") and fact["object"].lower() not in entity_node_ids:
-        try:
-            object_node_id = await ensure_entity_node(
-                fact["object"], "object", adapter
-            )
-            await adapter.create_edge(
-                GraphEdge(
-                    type="MENTIONS",
-                    from_node=node_id,
-                    to_node=object_node_id,
-                    properties={
-                        "role": "object",
-                        "createdAt": fact.get("createdAt", now),
-                    },
-                )
-            )
-        except Exception:
-            pass
-
-    # If we have subject, object, predicate but no enriched relations, create typed relationship
-    if (
-        fact.get("subject")
-        and fact.get("object")
-        and fact.get("predicate")
-        and not fact.get("relations")
-    ):
-        try:
-            subject_nodes = await adapter.find_nodes(
-                "Entity", {"name": fact["subject"]}, 1
-            )
-            object_nodes = await adapter.find_nodes(
-                "Entity", {"name": fact["object"]}, 1
-            )
-
-            if subject_nodes and object_nodes:
-                relationship_type = fact["predicate"].upper().replace(" ", "_")
-                await adapter.create_edge(
-                    GraphEdge(
-                        type=relationship_type,
-                        from_node=subject_nodes[0].id,  # type: ignore[arg-type]
-                        to_node=object_nodes[0].id,  # type: ignore[arg-type]
-                        properties={
-                            "factId": fact["factId"],
-                            "confidence": fact["confidence"],
-                            "createdAt": fact.get("createdAt", now),
-                        },
-                    )
-                )
-        except Exception:
-            pass
-
-    # sourceRef → EXTRACTED_FROM edge
-    source_ref = fact.get("sourceRef") or {}
-    if source_ref.get("conversationId"):
+    for entity in fact_entity_nodes(fact, now):
         try:
-            conv_node_id = await find_graph_node_id(
-                "Conversation", source_ref["conversationId"], adapter
+            name = entity.properties["name"]
+            known[NodeRef("Entity", "name", name)] = await adapter.merge_node(
+                entity, {"name": name}
             )
-            if conv_node_id:
-                await adapter.create_edge(
-                    GraphEdge(
-                        type="EXTRACTED_FROM",
-                        from_node=node_id,
-                        to_node=conv_node_id,
-                        properties={
-                            "messageIds": source_ref.get("messageIds", []),
-                            "createdAt": fact.get("createdAt", now),
-                        },
-                    )
-                )
         except Exception:
             pass
 
-    # MemorySpace → IN_SPACE edge
-    try:
-        space_node_id = await find_graph_node_id(
-            "MemorySpace", fact["memorySpaceId"], adapter
-        )
-        if space_node_id:
-            await adapter.create_edge(
-                GraphEdge(
-                    type="IN_SPACE",
-                    from_node=node_id,
-                    to_node=space_node_id,
-                    properties={"createdAt": fact.get("createdAt", now)},
-                )
-            )
-    except Exception:
-        pass
-
-    # Fact versioning relationships
-    if fact.get("supersedes"):
+    for spec in fact_edges(fact, now):
         try:
-            superseded_fact_node_id = await find_graph_node_id(
-                "Fact", fact["supersedes"], adapter
-            )
-            if superseded_fact_node_id:
-                await adapter.create_edge(
-                    GraphEdge(
-                        type="SUPERSEDES",
-                        from_node=node_id,
-                        to_node=superseded_fact_node_id,
-                        properties={
-                            "version": fact.get("version"),
-                            "createdAt": fact.get("createdAt", now),
-                        },
-                    )
-                )
-        except Exception:
-            pass
-
-    # Participant relationship (Hive Mode)
-    if fact.get("participantId"):
-        try:
-            participant_node_id = await ensure_participant_node(
-                fact["participantId"], adapter
-            )
-            await adapter.create_edge(
-                GraphEdge(
-                    type="EXTRACTED_BY",
-                    from_node=node_id,
-                    to_node=participant_node_id,
-                    properties={"createdAt": fact.get("createdAt", now)},
-                )
-            )
+            await _write_edge_spec(spec, node_id, adapter, known)
         except Exception:
             pass
 
@@ -1660,7 +1329,16 @@ __all__ = [
     "create_deletion_context",
     "can_run_orphan_cleanup",
     "detect_orphan",
+    "detect_orphans",
     "delete_with_orphan_cleanup",
+    # Sync specs (shared by per-entity and batch sync)
+    "EdgeSpec",
+    "NodeRef",
+    "memory_node",
+    "memory_edges",
+    "fact_node",
+    "fact_entity_nodes",
+    "fact_edges",
     # Helper functions
     "find_graph_node_id",
     "ensure_user_node",
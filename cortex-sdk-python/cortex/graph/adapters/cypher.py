@@ -616,108 +616,115 @@ class CypherGraphAdapter:
         Returns:
             Query results
         """
-        session = self._get_session()
-
-        try:
-            cypher = query.cypher if isinstance(query, GraphQuery) else query
-            query_params = (
-                {**(query.params or {}), **(params or {})}
-                if isinstance(query, GraphQuery)
-                else (params or {})
-            )
+        cypher = query.cypher if isinstance(query, GraphQuery) else query
+        query_params = (
+            {**(query.params or {}), **(params or {})}
+            if isinstance(query, GraphQuery)
+            else (params or {})
+        )
 
-            result = await session.run(
-                cypher,
-                self._serialize_properties(query_params),
-            )
+        return await self._run_query(cypher, self._serialize_properties(query_params))
 
-            # Extract records
-            records_data = await result.data()
-            records = [
-                {key: self._deserialize_value(value) for key, value in record.items()}
-                for record in records_data
-            ]
+    async def query_batch(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> GraphQueryResult:
+        """
+        Execute a Cypher statement that reads ``UNWIND $rows AS row``.
 
-            # Extract statistics
-            summary = await result.consume()
-            counters = summary.counters
-            stats = QueryStatistics(
-                nodes_created=counters.nodes_created,
-                nodes_deleted=counters.nodes_deleted,
-                relationships_created=counters.relationships_created,
-                relationships_deleted=counters.relationships_deleted,
-                properties_set=counters.properties_set,
-                labels_added=counters.labels_added,
-            )
+        Rows are passed as a list of maps, so the statement can read
+        ``row.key`` or ``row.props.factId``. Only the values inside each
+        row are serialized like node properties (maps nested in a row value
+        are stored as JSON).
 
-            return GraphQueryResult(
-                records=records,
-                count=len(records),
-                stats=stats,
-            )
+        Args:
+            query: Cypher statement using ``$rows``
+            rows: One map per row
+            params: Optional additional query parameters
 
-        except Exception as e:
-            cypher_str = query.cypher if isinstance(query, GraphQuery) else query
-            raise GraphQueryError(
-                f"Query failed: {e}",
-                query=cypher_str,
-                cause=e if isinstance(e, Exception) else None,
-            )
-        finally:
-            await session.close()
+        Returns:
+            Query results
+        """
+        return await self._run_query(
+            query,
+            {
+                **self._serialize_properties(params or {}),
+                "rows": [self._serialize_row(row) for row in rows],
+            },
+        )
 
     async def traverse(self, config: TraversalConfig) -> List[GraphNode]:
         """
         Traverse the graph from a starting node.
 
+        Runs a breadth-first traversal, one bounded query per depth level,
+        instead of a variable-length path match. Variable-length matches
+        enumerate every path before DISTINCT, which explodes around hub
+        nodes; level-by-level expansion only touches each node once.
+
         Args:
-            config: Traversal configuration
+            config: Traversal configuration. ``max_fan_out`` caps the
+                neighbors followed per node per level, ``exclude_labels``
+                and ``exclude_relationship_types`` keep the traversal out
+                of hub nodes, and ``max_results`` stops it early.
 
         Returns:
-            List of connected nodes
+            List of connected nodes (excluding the start node), in
+            breadth-first order with ``depth`` set on each node
         """
         session = self._get_session()
 
         try:
-            # Build relationship pattern
-            # Neo4j uses | to separate multiple relationship types in variable-length paths
-            rel_types = (
-                f":{'|'.join(config.relationship_types)}"
-                if config.relationship_types
-                else ""
-            )
-
-            direction = config.direction or "BOTH"
-            if direction == "OUTGOING":
-                rel_pattern = f"-[{rel_types}*1..{config.max_depth}]->"
-            elif direction == "INCOMING":
-                rel_pattern = f"<-[{rel_types}*1..{config.max_depth}]-"
-            else:
-                rel_pattern = f"-[{rel_types}*1..{config.max_depth}]-"
+            query = self._build_traversal_level_query(config)
+            start_id = self._convert_id_for_query(config.start_id)
 
-            id_func = self._get_id_function()
-            query = f"""
-                MATCH (start)
-                WHERE {id_func}(start) = $startId
-                MATCH path = (start){rel_pattern}(connected)
-                RETURN DISTINCT {id_func}(connected) as id, connected, labels(connected) as labels
-            """
+            visited: List[Any] = [start_id]
+            frontier: List[Any] = [start_id]
+            nodes: List[GraphNode] = []
 
-            params: Dict[str, Any] = {
-                "startId": self._convert_id_for_query(config.start_id),
-            }
+            for depth in range(1, config.max_depth + 1):
+                if not frontier:
+                    break
 
-            result = await session.run(query, self._serialize_properties(params))
-            records = await result.data()
-
-            return [
-                GraphNode(
-                    id=self._extract_id(record["id"]),
-                    label=record["labels"][0] if record["labels"] else "Node",
-                    properties=self._deserialize_properties(dict(record["connected"])),
+                remaining = (
+                    config.max_results - len(nodes)
+                    if config.max_results is not None
+                    else None
                 )
-                for record in records
-            ]
+                if remaining is not None and remaining <= 0:
+                    break
+
+                params: Dict[str, Any] = {
+                    "frontier": frontier,
+                    "visited": visited,
+                    "excludeLabels": config.exclude_labels or [],
+                    "excludeTypes": config.exclude_relationship_types or [],
+                }
+                if config.max_fan_out is not None:
+                    params["fanOut"] = config.max_fan_out
+                if remaining is not None:
+                    params["limit"] = remaining
+
+                result = await session.run(query, params)
+                records = await result.data()
+
+                frontier = []
+                for record in records:
+                    raw_id = record["id"]
+                    frontier.append(raw_id)
+                    visited.append(raw_id)
+                    nodes.append(
+                        GraphNode(
+                            id=self._extract_id(raw_id),
+                            label=record["labels"][0] if record["labels"] else "Node",
+                            properties=self._deserialize_properties(dict(record["connected"])),
+                            depth=depth,
+                        )
+                    )
+
+            return nodes
 
         except Exception as e:
             raise self._handle_error(
@@ -726,6 +733,47 @@ class CypherGraphAdapter:
         finally:
             await session.close()
 
+    def _build_traversal_level_query(self, config: TraversalConfig) -> str:
+        """
+        Build the query that expands one BFS level of a traversal.
+
+        Parameters: ``$frontier`` (node IDs to expand), ``$visited`` (node
+        IDs already seen), ``$excludeLabels``, ``$excludeTypes`` and,
+        when the corresponding limits are set, ``$fanOut`` and ``$limit``.
+        """
+        rel_types = (
+            f":{'|'.join(self._escape_label(t) for t in config.relationship_types)}"
+            if config.relationship_types
+            else ""
+        )
+
+        direction = config.direction or "BOTH"
+        if direction == "OUTGOING":
+            pattern = f"(src)-[r{rel_types}]->(connected)"
+        elif direction == "INCOMING":
+            pattern = f"(src)<-[r{rel_types}]-(connected)"
+        else:
+            pattern = f"(src)-[r{rel_types}]-(connected)"
+
+        id_func = self._get_id_function()
+        fan_out = "[..$fanOut]" if config.max_fan_out is not None else ""
+        limit = "LIMIT $limit" if config.max_results is not None else ""
+
+        return f"""
+            UNWIND $frontier AS frontierId
+            MATCH (src)
+            WHERE {id_func}(src) = frontierId
+            MATCH {pattern}
+            WHERE NOT {id_func}(connected) IN $visited
+              AND NOT type(r) IN $excludeTypes
+              AND NONE(l IN labels(connected) WHERE l IN $excludeLabels)
+            WITH src, collect(DISTINCT connected){fan_out} AS neighbors
+            UNWIND neighbors AS connected
+            WITH DISTINCT connected
+            RETURN {id_func}(connected) as id, connected, labels(connected) as labels
+            {limit}
+        """
+
     async def find_path(self, config: ShortestPathConfig) -> Optional[GraphPath]:
         """
         Find the shortest path between two nodes.
@@ -992,6 +1040,47 @@ class CypherGraphAdapter:
             else self._driver.session()
         )
 
+    async def _run_query(self, cypher: str, params: Dict[str, Any]) -> GraphQueryResult:
+        """Run Cypher with already serialized parameters."""
+        session = self._get_session()
+
+        try:
+            result = await session.run(cypher, params)
+
+            # Extract records
+            records_data = await result.data()
+            records = [
+                {key: self._deserialize_value(value) for key, value in record.items()}
+                for record in records_data
+            ]
+
+            # Extract statistics
+            summary = await result.consume()
+            counters = summary.counters
+            stats = QueryStatistics(
+                nodes_created=counters.nodes_created,
+                nodes_deleted=counters.nodes_deleted,
+                relationships_created=counters.relationships_created,
+                relationships_deleted=counters.relationships_deleted,
+                properties_set=counters.properties_set,
+                labels_added=counters.labels_added,
+            )
+
+            return GraphQueryResult(
+                records=records,
+                count=len(records),
+                stats=stats,
+            )
+
+        except Exception as e:
+            raise GraphQueryError(
+                f"Query failed: {e}",
+                query=cypher,
+                cause=e if isinstance(e, Exception) else None,
+            )
+        finally:
+            await session.close()
+
     def _escape_label(self, label: str) -> str:
         """Remove invalid characters from label."""
         return re.sub(r"[^a-zA-Z0-9_]", "_", label)
@@ -1018,6 +1107,13 @@ class CypherGraphAdapter:
         """Serialize all properties."""
         return {key: self._serialize_value(value) for key, value in properties.items()}
 
+    def _serialize_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize a batch row, keeping its map values (e.g. props) as maps."""
+        return {
+            key: self._serialize_properties(value) if isinstance(value, dict) else self._serialize_value(value)
+            for key, value in row.items()
+        }
+
     def _deserialize_value(self, value: Any) -> Any:
         """Deserialize a value from storage."""
         if value is None:
@@ -2,33 +2,81 @@
 Cortex SDK - Graph Batch Sync
 
 Functions for initial bulk sync of Cortex data to graph database.
+
+Memories and facts are read with cursor pagination (every memory space is
+walked to the end, not truncated), several memory spaces are synced
+concurrently, and each page is written to the graph with a handful of
+UNWIND-batched MERGE statements. Per-space cursors can be persisted to a
+checkpoint file so an interrupted sync resumes where it stopped; IDs whose
+write failed are kept there too and written again on resume.
 """
 
+import asyncio
+import hashlib
+import json
+import os
+import re
 import time
-from dataclasses import asdict
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from dataclasses import asdict, fields
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+from .._utils import snake_to_camel
 from ..types import (
+    BatchSyncCheckpoint,
     BatchSyncError,
     BatchSyncLimits,
     BatchSyncOptions,
+    BatchSyncProgress,
     BatchSyncResult,
     BatchSyncStats,
+    ChunkWatermark,
+    CountFactsFilter,
+    FactRecord,
     GraphAdapter,
+    GraphNode,
+    GraphReconcileOptions,
+    GraphReconcileResult,
+    GraphReconcileSpaceReport,
     ListMemorySpacesFilter,
     ListUsersFilter,
+    MemoryEntry,
 )
 from . import (
+    delete_fact_from_graph,
+    delete_memory_from_graph,
     sync_a2a_relationships,
     sync_fact_relationships,
     sync_fact_to_graph,
     sync_memory_relationships,
     sync_memory_to_graph,
 )
+from .sync_specs import (
+    EdgeSpec,
+    fact_edges,
+    fact_entity_nodes,
+    fact_node,
+    memory_edges,
+    memory_node,
+)
 
 if TYPE_CHECKING:
     from ..client import Cortex
 
+# Superseded facts stay in the graph as SUPERSEDES chains, so counting, the
+# bulk sync and reconciliation all read them.
+_INCLUDE_SUPERSEDED_FACTS = True
+
 
 async def initial_graph_sync(
     cortex: "Cortex",
@@ -44,7 +92,9 @@ async def initial_graph_sync(
     Args:
         cortex: Cortex client instance
         adapter: Graph database adapter
-        options: Batch sync options
+        options: Batch sync options. ``page_size`` and ``concurrency``
+            control throughput, ``checkpoint_path`` makes the sync
+            resumable, and ``on_progress_report`` receives throughput/ETA.
 
     Returns:
         Batch sync result with statistics
@@ -60,7 +110,13 @@ async def initial_graph_sync(
         ... ))
         >>>
         >>> result = await initial_graph_sync(cortex, adapter, BatchSyncOptions(
-        ...     on_progress=lambda entity, current, total: print(f"Syncing {entity}: {current}/{total}")
+        ...     limits=BatchSyncLimits(memories=None, facts=None),
+        ...     concurrency=8,
+        ...     checkpoint_path='graph-sync.checkpoint.json',
+        ...     on_progress_report=lambda p: print(
+        ...         f"{p.entity_type}: {p.processed}/{p.total} "
+        ...         f"({p.items_per_second:.0f}/s, ETA {p.eta_seconds}s)"
+        ...     ),
         ... ))
         >>>
         >>> print(f"Sync complete: {result.memories.synced} memories synced")
@@ -71,12 +127,16 @@ async def initial_graph_sync(
 
     result = BatchSyncResult()
     sync_rels = opts.sync_relationships
+    checkpoint = _CheckpointStore(opts.checkpoint_path)
+    await checkpoint.load()
 
     try:
+        memory_space_ids = await _list_memory_space_ids(cortex)
+
         # Phase 1: Sync Memories
         print("📦 Phase 1: Syncing Memories...")
         memories_result = await _sync_memories(
-            cortex, adapter, sync_rels, limits.memories, opts.on_progress
+            cortex, adapter, memory_space_ids, sync_rels, limits.memories, opts, checkpoint
         )
         result.memories = memories_result["stats"]
         result.errors.extend(memories_result["errors"])
@@ -84,7 +144,7 @@ async def initial_graph_sync(
         # Phase 2: Sync Facts
         print("📦 Phase 2: Syncing Facts...")
         facts_result = await _sync_facts(
-            cortex, adapter, sync_rels, limits.facts, opts.on_progress
+            cortex, adapter, memory_space_ids, sync_rels, limits.facts, opts, checkpoint
         )
         result.facts = facts_result["stats"]
         result.errors.extend(facts_result["errors"])
@@ -101,6 +161,11 @@ async def initial_graph_sync(
         result.agents = agents_result["stats"]
         result.errors.extend(agents_result["errors"])
 
+        # A fully finished sync starts from scratch next time; otherwise keep
+        # the cursors of spaces that could not be read and the failed IDs
+        if checkpoint.is_complete(memory_space_ids):
+            await checkpoint.clear()
+
         print("✅ Initial graph sync complete!")
 
     except Exception as e:
@@ -111,6 +176,300 @@ async def initial_graph_sync(
     return result
 
 
+# ============================================================================
+# Checkpointing and Progress
+# ============================================================================
+
+
+class _CheckpointStore:
+    """Loads and atomically persists a BatchSyncCheckpoint as JSON."""
+
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = path
+        self.state = BatchSyncCheckpoint()
+        self._lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        """Read the checkpoint file if one exists (file I/O off the event loop)."""
+        if not self.path:
+            return
+        data = await asyncio.to_thread(self._read, self.path)
+        if data is not None:
+            known = {f.name for f in fields(BatchSyncCheckpoint)}
+            self.state = BatchSyncCheckpoint(
+                **{k: v for k, v in data.items() if k in known}
+            )
+
+    @staticmethod
+    def _read(path: str) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data: Dict[str, Any] = json.load(f)
+        return data
+
+    async def save(self) -> None:
+        """Persist the current state (no-op without a checkpoint path)."""
+        if not self.path:
+            return
+        async with self._lock:
+            await asyncio.to_thread(self._write, self.path, asdict(self.state))
+
+    @staticmethod
+    def _write(path: str, data: Dict[str, Any]) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def is_complete(self, space_ids: Sequence[str]) -> bool:
+        """Whether every space finished both phases with no failed writes left."""
+        done_memories = set(self.state.completed_memory_spaces)
+        done_facts = set(self.state.completed_fact_spaces)
+        if self.state.failed_memory_ids or self.state.failed_fact_ids:
+            return False
+        return all(s in done_memories and s in done_facts for s in space_ids)
+
+    async def clear(self) -> None:
+        """Remove the checkpoint file after a completed sync."""
+        if self.path:
+            await asyncio.to_thread(self._remove, self.path)
+        self.state = BatchSyncCheckpoint()
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class _ProgressTracker:
+    """Counts processed entities and reports throughput and ETA."""
+
+    def __init__(
+        self,
+        entity_type: str,
+        total: Optional[int],
+        spaces_total: int,
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+        on_progress_report: Optional[Callable[[BatchSyncProgress], None]] = None,
+        already_processed: int = 0,
+    ) -> None:
+        self.entity_type = entity_type
+        self.total = total
+        self.spaces_total = spaces_total
+        self.spaces_completed = 0
+        self.processed = already_processed
+        self._resumed_from = already_processed
+        self._on_progress = on_progress
+        self._on_progress_report = on_progress_report
+        self._started = time.monotonic()
+
+    def advance(self, count: int) -> None:
+        """Record ``count`` newly processed entities and notify callbacks."""
+        self.processed += count
+
+        if self._on_progress:
+            self._on_progress(self.entity_type, self.processed, self.total or self.processed)
+
+        if self._on_progress_report:
+            self._on_progress_report(self.snapshot())
+
+    def snapshot(self) -> BatchSyncProgress:
+        """Current throughput and ETA."""
+        elapsed = max(time.monotonic() - self._started, 1e-6)
+        rate = (self.processed - self._resumed_from) / elapsed
+        eta: Optional[float] = None
+        if self.total is not None and rate > 0:
+            eta = max(self.total - self.processed, 0) / rate
+
+        return BatchSyncProgress(
+            entity_type=self.entity_type,
+            processed=self.processed,
+            total=self.total,
+            elapsed_ms=int(elapsed * 1000),
+            items_per_second=rate,
+            eta_seconds=eta,
+            spaces_completed=self.spaces_completed,
+            spaces_total=self.spaces_total,
+        )
+
+
+async def _list_memory_space_ids(cortex: "Cortex") -> List[str]:
+    """List every memory space ID, following offset pagination."""
+    space_ids: List[str] = []
+    offset = 0
+    page_size = 1000
+
+    while True:
+        page = await cortex.memory_spaces.list(
+            ListMemorySpacesFilter(limit=page_size, offset=offset)
+        )
+        space_ids.extend(space.memory_space_id for space in page.spaces)
+        if not page.has_more or not page.spaces:
+            break
+        offset += len(page.spaces)
+
+    return space_ids
+
+
+async def _count_total(
+    space_ids: Sequence[str],
+    count_one: Callable[[str], Awaitable[int]],
+    concurrency: int,
+) -> Optional[int]:
+    """Best-effort total across spaces (None if any count fails)."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _count(space_id: str) -> int:
+        async with semaphore:
+            return await count_one(space_id)
+
+    try:
+        counts = await asyncio.gather(*(_count(s) for s in space_ids))
+    except Exception:
+        return None
+    return sum(counts)
+
+
+# ============================================================================
+# Paginated Space Workers
+# ============================================================================
+
+
+async def _sync_paginated(
+    entity_type: str,
+    space_ids: Sequence[str],
+    fetch_page: Callable[[str, Optional[str], int], Awaitable[Tuple[List[Any], Optional[str], bool]]],
+    write_page: Callable[[List[Any]], Awaitable[List[BatchSyncError]]],
+    count_one: Callable[[str], Awaitable[int]],
+    limit: Optional[int],
+    options: BatchSyncOptions,
+    checkpoint: _CheckpointStore,
+    cursors: Dict[str, str],
+    completed: List[str],
+    counter_field: str,
+    failed_ids: Dict[str, List[str]],
+    fetch_by_ids: Callable[[str, List[str]], Awaitable[List[Any]]],
+) -> Dict[str, Any]:
+    """
+    Sync one entity type across all spaces with concurrent space workers.
+
+    Each worker walks its space page by page, writes each page in batch and
+    records the space cursor in the checkpoint after every page. IDs whose
+    write failed are recorded with the cursor, and entities that failed in
+    an earlier run are fetched by ID and written again before paging resumes.
+    """
+    stats = BatchSyncStats()
+    errors: List[BatchSyncError] = []
+    concurrency = max(1, options.concurrency)
+    page_size = max(1, options.page_size)
+
+    pending = [s for s in space_ids if s not in completed]
+    already = getattr(checkpoint.state, counter_field)
+
+    total = await _count_total(space_ids, count_one, concurrency)
+    if limit is not None:
+        total = min(total, limit) if total is not None else limit
+
+    tracker = _ProgressTracker(
+        entity_type,
+        total,
+        len(space_ids),
+        options.on_progress,
+        options.on_progress_report,
+        already_processed=already,
+    )
+    tracker.spaces_completed = len(space_ids) - len(pending)
+    semaphore = asyncio.Semaphore(concurrency)
+    # Entities claimed against ``limit`` by all space workers. Claims happen
+    # after each fetch with no await in between, so concurrent workers can
+    # never overshoot the global limit.
+    claimed = {"count": tracker.processed}
+
+    def _claim(count: int) -> int:
+        if limit is None:
+            return count
+        granted = max(0, min(count, limit - claimed["count"]))
+        claimed["count"] += granted
+        return granted
+
+    def _record_failures(space_id: str, page_errors: List[BatchSyncError]) -> None:
+        errors.extend(page_errors)
+        stats.failed += len(page_errors)
+        if page_errors:
+            failed = failed_ids.setdefault(space_id, [])
+            failed.extend(e.entity_id for e in page_errors if e.entity_id not in failed)
+
+    async def _retry_failed(space_id: str) -> None:
+        async with semaphore:
+            retry_ids = failed_ids.pop(space_id)
+            try:
+                items = await fetch_by_ids(space_id, retry_ids)
+            except Exception as e:
+                print(f"Failed to load failed {entity_type.lower()} for space {space_id}: {e}")
+                failed_ids[space_id] = retry_ids
+                return
+
+            # Entities deleted since the failed run are simply dropped
+            page_errors = await write_page(items) if items else []
+            _record_failures(space_id, page_errors)
+            stats.synced += len(items) - len(page_errors)
+            await checkpoint.save()
+
+    async def _sync_space(space_id: str) -> None:
+        async with semaphore:
+            cursor = cursors.get(space_id)
+            while True:
+                if limit is not None and claimed["count"] >= limit:
+                    return
+
+                try:
+                    items, next_cursor, is_done = await fetch_page(
+                        space_id, cursor, page_size
+                    )
+                except Exception as e:
+                    print(f"Failed to list {entity_type.lower()} for space {space_id}: {e}")
+                    return
+
+                granted = _claim(len(items))
+                truncated = granted < len(items)
+                items = items[:granted]
+
+                if items:
+                    page_errors = await write_page(items)
+                    _record_failures(space_id, page_errors)
+                    stats.synced += len(items) - len(page_errors)
+                    setattr(
+                        checkpoint.state,
+                        counter_field,
+                        getattr(checkpoint.state, counter_field) + len(items),
+                    )
+                    tracker.advance(len(items))
+
+                if truncated:
+                    # Limit reached mid-page: keep the cursor at this page
+                    await checkpoint.save()
+                    return
+
+                if is_done or not next_cursor:
+                    completed.append(space_id)
+                    cursors.pop(space_id, None)
+                    tracker.spaces_completed += 1
+                    await checkpoint.save()
+                    return
+
+                cursor = next_cursor
+                cursors[space_id] = cursor
+                await checkpoint.save()
+
+    await asyncio.gather(*(
+        _retry_failed(space_id) for space_id in space_ids if failed_ids.get(space_id)
+    ))
+    await asyncio.gather(*(_sync_space(space_id) for space_id in pending))
+
+    return {"stats": stats, "errors": errors}
+
+
 # ============================================================================
 # Internal Sync Functions
 # ============================================================================
@@ -119,142 +478,689 @@ async def initial_graph_sync(
 async def _sync_memories(
     cortex: "Cortex",
     adapter: GraphAdapter,
+    memory_space_ids: Sequence[str],
     sync_rels: bool,
-    limit: int,
-    on_progress: Optional[Callable[[str, int, int], None]],
+    limit: Optional[int],
+    options: BatchSyncOptions,
+    checkpoint: _CheckpointStore,
 ) -> Dict[str, Any]:
     """Sync memories to graph."""
-    stats = BatchSyncStats()
-    errors: List[BatchSyncError] = []
+
+    async def _fetch(
+        space_id: str, cursor: Optional[str], page_size: int
+    ) -> Tuple[List[Any], Optional[str], bool]:
+        page = await cortex.vector.list_page(space_id, cursor, page_size)
+        return page.memories, page.continue_cursor, page.is_done
+
+    async def _write(memories: List[MemoryEntry]) -> List[BatchSyncError]:
+        return await _write_memory_page(memories, adapter, sync_rels)
+
+    async def _fetch_by_ids(space_id: str, memory_ids: List[str]) -> List[Any]:
+        found = await asyncio.gather(*(cortex.vector.get(space_id, i) for i in memory_ids))
+        return [m for m in found if m is not None]
 
     try:
-        # Get all memory spaces to list memories
-        memory_spaces_result = await cortex.memory_spaces.list(
-            ListMemorySpacesFilter(limit=1000)
+        return await _sync_paginated(
+            "Memories",
+            memory_space_ids,
+            _fetch,
+            _write,
+            cortex.vector.count,
+            limit,
+            options,
+            checkpoint,
+            checkpoint.state.memory_cursors,
+            checkpoint.state.completed_memory_spaces,
+            "memories_synced",
+            checkpoint.state.failed_memory_ids,
+            _fetch_by_ids,
         )
-        memory_spaces = memory_spaces_result.spaces
+    except Exception as e:
+        print(f"Failed to sync memories: {e}")
+        return {"stats": BatchSyncStats(), "errors": []}
 
-        processed_count = 0
-        limit_per_space = limit // max(len(memory_spaces), 1)
 
-        for memory_space in memory_spaces:
-            if processed_count >= limit:
-                break
+async def _sync_facts(
+    cortex: "Cortex",
+    adapter: GraphAdapter,
+    memory_space_ids: Sequence[str],
+    sync_rels: bool,
+    limit: Optional[int],
+    options: BatchSyncOptions,
+    checkpoint: _CheckpointStore,
+) -> Dict[str, Any]:
+    """Sync facts to graph."""
 
-            try:
-                # List memories for this memory space
-                memories = await cortex.vector.list(
-                    memory_space.memory_space_id,
-                    limit=limit_per_space,
-                )
+    async def _fetch(
+        space_id: str, cursor: Optional[str], page_size: int
+    ) -> Tuple[List[Any], Optional[str], bool]:
+        page = await cortex.facts.list_page(
+            space_id, cursor, page_size, include_superseded=_INCLUDE_SUPERSEDED_FACTS
+        )
+        return page.facts, page.continue_cursor, page.is_done
 
-                for memory in memories:
-                    if processed_count >= limit:
-                        break
-
-                    try:
-                        # Convert dataclass to dict for sync function
-                        memory_dict = asdict(memory)
-                        # Sync node
-                        node_id = await sync_memory_to_graph(memory_dict, adapter)
-                        stats.synced += 1
-
-                        # Sync relationships
-                        if sync_rels:
-                            await sync_memory_relationships(memory_dict, node_id, adapter)
-
-                            # Check for A2A relationships
-                            if memory.source_type == "a2a":
-                                await sync_a2a_relationships(memory_dict, adapter)
-
-                        processed_count += 1
-
-                        if on_progress:
-                            on_progress("Memories", processed_count, limit)
-                    except Exception as e:
-                        stats.failed += 1
-                        errors.append(BatchSyncError(
-                            entity_type="Memory",
-                            entity_id=memory.memory_id,
-                            error=str(e),
-                        ))
+    async def _write(facts: List[FactRecord]) -> List[BatchSyncError]:
+        return await _write_fact_page(facts, adapter, sync_rels)
 
-            except Exception as e:
-                print(f"Failed to list memories for space {memory_space.memory_space_id}: {e}")
+    async def _fetch_by_ids(space_id: str, fact_ids: List[str]) -> List[Any]:
+        found = await asyncio.gather(*(cortex.facts.get(space_id, i) for i in fact_ids))
+        return [f for f in found if f is not None]
 
+    async def _count(space_id: str) -> int:
+        return await cortex.facts.count(CountFactsFilter(
+            memory_space_id=space_id, include_superseded=_INCLUDE_SUPERSEDED_FACTS
+        ))
+
+    try:
+        return await _sync_paginated(
+            "Facts",
+            memory_space_ids,
+            _fetch,
+            _write,
+            _count,
+            limit,
+            options,
+            checkpoint,
+            checkpoint.state.fact_cursors,
+            checkpoint.state.completed_fact_spaces,
+            "facts_synced",
+            checkpoint.state.failed_fact_ids,
+            _fetch_by_ids,
+        )
     except Exception as e:
-        print(f"Failed to sync memories: {e}")
+        print(f"Failed to sync facts: {e}")
+        return {"stats": BatchSyncStats(), "errors": []}
 
-    return {"stats": stats, "errors": errors}
 
+# ============================================================================
+# Batched Graph Writes
+# ============================================================================
 
-async def _sync_facts(
-    cortex: "Cortex",
+def _escape_identifier(value: str) -> str:
+    """Remove invalid characters from a label or relationship type."""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", value)
+
+
+def _to_graph_dict(entity: Any) -> Dict[str, Any]:
+    """Convert an SDK dataclass to the camelCase dict the sync functions use."""
+
+    def _camelize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {snake_to_camel(k): _camelize(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [_camelize(v) for v in value]
+        return value
+
+    result: Dict[str, Any] = _camelize(asdict(entity))
+    return result
+
+
+def _node_statement(label: str, key: str) -> str:
+    """UNWIND MERGE of nodes keyed by ``row.key`` with ``row.props`` set (merge_node semantics)."""
+    return (
+        f"UNWIND $rows AS row "
+        f"MERGE (n:{_escape_identifier(label)} {{{key}: row.key}}) "
+        f"SET n += row.props"
+    )
+
+
+def _node_row(node: GraphNode, key: str) -> Dict[str, Any]:
+    return {
+        "key": node.properties[key],
+        "props": {k: v for k, v in node.properties.items() if k != key},
+    }
+
+
+def _edge_statement(source: Tuple[str, str], spec: EdgeSpec) -> str:
+    """
+    UNWIND MERGE of edges shaped like ``spec`` from ``row.source`` to ``row.target``.
+
+    Targets with a node spec are merged (``row.targetProps`` set), others are
+    only matched. Edges carrying a factId are merged per fact, like the
+    separate edges the per-entity sync creates.
+    """
+    if spec.source:
+        source_label, source_key = spec.source.label, spec.source.key
+    else:
+        source_label, source_key = source
+    target = spec.target
+    target_clause = (
+        f"MERGE (t:{_escape_identifier(target.label)} {{{target.key}: row.target}}) "
+        f"SET t += row.targetProps "
+        if spec.target_node is not None
+        else f"MATCH (t:{_escape_identifier(target.label)} {{{target.key}: row.target}}) "
+    )
+    edge_key = " {factId: row.props.factId}" if "factId" in spec.properties else ""
+    return (
+        f"UNWIND $rows AS row "
+        f"MATCH (s:{_escape_identifier(source_label)} {{{source_key}: row.source}}) "
+        f"{target_clause}"
+        f"MERGE (s)-[r:{_escape_identifier(spec.type)}{edge_key}]->(t) "
+        f"SET r += row.props"
+    )
+
+
+async def _run_batch(adapter: GraphAdapter, statement: str, rows: List[Dict[str, Any]]) -> None:
+    """Run an UNWIND statement if there are rows (passed as a list of maps)."""
+    if rows:
+        await adapter.query_batch(statement, rows)
+
+
+async def _write_edge_specs(
+    adapter: GraphAdapter,
+    source: Tuple[str, str],
+    specs: List[Tuple[Any, EdgeSpec]],
+) -> None:
+    """Write (source id, spec) pairs with one statement per edge shape."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for source_id, spec in specs:
+        row: Dict[str, Any] = {
+            "source": spec.source.value if spec.source else source_id,
+            "target": spec.target.value,
+            "props": spec.properties,
+        }
+        if spec.target_node is not None:
+            row["targetProps"] = _node_row(spec.target_node, spec.target.key)["props"]
+        groups.setdefault(_edge_statement(source, spec), []).append(row)
+
+    for statement, rows in groups.items():
+        await _run_batch(adapter, statement, rows)
+
+
+def _memory_graph_dict(memory: MemoryEntry) -> Dict[str, Any]:
+    memory_dict = _to_graph_dict(memory)
+    memory_dict.update(memory_dict.get("metadata") or {})
+    return memory_dict
+
+
+async def _write_memory_page(
+    memories: List[MemoryEntry],
     adapter: GraphAdapter,
     sync_rels: bool,
-    limit: int,
-    on_progress: Optional[Callable[[str, int, int], None]],
-) -> Dict[str, Any]:
-    """Sync facts to graph."""
-    stats = BatchSyncStats()
-    errors: List[BatchSyncError] = []
+) -> List[BatchSyncError]:
+    """Write a page of memories (nodes + relationships) with UNWIND batches."""
+    try:
+        now = int(time.time() * 1000)
+        memory_dicts = [_memory_graph_dict(m) for m in memories]
+        await _run_batch(
+            adapter,
+            _node_statement("Memory", "memoryId"),
+            [_node_row(memory_node(m), "memoryId") for m in memory_dicts],
+        )
+
+        if sync_rels:
+            await _write_edge_specs(
+                adapter,
+                ("Memory", "memoryId"),
+                [(m["memoryId"], spec) for m in memory_dicts for spec in memory_edges(m, now)],
+            )
 
+            for memory_dict in memory_dicts:
+                if memory_dict.get("sourceType") == "a2a":
+                    await sync_a2a_relationships(memory_dict, adapter)
+
+        return []
+
+    except Exception:
+        # Batch failed - isolate the failing entities one by one
+        return await _write_memories_individually(memories, adapter, sync_rels)
+
+
+async def _write_memories_individually(
+    memories: List[MemoryEntry],
+    adapter: GraphAdapter,
+    sync_rels: bool,
+) -> List[BatchSyncError]:
+    """Per-entity fallback used when a batched page write fails."""
+    errors: List[BatchSyncError] = []
+    for memory in memories:
+        try:
+            memory_dict = _memory_graph_dict(memory)
+            node_id = await sync_memory_to_graph(memory_dict, adapter)
+            if sync_rels:
+                await sync_memory_relationships(memory_dict, node_id, adapter)
+                if memory.source_type == "a2a":
+                    await sync_a2a_relationships(memory_dict, adapter)
+        except Exception as e:
+            errors.append(BatchSyncError(
+                entity_type="Memory",
+                entity_id=memory.memory_id,
+                error=str(e),
+            ))
+    return errors
+
+
+async def _write_fact_page(
+    facts: List[FactRecord],
+    adapter: GraphAdapter,
+    sync_rels: bool,
+) -> List[BatchSyncError]:
+    """Write a page of facts (nodes + relationships) with UNWIND batches."""
     try:
-        # Get all memory spaces to list facts
-        memory_spaces_result = await cortex.memory_spaces.list(
-            ListMemorySpacesFilter(limit=1000)
+        now = int(time.time() * 1000)
+        fact_dicts = [_to_graph_dict(f) for f in facts]
+        await _run_batch(
+            adapter,
+            _node_statement("Fact", "factId"),
+            [_node_row(fact_node(f), "factId") for f in fact_dicts],
         )
-        memory_spaces = memory_spaces_result.spaces
 
-        processed_count = 0
-        limit_per_space = limit // max(len(memory_spaces), 1)
+        if sync_rels:
+            await _run_batch(
+                adapter,
+                _node_statement("Entity", "name"),
+                [
+                    _node_row(entity, "name")
+                    for f in fact_dicts
+                    for entity in fact_entity_nodes(f, now)
+                ],
+            )
+            await _write_edge_specs(
+                adapter,
+                ("Fact", "factId"),
+                [(f["factId"], spec) for f in fact_dicts for spec in fact_edges(f, now)],
+            )
+
+        return []
+
+    except Exception:
+        # Batch failed - isolate the failing entities one by one
+        return await _write_facts_individually(facts, adapter, sync_rels)
+
+
+async def _write_facts_individually(
+    facts: List[FactRecord],
+    adapter: GraphAdapter,
+    sync_rels: bool,
+) -> List[BatchSyncError]:
+    """Per-entity fallback used when a batched page write fails."""
+    errors: List[BatchSyncError] = []
+    for fact in facts:
+        try:
+            fact_dict = _to_graph_dict(fact)
+            node_id = await sync_fact_to_graph(fact_dict, adapter)
+            if sync_rels:
+                await sync_fact_relationships(fact_dict, node_id, adapter)
+        except Exception as e:
+            errors.append(BatchSyncError(
+                entity_type="Fact",
+                entity_id=fact.fact_id,
+                error=str(e),
+            ))
+    return errors
 
-        for memory_space in memory_spaces:
-            if processed_count >= limit:
-                break
 
-            try:
-                # List facts for this memory space
-                from ..types import ListFactsFilter
-                facts = await cortex.facts.list(ListFactsFilter(
-                    memory_space_id=memory_space.memory_space_id,
-                    limit=limit_per_space,
-                ))
+# ============================================================================
+# Incremental Reconciliation
+# ============================================================================
 
-                for fact in facts:
-                    if processed_count >= limit:
-                        break
-
-                    try:
-                        # Convert dataclass to dict for sync function
-                        fact_dict = asdict(fact)
-                        # Sync node
-                        node_id = await sync_fact_to_graph(fact_dict, adapter)
-                        stats.synced += 1
-
-                        # Sync relationships
-                        if sync_rels:
-                            await sync_fact_relationships(fact_dict, node_id, adapter)
-
-                        processed_count += 1
-
-                        if on_progress:
-                            on_progress("Facts", processed_count, limit)
-                    except Exception as e:
-                        stats.failed += 1
-                        errors.append(BatchSyncError(
-                            entity_type="Fact",
-                            entity_id=fact.fact_id,
-                            error=str(e),
-                        ))
 
-            except Exception as e:
-                print(f"Failed to list facts for space {memory_space.memory_space_id}: {e}")
+async def reconcile_graph(
+    cortex: "Cortex",
+    adapter: GraphAdapter,
+    options: Optional[GraphReconcileOptions] = None,
+) -> GraphReconcileResult:
+    """
+    Reconcile the graph with Cortex, syncing only what drifted.
 
-    except Exception as e:
-        print(f"Failed to sync facts: {e}")
+    Entities are bucketed by createdAt into ``chunk_ms`` windows. For every
+    memory space, per-chunk watermarks (count, newest updatedAt and sums of
+    updatedAt, version and createdAt) are computed server-side on both Cortex and the
+    graph and compared first; only chunks whose watermarks differ are read
+    and diffed entity by entity. Missing and changed entities are rewritten
+    with the same batched writes as initial_graph_sync; graph nodes whose
+    entity no longer exists in Cortex are deleted with orphan cleanup.
 
-    return {"stats": stats, "errors": errors}
+    Args:
+        cortex: Cortex client instance
+        adapter: Graph database adapter
+        options: Reconcile options (``dry_run`` reports without writing)
+
+    Returns:
+        Reconcile result with a report per memory space and entity type
+
+    Example:
+        >>> report = await reconcile_graph(
+        ...     cortex, adapter, GraphReconcileOptions(dry_run=True)
+        ... )
+        >>> for space in report.reports:
+        ...     if not space.in_sync:
+        ...         print(space.memory_space_id, space.entity_type,
+        ...               len(space.missing), len(space.changed),
+        ...               len(space.extraneous))
+    """
+    start_time = int(time.time() * 1000)
+    opts = options or GraphReconcileOptions()
+    result = GraphReconcileResult(dry_run=opts.dry_run)
+
+    space_ids = opts.memory_space_ids or await _list_memory_space_ids(cortex)
+    semaphore = asyncio.Semaphore(max(1, opts.concurrency))
+    page_size = max(1, opts.page_size)
+    chunk_ms = max(1, opts.chunk_ms)
+
+    async def _memory_digests(
+        space_id: str, cursor: Optional[str]
+    ) -> Tuple[List[ChunkWatermark], Optional[str], bool]:
+        page = await cortex.vector.chunk_digests(space_id, chunk_ms, cursor, page_size)
+        return page.chunks, page.continue_cursor, page.is_done
+
+    async def _fact_digests(
+        space_id: str, cursor: Optional[str]
+    ) -> Tuple[List[ChunkWatermark], Optional[str], bool]:
+        page = await cortex.facts.chunk_digests(
+            space_id, chunk_ms, cursor, page_size,
+            include_superseded=_INCLUDE_SUPERSEDED_FACTS,
+        )
+        return page.chunks, page.continue_cursor, page.is_done
+
+    async def _fetch_memories(
+        space_id: str, cursor: Optional[str], created_after: int, created_before: int
+    ) -> Tuple[List[Any], Optional[str], bool]:
+        page = await cortex.vector.list_page(
+            space_id, cursor, page_size,
+            created_after=created_after, created_before=created_before,
+        )
+        return page.memories, page.continue_cursor, page.is_done
+
+    async def _fetch_facts(
+        space_id: str, cursor: Optional[str], created_after: int, created_before: int
+    ) -> Tuple[List[Any], Optional[str], bool]:
+        page = await cortex.facts.list_page(
+            space_id, cursor, page_size,
+            include_superseded=_INCLUDE_SUPERSEDED_FACTS,
+            created_after=created_after, created_before=created_before,
+        )
+        return page.facts, page.continue_cursor, page.is_done
+
+    specs: Dict[str, Dict[str, Any]] = {
+        "memories": {
+            "label": "Memory",
+            "key": "memoryId",
+            "id_attr": "memory_id",
+            "digests": _memory_digests,
+            "fetch": _fetch_memories,
+            "write": _write_memory_page,
+            "delete": delete_memory_from_graph,
+        },
+        "facts": {
+            "label": "Fact",
+            "key": "factId",
+            "id_attr": "fact_id",
+            "digests": _fact_digests,
+            "fetch": _fetch_facts,
+            "write": _write_fact_page,
+            "delete": delete_fact_from_graph,
+        },
+    }
+
+    for entity_type in opts.entity_types:
+        spec = specs[entity_type]
+
+        # Phase 1: per-chunk watermarks on both sides (no entities read)
+        async def _watermarks(
+            space_id: str, spec: Dict[str, Any] = spec
+        ) -> Tuple[Dict[int, ChunkWatermark], Dict[int, ChunkWatermark]]:
+            async with semaphore:
+                return await asyncio.gather(
+                    _cortex_watermarks(spec["digests"], space_id),
+                    _graph_watermarks(adapter, spec["label"], space_id, chunk_ms),
+                )
+
+        watermarks = await asyncio.gather(*(_watermarks(s) for s in space_ids))
+
+        # Phase 2: entity-level diff of the differing chunks only
+        tracker = _ProgressTracker(
+            entity_type.capitalize(),
+            sum(
+                cortex_chunks[chunk].count
+                for cortex_chunks, graph_chunks in watermarks
+                for chunk in _differing_chunks(cortex_chunks, graph_chunks)
+                if chunk in cortex_chunks
+            ),
+            len(space_ids),
+            on_progress_report=opts.on_progress_report,
+        )
+
+        async def _run(space_id: str,
+                       chunks: Tuple[Dict[int, ChunkWatermark], Dict[int, ChunkWatermark]],
+                       entity_type: Literal["memories", "facts"] = entity_type,
+                       spec: Dict[str, Any] = spec,
+                       tracker: _ProgressTracker = tracker) -> None:
+            async with semaphore:
+                report = await _reconcile_space(
+                    space_id, entity_type, spec, chunks[0], chunks[1],
+                    adapter, opts, result, tracker,
+                )
+                tracker.spaces_completed += 1
+                result.reports.append(report)
+
+        await asyncio.gather(*(
+            _run(space_id, chunks) for space_id, chunks in zip(space_ids, watermarks)
+        ))
+
+    result.duration = int(time.time() * 1000) - start_time
+    return result
+
+
+async def _cortex_watermarks(
+    fetch_digests: Callable[[str, Optional[str]], Awaitable[Tuple[List[ChunkWatermark], Optional[str], bool]]],
+    memory_space_id: str,
+) -> Dict[int, ChunkWatermark]:
+    """Merge the per-page chunk watermarks of a memory space."""
+    chunks: Dict[int, ChunkWatermark] = {}
+    cursor: Optional[str] = None
+
+    while True:
+        page, next_cursor, is_done = await fetch_digests(memory_space_id, cursor)
+        for part in page:
+            _merge_watermark(chunks, part)
+        if is_done or not next_cursor:
+            return chunks
+        cursor = next_cursor
+
+
+def _merge_watermark(chunks: Dict[int, ChunkWatermark], part: ChunkWatermark) -> None:
+    """Fold a (partial) chunk watermark into ``chunks``."""
+    chunk = int(part.chunk)
+    current = chunks.get(chunk)
+    if current is None:
+        chunks[chunk] = ChunkWatermark(
+            chunk=chunk,
+            count=int(part.count),
+            max_updated_at=int(part.max_updated_at),
+            updated_offset_sum=int(part.updated_offset_sum),
+            version_sum=int(part.version_sum),
+            created_offset_sum=int(part.created_offset_sum),
+        )
+        return
+    current.count += int(part.count)
+    current.max_updated_at = max(current.max_updated_at, int(part.max_updated_at))
+    current.updated_offset_sum += int(part.updated_offset_sum)
+    current.version_sum += int(part.version_sum)
+    current.created_offset_sum += int(part.created_offset_sum)
+
+
+async def _graph_watermarks(
+    adapter: GraphAdapter,
+    label: str,
+    memory_space_id: str,
+    chunk_ms: int,
+) -> Dict[int, ChunkWatermark]:
+    """Per-chunk watermarks of a space's nodes, aggregated in the graph."""
+    result = await adapter.query(
+        f"""
+        MATCH (n:{label} {{memorySpaceId: $memorySpaceId}})
+        WHERE n.createdAt IS NOT NULL
+        WITH n, toInteger(floor(toFloat(n.createdAt) / $chunkMs)) AS chunk
+        RETURN chunk,
+               count(n) AS count,
+               max(coalesce(n.updatedAt, n.createdAt)) AS maxUpdatedAt,
+               sum(coalesce(n.updatedAt, n.createdAt) - n.createdAt) AS updatedOffsetSum,
+               sum(coalesce(n.version, 1)) AS versionSum,
+               sum(n.createdAt - chunk * $chunkMs) AS createdOffsetSum
+        """,
+        {"memorySpaceId": memory_space_id, "chunkMs": chunk_ms},
+    )
+    chunks: Dict[int, ChunkWatermark] = {}
+    for record in result.records:
+        _merge_watermark(chunks, ChunkWatermark(
+            chunk=record["chunk"],
+            count=record["count"],
+            max_updated_at=record["maxUpdatedAt"],
+            updated_offset_sum=record["updatedOffsetSum"],
+            version_sum=record["versionSum"],
+            created_offset_sum=record["createdOffsetSum"],
+        ))
+    return chunks
+
+
+def _differing_chunks(
+    cortex_chunks: Dict[int, ChunkWatermark],
+    graph_chunks: Dict[int, ChunkWatermark],
+) -> List[int]:
+    """Chunks whose watermarks differ (or exist on one side only)."""
+    return sorted(
+        chunk for chunk in set(cortex_chunks) | set(graph_chunks)
+        if cortex_chunks.get(chunk) != graph_chunks.get(chunk)
+    )
+
+
+def _checksum(chunks: Dict[int, ChunkWatermark]) -> str:
+    """Digest of the per-chunk watermarks, prefixed with the entity count."""
+    digest = hashlib.blake2b(digest_size=8)
+    for chunk in sorted(chunks):
+        c = chunks[chunk]
+        digest.update(
+            f"{c.chunk}|{c.count}|{c.max_updated_at}|{c.updated_offset_sum}|"
+            f"{c.version_sum}|{c.created_offset_sum};".encode("utf-8")
+        )
+    return f"{sum(c.count for c in chunks.values())}:{digest.hexdigest()}"
+
+
+async def _scan_graph_chunk(
+    adapter: GraphAdapter,
+    label: str,
+    key: str,
+    memory_space_id: str,
+    created_after: int,
+    created_before: int,
+    page_size: int,
+) -> Dict[str, Tuple[Any, Any]]:
+    """Read (updatedAt, version) for the nodes of one chunk in key order."""
+    state: Dict[str, Tuple[Any, Any]] = {}
+    after = ""
+
+    while True:
+        result = await adapter.query(
+            f"""
+            MATCH (n:{label} {{memorySpaceId: $memorySpaceId}})
+            WHERE n.createdAt >= $createdAfter AND n.createdAt <= $createdBefore
+              AND n.{key} > $after
+            RETURN n.{key} AS id, n.updatedAt AS updatedAt, n.version AS version
+            ORDER BY id
+            LIMIT $limit
+            """,
+            {
+                "memorySpaceId": memory_space_id,
+                "createdAfter": created_after,
+                "createdBefore": created_before,
+                "after": after,
+                "limit": page_size,
+            },
+        )
+        for record in result.records:
+            state[record["id"]] = (record.get("updatedAt"), record.get("version"))
+        if len(result.records) < page_size:
+            return state
+        after = result.records[-1]["id"]
+
+
+async def _reconcile_space(
+    memory_space_id: str,
+    entity_type: Literal["memories", "facts"],
+    spec: Dict[str, Any],
+    cortex_chunks: Dict[int, ChunkWatermark],
+    graph_chunks: Dict[int, ChunkWatermark],
+    adapter: GraphAdapter,
+    options: GraphReconcileOptions,
+    result: GraphReconcileResult,
+    tracker: _ProgressTracker,
+) -> GraphReconcileSpaceReport:
+    """Diff the differing chunks of one entity type and apply the changes."""
+    report = GraphReconcileSpaceReport(
+        memory_space_id=memory_space_id, entity_type=entity_type
+    )
+    label = spec["label"]
+    chunk_ms = max(1, options.chunk_ms)
+    page_size = max(1, options.page_size)
+
+    differing = _differing_chunks(cortex_chunks, graph_chunks)
+    report.chunks = len(set(cortex_chunks) | set(graph_chunks))
+    report.chunks_differing = len(differing)
+    report.cortex_count = sum(c.count for c in cortex_chunks.values())
+    report.graph_count = sum(c.count for c in graph_chunks.values())
+    report.cortex_checksum = _checksum(cortex_chunks)
+    report.graph_checksum = _checksum(graph_chunks)
+    report.in_sync = not differing
+
+    for chunk in differing:
+        created_after = chunk * chunk_ms
+        created_before = created_after + chunk_ms - 1
+        # Only this chunk's graph state is held in memory
+        graph_state = await _scan_graph_chunk(
+            adapter, label, spec["key"], memory_space_id,
+            created_after, created_before, page_size,
+        )
+        seen = set()
+
+        cursor: Optional[str] = None
+        while True:
+            entities, next_cursor, is_done = await spec["fetch"](
+                memory_space_id, cursor, created_after, created_before
+            )
+
+            to_write = []
+            for entity in entities:
+                entity_id = getattr(entity, spec["id_attr"])
+                updated_at = entity.updated_at or entity.created_at
+                version = entity.version or 1
+                seen.add(entity_id)
+
+                if entity_id not in graph_state:
+                    report.missing.append(entity_id)
+                    to_write.append(entity)
+                elif graph_state[entity_id] != (updated_at, version):
+                    report.changed.append(entity_id)
+                    to_write.append(entity)
+
+            if to_write and not options.dry_run:
+                page_errors = await spec["write"](to_write, adapter, options.sync_relationships)
+                result.errors.extend(page_errors)
+                result.synced += len(to_write) - len(page_errors)
+
+            if entities:
+                tracker.advance(len(entities))
+
+            if is_done or not next_cursor:
+                break
+            cursor = next_cursor
+
+        extraneous = sorted(set(graph_state) - seen)
+        report.extraneous.extend(extraneous)
+
+        if extraneous and options.delete_extraneous and not options.dry_run:
+            for entity_id in extraneous:
+                try:
+                    await spec["delete"](entity_id, adapter)
+                    result.deleted += 1
+                except Exception as e:
+                    result.errors.append(BatchSyncError(
+                        entity_type=label,
+                        entity_id=entity_id,
+                        error=str(e),
+                    ))
+
+    return report
 
 
 async def _sync_users(
@@ -342,4 +1248,5 @@ async def _sync_agents(
 
 __all__ = [
     "initial_graph_sync",
+    "reconcile_graph",
 ]
@@ -172,6 +172,22 @@ async def can_run_orphan_cleanup(adapter: "GraphAdapter") -> bool:
         return False
 
 
+_DEFAULT_ANCHOR_LABELS = ["Memory", "Fact", "Context"]
+_MAX_ISLAND_DEPTH = 10  # Prevent infinite loops
+
+
+def _id_function(adapter: "GraphAdapter") -> str:
+    """ID function of the connected database (elementId on Neo4j, id on Memgraph)."""
+    get_id_function = getattr(adapter, "_get_id_function", None)
+    return get_id_function() if callable(get_id_function) else "id"
+
+
+def _query_ids(adapter: "GraphAdapter", node_ids: List[str]) -> List[Any]:
+    """Convert node IDs to the type the database compares against."""
+    convert = getattr(adapter, "_convert_id_for_query", None)
+    return [convert(n) for n in node_ids] if callable(convert) else list(node_ids)
+
+
 async def detect_orphan(
     node_id: str,
     node_label: str,
@@ -188,6 +204,9 @@ async def detect_orphan(
     4. Check if remaining references include "anchor" types
     5. If no external refs, check for circular orphan island
 
+    Single-node form of detect_orphans(); prefer that when checking many
+    nodes from the same deletion.
+
     Args:
         node_id: Node ID to check
         node_label: Node label (e.g., 'Conversation', 'Entity')
@@ -202,92 +221,142 @@ async def detect_orphan(
         >>> if result.is_orphan:
         ...     print(f"Node is orphan: {result.reason}")
     """
-    rules = deletion_context.orphan_rules or ORPHAN_RULES
-    rule = rules.get(node_label)
-
-    # Rule 1: Never delete certain node types
-    if rule is not None and rule.never_delete:
-        return OrphanCheckResult(
-            is_orphan=False,
-            reason="Never delete rule",
-            referenced_by=[],
-            part_of_circular_island=False,
-        )
+    results = await detect_orphans({node_id: node_label}, deletion_context, adapter)
+    return results[node_id]
 
-    # Rule 2: Only delete if explicitly requested (not cascaded)
-    if rule is not None and rule.explicit_only:
-        return OrphanCheckResult(
-            is_orphan=False,
-            reason="Explicit delete only",
-            referenced_by=[],
-            part_of_circular_island=False,
-        )
 
-    # Find all incoming references (nodes pointing TO this node)
+async def detect_orphans(
+    nodes: Dict[str, str],
+    deletion_context: DeletionContext,
+    adapter: "GraphAdapter",
+) -> Dict[str, OrphanCheckResult]:
+    """
+    Detect orphans for a whole set of candidate nodes at once.
+
+    Same rules and results as detect_orphan(), but incoming references for
+    every candidate are fetched in one statement and circular islands are
+    explored with one statement per BFS level for all candidates together,
+    instead of one query per candidate and per visited node.
+
+    Args:
+        nodes: Candidate node IDs mapped to their labels
+        deletion_context: Context of current deletion operation
+        adapter: Graph database adapter
+
+    Returns:
+        Orphan check result per candidate node ID
+
+    Example:
+        >>> results = await detect_orphans(
+        ...     {"node-1": "Entity", "node-2": "Conversation"}, ctx, adapter
+        ... )
+        >>> orphans = [n for n, r in results.items() if r.is_orphan]
+    """
+    rules = deletion_context.orphan_rules or ORPHAN_RULES
+    deleted = {str(n) for n in deletion_context.deleted_node_ids}
+    results: Dict[str, OrphanCheckResult] = {}
+    candidates: List[str] = []
+
+    for node_id, node_label in nodes.items():
+        rule = rules.get(node_label)
+
+        # Rule 1: Never delete certain node types
+        if rule is not None and rule.never_delete:
+            results[node_id] = OrphanCheckResult(
+                is_orphan=False,
+                reason="Never delete rule",
+                referenced_by=[],
+                part_of_circular_island=False,
+            )
+        # Rule 2: Only delete if explicitly requested (not cascaded)
+        elif rule is not None and rule.explicit_only:
+            results[node_id] = OrphanCheckResult(
+                is_orphan=False,
+                reason="Explicit delete only",
+                referenced_by=[],
+                part_of_circular_island=False,
+            )
+        else:
+            candidates.append(node_id)
+
+    if not candidates:
+        return results
+
+    # Find all incoming references (nodes pointing TO each candidate)
+    id_func = _id_function(adapter)
     try:
         incoming = await adapter.query(
-            """
-            MATCH (referrer)-[r]->(target)
-            WHERE id(target) = $nodeId
-            RETURN id(referrer) as referrerId,
-                   labels(referrer)[0] as refererLabel,
-                   type(r) as relationshipType
+            f"""
+            UNWIND $nodeIds AS nodeId
+            MATCH (target) WHERE {id_func}(target) = nodeId
+            OPTIONAL MATCH (referrer)-[r]->(target)
+            RETURN {id_func}(target) AS nodeId,
+                   collect([{id_func}(referrer), labels(referrer)[0]]) AS refs
             """,
-            {"nodeId": node_id},
+            {"nodeIds": _query_ids(adapter, candidates)},
         )
     except Exception:
         # If query fails, assume not an orphan for safety
-        return OrphanCheckResult(
-            is_orphan=False,
-            reason="Query failed - assuming not orphan",
-            referenced_by=[],
-            part_of_circular_island=False,
-        )
+        for node_id in candidates:
+            results[node_id] = OrphanCheckResult(
+                is_orphan=False,
+                reason="Query failed - assuming not orphan",
+                referenced_by=[],
+                part_of_circular_island=False,
+            )
+        return results
+
+    refs_by_node: Dict[str, List[Any]] = {
+        str(record.get("nodeId")): record.get("refs") or [] for record in incoming.records
+    }
 
-    # Filter to external references (not being deleted, not self-reference)
-    external_refs = [
-        r
-        for r in incoming.records
-        if r.get("referrerId") not in deletion_context.deleted_node_ids
-        and r.get("referrerId") != node_id
-    ]
-
-    # If no external references, check for circular island
-    if len(external_refs) == 0:
-        island_check = await _check_circular_island(
-            node_id, node_label, deletion_context, adapter
-        )
+    unreferenced: List[str] = []
+    for node_id in candidates:
+        # Filter to external references (not being deleted, not self-reference)
+        external_refs = [
+            (str(ref[0]), ref[1])
+            for ref in refs_by_node.get(str(node_id), [])
+            if ref and ref[0] is not None
+            and str(ref[0]) not in deleted
+            and str(ref[0]) != str(node_id)
+        ]
+
+        if not external_refs:
+            unreferenced.append(node_id)
+            continue
 
-        return OrphanCheckResult(
-            is_orphan=True,
-            reason="Circular orphan island" if island_check["is_island"] else "No references",
-            referenced_by=[],
-            part_of_circular_island=island_check["is_island"],
-            island_nodes=island_check.get("island_nodes"),
+        # Has external references - check if they're "anchor" types
+        rule = rules.get(nodes[node_id])
+        anchor_labels = (
+            rule.keep_if_referenced_by
+            if rule and rule.keep_if_referenced_by
+            else _DEFAULT_ANCHOR_LABELS
         )
-
-    # Has external references - check if they're "anchor" types
-    default_anchors = ["Memory", "Fact", "Context"]
-    anchor_labels = (
-        rule.keep_if_referenced_by if rule and rule.keep_if_referenced_by else default_anchors
-    )
-    has_anchor_ref = any(r.get("refererLabel") in anchor_labels for r in external_refs)
-
-    if not has_anchor_ref:
-        # Referenced only by non-anchor types
-        return OrphanCheckResult(
-            is_orphan=True,
-            reason="No anchor references",
-            referenced_by=[str(r.get("referrerId")) for r in external_refs if r.get("referrerId") is not None],
+        has_anchor_ref = any(label in anchor_labels for _, label in external_refs)
+        referenced_by = list(dict.fromkeys(ref_id for ref_id, _ in external_refs))
+
+        results[node_id] = OrphanCheckResult(
+            is_orphan=not has_anchor_ref,
+            # Referenced only by non-anchor types is still an orphan
+            reason="Has anchor references" if has_anchor_ref else "No anchor references",
+            referenced_by=referenced_by,
             part_of_circular_island=False,
         )
 
-    return OrphanCheckResult(
-        is_orphan=False,
-        reason="Has anchor references",
-        referenced_by=[str(r.get("referrerId")) for r in external_refs if r.get("referrerId") is not None],
-        part_of_circular_island=False,
-    )
+    # If no external references, check for circular islands
+    if unreferenced:
+        islands = await _check_circular_islands(unreferenced, deletion_context, adapter)
+        for node_id in unreferenced:
+            island_check = islands[node_id]
+            results[node_id] = OrphanCheckResult(
+                is_orphan=True,
+                reason="Circular orphan island" if island_check["is_island"] else "No references",
+                referenced_by=[],
+                part_of_circular_island=island_check["is_island"],
+                island_nodes=island_check.get("island_nodes"),
+            )
+
+    return results
 
 
 async def _check_circular_island(
@@ -318,61 +387,118 @@ async def _check_circular_island(
     Returns:
         Dict with is_island bool and island_nodes list
     """
+    islands = await _check_circular_islands([node_id], deletion_context, adapter)
+    return islands[node_id]
+
+
+async def _check_circular_islands(
+    node_ids: List[str],
+    deletion_context: DeletionContext,
+    adapter: "GraphAdapter",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Check circular orphan islands for many starting nodes together.
+
+    Runs one BFS over all starting nodes: each level is a single UNWIND
+    query over the combined frontier. Starting nodes whose explorations
+    meet are merged into one island (union-find), so connected candidates
+    share the same result.
+
+    Args:
+        node_ids: Starting nodes
+        deletion_context: Deletion context
+        adapter: Graph adapter
+
+    Returns:
+        Dict per starting node with is_island bool and island_nodes list
+    """
+    deleted = {str(n) for n in deletion_context.deleted_node_ids}
+    id_func = _id_function(adapter)
+
+    # Union-find over starting nodes; every discovered node belongs to one root
+    parent: Dict[str, str] = {str(n): str(n) for n in node_ids}
+
+    def find(x: str) -> str:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(a: str, b: str) -> str:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+        return root_a
+
+    owner: Dict[str, str] = {n: n for n in parent}  # discovered node -> starting node
+    anchored: Set[str] = set()
+    frontier = list(parent)
     visited: Set[str] = set()
-    island_nodes: Set[str] = {node_id}
-    queue = [node_id]
-    max_depth = 10  # Prevent infinite loops
 
-    # BFS to explore connected component
+    # BFS to explore connected components
     depth = 0
-    while queue and depth < max_depth:
-        current_batch = list(queue)
-        queue.clear()
-
-        for current in current_batch:
-            if current in visited:
-                continue
-            visited.add(current)
-
-            # Find all neighbors (undirected - both incoming and outgoing)
-            try:
-                neighbors = await adapter.query(
-                    """
-                    MATCH (n)--(neighbor)
-                    WHERE id(n) = $currentId
-                    RETURN DISTINCT id(neighbor) as neighborId,
-                           labels(neighbor)[0] as neighborLabel
-                    """,
-                    {"currentId": current},
-                )
-            except Exception:
+    while frontier and depth < _MAX_ISLAND_DEPTH:
+        visited.update(frontier)
+
+        # Find all neighbors (undirected - both incoming and outgoing)
+        try:
+            neighbors = await adapter.query(
+                f"""
+                UNWIND $frontier AS currentId
+                MATCH (n)--(neighbor) WHERE {id_func}(n) = currentId
+                RETURN DISTINCT {id_func}(n) AS nodeId,
+                       {id_func}(neighbor) AS neighborId,
+                       labels(neighbor)[0] AS neighborLabel
+                """,
+                {"frontier": _query_ids(adapter, frontier)},
+            )
+        except Exception:
+            break
+
+        next_frontier: List[str] = []
+        for record in neighbors.records:
+            current = str(record.get("nodeId"))
+            neighbor_id = record.get("neighborId")
+            if current not in owner or neighbor_id is None:
                 continue
+            neighbor_id = str(neighbor_id)
 
-            for neighbor in neighbors.records:
-                neighbor_id = neighbor.get("neighborId")
-                neighbor_label = neighbor.get("neighborLabel")
+            # Skip if being deleted
+            if neighbor_id in deleted:
+                continue
 
-                # Skip if being deleted
-                if neighbor_id in deletion_context.deleted_node_ids:
-                    continue
+            root = find(owner[current])
 
-                # Check if neighbor is an anchor type (Memory, Fact, Context)
-                if neighbor_label in ["Memory", "Fact", "Context"]:
-                    # Found anchor! This is NOT an orphan island
-                    return {"is_island": False, "island_nodes": []}
+            # Check if neighbor is an anchor type (Memory, Fact, Context)
+            if record.get("neighborLabel") in _DEFAULT_ANCHOR_LABELS:
+                # Found anchor! This is NOT an orphan island
+                anchored.add(root)
+                continue
 
-                # Add to island and continue BFS
-                if neighbor_id is not None and neighbor_id not in visited:
-                    island_nodes.add(str(neighbor_id))
-                    queue.append(str(neighbor_id))
+            if neighbor_id in owner:
+                # Explorations met - same connected component
+                union(root, find(owner[neighbor_id]))
+            else:
+                owner[neighbor_id] = root
+                next_frontier.append(neighbor_id)
 
+        frontier = [n for n in dict.fromkeys(next_frontier) if n not in visited]
         depth += 1
 
-    # Completed BFS with no anchors found = orphan island
-    return {
-        "is_island": True,
-        "island_nodes": list(island_nodes),
-    }
+    anchored_roots = {find(r) for r in anchored}
+    members: Dict[str, List[str]] = {}
+    for node, start in owner.items():
+        members.setdefault(find(start), []).append(node)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for node_id in node_ids:
+        root = find(str(node_id))
+        if root in anchored_roots:
+            results[node_id] = {"is_island": False, "island_nodes": []}
+        else:
+            # Completed BFS with no anchors found = orphan island
+            results[node_id] = {"is_island": True, "island_nodes": members[root]}
+    return results
 
 
 async def delete_with_orphan_cleanup(
@@ -385,7 +511,8 @@ async def delete_with_orphan_cleanup(
     Delete a node and cascade to orphaned references.
 
     Uses sophisticated orphan detection to safely clean up related nodes
-    while protecting against circular references.
+    while protecting against circular references. Each cascade level is
+    checked with one detect_orphans() call and deleted in one statement.
 
     Args:
         node_id: Node to delete
@@ -394,14 +521,17 @@ async def delete_with_orphan_cleanup(
         adapter: Graph adapter
 
     Returns:
-        Delete result with all cascaded deletions
+        Delete result with all cascaded deletions (only nodes that were
+        actually deleted are reported)
+
+    Raises:
+        Exception: If a delete statement fails
 
     Example:
         >>> ctx = create_deletion_context("Delete Memory mem-123", ORPHAN_RULES)
         >>> result = await delete_with_orphan_cleanup("node-123", "Memory", ctx, adapter)
         >>> print(f"Deleted {len(result.deleted_nodes)} nodes")
     """
-    deleted_nodes: List[str] = [node_id]
     deleted_edges: List[str] = []
     orphan_islands: List[Dict[str, Any]] = []
 
@@ -409,64 +539,61 @@ async def delete_with_orphan_cleanup(
     deletion_context.deleted_node_ids.add(node_id)
 
     # 1. Get all nodes this node references (outgoing edges)
-    try:
-        referenced_nodes = await adapter.query(
-            """
-            MATCH (n)-[r]->(referenced)
-            WHERE id(n) = $nodeId
-            RETURN id(referenced) as refId,
-                   labels(referenced)[0] as refLabel,
-                   id(r) as edgeId
-            """,
-            {"nodeId": node_id},
-        )
-    except Exception:
-        referenced_nodes_records: List[Dict[str, Any]] = []
-    else:
-        referenced_nodes_records = referenced_nodes.records
+    pending = await _referenced_nodes([node_id], adapter)
 
     # 2. Delete the primary node (detach delete removes all edges)
-    try:
-        await adapter.delete_node(node_id, detach=True)
-    except Exception:
-        # Node may already be deleted
-        pass
-
-    # 3. Check each referenced node for orphan status
-    for ref in referenced_nodes_records:
-        ref_id = ref.get("refId")
-        ref_label = ref.get("refLabel")
-
-        if not ref_id or not ref_label:
-            continue
-
-        orphan_check = await detect_orphan(ref_id, ref_label, deletion_context, adapter)
+    deleted_nodes = await _delete_nodes([node_id], adapter)
+
+    # 3. Check referenced nodes for orphan status, one cascade level at a time
+    labels: Dict[str, str] = dict(pending)
+    rechecked: Dict[str, OrphanCheckResult] = {}
+    while pending:
+        labels.update(pending)
+        checks = await detect_orphans(pending, deletion_context, adapter)
+
+        to_delete: List[str] = []
+        cascade: List[str] = []
+        for ref_id, orphan_check in checks.items():
+            if not orphan_check.is_orphan:
+                rechecked[ref_id] = orphan_check
+                continue
 
-        if orphan_check.is_orphan:
             if orphan_check.part_of_circular_island and orphan_check.island_nodes:
                 # Delete entire orphan island
-                for island_node_id in orphan_check.island_nodes:
-                    if island_node_id not in deletion_context.deleted_node_ids:
-                        try:
-                            await adapter.delete_node(island_node_id, detach=True)
-                            deleted_nodes.append(island_node_id)
-                            deletion_context.deleted_node_ids.add(island_node_id)
-                        except Exception:
-                            pass  # Node may have already been deleted via cascade
-
-                orphan_islands.append({
-                    "nodes": orphan_check.island_nodes,
-                    "reason": orphan_check.reason,
-                })
-            else:
-                # Single orphan node - recursive delete with cascade
-                cascade_result = await delete_with_orphan_cleanup(
-                    ref_id, ref_label, deletion_context, adapter
-                )
-
-                deleted_nodes.extend(cascade_result.deleted_nodes)
-                deleted_edges.extend(cascade_result.deleted_edges)
-                orphan_islands.extend(cascade_result.orphan_islands)
+                island_new = [
+                    n for n in orphan_check.island_nodes
+                    if n not in deletion_context.deleted_node_ids and n not in to_delete
+                ]
+                to_delete.extend(island_new)
+                if island_new:
+                    orphan_islands.append({
+                        "nodes": orphan_check.island_nodes,
+                        "reason": orphan_check.reason,
+                    })
+            elif ref_id not in deletion_context.deleted_node_ids:
+                # Single orphan node - cascade to what it references
+                to_delete.append(ref_id)
+                cascade.append(ref_id)
+
+        if not to_delete:
+            break
+
+        next_pending = await _referenced_nodes(cascade, adapter)
+        deleted_nodes.extend(await _delete_nodes(to_delete, adapter))
+        # Nodes that did not match are gone as well; never revisit them
+        deletion_context.deleted_node_ids.update(to_delete)
+
+        # Nodes kept alive only by references from just-deleted nodes
+        deleted_now = set(to_delete)
+        for ref_id, orphan_check in list(rechecked.items()):
+            if orphan_check.referenced_by and deleted_now.intersection(orphan_check.referenced_by):
+                next_pending.setdefault(ref_id, labels[ref_id])
+                del rechecked[ref_id]
+
+        pending = {
+            n: label for n, label in next_pending.items()
+            if n not in deletion_context.deleted_node_ids and label
+        }
 
     return DeleteResult(
         deleted_nodes=deleted_nodes,
@@ -475,6 +602,59 @@ async def delete_with_orphan_cleanup(
     )
 
 
+async def _referenced_nodes(
+    node_ids: List[str],
+    adapter: "GraphAdapter",
+) -> Dict[str, str]:
+    """Nodes referenced by outgoing edges of ``node_ids`` (ID -> label)."""
+    if not node_ids:
+        return {}
+
+    id_func = _id_function(adapter)
+    try:
+        referenced = await adapter.query(
+            f"""
+            UNWIND $nodeIds AS nodeId
+            MATCH (n)-[r]->(referenced) WHERE {id_func}(n) = nodeId
+            RETURN DISTINCT {id_func}(referenced) AS refId,
+                   labels(referenced)[0] AS refLabel
+            """,
+            {"nodeIds": _query_ids(adapter, node_ids)},
+        )
+    except Exception:
+        return {}
+
+    return {
+        str(r["refId"]): r["refLabel"]
+        for r in referenced.records
+        if r.get("refId") is not None and r.get("refLabel")
+    }
+
+
+async def _delete_nodes(node_ids: List[str], adapter: "GraphAdapter") -> List[str]:
+    """
+    Detach-delete a set of nodes in one statement.
+
+    Nodes that no longer exist simply do not match; query errors propagate.
+
+    Returns:
+        IDs of the nodes that were actually deleted
+    """
+    id_func = _id_function(adapter)
+    result = await adapter.query(
+        f"""
+        UNWIND $nodeIds AS nodeId
+        MATCH (n) WHERE {id_func}(n) = nodeId
+        WITH n, nodeId
+        DETACH DELETE n
+        RETURN nodeId AS deletedId
+        """,
+        {"nodeIds": _query_ids(adapter, node_ids)},
+    )
+    deleted = {str(record["deletedId"]) for record in result.records}
+    return [n for n in node_ids if str(n) in deleted]
+
+
 __all__ = [
     "OrphanRule",
     "DeletionContext",
@@ -484,5 +664,6 @@ __all__ = [
     "create_deletion_context",
     "can_run_orphan_cleanup",
     "detect_orphan",
+    "detect_orphans",
     "delete_with_orphan_cleanup",
 ]
@@ -0,0 +1,341 @@
+"""
+Cortex SDK - Graph Sync Specifications
+
+Single source of truth for the graph shape of memories and facts: which
+nodes are written with which properties, and which edges connect them.
+
+Both the per-entity sync functions (sync_memory_relationships,
+sync_fact_relationships) and the batched initial sync (batch_sync) are
+built from these specs, so the two paths cannot drift apart.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from ..types import GraphNode
+
+
+@dataclass(frozen=True)
+class NodeRef:
+    """A node identified by label and key property."""
+
+    label: str
+    key: str
+    value: Any
+
+
+@dataclass
+class EdgeSpec:
+    """An edge to write, with its endpoints and properties."""
+
+    type: str
+    target: NodeRef
+    properties: Dict[str, Any]
+    source: Optional[NodeRef] = None
+    """Edge source (None = the memory/fact being synced)."""
+
+    target_node: Optional[GraphNode] = None
+    """Node merged (created if missing) for the target; None = match only."""
+
+
+def relationship_type(predicate: str) -> str:
+    """Relationship type for a fact predicate (e.g. "works at" -> WORKS_AT)."""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", predicate.upper().replace(" ", "_"))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Shared Nodes
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def id_node(label: str, key: str, value: str, now: int) -> GraphNode:
+    """User/Agent/Participant node created on demand."""
+    return GraphNode(label=label, properties={key: value, "createdAt": now})
+
+
+def entity_node(name: str, entity_type: str, now: int) -> GraphNode:
+    """Entity node for a plain subject/object."""
+    return GraphNode(
+        label="Entity",
+        properties={"name": name, "type": entity_type, "createdAt": now},
+    )
+
+
+def enriched_entity_node(
+    name: str, entity_type: str, full_value: Optional[str], now: int
+) -> GraphNode:
+    """Entity node from enriched extraction (specific type and full value)."""
+    return GraphNode(
+        label="Entity",
+        properties={
+            "name": name,
+            "type": entity_type,
+            "entityType": entity_type,
+            "fullValue": full_value,
+            "createdAt": now,
+            "updatedAt": now,
+        },
+    )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Memories
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def memory_node(memory: Dict[str, Any]) -> GraphNode:
+    """Memory node (content truncated for the graph)."""
+    return GraphNode(
+        label="Memory",
+        properties={
+            "memoryId": memory["memoryId"],
+            "memorySpaceId": memory["memorySpaceId"],
+            "participantId": memory.get("participantId"),
+            "userId": memory.get("userId"),
+            "agentId": memory.get("agentId"),
+            "content": (memory.get("content") or "")[:200],
+            "contentType": memory.get("contentType"),
+            "sourceType": memory.get("sourceType"),
+            "sourceUserId": memory.get("sourceUserId"),
+            "importance": memory.get("importance"),
+            "tags": memory.get("tags") or [],
+            "version": memory.get("version") or 1,
+            "createdAt": memory["createdAt"],
+            "updatedAt": memory.get("updatedAt") or memory["createdAt"],
+        },
+    )
+
+
+def memory_edges(memory: Dict[str, Any], now: int) -> List[EdgeSpec]:
+    """
+    Edges from a memory node.
+
+    - REFERENCES -> Conversation (if conversationRef exists)
+    - RELATES_TO -> User / Agent
+    - IN_SPACE -> MemorySpace
+    - SOURCED_FROM -> Fact (if immutableRef is a fact)
+    - STORED_BY -> Participant (Hive Mode)
+    """
+    created_at = memory.get("createdAt", now)
+    edges: List[EdgeSpec] = []
+
+    conversation_ref = memory.get("conversationRef") or {}
+    if conversation_ref.get("conversationId"):
+        edges.append(EdgeSpec(
+            "REFERENCES",
+            NodeRef("Conversation", "conversationId", conversation_ref["conversationId"]),
+            {"messageIds": conversation_ref.get("messageIds") or [], "createdAt": created_at},
+        ))
+
+    for label, key in (("User", "userId"), ("Agent", "agentId")):
+        if memory.get(key):
+            edges.append(EdgeSpec(
+                "RELATES_TO",
+                NodeRef(label, key, memory[key]),
+                {"createdAt": created_at},
+                target_node=id_node(label, key, memory[key], now),
+            ))
+
+    edges.append(EdgeSpec(
+        "IN_SPACE",
+        NodeRef("MemorySpace", "memorySpaceId", memory["memorySpaceId"]),
+        {"createdAt": created_at},
+    ))
+
+    immutable_ref = memory.get("immutableRef") or {}
+    if immutable_ref.get("type") == "fact" and immutable_ref.get("id"):
+        edges.append(EdgeSpec(
+            "SOURCED_FROM",
+            NodeRef("Fact", "factId", immutable_ref["id"]),
+            {"version": immutable_ref.get("version"), "createdAt": created_at},
+        ))
+
+    if memory.get("participantId"):
+        edges.append(EdgeSpec(
+            "STORED_BY",
+            NodeRef("Participant", "participantId", memory["participantId"]),
+            {"createdAt": created_at},
+            target_node=id_node("Participant", "participantId", memory["participantId"], now),
+        ))
+
+    return edges
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Facts
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def fact_node(fact: Dict[str, Any]) -> GraphNode:
+    """Fact node."""
+    return GraphNode(
+        label="Fact",
+        properties={
+            "factId": fact["factId"],
+            "memorySpaceId": fact["memorySpaceId"],
+            "participantId": fact.get("participantId"),
+            "fact": fact["fact"],
+            "factType": fact["factType"],
+            "subject": fact.get("subject"),
+            "predicate": fact.get("predicate"),
+            "object": fact.get("object"),
+            "confidence": fact["confidence"],
+            "sourceType": fact.get("sourceType"),
+            "tags": fact.get("tags") or [],
+            "version": fact.get("version") or 1,
+            "supersededBy": fact.get("supersededBy"),
+            "supersedes": fact.get("supersedes"),
+            "createdAt": fact["createdAt"],
+            "updatedAt": fact.get("updatedAt") or fact["createdAt"],
+        },
+    )
+
+
+def fact_entity_nodes(fact: Dict[str, Any], now: int) -> List[GraphNode]:
+    """
+    Entity nodes a fact needs, in write order.
+
+    Enriched entities come first; relation endpoints and the legacy
+    subject/object are only added when no entity of that name (case
+    insensitive) was added before.
+    """
+    nodes: Dict[str, GraphNode] = {}
+
+    for entity in fact.get("entities") or []:
+        if entity.get("name"):
+            nodes.setdefault(entity["name"].lower(), enriched_entity_node(
+                entity["name"], entity.get("type") or "entity", entity.get("fullValue"), now,
+            ))
+
+    for relation in fact.get("relations") or []:
+        for role in ("subject", "object"):
+            name = relation.get(role)
+            if name:
+                nodes.setdefault(name.lower(), entity_node(name, role, now))
+
+    for role in ("subject", "object"):
+        name = fact.get(role)
+        if name:
+            nodes.setdefault(name.lower(), entity_node(name, role, now))
+
+    return list(nodes.values())
+
+
+def fact_edges(fact: Dict[str, Any], now: int) -> List[EdgeSpec]:
+    """
+    Edges for a fact, in write order (entity nodes must exist first).
+
+    - MENTIONS -> Entity (enriched entities, then legacy subject/object)
+    - typed Entity -> Entity edges from relations (or subject/predicate/object)
+    - EXTRACTED_FROM -> Conversation (if sourceRef exists)
+    - IN_SPACE -> MemorySpace
+    - SUPERSEDES -> Fact (fact versioning)
+    - EXTRACTED_BY -> Participant (Hive Mode)
+    """
+    created_at = fact.get("createdAt", now)
+    edges: List[EdgeSpec] = []
+
+    # Entity names resolve case-insensitively to the first node written
+    names: Dict[str, str] = {}
+    for entity in fact.get("entities") or []:
+        if not entity.get("name"):
+            continue
+        names.setdefault(entity["name"].lower(), entity["name"])
+        edges.append(EdgeSpec(
+            "MENTIONS",
+            NodeRef("Entity", "name", names[entity["name"].lower()]),
+            {
+                "role": entity.get("type"),
+                "fullValue": entity.get("fullValue"),
+                "createdAt": created_at,
+            },
+        ))
+
+    for relation in fact.get("relations") or []:
+        subject, predicate, obj = (
+            relation.get("subject"), relation.get("predicate"), relation.get("object")
+        )
+        if not (subject and predicate and obj):
+            continue
+        names.setdefault(subject.lower(), subject)
+        names.setdefault(obj.lower(), obj)
+        edges.append(EdgeSpec(
+            relationship_type(predicate),
+            NodeRef("Entity", "name", names[obj.lower()]),
+            {
+                "factId": fact["factId"],
+                "confidence": fact["confidence"],
+                "category": fact.get("category"),
+                "createdAt": created_at,
+            },
+            source=NodeRef("Entity", "name", names[subject.lower()]),
+        ))
+
+    for role in ("subject", "object"):
+        name = fact.get(role)
+        if name and name.lower() not in names:
+            names[name.lower()] = name
+            edges.append(EdgeSpec(
+                "MENTIONS",
+                NodeRef("Entity", "name", name),
+                {"role": role, "createdAt": created_at},
+            ))
+
+    if fact.get("subject") and fact.get("object") and fact.get("predicate") and not fact.get("relations"):
+        edges.append(EdgeSpec(
+            relationship_type(fact["predicate"]),
+            NodeRef("Entity", "name", names[fact["object"].lower()]),
+            {
+                "factId": fact["factId"],
+                "confidence": fact["confidence"],
+                "createdAt": created_at,
+            },
+            source=NodeRef("Entity", "name", names[fact["subject"].lower()]),
+        ))
+
+    source_ref = fact.get("sourceRef") or {}
+    if source_ref.get("conversationId"):
+        edges.append(EdgeSpec(
+            "EXTRACTED_FROM",
+            NodeRef("Conversation", "conversationId", source_ref["conversationId"]),
+            {"messageIds": source_ref.get("messageIds") or [], "createdAt": created_at},
+        ))
+
+    edges.append(EdgeSpec(
+        "IN_SPACE",
+        NodeRef("MemorySpace", "memorySpaceId", fact["memorySpaceId"]),
+        {"createdAt": created_at},
+    ))
+
+    if fact.get("supersedes"):
+        edges.append(EdgeSpec(
+            "SUPERSEDES",
+            NodeRef("Fact", "factId", fact["supersedes"]),
+            {"version": fact.get("version"), "createdAt": created_at},
+        ))
+
+    if fact.get("participantId"):
+        edges.append(EdgeSpec(
+            "EXTRACTED_BY",
+            NodeRef("Participant", "participantId", fact["participantId"]),
+            {"createdAt": created_at},
+            target_node=id_node("Participant", "participantId", fact["participantId"], now),
+        ))
+
+    return edges
+
+
+__all__ = [
+    "EdgeSpec",
+    "NodeRef",
+    "entity_node",
+    "enriched_entity_node",
+    "fact_edges",
+    "fact_entity_nodes",
+    "fact_node",
+    "id_node",
+    "memory_edges",
+    "memory_node",
+    "relationship_type",
+]
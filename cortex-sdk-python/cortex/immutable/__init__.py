@@ -5,8 +5,9 @@ Layer 1b: Shared immutable data with automatic versioning
 """
 
 from datetime import datetime
-from typing import Any, List, Optional, Union
+from typing import Any, AsyncIterator, List, Optional, Union
 
+from .._pagination import iterate_pages
 from .._utils import convert_convex_response, filter_none_values
 from ..errors import CortexError, ErrorCode  # noqa: F401
 from ..types import (
@@ -385,6 +386,64 @@ class ImmutableAPI:
 
         return [ImmutableRecord(**convert_convex_response(record)) for record in entries]
 
+    def iter(
+        self,
+        filter: Optional[ListImmutableFilter] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[ImmutableRecord]:
+        """
+        Iterate over every matching immutable record using cursor pagination.
+
+        The next page is fetched while the caller processes the current one,
+        so at most two pages are held in memory however many records match.
+        ``filter.limit`` caps the number of records yielded.
+
+        Args:
+            filter: Optional filter with type, user_id, and limit
+            page_size: Maximum records scanned per page
+
+        Returns:
+            Async iterator of immutable records
+
+        Example:
+            >>> async for record in cortex.immutable.iter(ListImmutableFilter(user_id='user-123')):
+            ...     process(record)
+        """
+        # Extract filter values
+        type_val = filter.type if filter else None
+        user_id = filter.user_id if filter else None
+        limit = filter.limit if filter else None
+
+        # CLIENT-SIDE VALIDATION
+        if type_val is not None:
+            validate_type(type_val, "type")
+        if user_id is not None:
+            validate_user_id(user_id, "user_id")
+        if limit is not None:
+            validate_limit(limit, "limit")
+        validate_limit(page_size, "page_size")
+
+        args = filter_none_values({
+            "type": type_val,
+            "userId": user_id,
+            "tenantId": self._tenant_id,
+        })
+
+        async def fetch_page(cursor: Optional[str]) -> Any:
+            return await self._execute_with_resilience(
+                lambda: self.client.query(
+                    "immutable:listPage",
+                    {**args, "paginationOpts": {"numItems": page_size, "cursor": cursor}},
+                ),
+                "immutable:listPage",
+            )
+
+        return iterate_pages(
+            fetch_page,
+            lambda record: ImmutableRecord(**convert_convex_response(record)),
+            limit=limit,
+        )
+
     async def search(
         self,
         input: SearchImmutableInput,
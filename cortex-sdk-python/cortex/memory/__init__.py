@@ -5,13 +5,31 @@ Layer 4: High-level helpers that orchestrate Layer 1 (ACID) and Layer 2 (Vector)
 """
 
 import asyncio
+import dataclasses
 import time
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
+from .._utils import convert_convex_response
 from ..conversations import ConversationsAPI
 from ..errors import CortexError, ErrorCode
-from ..facts import FactsAPI, StoreFactWithDedupOptions
-from ..facts.belief_revision import ConflictCandidate, ReviseParams
+from ..facts import EmbeddingCache, FactsAPI, StoreFactWithDedupOptions
+from ..facts.belief_revision import (
+    ConflictCandidate,
+    PartialRevisionError,
+    ReviseParams,
+)
 from ..facts.deduplication import (
     DeduplicationConfig,
     FactDeduplicationService,
@@ -25,6 +43,7 @@ from ..types import (
     DeleteMemoryOptions,
     DeleteMemoryResult,
     EnrichedMemory,
+    FactRecord,
     FactRevisionAction,
     ForgetOptions,
     ForgetResult,
@@ -59,6 +78,8 @@ from ..types import (
     RevisionAction as RevisionAction,
 )
 from ..vector import VectorAPI
+from .stream_utils import RememberStreamTee, StreamTee
+from .streaming_types import PartialMemoryPromotion
 from .validators import (
     MemoryValidationError,
     validate_content,
@@ -99,6 +120,7 @@ class MemoryAPI:
         resilience: Optional[Any] = None,
         llm_config: Optional[LLMConfig] = None,
         auth_context: Optional[AuthContext] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ) -> None:
         """
         Initialize Memory API.
@@ -109,6 +131,8 @@ class MemoryAPI:
             resilience: Optional resilience layer for overload protection
             llm_config: Optional LLM configuration for automatic fact extraction
             auth_context: Optional auth context for multi-tenancy
+            embedding_cache: Optional fact embedding cache shared with
+                cortex.facts
         """
         self.client = client
         self.graph_adapter = graph_adapter
@@ -128,7 +152,10 @@ class MemoryAPI:
             if llm_client and hasattr(llm_client, "complete"):
                 belief_revision_llm_client = llm_client
 
-        self.facts = FactsAPI(client, graph_adapter, resilience, auth_context, belief_revision_llm_client)
+        self.facts = FactsAPI(
+            client, graph_adapter, resilience, auth_context, belief_revision_llm_client,
+            embedding_cache=embedding_cache,
+        )
 
     @property
     def _tenant_id(self) -> Optional[str]:
@@ -321,6 +348,8 @@ class MemoryAPI:
                         strategy=fact_dedup.strategy,
                         similarity_threshold=fact_dedup.similarity_threshold,
                         generate_embedding=generate_embedding,
+                        generate_embeddings=fact_dedup.generate_embeddings,
+                        embedding_model=fact_dedup.embedding_model,
                     )
                 return fact_dedup
 
@@ -430,6 +459,53 @@ class MemoryAPI:
             # Log warning but don't fail
             print(f"Warning: Failed to auto-register memory space: {error}")
 
+    async def _promote_partial_memory(
+        self,
+        promotion: PartialMemoryPromotion,
+        params: RememberParams,
+        agent_content: str,
+        message_ids: List[str],
+        sync_to_graph: bool,
+    ) -> MemoryEntry:
+        """
+        Finalize a streamed partial memory as the agent's conversation memory.
+
+        One mutation sets the final content, the precomputed embedding, the
+        message refs and ownership. A partial graph node created during the
+        stream is reused rather than creating a second node.
+        """
+        record = await promotion.storage_handler.finalize_memory(
+            agent_content,
+            promotion.embedding,
+            message_ids=message_ids,
+            agent_id=params.agent_id,
+            user_name=params.user_name,
+        )
+        if record is None:
+            # Already finalized, or the backend did not return the record
+            memory = await self.vector.get(
+                params.memory_space_id, promotion.storage_handler.partial_memory_id
+            )
+            if memory is None:
+                raise CortexError(
+                    ErrorCode.MEMORY_NOT_FOUND,
+                    f"Memory {promotion.storage_handler.partial_memory_id} not found",
+                )
+            return memory
+
+        if sync_to_graph and self.graph_adapter:
+            try:
+                from ..graph import sync_memory_relationships, sync_memory_to_graph
+
+                node_id = promotion.graph_node_id or await sync_memory_to_graph(
+                    record, self.graph_adapter
+                )
+                await sync_memory_relationships(record, node_id, self.graph_adapter)
+            except Exception as error:
+                print(f"Warning: Failed to sync memory to graph: {error}")
+
+        return MemoryEntry(**convert_convex_response(record))
+
     async def remember(
         self, params: RememberParams, options: Optional[RememberOptions] = None
     ) -> RememberResult:
@@ -481,6 +557,22 @@ class MemoryAPI:
             ...     RememberParams(..., observer=MyObserver())
             ... )
         """
+        return await self._remember(params, options)
+
+    async def _remember(
+        self,
+        params: RememberParams,
+        options: Optional[RememberOptions] = None,
+        promotion: Optional[PartialMemoryPromotion] = None,
+    ) -> RememberResult:
+        """
+        Orchestrate remember() across all layers.
+
+        With ``promotion`` (from remember_stream), the streamed partial memory
+        becomes the agent memory instead of storing a second one, its
+        embedding is reused, and facts are only extracted from the text
+        progressive extraction has not covered.
+        """
         import uuid
 
         # Client-side validation
@@ -727,7 +819,8 @@ class MemoryAPI:
 
                 if params.generate_embedding:
                     user_embedding = await params.generate_embedding(user_content)
-                    agent_embedding = await params.generate_embedding(agent_content)
+                    if promotion is None:
+                        agent_embedding = await params.generate_embedding(agent_content)
 
                 # Store user message in Vector
                 user_memory = await self.vector.store(
@@ -772,8 +865,18 @@ class MemoryAPI:
                     ]
                 )
 
+                if promotion is not None:
+                    # The streamed partial memory becomes the agent memory
+                    agent_memory = await self._promote_partial_memory(
+                        promotion,
+                        params,
+                        agent_content,
+                        [agent_message_id] if agent_message_id else [],
+                        should_sync_to_graph,
+                    )
+                    stored_memories.append(agent_memory)
                 # Only store agent response in vector if it contains meaningful information
-                if not is_acknowledgment:
+                elif not is_acknowledgment:
                     agent_memory = await self.vector.store(
                         params.memory_space_id,
                         StoreMemoryInput(
@@ -841,6 +944,14 @@ class MemoryAPI:
         extracted_facts: List[FactRecordModel] = []
         revision_actions: List[FactRevisionAction] = []
 
+        # Facts stored during the stream count as extracted; only the text
+        # progressive extraction has not covered is sent to the extractor
+        fact_content = params.agent_response
+        if promotion is not None:
+            extracted_facts.extend(promotion.progressive_facts)
+            if promotion.fact_content is not None:
+                fact_content = promotion.fact_content
+
         if not self._should_skip_layer("facts", skip_layers):
             if observer:
                 event = self._create_layer_event("facts", "in_progress", orchestration_start_time)
@@ -849,10 +960,10 @@ class MemoryAPI:
 
             fact_extractor = self._get_fact_extractor(params)
 
-            if fact_extractor:
+            if fact_extractor and fact_content:
                 try:
                     facts_to_store = await fact_extractor(
-                        params.user_message, params.agent_response
+                        params.user_message, fact_content
                     )
 
                     if facts_to_store:
@@ -886,39 +997,59 @@ class MemoryAPI:
                                 snake_key = ''.join(['_' + c.lower() if c.isupper() else c for c in key]).lstrip('_')
                                 return getattr(fact_data, snake_key, default)
 
-                        for fact_data in facts_to_store:
+                        def _revise_params_for(fact_data: Any) -> ReviseParams:
+                            """Build belief revision params for an extracted fact."""
+                            confidence_raw = _get_fact_value(fact_data, "confidence", 80)
+                            # Normalize confidence: if float <= 1, treat as percentage and multiply
+                            confidence_val = int(confidence_raw * 100) if isinstance(confidence_raw, float) and confidence_raw <= 1 else int(confidence_raw)
+
+                            return ReviseParams(
+                                memory_space_id=params.memory_space_id,
+                                user_id=params.user_id,
+                                participant_id=params.participant_id,
+                                fact=ConflictCandidate(
+                                    fact=_get_fact_value(fact_data, "fact"),
+                                    fact_type=_get_fact_value(fact_data, "factType"),
+                                    subject=_get_fact_value(fact_data, "subject", params.user_id or params.agent_id),
+                                    predicate=_get_fact_value(fact_data, "predicate"),
+                                    object=_get_fact_value(fact_data, "object"),
+                                    confidence=confidence_val,
+                                    tags=_get_fact_value(fact_data, "tags", params.tags or []),
+                                ),
+                            )
+
+                        # Revise all facts from this turn together (one LLM call,
+                        # one batched write); facts the batch did not write fall
+                        # back to revise()
+                        batched_revisions: Dict[int, Any] = {}
+                        if use_belief_revision and len(facts_to_store) > 1:
+                            try:
+                                batch_results = await self.facts.revise_many(
+                                    [_revise_params_for(fact_data) for fact_data in facts_to_store]
+                                )
+                                batched_revisions = dict(enumerate(batch_results))
+                            except PartialRevisionError as error:
+                                print(f"Warning: {error}. Revising the remaining facts individually")
+                                batched_revisions = {
+                                    index: result
+                                    for index, result in enumerate(error.results)
+                                    if result is not None
+                                }
+                            except Exception as error:
+                                print(f"Warning: Batched belief revision failed, revising facts individually: {error}")
+
+                        for fact_index, fact_data in enumerate(facts_to_store):
                             try:
                                 if use_belief_revision:
                                     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
                                     # BELIEF REVISION PATH (intelligent fact management)
                                     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-                                    fact_text = _get_fact_value(fact_data, "fact")
-                                    fact_type_val = _get_fact_value(fact_data, "factType")
-                                    subject_val = _get_fact_value(fact_data, "subject", params.user_id or params.agent_id)
-                                    predicate_val = _get_fact_value(fact_data, "predicate")
-                                    object_val = _get_fact_value(fact_data, "object")
-                                    confidence_raw = _get_fact_value(fact_data, "confidence", 80)
-                                    tags_val = _get_fact_value(fact_data, "tags", params.tags or [])
-
-                                    # Normalize confidence: if float <= 1, treat as percentage and multiply
-                                    confidence_val = int(confidence_raw * 100) if isinstance(confidence_raw, float) and confidence_raw <= 1 else int(confidence_raw)
-
-                                    revise_result = await self.facts.revise(
-                                        ReviseParams(
-                                            memory_space_id=params.memory_space_id,
-                                            user_id=params.user_id,
-                                            participant_id=params.participant_id,
-                                            fact=ConflictCandidate(
-                                                fact=fact_text,
-                                                fact_type=fact_type_val,
-                                                subject=subject_val,
-                                                predicate=predicate_val,
-                                                object=object_val,
-                                                confidence=confidence_val,
-                                                tags=tags_val,
-                                            ),
+                                    if fact_index in batched_revisions:
+                                        revise_result = batched_revisions[fact_index]
+                                    else:
+                                        revise_result = await self.facts.revise(
+                                            _revise_params_for(fact_data)
                                         )
-                                    )
 
                                     # Track revision action
                                     # Handle both dict and object results from revise()
@@ -1088,6 +1219,10 @@ class MemoryAPI:
                 except Exception as error:
                     print(f"Warning: Failed to extract facts: {error}")
 
+            if promotion is not None:
+                # A final-pass fact may resolve to one stored during the stream
+                extracted_facts = list({f.fact_id: f for f in extracted_facts}.values())
+
             # Track created fact IDs
             created_ids["factIds"] = [f.fact_id for f in extracted_facts]
 
@@ -1279,6 +1414,7 @@ class MemoryAPI:
             ProgressiveGraphSync,
             ProgressiveStorageHandler,
             StreamErrorRecovery,
+            StreamPipeline,
             StreamProcessor,
             create_stream_context,
         )
@@ -1298,7 +1434,7 @@ class MemoryAPI:
             opts = options
 
         # Initialize components
-        metrics = MetricsCollector()
+        metrics = MetricsCollector(opts.token_counter)
 
         context = create_stream_context(
             memory_space_id=str(memory_space_id or ""),
@@ -1377,44 +1513,64 @@ class MemoryAPI:
         original_hooks = opts.hooks if opts else None
         progressive_facts: List[Any] = []
 
-        # Create enhanced hooks that integrate progressive components
-        async def enhanced_on_chunk(event: ChunkEvent) -> None:
-            # Call original hook if exists
-            hook_fn = None
-            if original_hooks:
-                if isinstance(original_hooks, dict):
-                    hook_fn = original_hooks.get("onChunk")
-                elif hasattr(original_hooks, 'on_chunk'):
-                    hook_fn = original_hooks.on_chunk
+        # The caller's on_chunk hook sees each chunk first; storage, fact
+        # extraction and graph sync consume it from bounded queues
+        caller_on_chunk = None
+        if original_hooks:
+            if isinstance(original_hooks, dict):
+                caller_on_chunk = original_hooks.get("onChunk")
+            elif hasattr(original_hooks, 'on_chunk'):
+                caller_on_chunk = original_hooks.on_chunk
+
+        pipeline = StreamPipeline(
+            pass_through=caller_on_chunk if callable(caller_on_chunk) else None,
+            queue_size=opts.pipeline_queue_size,
+            policy=opts.backpressure_policy,
+            stage_policies=opts.stage_backpressure,
+        )
 
-            if hook_fn and callable(hook_fn):
-                hook_result = hook_fn(event)
-                if asyncio.iscoroutine(hook_result):
-                    await hook_result
+        # Progressive storage update
+        if storage_handler:
+            async def storage_stage(event: ChunkEvent) -> None:
+                if storage_handler.should_update():
+                    await storage_handler.update_partial_content(
+                        event.accumulated, event.chunk_number
+                    )
 
-            # Progressive storage update
-            if storage_handler and storage_handler.should_update():
-                await storage_handler.update_partial_content(
-                    event.accumulated, event.chunk_number
-                )
+            pipeline.add_stage(
+                "storage", storage_stage, when=lambda _: storage_handler.should_update()
+            )
 
-            # Progressive fact extraction
-            if fact_extractor and fact_extractor.should_extract(len(event.accumulated)):
-                user_message_val = params.get("userMessage") if isinstance(params, dict) else params.user_message
-                facts = await fact_extractor.extract_from_chunk(
-                    event.accumulated,
-                    event.chunk_number,
-                    extract_facts_fn,  # type: ignore
-                    str(user_message_val or ""),
-                    str(conversation_id or ""),
-                    sync_to_graph=(opts.sync_to_graph if opts else True) and self.graph_adapter is not None,
-                )
-                progressive_facts.extend(facts)
+        # Progressive fact extraction (runs in the background)
+        if fact_extractor:
+            def facts_stage(event: ChunkEvent) -> None:
+                if fact_extractor.should_extract(event.accumulated_length):
+                    user_message_val = params.get("userMessage") if isinstance(params, dict) else params.user_message
+                    fact_extractor.schedule_extraction(
+                        event.accumulated,
+                        event.chunk_number,
+                        extract_facts_fn,  # type: ignore
+                        str(user_message_val or ""),
+                        str(conversation_id or ""),
+                        sync_to_graph=(opts.sync_to_graph if opts else True) and self.graph_adapter is not None,
+                    )
 
-            # Progressive graph sync update
-            if graph_sync and graph_sync.should_sync():
+            pipeline.add_stage(
+                "facts",
+                facts_stage,
+                when=lambda event: fact_extractor.should_extract(event.accumulated_length),
+            )
+
+        # Progressive graph sync update
+        if graph_sync:
+            async def graph_stage(event: ChunkEvent) -> None:
                 await graph_sync.update_partial_node(event.accumulated, context)
 
+            pipeline.add_stage("graph", graph_stage, when=lambda _: graph_sync.should_sync())
+
+        async def enhanced_on_chunk(event: ChunkEvent) -> None:
+            await pipeline.publish(event)
+
         async def enhanced_on_progress(event: ProgressEvent) -> None:
             # Call original hook if exists
             hook_fn = None
@@ -1534,19 +1690,38 @@ class MemoryAPI:
             response_stream = params.get("responseStream") if isinstance(params, dict) else params.response_stream
             full_response = await processor.process_stream(response_stream, opts)  # type: ignore
 
+            # Let queued stage work and in-flight progressive extraction finish
+            await pipeline.close()
+            if fact_extractor:
+                progressive_facts.extend(await fact_extractor.drain())
+
             # Step 4: Validate we got content
             if not full_response or full_response.strip() == "":
                 raise Exception("Response stream completed but produced no content.")
 
-            # Step 5: Finalize storage
+            # Step 5: Prepare to promote the partial memory in place
             generate_embedding_fn = params.get("generateEmbedding") if isinstance(params, dict) else getattr(params, "generate_embedding", None)
+            promotion: Optional[PartialMemoryPromotion] = None
             if storage_handler and storage_handler.is_ready():
-                embedding = None
-                if generate_embedding_fn:
-                    embedding = await generate_embedding_fn(full_response)
-                await storage_handler.finalize_memory(full_response, embedding)
+                promotion = PartialMemoryPromotion(
+                    storage_handler=storage_handler,
+                    embedding=(
+                        await generate_embedding_fn(full_response)
+                        if generate_embedding_fn
+                        else None
+                    ),
+                    fact_content=(
+                        fact_extractor.unprocessed_content(full_response)
+                        if fact_extractor
+                        else None
+                    ),
+                    progressive_facts=(
+                        fact_extractor.get_extracted_facts() if fact_extractor else []
+                    ),
+                    graph_node_id=graph_sync.partial_node_id if graph_sync else None,
+                )
 
-            # Step 6: Use remember() for final storage
+            # Step 6: Use remember() for the remaining layers
             # Determine sync_to_graph - default to True if graph adapter exists
             should_sync = (opts.sync_to_graph if opts and hasattr(opts, 'sync_to_graph') else True) and self.graph_adapter is not None
 
@@ -1556,7 +1731,7 @@ class MemoryAPI:
             # Extract observer from params (v0.25.0+)
             stream_observer = params.get("observer") if isinstance(params, dict) else getattr(params, "observer", None)
 
-            remember_result = await self.remember(
+            remember_result = await self._remember(
                 RememberParams(
                     memory_space_id=str(memory_space_id or ""),
                     conversation_id=str(conversation_id or ""),
@@ -1577,11 +1752,22 @@ class MemoryAPI:
                     observer=stream_observer,  # Pass observer for real-time monitoring (v0.25.0+)
                 ),
                 RememberOptions(sync_to_graph=should_sync, belief_revision=belief_revision_setting),
+                promotion,
             )
 
+            # The vector layer was skipped, so nothing promoted the partial memory
+            if storage_handler and storage_handler.is_ready():
+                await storage_handler.finalize_memory(
+                    full_response, promotion.embedding if promotion else None
+                )
+
             # Step 7: Finalize graph sync
             if graph_sync and remember_result.memories:
-                await graph_sync.finalize_node(remember_result.memories[0])
+                await graph_sync.finalize_node(remember_result.memories[-1])
+
+            # The interrupted attempt this stream replaced is no longer needed
+            if opts.resume_token:
+                await error_recovery.delete_resume_token(opts.resume_token)
 
             # Step 8: Generate performance insights
             metrics_snapshot = metrics.get_snapshot()
@@ -1606,9 +1792,16 @@ class MemoryAPI:
                 ),
                 # Include belief revision actions from remember() result
                 fact_revisions=remember_result.fact_revisions,
+                pipeline_metrics=pipeline.get_metrics(),
             )
 
         except Exception as error:
+            # Stop the stage consumers and background extraction before
+            # recovery or cleanup, including the resumable exit below
+            await pipeline.cancel()
+            if fact_extractor:
+                await fact_extractor.cancel()
+
             # Error recovery
             _ = error_recovery.create_stream_error(
                 error, context, "streaming"
@@ -1627,6 +1820,7 @@ class MemoryAPI:
                         retry_delay=opts.retry_delay or 1000,
                         preserve_partial_data=True,
                     ),
+                    storage_handler,
                 )
 
                 if recovery_result.success and opts.generate_resume_token:
@@ -1644,6 +1838,58 @@ class MemoryAPI:
 
             raise
 
+    def remember_stream_tee(
+        self, params: Any, options: Optional[Any] = None
+    ) -> RememberStreamTee:
+        """
+        Forward a streaming response to the caller while remembering it.
+
+        The response stream is read once. Every chunk is handed to the
+        returned iterator as soon as it arrives, and remember_stream() runs
+        in the background on a copy, so persistence (conversation setup,
+        partial storage, fact extraction) never delays the caller's
+        time-to-first-token. Must be called from a running event loop.
+
+        Args:
+            params: RememberStreamParams (or dict) as for remember_stream()
+            options: Optional StreamingOptions as for remember_stream()
+
+        Returns:
+            RememberStreamTee yielding response chunks; ``await tee.result``
+            gives the EnhancedRememberStreamResult. Validation and storage
+            errors are raised from ``result``; errors from the response
+            stream are raised from both.
+
+        Example:
+            >>> tee = cortex.memory.remember_stream_tee({
+            ...     'memorySpaceId': 'agent-1',
+            ...     'conversationId': 'conv-123',
+            ...     'userMessage': 'What is the weather?',
+            ...     'responseStream': llm_stream,
+            ...     'userId': 'user-1',
+            ...     'userName': 'Alex',
+            ...     'agentId': 'assistant-v1',
+            ... })
+            >>> async for chunk in tee:
+            ...     await websocket.send(chunk)
+            >>> result = await tee.result
+        """
+        response_stream = params.get("responseStream") if isinstance(params, dict) else params.response_stream
+        validate_stream_object(response_stream)
+
+        tee: StreamTee[str] = StreamTee(cast(AsyncIterable[str], response_stream))
+        caller_chunks, cortex_chunks = tee.branches
+
+        if isinstance(params, dict):
+            cortex_params: Any = {**params, "responseStream": cortex_chunks}
+        else:
+            cortex_params = dataclasses.replace(params, response_stream=cortex_chunks)
+
+        result = asyncio.ensure_future(self.remember_stream(cortex_params, options))
+        tee.start()
+
+        return RememberStreamTee(caller_chunks, result, tee)
+
     async def forget(
         self,
         memory_space_id: str,
@@ -1854,25 +2100,22 @@ class MemoryAPI:
             if conv:
                 conversations[conv_id] = conv
 
-        # Batch fetch facts
+        # Batch fetch facts (streamed; only facts linked to these memories are kept)
         from ..types import ListFactsFilter
-        all_facts = await self.facts.list(
-            ListFactsFilter(memory_space_id=memory_space_id, limit=10000)
-        )
+        memory_ids = {mem.memory_id for mem in memories}
 
         facts_by_memory_id: Dict[str, List[Any]] = {}
         facts_by_conversation_id: Dict[str, List[Any]] = {}
 
-        for fact in all_facts:
-            if fact.source_ref and fact.source_ref.memory_id:
-                if fact.source_ref.memory_id not in facts_by_memory_id:
-                    facts_by_memory_id[fact.source_ref.memory_id] = []
-                facts_by_memory_id[fact.source_ref.memory_id].append(fact)
+        async for fact in self.facts.iter(ListFactsFilter(memory_space_id=memory_space_id)):
+            fact_memory_id = self._ref_field(fact.source_ref, "memory_id")
+            fact_conversation_id = self._ref_field(fact.source_ref, "conversation_id")
+
+            if fact_memory_id in memory_ids:
+                facts_by_memory_id.setdefault(fact_memory_id, []).append(fact)
 
-            if fact.source_ref and fact.source_ref.conversation_id:
-                if fact.source_ref.conversation_id not in facts_by_conversation_id:
-                    facts_by_conversation_id[fact.source_ref.conversation_id] = []
-                facts_by_conversation_id[fact.source_ref.conversation_id].append(fact)
+            if fact_conversation_id in conversation_ids:
+                facts_by_conversation_id.setdefault(fact_conversation_id, []).append(fact)
 
         # Enrich results
         enriched = []
@@ -2056,6 +2299,7 @@ class MemoryAPI:
                     relationship_types=graph_exp.relationship_types or [],
                     expand_from_facts=graph_exp.expand_from_facts if graph_exp.expand_from_facts is not None else True,
                     expand_from_memories=graph_exp.expand_from_memories if graph_exp.expand_from_memories is not None else True,
+                    max_fan_out=graph_exp.max_fan_out or 25,
                 )
 
                 expansion_result = await perform_graph_expansion(
@@ -2469,22 +2713,19 @@ class MemoryAPI:
 
         # Count affected facts
         from ..types import ListFactsFilter, UpdateManyResult
-        all_facts = await self.facts.list(
-            ListFactsFilter(memory_space_id=memory_space_id, limit=10000)
-        )
         memory_ids = result.get("memoryIds", [])
-        affected_facts = [
-            fact
-            for fact in all_facts
-            if fact.source_ref
-            and fact.source_ref.memory_id in memory_ids
-        ]
+        updated_ids = set(memory_ids)
+        facts_affected = 0
+        if updated_ids:
+            async for fact in self.facts.iter(ListFactsFilter(memory_space_id=memory_space_id)):
+                if self._ref_field(fact.source_ref, "memory_id") in updated_ids:
+                    facts_affected += 1
 
         return UpdateManyResult(
             updated=result.get("updated", 0),
             memory_ids=memory_ids,
             new_versions=result.get("newVersions", []),
-            facts_affected=len(affected_facts),
+            facts_affected=facts_affected,
         )
 
     async def delete_many(
@@ -2515,22 +2756,23 @@ class MemoryAPI:
         if filters.get("source_type") is not None:
             validate_source_type(filters["source_type"])
 
-        # Get all memories to delete
-        memories = await self.vector.list(memory_space_id, limit=10000)
-
-        total_facts_deleted = 0
-        all_fact_ids: List[str] = []
-
-        # Cascade delete facts for each memory
-        for memory in memories:
-            facts_deleted, fact_ids = await self._cascade_delete_facts(
-                memory_space_id,
-                memory.memory_id,
-                memory.conversation_ref.conversation_id if memory.conversation_ref else None,
-                True,
-            )
-            total_facts_deleted += facts_deleted
-            all_fact_ids.extend(fact_ids)
+        # Collect the memories the delete will match
+        memory_ids: Set[str] = set()
+        conversation_ids: Set[str] = set()
+        async for memory in self.vector.iter(
+            memory_space_id,
+            user_id=filters.get("user_id"),
+            source_type=filters.get("source_type"),
+        ):
+            memory_ids.add(memory.memory_id)
+            conversation_id = self._ref_field(memory.conversation_ref, "conversation_id")
+            if conversation_id:
+                conversation_ids.add(conversation_id)
+
+        # Cascade delete their facts in a single pass over the space
+        total_facts_deleted, all_fact_ids = await self._cascade_delete_linked_facts(
+            memory_space_id, memory_ids, conversation_ids, True
+        )
 
         # Delete memories
         result = await self.vector.delete_many(
@@ -2730,6 +2972,13 @@ class MemoryAPI:
 
     # Helper methods
 
+    @staticmethod
+    def _ref_field(ref: Any, name: str) -> Any:
+        """Helper: Read a reference field whether the ref is a dict or a dataclass."""
+        if ref is None:
+            return None
+        return ref.get(name) if isinstance(ref, dict) else getattr(ref, name, None)
+
     async def _cascade_delete_facts(
         self,
         memory_space_id: str,
@@ -2738,42 +2987,62 @@ class MemoryAPI:
         sync_to_graph: Optional[bool],
     ) -> Tuple[int, List[str]]:
         """Helper: Find and cascade delete facts linked to a memory."""
-        from ..types import ListFactsFilter
-        all_facts = await self.facts.list(
-            ListFactsFilter(memory_space_id=memory_space_id, limit=10000)
+        return await self._cascade_delete_linked_facts(
+            memory_space_id,
+            {memory_id},
+            {conversation_id} if conversation_id else set(),
+            sync_to_graph,
         )
 
-        facts_to_delete = [
-            fact
-            for fact in all_facts
-            if (
-                fact.source_ref
-                and (
-                    fact.source_ref.memory_id == memory_id
-                    or (
-                        conversation_id
-                        and fact.source_ref.conversation_id == conversation_id
-                    )
-                )
-            )
+    async def _cascade_delete_linked_facts(
+        self,
+        memory_space_id: str,
+        memory_ids: Set[str],
+        conversation_ids: Set[str],
+        sync_to_graph: Optional[bool],
+    ) -> Tuple[int, List[str]]:
+        """Helper: Cascade delete facts linked to any of the given memories or conversations."""
+        if not memory_ids and not conversation_ids:
+            return 0, []
+
+        from ..types import DeleteFactOptions
+
+        # Stream the space and keep only the IDs of linked facts
+        fact_ids_to_delete = [
+            fact.fact_id
+            async for fact in self._iter_linked_facts(memory_space_id, memory_ids, conversation_ids)
         ]
 
         deleted_fact_ids: List[str] = []
-        for fact in facts_to_delete:
+        for fact_id in fact_ids_to_delete:
             try:
-                from ..types import DeleteFactOptions
-
                 await self.facts.delete(
                     memory_space_id,
-                    fact.fact_id,
+                    fact_id,
                     DeleteFactOptions(sync_to_graph=sync_to_graph),
                 )
-                deleted_fact_ids.append(fact.fact_id)
+                deleted_fact_ids.append(fact_id)
             except Exception as error:
                 print(f"Warning: Failed to delete linked fact: {error}")
 
         return len(deleted_fact_ids), deleted_fact_ids
 
+    async def _iter_linked_facts(
+        self,
+        memory_space_id: str,
+        memory_ids: Set[str],
+        conversation_ids: Set[str],
+    ) -> AsyncIterator[FactRecord]:
+        """Helper: Stream the facts linked to any of the given memories or conversations."""
+        from ..types import ListFactsFilter
+
+        async for fact in self.facts.iter(ListFactsFilter(memory_space_id=memory_space_id)):
+            if (
+                self._ref_field(fact.source_ref, "memory_id") in memory_ids
+                or self._ref_field(fact.source_ref, "conversation_id") in conversation_ids
+            ):
+                yield fact
+
     async def _fetch_facts_for_memory(
         self,
         memory_space_id: str,
@@ -2781,23 +3050,12 @@ class MemoryAPI:
         conversation_id: Optional[str],
     ) -> List:
         """Helper: Fetch facts for a memory or conversation."""
-        from ..types import ListFactsFilter
-        all_facts = await self.facts.list(
-            ListFactsFilter(memory_space_id=memory_space_id, limit=10000)
-        )
-
         return [
             fact
-            for fact in all_facts
-            if (
-                fact.source_ref
-                and (
-                    fact.source_ref.memory_id == memory_id
-                    or (
-                        conversation_id
-                        and fact.source_ref.conversation_id == conversation_id
-                    )
-                )
+            async for fact in self._iter_linked_facts(
+                memory_space_id,
+                {memory_id},
+                {conversation_id} if conversation_id else set(),
             )
         ]
 
@@ -9,10 +9,13 @@ Sub-modules for the recall() orchestration API:
 from .graph_enhancement import (
     GraphExpansionConfig,
     GraphExpansionResult,
+    build_batched_expansion_query,
     expand_via_graph,
+    expand_via_graph_batched,
     extract_entities_from_results,
     fetch_related_facts,
     fetch_related_memories,
+    fetch_related_memories_batched,
     perform_graph_expansion,
 )
 from .result_processor import (
@@ -35,7 +38,10 @@ __all__ = [
     "GraphExpansionResult",
     "extract_entities_from_results",
     "expand_via_graph",
+    "expand_via_graph_batched",
+    "build_batched_expansion_query",
     "fetch_related_memories",
+    "fetch_related_memories_batched",
     "fetch_related_facts",
     "perform_graph_expansion",
     # Result processing
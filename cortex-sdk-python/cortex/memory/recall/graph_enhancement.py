@@ -8,16 +8,26 @@ The graph expansion strategy:
 1. Extract entities from initial search results
 2. Traverse graph relationships to discover connected entities
 3. Fetch additional memories/facts that mention discovered entities
+
+Steps 2 and 3 are batched: all seed entities are resolved and traversed in
+a single Cypher statement, and related memories are fetched with a few
+concurrent bounded searches, so graph expansion adds a couple of round trips to recall() rather
+than one per entity.
 """
 
+import asyncio
+import re
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, List, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Set
 
 if TYPE_CHECKING:
     from ...facts import FactsAPI
     from ...types import FactRecord, MemoryEntry
     from ...vector import VectorAPI
 
+# Maximum number of terms sent in a single full-text search query
+_MAX_SEARCH_TERMS = 16
+
 
 @dataclass
 class GraphExpansionConfig:
@@ -26,6 +36,10 @@ class GraphExpansionConfig:
     relationship_types: List[str] = field(default_factory=list)
     expand_from_facts: bool = True
     expand_from_memories: bool = True
+    max_seed_entities: int = 10    # Seed entities resolved per expansion
+    max_fan_out: int = 25          # Neighbors followed per node per depth (hub cap)
+    max_frontier: int = 200        # Nodes carried into the next depth
+    max_discovered: int = 100      # Entity names returned
 
 
 @dataclass
@@ -175,6 +189,115 @@ async def expand_via_graph(
         return []
 
 
+def _escape_relationship_type(rel_type: str) -> str:
+    """Remove invalid characters from a relationship type."""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", rel_type)
+
+
+def build_batched_expansion_query(config: GraphExpansionConfig) -> str:
+    """
+    Build the Cypher statement used by expand_via_graph_batched().
+
+    Seeds are resolved with a single UNWIND, then the traversal is unrolled
+    level by level (breadth-first) up to ``config.max_depth``. At each level
+    every frontier node follows at most ``$fanOut`` neighbors and at most
+    ``$frontierLimit`` new nodes survive into the next level, so hub nodes
+    cannot cause path explosion. Only Entity names are returned.
+
+    Args:
+        config: Expansion configuration
+
+    Returns:
+        Cypher query string (parameters: names, fanOut, frontierLimit, resultLimit)
+    """
+    rel_types = (
+        ":" + "|".join(_escape_relationship_type(t) for t in config.relationship_types)
+        if config.relationship_types
+        else ""
+    )
+
+    lines = [
+        "UNWIND $names AS seedName",
+        "MATCH (seed:Entity {name: seedName})",
+        "WITH collect(DISTINCT seed) AS frontier",
+        "WITH frontier, frontier AS visited",
+    ]
+
+    for _ in range(max(1, config.max_depth)):
+        lines.extend([
+            # [null] keeps one row alive when the frontier is exhausted
+            "UNWIND (CASE WHEN size(frontier) = 0 THEN [null] ELSE frontier END) AS src",
+            f"OPTIONAL MATCH (src)-[{rel_types}]-(nbr)",
+            "WHERE NOT nbr IN visited",
+            "WITH visited, src, collect(DISTINCT nbr)[..$fanOut] AS nbrs",
+            "UNWIND (CASE WHEN size(nbrs) = 0 THEN [null] ELSE nbrs END) AS nbr",
+            "WITH visited, collect(DISTINCT nbr)[..$frontierLimit] AS nextFrontier",
+            "WITH visited + nextFrontier AS visited, nextFrontier AS frontier",
+        ])
+
+    lines.extend([
+        "UNWIND visited AS node",
+        "WITH node",
+        "WHERE node:Entity AND node.name IS NOT NULL AND NOT node.name IN $names",
+        "RETURN DISTINCT node.name AS name",
+        "LIMIT $resultLimit",
+    ])
+
+    return "\n".join(lines)
+
+
+async def expand_via_graph_batched(
+    initial_entities: List[str],
+    graph_adapter: Any,
+    config: GraphExpansionConfig,
+) -> List[str]:
+    """
+    Discover connected entities from all seeds in one graph query.
+
+    Batched equivalent of expand_via_graph(): instead of one find_nodes()
+    and one traverse() per seed entity, all seeds are resolved and expanded
+    in a single Cypher statement with per-depth fan-out caps.
+
+    Args:
+        initial_entities: Starting entity names
+        graph_adapter: Graph database adapter (must support query())
+        config: Expansion configuration
+
+    Returns:
+        List of discovered entity names (excluding initial entities)
+
+    Raises:
+        Exception: If the batched query fails (callers may fall back to
+            expand_via_graph())
+    """
+    if not graph_adapter or not initial_entities:
+        return []
+
+    is_connected = await graph_adapter.is_connected()
+    if not is_connected:
+        return []
+
+    seeds = initial_entities[: config.max_seed_entities]
+    params: Dict[str, Any] = {
+        "names": seeds,
+        "fanOut": config.max_fan_out,
+        "frontierLimit": config.max_frontier,
+        "resultLimit": config.max_discovered,
+    }
+
+    result = await graph_adapter.query(build_batched_expansion_query(config), params)
+
+    discovered: List[str] = []
+    seen: Set[str] = set(initial_entities)
+    for record in result.records:
+        name = record.get("name") if isinstance(record, dict) else None
+        if isinstance(name, str) and name and name not in seen:
+            seen.add(name)
+            discovered.append(name)
+
+    return discovered
+
+
 async def fetch_related_memories(
     discovered_entities: List[str],
     memory_space_id: str,
@@ -251,6 +374,90 @@ async def fetch_related_memories(
         return []
 
 
+async def fetch_related_memories_batched(
+    discovered_entities: List[str],
+    memory_space_id: str,
+    vector_api: "VectorAPI",
+    processed_ids: Set[str],
+    limit: int = 10,
+) -> List["MemoryEntry"]:
+    """
+    Fetch memories that reference any discovered entity in batched searches.
+
+    Batched equivalent of fetch_related_memories(): whole entity names are
+    combined into keyword queries of at most _MAX_SEARCH_TERMS terms (the
+    content search index matches any of the terms), so a handful of
+    concurrent round trips replace one search per entity. Entities are never
+    split across queries or dropped, and memories containing a full entity
+    name rank ahead of partial term matches.
+
+    Args:
+        discovered_entities: Entities to search for
+        memory_space_id: Memory space to search in
+        vector_api: Vector API instance
+        processed_ids: IDs already processed (to avoid re-fetching)
+        limit: Maximum memories to return
+
+    Returns:
+        List of related memories
+    """
+    entities: List[str] = []
+    for entity in discovered_entities:
+        entity = " ".join(entity.split())
+        if entity and entity not in entities:
+            entities.append(entity)
+    if not entities:
+        return []
+
+    # Full-text search accepts a bounded number of terms per query
+    chunks: List[List[str]] = []
+    chunk_terms = 0
+    for entity in entities:
+        terms = len(entity.split())
+        if not chunks or chunk_terms + terms > _MAX_SEARCH_TERMS:
+            chunks.append([])
+            chunk_terms = 0
+        chunks[-1].append(entity)
+        chunk_terms += terms
+
+    try:
+        from ...types import SearchOptions
+
+        options = SearchOptions(limit=min(limit + len(processed_ids), 100), min_score=0.5)
+        results = await asyncio.gather(
+            *(vector_api.search(memory_space_id, " ".join(chunk), options) for chunk in chunks),
+            return_exceptions=True,
+        )
+    except Exception:
+        # Memory fetch failed - return empty (graceful degradation)
+        return []
+
+    candidates: List["MemoryEntry"] = []
+    seen: Set[str] = set()
+    for memories in results:
+        # Individual search failure - continue with others
+        if isinstance(memories, BaseException):
+            continue
+        for memory in memories:
+            memory_id = getattr(memory, 'memory_id', None)
+            if not memory_id or memory_id in processed_ids or memory_id in seen:
+                continue
+            seen.add(memory_id)
+            candidates.append(memory)
+
+    # Whole-name matches first (stable, so search order is kept within each group)
+    phrases = [entity.lower() for entity in entities]
+    candidates.sort(
+        key=lambda memory: not any(
+            phrase in (getattr(memory, 'content', None) or "").lower() for phrase in phrases
+        )
+    )
+
+    related_memories = candidates[:limit]
+    processed_ids.update(memory.memory_id for memory in related_memories)
+    return related_memories
+
+
 async def fetch_related_facts(
     discovered_entities: List[str],
     memory_space_id: str,
@@ -388,21 +595,33 @@ async def perform_graph_expansion(
     if not initial_entities:
         return GraphExpansionResult(processed_ids=processed_ids)
 
-    # Step 2: Expand via graph
-    discovered_entities = await expand_via_graph(
-        initial_entities,
-        graph_adapter,
-        config,
-    )
+    # Step 2: Expand via graph (single batched query, per-entity fallback
+    # for adapters that cannot run the batched Cypher statement)
+    batched = True
+    try:
+        discovered_entities = await expand_via_graph_batched(
+            initial_entities,
+            graph_adapter,
+            config,
+        )
+    except Exception:
+        batched = False
+        discovered_entities = await expand_via_graph(
+            initial_entities,
+            graph_adapter,
+            config,
+        )
 
     if not discovered_entities:
         return GraphExpansionResult(processed_ids=processed_ids)
 
     # Step 3: Fetch related data in parallel
-    import asyncio
+    async def _no_results() -> List[Any]:
+        return []
 
+    fetch_memories = fetch_related_memories_batched if batched else fetch_related_memories
     related_memories_task = (
-        fetch_related_memories(
+        fetch_memories(
             discovered_entities,
             memory_space_id,
             vector_api,
@@ -410,7 +629,7 @@ async def perform_graph_expansion(
             10,
         )
         if config.expand_from_memories
-        else asyncio.coroutine(lambda: [])()
+        else _no_results()
     )
 
     related_facts_task = (
@@ -422,7 +641,7 @@ async def perform_graph_expansion(
             10,
         )
         if config.expand_from_facts
-        else asyncio.coroutine(lambda: [])()
+        else _no_results()
     )
 
     related_memories, related_facts = await asyncio.gather(
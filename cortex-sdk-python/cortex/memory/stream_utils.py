@@ -8,8 +8,20 @@ Python implementation matching TypeScript src/memory/streamUtils.ts
 """
 
 import asyncio
+from collections import deque
 from collections.abc import AsyncIterable
-from typing import Any, Callable, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
@@ -107,61 +119,90 @@ class RollingContextWindow:
     """
     Create a rolling context window for streaming
     Keeps only the last N characters in memory
+
+    Chunks live in a deque with a running character total, so adding a
+    chunk and trimming old ones is O(1) amortized; the context string is
+    joined only when read and cached until the next add.
     """
 
     def __init__(self, max_size: int = 1000) -> None:
-        self.window: List[str] = []
+        self.window: Deque[str] = deque()
         self.max_size = max_size
+        self._size = 0
+        self._context: Optional[str] = None
 
     def add(self, chunk: str) -> None:
         """Add a chunk to the window"""
         self.window.append(chunk)
+        self._size += len(chunk)
+        self._context = None
 
         # Trim window if it exceeds max size
-        while len(self.get_context()) > self.max_size and len(self.window) > 1:
-            self.window.pop(0)
+        while self._size > self.max_size and len(self.window) > 1:
+            self._size -= len(self.window.popleft())
 
     def get_context(self) -> str:
         """Get current context"""
-        return "".join(self.window)
+        if self._context is None:
+            self._context = "".join(self.window)
+        return self._context
 
     def get_size(self) -> int:
         """Get context size"""
-        return len(self.get_context())
+        return self._size
 
     def clear(self) -> None:
         """Clear the window"""
-        self.window = []
+        self.window.clear()
+        self._size = 0
+        self._context = None
 
 
 class AsyncQueue(Generic[T]):
-    """Create an async queue for processing items"""
+    """
+    Create an async queue for processing items
 
-    def __init__(self, processor: Optional[Callable[[T], Any]] = None) -> None:
-        self.queue: List[T] = []
+    Backed by asyncio.Queue, so enqueue and dequeue are O(1). With
+    ``max_size`` set the queue is bounded: enqueue waits for space while a
+    processor or consumer catches up, pushing back on the producer.
+    """
+
+    def __init__(
+        self, processor: Optional[Callable[[T], Any]] = None, max_size: int = 0
+    ) -> None:
+        self.queue: "asyncio.Queue[T]" = asyncio.Queue(maxsize=max(0, max_size))
         self.processing = False
         self.processor = processor
 
     async def enqueue(self, item: T) -> None:
-        """Enqueue an item"""
-        self.queue.append(item)
+        """Enqueue an item (waits for space when the queue is full)"""
+        await self.queue.put(item)
 
         if self.processor and not self.processing:
             await self._process_queue()
 
     def dequeue(self) -> Optional[T]:
         """Dequeue an item"""
-        if self.queue:
-            return self.queue.pop(0)
-        return None
+        try:
+            return self.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    async def get(self) -> T:
+        """Wait for an item and dequeue it"""
+        return await self.queue.get()
 
     def size(self) -> int:
         """Get queue size"""
-        return len(self.queue)
+        return self.queue.qsize()
 
     def is_empty(self) -> bool:
         """Check if queue is empty"""
-        return len(self.queue) == 0
+        return self.queue.empty()
+
+    def is_full(self) -> bool:
+        """Check if a bounded queue is at capacity"""
+        return self.queue.full()
 
     async def _process_queue(self) -> None:
         """Process all items in queue"""
@@ -170,21 +211,23 @@ class AsyncQueue(Generic[T]):
 
         self.processing = True
 
-        while self.queue:
-            item = self.queue.pop(0)
-            if item is not None:
-                try:
-                    result = self.processor(item)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as error:
-                    print(f"Error processing queue item: {error}")
-
-        self.processing = False
+        try:
+            while not self.queue.empty():
+                item = self.queue.get_nowait()
+                if item is not None:
+                    try:
+                        result = self.processor(item)
+                        if asyncio.iscoroutine(result):
+                            await result
+                    except Exception as error:
+                        print(f"Error processing queue item: {error}")
+        finally:
+            self.processing = False
 
     def clear(self) -> None:
         """Clear the queue"""
-        self.queue = []
+        while not self.queue.empty():
+            self.queue.get_nowait()
 
 
 async def with_stream_timeout(
@@ -269,3 +312,106 @@ async def buffer_stream(
     if buffer:
         yield list(buffer)
 
+
+class StreamTee(Generic[T]):
+    """
+    Read a stream once and replay it to several consumers
+
+    A pump task pulls from the source as fast as it produces and appends
+    each item to an unbounded queue per branch, so a slow or late branch
+    never delays the others. An error from the source is raised in every
+    branch once the items before it have been delivered.
+    """
+
+    _END = object()
+
+    def __init__(self, source: AsyncIterable[T], branches: int = 2) -> None:
+        self.source = source
+        self._queues: List["asyncio.Queue[Tuple[Any, Any]]"] = [
+            asyncio.Queue() for _ in range(branches)
+        ]
+        self.branches: List[AsyncIterator[T]] = [self._branch(q) for q in self._queues]
+        self._pump_task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start reading the source (branches also start it on first read)"""
+        if self._pump_task is None:
+            self._pump_task = asyncio.ensure_future(self._pump())
+
+    async def _pump(self) -> None:
+        try:
+            async for item in self.source:
+                for queue in self._queues:
+                    queue.put_nowait((item, None))
+        except BaseException as error:
+            for queue in self._queues:
+                queue.put_nowait((self._END, error))
+            if isinstance(error, asyncio.CancelledError):
+                raise
+            return
+        for queue in self._queues:
+            queue.put_nowait((self._END, None))
+
+    async def _branch(self, queue: "asyncio.Queue[Tuple[Any, Any]]") -> AsyncIterator[T]:
+        self.start()
+        while True:
+            item, error = await queue.get()
+            if item is self._END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+
+    async def aclose(self) -> None:
+        """Stop reading the source; branches end with CancelledError"""
+        if self._pump_task is not None and not self._pump_task.done():
+            self._pump_task.cancel()
+            try:
+                await self._pump_task
+            except asyncio.CancelledError:
+                pass
+
+
+class RememberStreamTee:
+    """
+    Response chunks for the caller, with remember_stream() persisting a copy
+
+    Iterate it to receive chunks as soon as the LLM produces them; await
+    ``result`` for the EnhancedRememberStreamResult once Cortex has stored
+    everything.
+
+    Example:
+        >>> tee = cortex.memory.remember_stream_tee(params)
+        >>> async for chunk in tee:
+        ...     await websocket.send(chunk)
+        >>> result = await tee.result
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[str],
+        result: "asyncio.Future[Any]",
+        tee: Optional[StreamTee[str]] = None,
+    ) -> None:
+        self._chunks = chunks
+        self._result = result
+        self._tee = tee
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._chunks
+
+    @property
+    def result(self) -> Awaitable[Any]:
+        """Resolves to the EnhancedRememberStreamResult (or raises its error)"""
+        return self._result
+
+    async def aclose(self) -> None:
+        """Stop reading the response and cancel persistence"""
+        if self._tee is not None:
+            await self._tee.aclose()
+        if not self._result.done():
+            self._result.cancel()
+        try:
+            await self._result
+        except (asyncio.CancelledError, Exception):
+            pass
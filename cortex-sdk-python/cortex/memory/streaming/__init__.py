@@ -22,13 +22,24 @@ from .progressive_storage_handler import (
     calculate_optimal_update_interval,
 )
 from .stream_metrics import MetricsCollector
-from .stream_processor import StreamProcessor, create_stream_context
+from .stream_pipeline import PipelineStage, StreamPipeline
+from .stream_processor import StreamProcessor, TextAccumulator, create_stream_context
+from .tokenizer import (
+    HeuristicTokenCounter,
+    IncrementalTokenCounter,
+    TiktokenCounter,
+    TokenCounter,
+    get_token_counter,
+)
 
 __all__ = [
     # Core processors
     "StreamProcessor",
     "MetricsCollector",
+    "TextAccumulator",
     "create_stream_context",
+    "StreamPipeline",
+    "PipelineStage",
     # Storage and sync
     "ProgressiveStorageHandler",
     "calculate_optimal_update_interval",
@@ -41,6 +52,12 @@ __all__ = [
     "ResponseChunker",
     "estimate_optimal_chunk_size",
     "should_chunk_content",
+    # Token counting
+    "TokenCounter",
+    "HeuristicTokenCounter",
+    "TiktokenCounter",
+    "IncrementalTokenCounter",
+    "get_token_counter",
     # Error recovery
     "StreamErrorRecovery",
     "ResumableStreamError",
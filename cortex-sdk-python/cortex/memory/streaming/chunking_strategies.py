@@ -2,19 +2,38 @@
 Chunking Strategies
 
 Different approaches for breaking long responses into chunks:
-- Token-based: Split by token count
+- Token-based: Split on exact token boundaries (see tokenizer.py)
 - Sentence-based: Split by sentences
 - Paragraph-based: Split by paragraphs
 - Fixed-size: Split by character count
-- Semantic: Split by meaning (requires embeddings)
+- Semantic: Split where the topic shifts, measured with the caller's
+  embeddings or, offline, with word overlap between neighbouring sentences
 
 Python implementation matching TypeScript src/memory/streaming/ChunkingStrategies.ts
 """
 
+import asyncio
+import math
 import re
-from typing import List
+from collections import Counter
+from typing import Any, Callable, List, Optional
 
+from ...facts.deduplication import cosine_similarity
 from ..streaming_types import ChunkingConfig, ChunkStrategy, ContentChunk
+from .tokenizer import TokenCounter, get_token_counter
+
+SENTENCE_REGEX = re.compile(r"[.!?]+\s+")
+WORD_REGEX = re.compile(r"\w{3,}")
+
+# Sentences on each side of a boundary compared by lexical similarity
+LEXICAL_WINDOW = 2
+
+STOPWORDS = frozenset(
+    "the and for are but not you all any can had her was one our out has him his how "
+    "its may new now old see two way who did get let say she too use that with have "
+    "this will your from they been were said each which their there what about would "
+    "these other into more some could them than then also only very just when where".split()
+)
 
 
 class ResponseChunker:
@@ -26,7 +45,7 @@ class ResponseChunker:
         """Chunk content based on the specified strategy"""
         if config.strategy == ChunkStrategy.TOKEN:
             return self._chunk_by_tokens(
-                content, config.max_chunk_size, config.overlap_size
+                content, config.max_chunk_size, config.overlap_size, config.token_counter
             )
 
         elif config.strategy == ChunkStrategy.SENTENCE:
@@ -45,39 +64,42 @@ class ResponseChunker:
             )
 
         elif config.strategy == ChunkStrategy.SEMANTIC:
-            # Semantic chunking would require embeddings - fallback to sentence for now
-            print(
-                "Warning: Semantic chunking requires embeddings, falling back to sentence-based"
-            )
-            return self._chunk_by_sentences(
-                content, config.max_chunk_size, config.preserve_boundaries
-            )
+            return await self._chunk_by_semantics(content, config)
 
         else:
             raise ValueError(f"Unknown chunking strategy: {config.strategy}")
 
     def _chunk_by_tokens(
-        self, content: str, max_tokens: int, overlap_tokens: int = 0
+        self,
+        content: str,
+        max_tokens: int,
+        overlap_tokens: int = 0,
+        token_counter: Optional[TokenCounter] = None,
     ) -> List[ContentChunk]:
-        """Chunk by token count (approximate - 1 token ≈ 4 characters)"""
+        """Chunk by token count, cutting on token boundaries"""
         chunks: List[ContentChunk] = []
-        max_chars = max_tokens * 4  # Approximate character count
-        overlap_chars = overlap_tokens * 4
 
         # Validate overlap
-        if overlap_chars >= max_chars:
+        if overlap_tokens >= max_tokens:
             raise ValueError("overlap_tokens must be smaller than max_tokens")
 
-        start_offset = 0
+        # Character offset where each token starts, plus the end of content
+        token_starts = (token_counter or get_token_counter()).token_offsets(content)
+        token_starts.append(len(content))
+        total_tokens = len(token_starts) - 1
+
+        start_token = 0
         chunk_index = 0
-        step_size = max_chars - overlap_chars
+        step_size = max_tokens - overlap_tokens
 
         # Safety check
         if step_size <= 0:
             raise ValueError("Invalid chunking configuration")
 
-        while start_offset < len(content):
-            end_offset = min(start_offset + max_chars, len(content))
+        while start_token < total_tokens:
+            end_token = min(start_token + max_tokens, total_tokens)
+            start_offset = token_starts[start_token]
+            end_offset = token_starts[end_token]
             chunk_content = content[start_offset:end_offset]
 
             chunks.append(
@@ -90,16 +112,17 @@ class ResponseChunker:
                         "chunkIndex": chunk_index,
                         "startOffset": start_offset,
                         "endOffset": end_offset,
+                        "tokenCount": end_token - start_token,
                         "hasOverlap": overlap_tokens > 0 and start_offset > 0,
                     },
                 )
             )
 
             # Move to next chunk with overlap
-            if end_offset >= len(content):
+            if end_token >= total_tokens:
                 break
 
-            start_offset += step_size
+            start_token += step_size
             chunk_index += 1
 
             # Safety: prevent infinite loops
@@ -117,19 +140,7 @@ class ResponseChunker:
     ) -> List[ContentChunk]:
         """Chunk by sentences"""
         chunks: List[ContentChunk] = []
-
-        # Split into sentences (simple regex - can be improved)
-        sentence_regex = re.compile(r"[.!?]+\s+")
-        sentences: List[str] = []
-        last_index = 0
-
-        for match in sentence_regex.finditer(content):
-            sentences.append(content[last_index : match.end()])
-            last_index = match.end()
-
-        # Add remaining content as last sentence
-        if last_index < len(content):
-            sentences.append(content[last_index:])
+        sentences = self._split_sentences(content)
 
         if len(sentences) == 0:
             # No sentence breaks found, treat entire content as one chunk
@@ -187,6 +198,147 @@ class ResponseChunker:
 
         return chunks
 
+    def _split_sentences(self, content: str) -> List[str]:
+        """Split into sentences (simple regex - can be improved)"""
+        sentences: List[str] = []
+        last_index = 0
+
+        for match in SENTENCE_REGEX.finditer(content):
+            sentences.append(content[last_index : match.end()])
+            last_index = match.end()
+
+        # Add remaining content as last sentence
+        if last_index < len(content):
+            sentences.append(content[last_index:])
+
+        return sentences
+
+    async def _chunk_by_semantics(
+        self, content: str, config: ChunkingConfig
+    ) -> List[ContentChunk]:
+        """
+        Chunk by meaning
+
+        Splits between neighbouring sentences whose similarity falls below
+        the threshold, keeping each chunk within min/max sentence counts.
+        """
+        sentences = self._split_sentences(content)
+        max_sentences = max(1, config.max_chunk_size)
+        min_sentences = max(1, min(config.min_chunk_size, max_sentences))
+
+        if len(sentences) <= 1:
+            return self._chunk_by_sentences(
+                content, max_sentences, config.preserve_boundaries
+            )
+
+        similarities = await self._boundary_similarities(sentences, config)
+
+        threshold = config.similarity_threshold
+        if threshold is None:
+            mean = sum(similarities) / len(similarities)
+            std = math.sqrt(sum((s - mean) ** 2 for s in similarities) / len(similarities))
+            threshold = mean - std
+
+        # Group sentences, splitting at similarity drops
+        groups: List[List[str]] = [[sentences[0]]]
+        for sentence, similarity in zip(sentences[1:], similarities):
+            current = groups[-1]
+            if len(current) >= max_sentences or (
+                similarity < threshold and len(current) >= min_sentences
+            ):
+                groups.append([sentence])
+            else:
+                current.append(sentence)
+
+        # Fold a short trailing chunk into the one before it when it fits
+        if (
+            len(groups) > 1
+            and len(groups[-1]) < min_sentences
+            and len(groups[-2]) + len(groups[-1]) <= max_sentences
+        ):
+            groups[-2].extend(groups.pop())
+
+        chunks: List[ContentChunk] = []
+        start_offset = 0
+
+        for chunk_index, group in enumerate(groups):
+            chunk_content = "".join(group)
+            end_offset = start_offset + len(chunk_content)
+
+            chunks.append(
+                ContentChunk(
+                    content=chunk_content,
+                    chunk_index=chunk_index,
+                    start_offset=start_offset,
+                    end_offset=end_offset,
+                    metadata={
+                        "chunkIndex": chunk_index,
+                        "totalChunks": len(groups),
+                        "startOffset": start_offset,
+                        "endOffset": end_offset,
+                        "hasOverlap": False,
+                    },
+                )
+            )
+
+            start_offset = end_offset
+
+        return chunks
+
+    async def _boundary_similarities(
+        self, sentences: List[str], config: ChunkingConfig
+    ) -> List[float]:
+        """Similarity across each boundary between consecutive sentences"""
+        if config.generate_embedding is not None:
+            try:
+                embeddings = await self._embed_sentences(
+                    sentences, config.generate_embedding, config.embedding_batch_size
+                )
+                return [
+                    cosine_similarity(a, b) for a, b in zip(embeddings, embeddings[1:])
+                ]
+            except Exception as error:
+                print(
+                    f"Warning: Semantic chunking embeddings failed, using lexical similarity: {error}"
+                )
+
+        counts = [_term_counts(sentence) for sentence in sentences]
+        similarities: List[float] = []
+
+        for boundary in range(1, len(sentences)):
+            before: Counter = Counter()
+            after: Counter = Counter()
+            for c in counts[max(0, boundary - LEXICAL_WINDOW) : boundary]:
+                before.update(c)
+            for c in counts[boundary : boundary + LEXICAL_WINDOW]:
+                after.update(c)
+            similarities.append(_counts_cosine(before, after))
+
+        return similarities
+
+    async def _embed_sentences(
+        self,
+        sentences: List[str],
+        generate_embedding: Callable[[str], Any],
+        batch_size: int,
+    ) -> List[List[float]]:
+        """Embed sentences, running up to ``batch_size`` calls at once"""
+
+        async def embed(sentence: str) -> List[float]:
+            result = generate_embedding(sentence)
+            if asyncio.iscoroutine(result):
+                result = await result
+            return list(result)
+
+        embeddings: List[List[float]] = []
+        step = max(1, batch_size)
+
+        for start in range(0, len(sentences), step):
+            batch = sentences[start : start + step]
+            embeddings.extend(await asyncio.gather(*(embed(s) for s in batch)))
+
+        return embeddings
+
     def _chunk_by_paragraphs(
         self, content: str, max_paragraphs: int, preserve_boundaries: bool = True
     ) -> List[ContentChunk]:
@@ -328,9 +480,17 @@ class ResponseChunker:
 
 
 def estimate_optimal_chunk_size(
-    content_length: int, strategy: ChunkStrategy
+    content_length: int,
+    strategy: ChunkStrategy,
+    sample: Optional[str] = None,
+    token_counter: Optional[TokenCounter] = None,
 ) -> int:
-    """Helper to estimate optimal chunk size based on content length"""
+    """
+    Helper to estimate optimal chunk size based on content length
+
+    Pass a ``sample`` of the content to size FIXED chunks from its measured
+    characters per token instead of assuming 4.
+    """
     if strategy == ChunkStrategy.TOKEN:
         # Aim for ~500 tokens per chunk
         return 500
@@ -344,11 +504,15 @@ def estimate_optimal_chunk_size(
         return 3 if content_length > 5000 else 2
 
     elif strategy == ChunkStrategy.FIXED:
-        # Aim for 2000 characters per chunk
+        # Aim for ~500 tokens' worth of characters (2000 at 4 chars/token)
+        if sample:
+            tokens = (token_counter or get_token_counter()).count(sample)
+            if tokens > 0:
+                return max(1, int(500 * len(sample) / tokens))
         return 2000
 
     elif strategy == ChunkStrategy.SEMANTIC:
-        # Similar to sentence-based
+        # Upper bound in sentences; topic shifts usually split sooner
         return 10
 
     else:
@@ -358,3 +522,22 @@ def estimate_optimal_chunk_size(
 def should_chunk_content(content_length: int, threshold: int = 10000) -> bool:
     """Helper to determine if content should be chunked"""
     return content_length > threshold  # 10K chars ~= 2500 tokens
+
+
+def lexical_similarity(a: str, b: str) -> float:
+    """Cosine similarity of the content-word counts of two texts (0.0 to 1.0)"""
+    return _counts_cosine(_term_counts(a), _term_counts(b))
+
+
+def _term_counts(text: str) -> Counter:
+    return Counter(
+        word for word in WORD_REGEX.findall(text.lower()) if word not in STOPWORDS
+    )
+
+
+def _counts_cosine(a: Counter, b: Counter) -> float:
+    if not a or not b:
+        return 0.0
+    dot = sum(count * b[word] for word, count in a.items() if word in b)
+    norm = math.sqrt(sum(c * c for c in a.values())) * math.sqrt(sum(c * c for c in b.values()))
+    return dot / norm if norm else 0.0
@@ -7,15 +7,18 @@ Handles stream failures with multiple recovery strategies:
 - Retry with exponential backoff
 - Best-effort continuation
 
-Includes resume token generation for interrupted streams.
+Includes resume token generation for interrupted streams. Tokens are small
+mutable-store rows that point at the persisted partial memory (offset and
+checksum) rather than copying the streamed text, are deleted once a
+resumed stream succeeds, and are swept with mutable.purge_many after
+their TTL.
 
 Python implementation matching TypeScript src/memory/streaming/ErrorRecovery.ts
 """
 
 import asyncio
-import hashlib
 import secrets
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 from ..streaming_types import (
     FailureStrategy,
@@ -25,9 +28,13 @@ from ..streaming_types import (
     StreamContext,
     StreamError,
 )
+from .progressive_storage_handler import content_checksum, content_prefix
 
 T = TypeVar("T")
 
+RESUME_TOKEN_NAMESPACE = "resume-tokens"
+RESUME_TOKEN_PREFIX = "resume_"
+
 
 class StreamErrorRecovery:
     """Handles error recovery for streaming operations"""
@@ -50,12 +57,18 @@ class StreamErrorRecovery:
         error: Exception,
         context: StreamContext,
         options: RecoveryOptions,
+        storage_handler: Optional[Any] = None,
     ) -> RecoveryResult:
-        """Handle a stream error and attempt recovery"""
+        """
+        Handle a stream error and attempt recovery
+
+        Pass the stream's ProgressiveStorageHandler so partial data is
+        flushed to the partial memory and resume tokens can point at it.
+        """
         print(f"Warning: Stream error occurred: {error}")
 
         if options.strategy == FailureStrategy.STORE_PARTIAL:
-            return await self._store_partial_on_failure(context, options)
+            return await self._store_partial_on_failure(context, options, storage_handler)
 
         elif options.strategy == FailureStrategy.ROLLBACK:
             return await self._rollback_to_last_state(context)
@@ -64,7 +77,7 @@ class StreamErrorRecovery:
             return await self._retry_strategy(context, options)
 
         elif options.strategy == FailureStrategy.BEST_EFFORT:
-            return await self._best_effort_strategy(context, options)
+            return await self._best_effort_strategy(context, options, storage_handler)
 
         else:
             return RecoveryResult(
@@ -72,7 +85,10 @@ class StreamErrorRecovery:
             )
 
     async def _store_partial_on_failure(
-        self, context: StreamContext, options: RecoveryOptions
+        self,
+        context: StreamContext,
+        options: RecoveryOptions,
+        storage_handler: Optional[Any] = None,
     ) -> RecoveryResult:
         """Store partial data on failure"""
         import time
@@ -81,18 +97,29 @@ class StreamErrorRecovery:
             # Generate resume token if requested
             resume_token: Optional[str] = None
             if options.preserve_partial_data:
-                resume_token = await self.generate_resume_token(
-                    ResumeContext(
-                        resume_token="",  # Will be filled in
-                        last_processed_chunk=context.chunk_count,
-                        accumulated_content=context.accumulated_text,
-                        partial_memory_id=context.partial_memory_id or "",
-                        facts_extracted=context.extracted_fact_ids,
-                        timestamp=int(time.time() * 1000),
-                        checksum=self._calculate_checksum(context.accumulated_text),
-                    )
+                resume_context = ResumeContext(
+                    resume_token="",  # Will be filled in
+                    last_processed_chunk=context.chunk_count,
+                    accumulated_content=context.accumulated_text,
+                    partial_memory_id=context.partial_memory_id or "",
+                    facts_extracted=context.extracted_fact_ids,
+                    timestamp=int(time.time() * 1000),
+                    checksum=self._calculate_checksum(context.accumulated_text),
                 )
 
+                # Flush what was streamed so the token can point at it
+                if storage_handler is not None and storage_handler.is_ready():
+                    await storage_handler.update_partial_content(
+                        context.accumulated_text, context.chunk_count, force=True
+                    )
+                    checkpoint = storage_handler.checkpoint()
+                    if checkpoint is not None:
+                        resume_context.memory_space_id = context.memory_space_id
+                        resume_context.content_offset = checkpoint[0]
+                        resume_context.checksum = f"{checkpoint[1]:08x}"
+
+                resume_token = await self.generate_resume_token(resume_context)
+
             return RecoveryResult(
                 success=True,
                 strategy=FailureStrategy.STORE_PARTIAL,
@@ -139,13 +166,18 @@ class StreamErrorRecovery:
         return RecoveryResult(success=False, strategy=FailureStrategy.RETRY)
 
     async def _best_effort_strategy(
-        self, context: StreamContext, options: RecoveryOptions
+        self,
+        context: StreamContext,
+        options: RecoveryOptions,
+        storage_handler: Optional[Any] = None,
     ) -> RecoveryResult:
         """Best-effort strategy - try to save what we can"""
         try:
             # Try to store partial content if we have any
             if context.accumulated_text and len(context.accumulated_text) > 0:
-                result = await self._store_partial_on_failure(context, options)
+                result = await self._store_partial_on_failure(
+                    context, options, storage_handler
+                )
                 return result
 
             return RecoveryResult(success=False, strategy=FailureStrategy.BEST_EFFORT)
@@ -183,31 +215,39 @@ class StreamErrorRecovery:
         raise last_error or Exception("Max retries exceeded")
 
     async def generate_resume_token(self, context: ResumeContext) -> str:
-        """Generate a resume token for interrupted streams"""
+        """
+        Generate a resume token for interrupted streams
+
+        With a checkpoint (``context.memory_space_id`` set) the token only
+        records where the persisted partial memory ends; otherwise there is
+        no stored copy, and the accumulated content is kept in the token.
+        """
         import time
 
         # Create a unique token
-        token = f"resume_{int(time.time() * 1000)}_{secrets.token_hex(16)}"
+        token = f"{RESUME_TOKEN_PREFIX}{int(time.time() * 1000)}_{secrets.token_hex(16)}"
+
+        value: Dict[str, Any] = {
+            "resumeToken": token,
+            "lastProcessedChunk": context.last_processed_chunk,
+            "partialMemoryId": context.partial_memory_id,
+            "factsExtracted": context.facts_extracted,
+            "timestamp": context.timestamp,
+            "checksum": context.checksum,
+            "expiresAt": int(time.time() * 1000) + self.resume_token_ttl,
+        }
+        if context.memory_space_id:
+            value["memorySpaceId"] = context.memory_space_id
+            value["contentOffset"] = context.content_offset
+        else:
+            value["accumulatedContent"] = context.accumulated_content
 
         # Store resume context in mutable store with TTL
         try:
             await self._execute_with_resilience(
                 lambda: self.client.mutation(
                     "mutable:set",
-                    {
-                        "namespace": "resume-tokens",
-                        "key": token,
-                        "value": {
-                            "resumeToken": token,
-                            "lastProcessedChunk": context.last_processed_chunk,
-                            "accumulatedContent": context.accumulated_content,
-                            "partialMemoryId": context.partial_memory_id,
-                            "factsExtracted": context.facts_extracted,
-                            "timestamp": context.timestamp,
-                            "checksum": context.checksum,
-                            "expiresAt": int(time.time() * 1000) + self.resume_token_ttl,
-                        },
-                    },
+                    {"namespace": RESUME_TOKEN_NAMESPACE, "key": token, "value": value},
                 ),
                 "mutable:set",
             )
@@ -218,13 +258,18 @@ class StreamErrorRecovery:
             raise Exception(f"Failed to generate resume token: {error}")
 
     async def validate_resume_token(self, token: str) -> Optional[ResumeContext]:
-        """Validate and retrieve resume context from token"""
+        """
+        Validate and retrieve resume context from token
+
+        Checkpoint tokens read the content back from the partial memory and
+        are rejected if its prefix no longer matches the recorded checksum.
+        """
         import time
 
         try:
             stored = await self._execute_with_resilience(
                 lambda: self.client.query(
-                    "mutable:get", {"namespace": "resume-tokens", "key": token}
+                    "mutable:get", {"namespace": RESUME_TOKEN_NAMESPACE, "key": token}
                 ),
                 "mutable:get",
             )
@@ -238,10 +283,29 @@ class StreamErrorRecovery:
             if context_data.get("expiresAt", 0) < int(time.time() * 1000):
                 return None
 
+            memory_space_id = context_data.get("memorySpaceId")
+            content_offset = context_data.get("contentOffset", 0)
+            if memory_space_id:
+                memory = await self._execute_with_resilience(
+                    lambda: self.client.query(
+                        "memories:get",
+                        {
+                            "memorySpaceId": memory_space_id,
+                            "memoryId": context_data.get("partialMemoryId"),
+                        },
+                    ),
+                    "memories:get",
+                )
+                if not memory:
+                    print("Warning: Resume checkpoint's partial memory no longer exists")
+                    return None
+                accumulated_content = content_prefix(memory.get("content", ""), content_offset)
+                calculated_checksum = f"{content_checksum(accumulated_content):08x}"
+            else:
+                accumulated_content = context_data.get("accumulatedContent", "")
+                calculated_checksum = self._calculate_checksum(accumulated_content)
+
             # Validate checksum
-            calculated_checksum = self._calculate_checksum(
-                context_data.get("accumulatedContent", "")
-            )
             if calculated_checksum != context_data.get("checksum"):
                 print("Warning: Resume context checksum mismatch")
                 return None
@@ -249,11 +313,13 @@ class StreamErrorRecovery:
             return ResumeContext(
                 resume_token=context_data.get("resumeToken", ""),
                 last_processed_chunk=context_data.get("lastProcessedChunk", 0),
-                accumulated_content=context_data.get("accumulatedContent", ""),
+                accumulated_content=accumulated_content,
                 partial_memory_id=context_data.get("partialMemoryId", ""),
                 facts_extracted=context_data.get("factsExtracted", []),
                 timestamp=context_data.get("timestamp", 0),
                 checksum=context_data.get("checksum", ""),
+                memory_space_id=memory_space_id,
+                content_offset=content_offset,
             )
 
         except Exception as error:
@@ -263,19 +329,59 @@ class StreamErrorRecovery:
     async def delete_resume_token(self, token: str) -> None:
         """Delete a resume token (cleanup)"""
         try:
-            # TODO: Implement mutable.delete mutation in Convex
-            print("Warning: Resume token cleanup not yet implemented")
-            # await self.client.mutation(
-            #     "mutable:delete",
-            #     {"namespace": "resume-tokens", "key": token}
-            # )
+            await self._execute_with_resilience(
+                lambda: self.client.mutation(
+                    "mutable:deleteKey", {"namespace": RESUME_TOKEN_NAMESPACE, "key": token}
+                ),
+                "mutable:delete",
+            )
         except Exception as error:
             print(f"Warning: Failed to delete resume token: {error}")
-            # Non-critical - tokens will expire anyway
+            # Non-critical - the sweeper removes it after the TTL
+
+    async def sweep_expired_resume_tokens(self) -> int:
+        """
+        Delete resume tokens older than the TTL
+
+        Returns:
+            Number of tokens deleted
+        """
+        import time
+
+        from ...mutable import MutableAPI
+        from ...types import PurgeManyMutableFilter
+
+        result = await MutableAPI(self.client, resilience=self._resilience).purge_many(
+            PurgeManyMutableFilter(
+                namespace=RESUME_TOKEN_NAMESPACE,
+                key_prefix=RESUME_TOKEN_PREFIX,
+                updated_before=int(time.time() * 1000) - self.resume_token_ttl,
+            )
+        )
+        return int((result or {}).get("deleted", 0))
+
+    def start_resume_token_sweeper(
+        self, interval_ms: int = 600000
+    ) -> "asyncio.Task[None]":
+        """
+        Sweep expired resume tokens now and then every ``interval_ms``
+
+        Cancel the returned task to stop the sweeper.
+        """
+
+        async def sweep_periodically() -> None:
+            while True:
+                try:
+                    await self.sweep_expired_resume_tokens()
+                except Exception as error:
+                    print(f"Warning: Failed to sweep resume tokens: {error}")
+                await asyncio.sleep(interval_ms / 1000)
+
+        return asyncio.ensure_future(sweep_periodically())
 
     def _calculate_checksum(self, content: str) -> str:
         """Calculate checksum for content verification"""
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return f"{content_checksum(content):08x}"
 
     def create_stream_error(
         self,
@@ -4,19 +4,25 @@ Progressive Fact Extractor
 Extracts facts incrementally during streaming with deduplication
 to avoid storing redundant information as content accumulates.
 
+Each extraction only sees the text streamed since the previous one (plus a
+short overlap), and schedule_extraction() runs it in a background task so
+slow LLM calls never stall the stream.
+
 Now supports cross-session deduplication via DeduplicationConfig.
 
 Python implementation matching TypeScript src/memory/streaming/FactExtractor.ts
 """
 
+import asyncio
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ...facts.deduplication import (
     DeduplicationConfig,
     DeduplicationStrategy,
     FactDeduplicationService,
 )
+from ...facts.normalization import fact_key as normalized_fact_key
 from ..streaming_types import ProgressiveFact
 
 
@@ -39,6 +45,12 @@ class ProgressiveFactExtractorConfig:
     extraction_threshold: int = 500
     """Character threshold for triggering extraction during streaming."""
 
+    context_overlap: int = 200
+    """
+    Characters of already-processed text sent ahead of each new window, so
+    facts that straddle the window boundary are still seen whole.
+    """
+
 
 class ProgressiveFactExtractor:
     """
@@ -71,11 +83,19 @@ class ProgressiveFactExtractor:
         self.user_id = user_id
         self.participant_id = participant_id
         self.extraction_threshold = config.extraction_threshold if config else 500
+        self.context_overlap = config.context_overlap if config else 200
 
         self.extracted_facts: Dict[str, Any] = {}
         self.last_extraction_point = 0
         self.extraction_count = 0
 
+        # Background extraction (schedule_extraction / drain)
+        self._task: Optional["asyncio.Future[None]"] = None
+        self._pending: Optional[Tuple[Any, ...]] = None
+        self._last_trigger_point = 0
+        self._background_facts: List[ProgressiveFact] = []
+        self.coalesced_triggers = 0
+
         # Resolve deduplication config
         # Default to 'structural' for streaming (faster than semantic, still effective)
         self._deduplication_config: Optional[DeduplicationConfig] = None
@@ -95,7 +115,96 @@ class ProgressiveFactExtractor:
 
     def should_extract(self, content_length: int) -> bool:
         """Check if we should extract facts based on content length."""
-        return content_length - self.last_extraction_point >= self.extraction_threshold
+        since = max(self.last_extraction_point, self._last_trigger_point)
+        return content_length - since >= self.extraction_threshold
+
+    def unprocessed_content(self, content: str) -> str:
+        """
+        The part of ``content`` no extraction has covered yet.
+
+        Starts ``context_overlap`` characters before ``last_extraction_point``
+        so facts spanning the boundary are still seen.
+
+        Returns:
+            The unprocessed window, or an empty string if there is no new text
+        """
+        if len(content) <= self.last_extraction_point:
+            return ""
+        return content[max(0, self.last_extraction_point - self.context_overlap):]
+
+    def schedule_extraction(
+        self,
+        content: str,
+        chunk_number: int,
+        extract_facts: Callable,
+        user_message: str,
+        conversation_id: str,
+        sync_to_graph: bool = False,
+    ) -> None:
+        """
+        Run extract_from_chunk in a background task.
+
+        Returns immediately. While an extraction is in flight, further
+        triggers are coalesced: only the latest content is kept, and it is
+        extracted once the running call finishes. Collect the stored facts
+        with drain().
+
+        Args:
+            content: Accumulated content so far
+            chunk_number: Current chunk number
+            extract_facts: Async function to extract facts from content
+            user_message: The user's message
+            conversation_id: Conversation ID for source reference
+            sync_to_graph: Whether to sync facts to graph database
+        """
+        if self._pending is not None:
+            self.coalesced_triggers += 1
+
+        self._last_trigger_point = len(content)
+        self._pending = (
+            content,
+            chunk_number,
+            extract_facts,
+            user_message,
+            conversation_id,
+            sync_to_graph,
+        )
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run_pending())
+
+    async def _run_pending(self) -> None:
+        while self._pending is not None:
+            args, self._pending = self._pending, None
+            self._background_facts.extend(await self.extract_from_chunk(*args))
+
+    async def drain(self) -> List[ProgressiveFact]:
+        """
+        Wait for background extraction to finish.
+
+        Returns:
+            Facts stored by background extractions since the last drain()
+        """
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception as error:
+                print(f"Warning: Progressive fact extraction failed: {error}")
+            self._task = None
+
+        facts, self._background_facts = self._background_facts, []
+        return facts
+
+    async def cancel(self) -> None:
+        """Stop background extraction, dropping any coalesced trigger."""
+        self._pending = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._task = None
 
     async def extract_from_chunk(
         self,
@@ -109,8 +218,10 @@ class ProgressiveFactExtractor:
         """
         Extract facts from a chunk of content.
 
-        Uses cross-session deduplication if configured, otherwise
-        falls back to in-memory deduplication.
+        Only the text after ``last_extraction_point`` is sent to
+        ``extract_facts``, preceded by up to ``context_overlap`` characters
+        of already-processed text. Uses cross-session deduplication if
+        configured, otherwise falls back to in-memory deduplication.
 
         Args:
             content: Accumulated content so far
@@ -126,8 +237,12 @@ class ProgressiveFactExtractor:
         new_facts: List[ProgressiveFact] = []
 
         try:
-            # Extract facts from current content
-            facts_to_store = await extract_facts(user_message, content)
+            # Extract facts from the unprocessed window
+            window = self.unprocessed_content(content)
+            if not window:
+                return new_facts
+
+            facts_to_store = await extract_facts(user_message, window)
 
             if not facts_to_store or len(facts_to_store) == 0:
                 self.last_extraction_point = len(content)
@@ -354,16 +469,11 @@ class ProgressiveFactExtractor:
         """
         Generate a key for in-memory fact deduplication.
 
-        This is a simple implementation - cross-session deduplication
-        uses more sophisticated matching via FactDeduplicationService.
+        Uses the shared exact-match normalization; cross-session
+        deduplication uses more sophisticated matching via
+        FactDeduplicationService.
         """
-        # Normalize the fact text
-        normalized = fact.lower().strip()
-
-        # Include subject if available for better distinction
-        key = f"{subject}::{normalized}" if subject else normalized
-
-        return key
+        return normalized_fact_key(fact, subject)
 
     async def _update_facts_with_memory_ref(
         self, memory_id: str, message_ids: List[str], sync_to_graph: bool
@@ -415,6 +525,9 @@ class ProgressiveFactExtractor:
         self.extracted_facts.clear()
         self.last_extraction_point = 0
         self.extraction_count = 0
+        self._last_trigger_point = 0
+        self._background_facts = []
+        self.coalesced_triggers = 0
 
 
 __all__ = [
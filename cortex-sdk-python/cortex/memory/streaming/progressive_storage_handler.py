@@ -7,13 +7,53 @@ Manages partial memory updates during streaming to enable:
 - Real-time access to in-progress memories
 - Rollback capabilities
 
+Updates after the first send only the newly streamed suffix
+(memories:appendPartialMemory), guarded by the stored length and checksum,
+and fall back to a full rewrite when the stored content has diverged.
+
 Python implementation matching TypeScript src/memory/streaming/ProgressiveStorageHandler.ts
 """
 
-from typing import Any, List, Optional
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Tuple, cast
 
+from ..._utils import filter_none_values
 from ..streaming_types import PartialUpdate
 
+FNV_OFFSET_BASIS = 0x811C9DC5
+FNV_PRIME = 0x01000193
+
+# Aim to spend at most 1/LATENCY_BUDGET_FACTOR of the stream waiting on storage
+LATENCY_BUDGET_FACTOR = 20
+LATENCY_SMOOTHING = 0.3
+
+
+def _utf16_units(text: str) -> "array[int]":
+    units = array("H")
+    units.frombytes(text.encode("utf-16-le"))
+    if sys.byteorder == "big":
+        units.byteswap()
+    return units
+
+
+def content_checksum(text: str, checksum: int = FNV_OFFSET_BASIS) -> int:
+    """
+    Extend a 32-bit FNV-1a checksum over the UTF-16 code units of ``text``
+
+    Matches the Convex backend, which measures and hashes strings in UTF-16.
+    Extending the checksum of a prefix with the suffix gives the checksum of
+    the whole string.
+    """
+    for unit in _utf16_units(text):
+        checksum = ((checksum ^ unit) * FNV_PRIME) & 0xFFFFFFFF
+    return checksum
+
+
+def content_prefix(text: str, length: int) -> str:
+    """Return the first ``length`` UTF-16 code units of ``text``"""
+    return text.encode("utf-16-le")[: length * 2].decode("utf-16-le", errors="ignore")
+
 
 class ProgressiveStorageHandler:
     """Handles progressive storage of streaming content"""
@@ -26,6 +66,9 @@ class ProgressiveStorageHandler:
         user_id: str,
         update_interval: int = 3000,  # Default: update every 3 seconds
         resilience: Optional[Any] = None,
+        adaptive_interval: bool = True,
+        min_update_interval: Optional[int] = None,
+        max_update_interval: int = 15000,
     ) -> None:
         self.client = client
         self.memory_space_id = memory_space_id
@@ -34,11 +77,43 @@ class ProgressiveStorageHandler:
         self.update_interval = update_interval
         self._resilience = resilience
 
+        # Adaptive interval: scaled to the observed mutation latency
+        self.adaptive_interval = adaptive_interval
+        self.min_update_interval = (
+            min_update_interval
+            if min_update_interval is not None
+            else min(update_interval, 1000)
+        )
+        self.max_update_interval = max(max_update_interval, self.min_update_interval)
+        self.mutation_latency_ms: Optional[float] = None
+
         self.partial_memory_id: Optional[str] = None
         self.last_update_time = 0
         self.update_history: List[PartialUpdate] = []
         self.is_initialized = False
         self.is_finalized = False
+        self._reset_synced_state()
+
+    def _reset_synced_state(self) -> None:
+        """Forget what the server holds, so the next update is a full rewrite"""
+        self._synced_text: Optional[str] = None
+        self._synced_length = 0  # UTF-16 code units, as Convex measures strings
+        self._synced_checksum = FNV_OFFSET_BASIS
+
+    def _record_latency(self, latency_ms: float) -> None:
+        """Fold a mutation latency into the running average and retune the interval"""
+        if self.mutation_latency_ms is None:
+            self.mutation_latency_ms = latency_ms
+        else:
+            self.mutation_latency_ms += LATENCY_SMOOTHING * (
+                latency_ms - self.mutation_latency_ms
+            )
+
+        if self.adaptive_interval:
+            target = int(self.mutation_latency_ms * LATENCY_BUDGET_FACTOR)
+            self.update_interval = max(
+                self.min_update_interval, min(self.max_update_interval, target)
+            )
 
     async def _execute_with_resilience(
         self, operation: Any, operation_name: str
@@ -118,22 +193,16 @@ class ProgressiveStorageHandler:
         if not force and time_since_last_update < self.update_interval:
             return False
 
+        metadata = {
+            "lastUpdateTime": now,
+            "currentChunk": chunk_number,
+            "contentLength": len(content),
+        }
+
         try:
-            await self._execute_with_resilience(
-                lambda: self.client.mutation(
-                    "memories:updatePartialMemory",
-                    {
-                        "memoryId": self.partial_memory_id,
-                        "content": content,
-                        "metadata": {
-                            "lastUpdateTime": now,
-                            "currentChunk": chunk_number,
-                            "contentLength": len(content),
-                        },
-                    },
-                ),
-                "memories:updatePartialMemory",
-            )
+            started = time.perf_counter()
+            sent, full_rewrite = await self._send_update(content, metadata)
+            self._record_latency((time.perf_counter() - started) * 1000)
 
             self.last_update_time = now
             self.update_history.append(
@@ -142,21 +211,85 @@ class ProgressiveStorageHandler:
                     memory_id=self.partial_memory_id,
                     content_length=len(content),
                     chunk_number=chunk_number,
+                    sent_length=sent,
+                    full_rewrite=full_rewrite,
                 )
             )
 
             return True
 
         except Exception as error:
+            self._reset_synced_state()
             print(f"Warning: Failed to update partial memory: {error}")
             return False
 
+    async def _send_update(self, content: str, metadata: Any) -> Tuple[int, bool]:
+        """
+        Bring the stored content up to ``content``
+
+        Appends the unsent suffix when the content extends what was last
+        stored, and rewrites it in full otherwise or when the server rejects
+        the append. Returns the number of characters sent and whether the
+        content was rewritten in full.
+        """
+        synced = self._synced_text
+        if synced is not None and len(content) >= len(synced) and content.startswith(synced):
+            delta = content[len(synced):]
+            result = await self._execute_with_resilience(
+                lambda: self.client.mutation(
+                    "memories:appendPartialMemory",
+                    {
+                        "memoryId": self.partial_memory_id,
+                        "offset": self._synced_length,
+                        "baseChecksum": self._synced_checksum,
+                        "delta": delta,
+                        "metadata": metadata,
+                    },
+                ),
+                "memories:appendPartialMemory",
+            )
+
+            if isinstance(result, dict) and result.get("applied"):
+                self._synced_text = content
+                self._synced_length += len(_utf16_units(delta))
+                self._synced_checksum = content_checksum(delta, self._synced_checksum)
+                return len(delta), False
+
+        # Full rewrite: first update, diverged content, or rejected append
+        await self._execute_with_resilience(
+            lambda: self.client.mutation(
+                "memories:updatePartialMemory",
+                {
+                    "memoryId": self.partial_memory_id,
+                    "content": content,
+                    "metadata": metadata,
+                },
+            ),
+            "memories:updatePartialMemory",
+        )
+
+        self._synced_text = content
+        self._synced_length = len(_utf16_units(content))
+        self._synced_checksum = content_checksum(content)
+        return len(content), True
+
     async def finalize_memory(
-        self, full_content: str, embedding: Optional[List[float]] = None
-    ) -> None:
+        self,
+        full_content: str,
+        embedding: Optional[List[float]] = None,
+        message_ids: Optional[List[str]] = None,
+        agent_id: Optional[str] = None,
+        user_name: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
         Finalize the partial memory with complete content
         Marks the memory as complete and removes partial flags
+
+        Passing ``message_ids`` promotes the partial memory in place to the
+        agent's conversation memory (message refs, owner and role are set).
+
+        Returns:
+            The finalized memory record, or None if the backend did not return it
         """
         import time
 
@@ -164,10 +297,10 @@ class ProgressiveStorageHandler:
             raise Exception("Partial memory not initialized")
 
         if self.is_finalized:
-            return  # Already finalized
+            return None  # Already finalized
 
         try:
-            mutation_params = {
+            mutation_params: Dict[str, Any] = {
                 "memoryId": self.partial_memory_id,
                 "content": full_content,
                 "metadata": {
@@ -179,15 +312,27 @@ class ProgressiveStorageHandler:
 
             # Only include embedding if provided (Convex requires array, not null)
             if embedding is not None:
-                mutation_params["embedding"] = embedding  # type: ignore[assignment]
+                mutation_params["embedding"] = embedding
 
-            await self._execute_with_resilience(
+            if message_ids is not None:
+                mutation_params.update(filter_none_values({
+                    "messageIds": message_ids,
+                    "agentId": agent_id,
+                    "sourceUserId": self.user_id or None,
+                    "sourceUserName": user_name,
+                    "messageRole": "agent",
+                }))
+
+            result = await self._execute_with_resilience(
                 lambda: self.client.mutation("memories:finalizePartialMemory", mutation_params),
                 "memories:finalizePartialMemory",
             )
 
             self.is_finalized = True
 
+            memory = result.get("memory") if isinstance(result, dict) else None
+            return cast(Optional[Dict[str, Any]], memory)
+
         except Exception as error:
             raise Exception(f"Failed to finalize partial memory: {error}")
 
@@ -215,6 +360,7 @@ class ProgressiveStorageHandler:
             self.is_initialized = False
             self.is_finalized = False
             self.update_history = []
+            self._reset_synced_state()
 
         except Exception as error:
             print(f"Warning: Failed to rollback partial memory: {error}")
@@ -230,6 +376,17 @@ class ProgressiveStorageHandler:
         time_since_last_update = int(time.time() * 1000) - self.last_update_time
         return time_since_last_update >= self.update_interval
 
+    def checkpoint(self) -> Optional[Tuple[int, int]]:
+        """
+        Length (UTF-16 code units) and checksum of the content the server holds
+
+        Returns None until an update has succeeded, or after one failed and
+        the server copy is unknown.
+        """
+        if self._synced_text is None:
+            return None
+        return self._synced_length, self._synced_checksum
+
     def get_partial_memory_id(self) -> Optional[str]:
         """Get the partial memory ID"""
         return self.partial_memory_id
@@ -250,7 +407,12 @@ class ProgressiveStorageHandler:
 def calculate_optimal_update_interval(
     average_chunk_size: float, chunks_per_second: float
 ) -> int:
-    """Helper to estimate optimal update interval based on stream characteristics"""
+    """
+    Helper to estimate an initial update interval based on stream characteristics
+
+    ProgressiveStorageHandler retunes its interval from observed mutation
+    latency once updates start (see ``adaptive_interval``).
+    """
     # If stream is very fast, update less frequently to reduce load
     if chunks_per_second > 10:
         return 5000  # 5 seconds
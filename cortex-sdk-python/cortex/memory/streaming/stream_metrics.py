@@ -11,12 +11,25 @@ import time
 from typing import Dict, List, Literal, Optional
 
 from ..streaming_types import StreamMetrics
+from .tokenizer import IncrementalTokenCounter, TokenCounter
 
 
 class MetricsCollector:
-    """Collects and aggregates streaming metrics in real-time"""
+    """
+    Collects and aggregates streaming metrics in real-time
 
-    def __init__(self) -> None:
+    Totals, mean/variance (Welford) and inter-chunk delays are kept as
+    running aggregates, so recording a chunk and taking a snapshot are O(1)
+    however long the stream runs. The raw ``chunk_sizes`` and
+    ``chunk_timestamps`` lists are still recorded for callers that want them.
+
+    Tokens are counted from the chunk text with ``token_counter`` (tiktoken
+    when installed, see tokenizer.py); chunks recorded by size alone fall
+    back to 1 token ≈ 4 chars.
+    """
+
+    def __init__(self, token_counter: Optional[TokenCounter] = None) -> None:
+        self.token_counter = token_counter
         self.start_time = int(time.time() * 1000)
         self.first_chunk_time: Optional[int] = None
         self.chunk_sizes: List[int] = []
@@ -26,9 +39,22 @@ class MetricsCollector:
         self.error_count = 0
         self.retry_count = 0
         self.token_estimate = 0
-
-    def record_chunk(self, size: int) -> None:
-        """Record a received chunk"""
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        self._tokens = IncrementalTokenCounter(self.token_counter)
+        self._size_only_tokens = 0
+        self.total_chunks = 0
+        self.total_bytes = 0
+        self._size_mean = 0.0
+        self._size_m2 = 0.0
+        self._size_counts: Dict[int, int] = {}
+        self._last_chunk_time: Optional[int] = None
+        self._min_delay: Optional[int] = None
+        self._max_delay: Optional[int] = None
+
+    def record_chunk(self, size: int, text: Optional[str] = None) -> None:
+        """Record a received chunk (pass its ``text`` for exact token counts)"""
         now = int(time.time() * 1000)
 
         # Record first chunk latency
@@ -38,8 +64,28 @@ class MetricsCollector:
         self.chunk_sizes.append(size)
         self.chunk_timestamps.append(now)
 
-        # Rough token estimate (1 token ≈ 4 chars)
-        self.token_estimate += size // 4
+        # Running aggregates
+        self.total_chunks += 1
+        self.total_bytes += size
+        delta = size - self._size_mean
+        self._size_mean += delta / self.total_chunks
+        self._size_m2 += delta * (size - self._size_mean)
+        self._size_counts[size] = self._size_counts.get(size, 0) + 1
+
+        if self._last_chunk_time is not None:
+            delay = now - self._last_chunk_time
+            if self._min_delay is None or delay < self._min_delay:
+                self._min_delay = delay
+            if self._max_delay is None or delay > self._max_delay:
+                self._max_delay = delay
+        self._last_chunk_time = now
+
+        if text is not None:
+            self._tokens.add(text)
+        else:
+            # Rough token estimate (1 token ≈ 4 chars)
+            self._size_only_tokens += size // 4
+        self.token_estimate = self._tokens.total + self._size_only_tokens
 
     def record_fact_extraction(self, count: int) -> None:
         """Record fact extraction"""
@@ -61,8 +107,8 @@ class MetricsCollector:
         """Get current metrics snapshot"""
         now = int(time.time() * 1000)
         duration = now - self.start_time
-        total_bytes = sum(self.chunk_sizes)
-        total_chunks = len(self.chunk_sizes)
+        total_bytes = self.total_bytes
+        total_chunks = self.total_chunks
 
         return StreamMetrics(
             # Timing
@@ -101,41 +147,48 @@ class MetricsCollector:
         return (tokens / 1000) * cost_per_1k
 
     def get_chunk_stats(self) -> Dict[str, float]:
-        """Get chunk size statistics"""
-        if not self.chunk_sizes:
+        """Get chunk size statistics (O(distinct sizes))"""
+        if not self.total_chunks:
             return {"min": 0.0, "max": 0.0, "median": 0.0, "std_dev": 0.0}
 
-        sorted_sizes = sorted(self.chunk_sizes)
-        min_size = float(sorted_sizes[0])
-        max_size = float(sorted_sizes[-1])
-        median = float(sorted_sizes[len(sorted_sizes) // 2])
+        sizes = sorted(self._size_counts)
+        min_size = float(sizes[0])
+        max_size = float(sizes[-1])
 
-        # Calculate standard deviation
-        mean = sum(self.chunk_sizes) / len(self.chunk_sizes)
-        variance = sum((size - mean) ** 2 for size in self.chunk_sizes) / len(
-            self.chunk_sizes
-        )
-        std_dev = variance**0.5
+        # Upper median, walking the size histogram
+        middle = self.total_chunks // 2
+        seen = 0
+        median = max_size
+        for size in sizes:
+            seen += self._size_counts[size]
+            if seen > middle:
+                median = float(size)
+                break
+
+        # Population standard deviation
+        std_dev = (self._size_m2 / self.total_chunks) ** 0.5
 
         return {"min": min_size, "max": max_size, "median": median, "std_dev": std_dev}
 
     def get_timing_stats(self) -> Dict[str, float]:
         """Get timing statistics"""
-        if len(self.chunk_timestamps) < 2:
+        if (
+            self.total_chunks < 2
+            or self.first_chunk_time is None
+            or self._last_chunk_time is None
+        ):
             return {
                 "average_inter_chunk_delay": 0.0,
                 "min_delay": 0.0,
                 "max_delay": 0.0,
             }
 
-        delays = [
-            self.chunk_timestamps[i] - self.chunk_timestamps[i - 1]
-            for i in range(1, len(self.chunk_timestamps))
-        ]
-
-        average_delay = sum(delays) / len(delays)
-        min_delay = float(min(delays))
-        max_delay = float(max(delays))
+        # Consecutive delays telescope to (last - first)
+        average_delay = (self._last_chunk_time - self.first_chunk_time) / (
+            self.total_chunks - 1
+        )
+        min_delay = float(self._min_delay or 0)
+        max_delay = float(self._max_delay or 0)
 
         return {
             "average_inter_chunk_delay": average_delay,
@@ -180,6 +233,7 @@ class MetricsCollector:
         self.error_count = 0
         self.retry_count = 0
         self.token_estimate = 0
+        self._reset_aggregates()
 
     def generate_insights(self) -> Dict[str, List[str]]:
         """Generate performance insights based on metrics"""
@@ -0,0 +1,217 @@
+"""
+Stream Pipeline
+
+Producer/consumer pipeline for remember_stream(). Each chunk is handed to
+the caller's hook first and then offered to bounded per-stage queues
+(storage, facts, graph), each drained by its own task, so a slow network
+call in one stage never holds up the token stream.
+
+When a stage falls behind, its BackpressurePolicy decides what happens:
+BLOCK waits for space (pushing back on the producer), DROP discards the new
+chunk, and COALESCE discards the oldest queued chunk. Chunk events carry the
+accumulated text, so for the built-in stages a newer event supersedes the
+ones before it and coalescing loses nothing.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, List, Mapping, Optional, Union
+
+from ..streaming_types import (
+    BackpressurePolicy,
+    ChunkEvent,
+    PipelineStageMetrics,
+    StreamPipelineMetrics,
+)
+
+StageHandler = Callable[[ChunkEvent], Any]
+PolicyLike = Union[BackpressurePolicy, str]
+
+
+class PipelineStage:
+    """A bounded queue of chunk events drained by one consumer task"""
+
+    def __init__(
+        self,
+        name: str,
+        handler: StageHandler,
+        queue_size: int = 16,
+        policy: PolicyLike = BackpressurePolicy.COALESCE,
+        when: Optional[Callable[[ChunkEvent], bool]] = None,
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        self.policy = BackpressurePolicy(policy)
+        self.when = when
+        self.queue: "asyncio.Queue[ChunkEvent]" = asyncio.Queue(maxsize=max(1, queue_size))
+        self.metrics = PipelineStageMetrics(
+            name=name, policy=self.policy, queue_size=self.queue.maxsize
+        )
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def offer(self, event: ChunkEvent) -> float:
+        """
+        Queue an event under the stage's backpressure policy.
+
+        Returns:
+            Milliseconds the producer waited for space (BLOCK only)
+        """
+        if self.when is not None and not self.when(event):
+            return 0.0
+
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._consume())
+
+        waited_ms = 0.0
+        if self.queue.full():
+            if self.policy == BackpressurePolicy.DROP:
+                self.metrics.dropped += 1
+                return 0.0
+
+            if self.policy == BackpressurePolicy.COALESCE:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.metrics.coalesced += 1
+            else:
+                started = time.perf_counter()
+                await self.queue.put(event)
+                waited_ms = (time.perf_counter() - started) * 1000
+                self.metrics.blocked_ms += waited_ms
+                self._record_enqueue()
+                return waited_ms
+
+        self.queue.put_nowait(event)
+        self._record_enqueue()
+        return waited_ms
+
+    def _record_enqueue(self) -> None:
+        self.metrics.enqueued += 1
+        self.metrics.queue_depth = self.queue.qsize()
+        if self.metrics.queue_depth > self.metrics.max_queue_depth:
+            self.metrics.max_queue_depth = self.metrics.queue_depth
+
+    async def _consume(self) -> None:
+        while True:
+            event = await self.queue.get()
+            self.metrics.queue_depth = self.queue.qsize()
+            started = time.perf_counter()
+            try:
+                result = self.handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+                self.metrics.processed += 1
+            except Exception as error:
+                self.metrics.errors += 1
+                print(f"Warning: Stream pipeline stage '{self.name}' failed: {error}")
+            finally:
+                self.metrics.busy_ms += (time.perf_counter() - started) * 1000
+                self.queue.task_done()
+
+    async def close(self) -> None:
+        """Process everything still queued, then stop the consumer"""
+        if self._task is None:
+            return
+        await self.queue.join()
+        await self._stop()
+
+    async def cancel(self) -> None:
+        """Discard queued events and stop the consumer"""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.queue.task_done()
+        self.metrics.queue_depth = 0
+        await self._stop()
+
+    async def _stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+class StreamPipeline:
+    """Fans chunk events out to the caller first, then to bounded stages"""
+
+    def __init__(
+        self,
+        pass_through: Optional[StageHandler] = None,
+        queue_size: int = 16,
+        policy: PolicyLike = BackpressurePolicy.COALESCE,
+        stage_policies: Optional[Mapping[str, PolicyLike]] = None,
+    ) -> None:
+        self.pass_through = pass_through
+        self.queue_size = queue_size
+        self.policy = BackpressurePolicy(policy)
+        self.stage_policies = stage_policies or {}
+        self.stages: List[PipelineStage] = []
+        self.metrics = StreamPipelineMetrics()
+        self._first_chunk_seen = False
+
+    def add_stage(
+        self,
+        name: str,
+        handler: StageHandler,
+        when: Optional[Callable[[ChunkEvent], bool]] = None,
+        policy: Optional[PolicyLike] = None,
+        queue_size: Optional[int] = None,
+    ) -> PipelineStage:
+        """
+        Add a consumer stage.
+
+        Args:
+            name: Stage name, used for metrics and ``stage_policies``
+            handler: Called (and awaited if async) with each queued event
+            when: Optional filter run by the producer; events it rejects
+                are never queued
+            policy: Backpressure policy, overriding the pipeline default
+            queue_size: Queue bound, overriding the pipeline default
+
+        Returns:
+            The new stage
+        """
+        stage = PipelineStage(
+            name,
+            handler,
+            queue_size=queue_size if queue_size is not None else self.queue_size,
+            policy=policy or self.stage_policies.get(name, self.policy),
+            when=when,
+        )
+        self.stages.append(stage)
+        self.metrics.stages[name] = stage.metrics
+        return stage
+
+    async def publish(self, event: ChunkEvent) -> None:
+        """Deliver an event to the caller, then offer it to every stage"""
+        if not self._first_chunk_seen:
+            self._first_chunk_seen = True
+            self.metrics.added_time_to_first_token_ms = max(
+                0.0, time.time() * 1000 - event.timestamp
+            )
+
+        if self.pass_through is not None:
+            try:
+                result = self.pass_through(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as error:
+                print(f"Warning: Error in stream hook: {error}")
+
+        for stage in self.stages:
+            self.metrics.producer_blocked_ms += await stage.offer(event)
+
+    async def close(self) -> None:
+        """Let every stage finish its queued work"""
+        for stage in self.stages:
+            await stage.close()
+
+    async def cancel(self) -> None:
+        """Drop queued work in every stage"""
+        for stage in self.stages:
+            await stage.cancel()
+
+    def get_metrics(self) -> StreamPipelineMetrics:
+        """Get per-stage queue metrics"""
+        return self.metrics
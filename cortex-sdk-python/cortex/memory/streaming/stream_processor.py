@@ -8,7 +8,8 @@ Python implementation matching TypeScript src/memory/streaming/StreamProcessor.t
 """
 
 import asyncio
-from typing import Any, AsyncIterable, Optional
+import time
+from typing import Any, AsyncIterable, Callable, List, Optional
 
 from ..streaming_types import (
     ChunkEvent,
@@ -22,6 +23,52 @@ from ..streaming_types import (
 from .stream_metrics import MetricsCollector
 
 
+class TextAccumulator:
+    """
+    Append-only text buffer for streamed responses
+
+    Chunks are appended to a list in O(1); the full text is only joined when
+    it is read, and the joined result is cached until the next append. A
+    stream of n chunks read k times therefore costs O(n + k * length) rather
+    than the O(n * length) of repeated string concatenation.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pending: List[str] = []
+        self._length = 0
+
+    def append(self, chunk: str) -> None:
+        """Append a chunk"""
+        self._pending.append(chunk)
+        self._length += len(chunk)
+
+    @property
+    def text(self) -> str:
+        """The full accumulated text"""
+        if self._pending:
+            self._pending.insert(0, self._text)
+            self._text = "".join(self._pending)
+            self._pending = []
+        return self._text
+
+    def text_at(self, length: int) -> str:
+        """The accumulated text as it was when it had ``length`` characters"""
+        text = self.text
+        return text if len(text) == length else text[:length]
+
+    def snapshot(self) -> Callable[[], str]:
+        """A callable returning the text as it is now, materialized on call"""
+        length = self._length
+        return lambda: self.text_at(length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.text
+
+
 class StreamProcessor:
     """Core stream processor that handles chunk iteration with hooks"""
 
@@ -34,7 +81,7 @@ class StreamProcessor:
         self.context = context
         self.hooks = hooks or StreamHooks()
         self.metrics = metrics or MetricsCollector()
-        self.accumulated_content = ""
+        self.accumulator = TextAccumulator()
         self.chunk_number = 0
         self.progress_callback_counter = 0
 
@@ -50,19 +97,24 @@ class StreamProcessor:
             # Process async iterable chunks
             await self._process_async_iterable(stream, opts)
 
+            self._sync_context()
+
             # Emit completion event
             if self.hooks.on_complete:
+                snapshot = self.metrics.get_snapshot()
                 complete_event = StreamCompleteEvent(
                     full_response=self.accumulated_content,
                     total_chunks=self.chunk_number,
-                    duration_ms=self.metrics.get_snapshot().stream_duration_ms,
-                    facts_extracted=self.metrics.get_snapshot().facts_extracted,
+                    duration_ms=snapshot.stream_duration_ms,
+                    facts_extracted=snapshot.facts_extracted,
                 )
                 await self._safely_call_hook(self.hooks.on_complete, complete_event)
 
             return self.accumulated_content
 
         except Exception as error:
+            self._sync_context()
+
             # Emit error event
             if self.hooks.on_error:
                 from ..streaming_types import ErrorContext
@@ -75,7 +127,7 @@ class StreamProcessor:
                     context=ErrorContext(
                         phase="streaming",
                         chunk_number=self.chunk_number,
-                        bytes_processed=len(self.accumulated_content),
+                        bytes_processed=len(self.accumulator),
                     ),
                     original_error=error,
                 )
@@ -94,31 +146,28 @@ class StreamProcessor:
         self, chunk: str, options: StreamingOptions
     ) -> None:
         """Process a single chunk"""
-        import time
-
         # Update state
         self.chunk_number += 1
-        self.accumulated_content += chunk
+        self.accumulator.append(chunk)
 
         # Record metrics
-        self.metrics.record_chunk(len(chunk))
+        self.metrics.record_chunk(len(chunk), chunk)
 
-        # Update context
+        # Update context (the accumulated text is synced lazily)
+        now = int(time.time() * 1000)
         self.context.chunk_count = self.chunk_number
-        self.context.accumulated_text = self.accumulated_content
-        self.context.estimated_tokens = self.metrics.get_snapshot().estimated_tokens
-        self.context.elapsed_ms = (
-            int(time.time() * 1000) - self.metrics.get_snapshot().start_time
-        )
+        self.context.estimated_tokens = self.metrics.token_estimate
+        self.context.elapsed_ms = now - self.metrics.start_time
 
         # Emit chunk event
         if self.hooks.on_chunk:
             chunk_event = ChunkEvent(
                 chunk=chunk,
                 chunk_number=self.chunk_number,
-                accumulated=self.accumulated_content,
-                timestamp=int(time.time() * 1000),
-                estimated_tokens=self.metrics.get_snapshot().estimated_tokens,
+                timestamp=now,
+                estimated_tokens=self.metrics.token_estimate,
+                accumulated_length=len(self.accumulator),
+                _source=self.accumulator.snapshot(),
             )
             await self._safely_call_hook(self.hooks.on_chunk, chunk_event)
 
@@ -128,7 +177,7 @@ class StreamProcessor:
             self.progress_callback_counter += 1
             metrics_snapshot = self.metrics.get_snapshot()
             progress_event = ProgressEvent(
-                bytes_processed=len(self.accumulated_content),
+                bytes_processed=len(self.accumulator),
                 chunks=self.chunk_number,
                 elapsed_ms=metrics_snapshot.stream_duration_ms,
                 estimated_completion=self._estimate_completion(metrics_snapshot),
@@ -159,6 +208,15 @@ class StreamProcessor:
         """Get current metrics"""
         return self.metrics
 
+    @property
+    def accumulated_content(self) -> str:
+        """Accumulated content so far"""
+        return self.accumulator.text
+
+    def _sync_context(self) -> None:
+        """Copy the accumulated text into the stream context"""
+        self.context.accumulated_text = self.accumulator.text
+
     def get_accumulated_content(self) -> str:
         """Get accumulated content so far"""
         return self.accumulated_content
@@ -169,6 +227,7 @@ class StreamProcessor:
 
     def get_context(self) -> StreamContext:
         """Get stream context"""
+        self._sync_context()
         return self.context
 
 
@@ -0,0 +1,144 @@
+"""
+Token Counting
+
+Pluggable token counters for chunking and stream metrics. When tiktoken is
+installed, counts come from its BPE encodings; otherwise a heuristic
+pre-tokenizer approximates BPE boundaries (words with their leading space,
+digit groups, punctuation runs, one token per CJK character), which tracks
+code and CJK text far better than a flat 4 characters per token.
+
+Counters report the character offset where each token starts, so chunkers
+can cut on exact token boundaries.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, List, Optional
+
+# tiktoken is optional - used for exact BPE counts when installed
+try:
+    import tiktoken
+
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+DEFAULT_ENCODING = "cl100k_base"
+
+HEURISTIC_TOKEN_REGEX = re.compile(
+    r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]"  # CJK, kana, hangul
+    r"|[\U00010000-\U0010ffff]"  # Emoji and other astral characters
+    r"| ?[^\W\d_]{1,8}"  # Words, long ones split
+    r"| ?\d{1,3}"  # Digit groups
+    r"| ?(?:[^\s\w]|_){1,3}"  # Punctuation and operators
+    r"|\s+(?!\S)|\s"  # Whitespace (a single space joins the next word)
+    r"|[\s\S]"
+)
+
+
+class TokenCounter(ABC):
+    """Abstract base class for token counters."""
+
+    name: str = "token-counter"
+
+    @abstractmethod
+    def token_offsets(self, text: str) -> List[int]:
+        """Character offset where each token of ``text`` starts"""
+        pass
+
+    def count(self, text: str) -> int:
+        """Number of tokens in ``text``"""
+        return len(self.token_offsets(text))
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Regex approximation of BPE tokenization (no dependencies)"""
+
+    name = "heuristic"
+
+    def token_offsets(self, text: str) -> List[int]:
+        return [match.start() for match in HEURISTIC_TOKEN_REGEX.finditer(text)]
+
+    def count(self, text: str) -> int:
+        return sum(1 for _ in HEURISTIC_TOKEN_REGEX.finditer(text))
+
+
+class TiktokenCounter(TokenCounter):
+    """Exact counts from a tiktoken BPE encoding"""
+
+    def __init__(self, encoding: Any) -> None:
+        self.encoding = encoding
+        self.name = f"tiktoken:{encoding.name}"
+
+    def token_offsets(self, text: str) -> List[int]:
+        tokens = self.encoding.encode(text, disallowed_special=())
+        _, offsets = self.encoding.decode_with_offsets(tokens)
+        return list(offsets)
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+@lru_cache(maxsize=8)
+def get_token_counter(encoding: str = DEFAULT_ENCODING) -> TokenCounter:
+    """
+    Get the best available token counter (cached per encoding).
+
+    Args:
+        encoding: tiktoken encoding name
+
+    Returns:
+        A TiktokenCounter when tiktoken is installed and the encoding loads,
+        otherwise a HeuristicTokenCounter
+    """
+    if HAS_TIKTOKEN:
+        try:
+            return TiktokenCounter(tiktoken.get_encoding(encoding))
+        except Exception as error:
+            print(f"Warning: Failed to load tiktoken encoding '{encoding}', using heuristic token counts: {error}")
+    return HeuristicTokenCounter()
+
+
+class IncrementalTokenCounter:
+    """
+    Running token count for a stream
+
+    Each chunk is tokenized together with the last few tokens of the text
+    before it, since BPE can merge across a chunk boundary, so the work per
+    chunk is proportional to the chunk rather than the whole response.
+    """
+
+    def __init__(
+        self, counter: Optional[TokenCounter] = None, lookback_tokens: int = 2
+    ) -> None:
+        self.counter = counter or get_token_counter()
+        self.lookback_tokens = max(1, lookback_tokens)
+        self.total = 0
+        self._settled = 0
+        self._tail = ""
+
+    def add(self, chunk: str) -> int:
+        """Add a chunk and return the running total"""
+        if not chunk:
+            return self.total
+
+        text = self._tail + chunk
+        offsets = self.counter.token_offsets(text)
+
+        if len(offsets) > self.lookback_tokens:
+            settled = len(offsets) - self.lookback_tokens
+            self._settled += settled
+            self._tail = text[offsets[settled]:]
+            self.total = self._settled + self.lookback_tokens
+        else:
+            self._tail = text
+            self.total = self._settled + len(offsets)
+
+        return self.total
+
+    def reset(self) -> None:
+        """Forget everything counted so far"""
+        self.total = 0
+        self._settled = 0
+        self._tail = ""
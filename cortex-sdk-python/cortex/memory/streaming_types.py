@@ -18,13 +18,25 @@ from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional
 
 @dataclass
 class ChunkEvent:
-    """Event emitted for each chunk received from the stream"""
+    """
+    Event emitted for each chunk received from the stream
+
+    The accumulated text is only built by ``_source`` when ``accumulated`` is
+    read, so hooks that look at the chunk alone never pay for joining the
+    whole response. ``accumulated_length`` is known without that cost.
+    """
 
     chunk: str
     chunk_number: int
-    accumulated: str
     timestamp: int
     estimated_tokens: int
+    accumulated_length: int
+    _source: Callable[[], str] = field(repr=False, compare=False)
+
+    @property
+    def accumulated(self) -> str:
+        """Full response text up to and including this chunk"""
+        return self._source()
 
 
 @dataclass
@@ -106,6 +118,8 @@ class PartialUpdate:
     memory_id: str
     content_length: int
     chunk_number: int
+    sent_length: int = 0  # Characters sent: the appended delta, or all of them
+    full_rewrite: bool = True
 
 
 @dataclass
@@ -119,6 +133,23 @@ class ProgressiveFact:
     deduped: bool = False
 
 
+@dataclass
+class PartialMemoryPromotion:
+    """
+    Work already done during a stream, handed to remember() at finalize time
+
+    The partial memory is promoted in place to the agent's conversation
+    memory using the precomputed embedding, and only the text progressive
+    extraction has not covered is sent for fact extraction.
+    """
+
+    storage_handler: Any  # ProgressiveStorageHandler holding the partial memory
+    embedding: Optional[List[float]] = None
+    fact_content: Optional[str] = None  # None: extract from the full response
+    progressive_facts: List[Any] = field(default_factory=list)  # List[FactRecord]
+    graph_node_id: Optional[str] = None  # Partial graph node, if already synced
+
+
 @dataclass
 class GraphSyncEvent:
     """Graph sync event during streaming"""
@@ -206,6 +237,13 @@ class ResumeContext:
     timestamp: int
     checksum: str
 
+    # Checkpoint into the persisted partial memory. When memory_space_id is
+    # set, the token stores only this offset (UTF-16 code units) and the
+    # checksum of the content before it; accumulated_content is read back
+    # from the partial memory on validation.
+    memory_space_id: Optional[str] = None
+    content_offset: int = 0
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Chunking Strategies
@@ -231,6 +269,16 @@ class ChunkingConfig:
     overlap_size: int = 0
     preserve_boundaries: bool = True
 
+    # Semantic chunking (sizes are in sentences, like SENTENCE). Without
+    # generate_embedding, sentences are compared by word overlap instead.
+    generate_embedding: Optional[Callable[[str], Any]] = None
+    embedding_batch_size: int = 16
+    min_chunk_size: int = 1
+    similarity_threshold: Optional[float] = None  # None: mean minus one std of the similarities
+
+    # Token counter for TOKEN chunking (defaults to tiktoken when installed)
+    token_counter: Optional[Any] = None
+
 
 @dataclass
 class ContentChunk:
@@ -267,6 +315,46 @@ class ProcessingStrategy:
     enable_predictive_loading: bool
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Stream Pipeline
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class BackpressurePolicy(str, Enum):
+    """What a pipeline stage does with a chunk when its queue is full"""
+
+    BLOCK = "block"  # Wait for space (slows the producer)
+    DROP = "drop"  # Discard the new chunk
+    COALESCE = "coalesce"  # Discard the oldest queued chunk, keep the new one
+
+
+@dataclass
+class PipelineStageMetrics:
+    """Queue metrics for one pipeline stage"""
+
+    name: str
+    policy: BackpressurePolicy
+    queue_size: int
+    enqueued: int = 0
+    processed: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    blocked_ms: float = 0.0  # Producer time spent waiting on a full queue (BLOCK)
+    busy_ms: float = 0.0  # Time spent in the stage handler
+
+
+@dataclass
+class StreamPipelineMetrics:
+    """Metrics for the streaming pipeline"""
+
+    stages: Dict[str, PipelineStageMetrics] = field(default_factory=dict)
+    added_time_to_first_token_ms: float = 0.0  # From chunk receipt to the caller's hook
+    producer_blocked_ms: float = 0.0
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Streaming Options
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -307,8 +395,12 @@ class StreamingOptions:
     max_retries: int = 3
     retry_delay: int = 1000
     generate_resume_token: bool = False
+    resume_token: Optional[str] = None  # From an interrupted attempt; deleted on success
     stream_timeout: Optional[int] = None
 
+    # Token counter for stream metrics (defaults to tiktoken when installed)
+    token_counter: Optional[Any] = None
+
     # Memory efficiency
     max_buffer_size: int = 10000
     incremental_embeddings: bool = False
@@ -316,6 +408,12 @@ class StreamingOptions:
     # Adaptive processing
     enable_adaptive_processing: bool = False
 
+    # Pipeline: storage, fact and graph stages consume chunks from bounded
+    # queues so they never block the stream
+    pipeline_queue_size: int = 16
+    backpressure_policy: BackpressurePolicy = BackpressurePolicy.COALESCE
+    stage_backpressure: Optional[Dict[str, BackpressurePolicy]] = None  # Per stage: "storage", "facts", "graph"
+
     # Advanced
     max_response_length: Optional[int] = None
 
@@ -374,6 +472,9 @@ class EnhancedRememberStreamResult:
     Only populated when belief revision is enabled (default when LLM configured).
     """
 
+    # Per-stage queue metrics for the streaming pipeline
+    pipeline_metrics: Optional[StreamPipelineMetrics] = None
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Stream Context
@@ -389,7 +490,8 @@ class StreamContext:
     user_id: str
     user_name: str
 
-    # State
+    # State (accumulated_text is refreshed by StreamProcessor when the
+    # stream ends or fails, and whenever get_context() is called)
     accumulated_text: str = ""
     chunk_count: int = 0
     estimated_tokens: int = 0
@@ -626,6 +626,14 @@ class MemoryEntry:
     fact_category: Optional[str] = None  # Category for filtering (e.g., "addressing_preference")
 
 
+@dataclass
+class ListMemoriesPageResult:
+    """One page of memories from cursor pagination."""
+    memories: List[MemoryEntry]
+    continue_cursor: Optional[str]
+    is_done: bool
+
+
 @dataclass
 class MemorySource:
     """Source information for a memory."""
@@ -715,6 +723,19 @@ class FactRecord:
     semantic_context: Optional[str] = None  # Usage context sentence
     entities: Optional[List[EnrichedEntity]] = None  # Extracted entities with types
     relations: Optional[List[EnrichedRelation]] = None  # Subject-predicate-object triples for graph
+    embedding: Optional[List[float]] = None  # Fact embedding for semantic dedup/conflict search
+    normalized_subject: Optional[str] = None  # Slot key: normalized subject
+    predicate_class: Optional[str] = None  # Slot key: predicate class
+    scope_key: Optional[str] = None  # Vector search scope: memorySpaceId|userId|factType
+    type_scope_key: Optional[str] = None  # Vector search scope: memorySpaceId|factType
+
+
+@dataclass
+class ListFactsPageResult:
+    """One page of facts from cursor pagination."""
+    facts: List[FactRecord]
+    continue_cursor: Optional[str]
+    is_done: bool
 
 
 @dataclass
@@ -741,6 +762,9 @@ class StoreFactParams:
     semantic_context: Optional[str] = None  # Usage context sentence
     entities: Optional[List[EnrichedEntity]] = None  # Extracted entities with types
     relations: Optional[List[EnrichedRelation]] = None  # Subject-predicate-object triples for graph
+    embedding: Optional[List[float]] = None  # Indexed for semantic dedup/conflict search
+    normalized_subject: Optional[str] = None  # Slot key (computed from subject when omitted)
+    predicate_class: Optional[str] = None  # Slot key (computed from predicate when omitted)
 
 
 @dataclass
@@ -1152,6 +1176,7 @@ class RecallGraphExpansionConfig:
     relationship_types: Optional[List[str]] = None  # Types to follow (None = all)
     expand_from_facts: bool = True     # Expand from discovered facts
     expand_from_memories: bool = True  # Expand from discovered memories
+    max_fan_out: int = 25              # Neighbors followed per node per depth (caps hub nodes)
 
 
 @dataclass
@@ -1925,6 +1950,7 @@ class GraphNode:
     label: str
     properties: Dict[str, Any]
     id: Optional[str] = None
+    depth: Optional[int] = None  # Hops from the start node (set by traverse())
 
 
 @dataclass
@@ -2030,9 +2056,9 @@ class GraphDeleteResult:
 
 @dataclass
 class BatchSyncLimits:
-    """Limits for batch sync operations per entity type."""
-    memories: int = 10000
-    facts: int = 10000
+    """Limits for batch sync operations per entity type (None = no limit)."""
+    memories: Optional[int] = 10000
+    facts: Optional[int] = 10000
     users: int = 1000
     agents: int = 1000
 
@@ -2064,12 +2090,106 @@ class BatchSyncResult:
     duration: int = 0
 
 
+@dataclass
+class BatchSyncProgress:
+    """Throughput report for a batch sync phase."""
+    entity_type: str
+    processed: int
+    total: Optional[int]  # None when the total could not be counted
+    elapsed_ms: int
+    items_per_second: float
+    eta_seconds: Optional[float] = None
+    spaces_completed: int = 0
+    spaces_total: int = 0
+
+
+@dataclass
+class BatchSyncCheckpoint:
+    """Resumable state for batch graph sync (per memory space cursors)."""
+    memory_cursors: Dict[str, str] = field(default_factory=dict)
+    fact_cursors: Dict[str, str] = field(default_factory=dict)
+    completed_memory_spaces: List[str] = field(default_factory=list)
+    completed_fact_spaces: List[str] = field(default_factory=list)
+    memories_synced: int = 0
+    facts_synced: int = 0
+    # IDs whose write failed, per memory space; retried when the sync resumes
+    failed_memory_ids: Dict[str, List[str]] = field(default_factory=dict)
+    failed_fact_ids: Dict[str, List[str]] = field(default_factory=dict)
+
+
 @dataclass
 class BatchSyncOptions:
     """Options for batch graph sync."""
     limits: Optional[BatchSyncLimits] = None
     sync_relationships: bool = True
-    on_progress: Optional[Any] = None  # Callback function
+    on_progress: Optional[Any] = None  # Callback function (entity, current, total)
+    page_size: int = 500  # Entities fetched and written per page
+    concurrency: int = 4  # Memory spaces synced concurrently
+    checkpoint_path: Optional[str] = None  # JSON file for resuming a crashed sync
+    on_progress_report: Optional[Callable[[BatchSyncProgress], None]] = None
+
+
+@dataclass
+class GraphReconcileOptions:
+    """Options for incremental graph reconciliation."""
+    dry_run: bool = False  # Report drift without writing to the graph
+    memory_space_ids: Optional[List[str]] = None  # None = all memory spaces
+    entity_types: List[Literal["memories", "facts"]] = field(
+        default_factory=lambda: ["memories", "facts"]
+    )
+    delete_extraneous: bool = True  # Remove graph nodes deleted from Cortex
+    sync_relationships: bool = True
+    page_size: int = 500  # Entities compared and written per page
+    concurrency: int = 4  # Memory spaces reconciled concurrently
+    chunk_ms: int = 86_400_000  # createdAt window per compared chunk (1 day)
+    on_progress_report: Optional[Callable[[BatchSyncProgress], None]] = None
+
+
+@dataclass
+class ChunkWatermark:
+    """Watermarks of the entities created in one createdAt window."""
+    chunk: int  # floor(createdAt / chunk_ms)
+    count: int
+    max_updated_at: int
+    updated_offset_sum: int  # Sum of (updatedAt - createdAt)
+    version_sum: int
+    created_offset_sum: int  # Sum of (createdAt - chunk * chunk_ms)
+
+
+@dataclass
+class ChunkDigestPageResult:
+    """Chunk watermarks for one page of a memory space (chunks may span pages)."""
+    chunks: List[ChunkWatermark]
+    continue_cursor: Optional[str]
+    is_done: bool
+
+
+@dataclass
+class GraphReconcileSpaceReport:
+    """Drift found for one entity type in one memory space."""
+    memory_space_id: str
+    entity_type: Literal["memories", "facts"]
+    cortex_count: int = 0
+    graph_count: int = 0
+    cortex_checksum: str = ""  # Digest of the per-chunk watermarks
+    graph_checksum: str = ""
+    in_sync: bool = True
+    chunks: int = 0  # Chunks compared by watermark
+    chunks_differing: int = 0  # Chunks compared entity by entity
+    missing: List[str] = field(default_factory=list)  # In Cortex, not in graph
+    changed: List[str] = field(default_factory=list)  # updatedAt/version differ
+    extraneous: List[str] = field(default_factory=list)  # In graph, not in Cortex
+
+
+@dataclass
+class GraphReconcileResult:
+    """Result of incremental graph reconciliation."""
+    dry_run: bool
+    reports: List[GraphReconcileSpaceReport] = field(default_factory=list)
+    synced: int = 0
+    deleted: int = 0
+    errors: List[BatchSyncError] = field(default_factory=list)
+    duration: int = 0
 
 
 @dataclass
@@ -2087,6 +2207,10 @@ class TraversalConfig:
     relationship_types: List[str]
     max_depth: int
     direction: Literal["OUTGOING", "INCOMING", "BOTH"] = "BOTH"
+    max_results: Optional[int] = None  # Stop once this many nodes are found
+    max_fan_out: Optional[int] = None  # Neighbors followed per node per level
+    exclude_labels: Optional[List[str]] = None  # Hub labels never returned or expanded
+    exclude_relationship_types: Optional[List[str]] = None  # Edge types never followed
 
 
 @dataclass
@@ -2469,6 +2593,25 @@ class GraphAdapter(Protocol):
         """
         ...
 
+    async def query_batch(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> GraphQueryResult:
+        """
+        Execute a Cypher statement that reads ``UNWIND $rows AS row``.
+
+        Args:
+            query: Cypher statement using ``$rows``
+            rows: One map per row (passed as maps, not serialized to JSON)
+            params: Optional additional query parameters
+
+        Returns:
+            Query results
+        """
+        ...
+
     async def traverse(self, config: TraversalConfig) -> List[GraphNode]:
         """
         Traverse the graph from a starting node.
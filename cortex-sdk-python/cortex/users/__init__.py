@@ -5,10 +5,11 @@ Coordination Layer: User profile management with GDPR cascade deletion
 """
 
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 __all__ = ["UsersAPI", "UserValidationError"]
 
+from .._pagination import iterate_pages
 from .._utils import convert_convex_response, filter_none_values  # noqa: F401
 from ..errors import CascadeDeletionError, CortexError, ErrorCode
 from ..types import (
@@ -655,6 +656,22 @@ class UsersAPI:
 
     # Helper methods for cascade deletion
 
+    def _iter_pages(
+        self, function_name: str, args: Dict[str, Any], page_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the raw records of a cursor-paginated listPage query."""
+
+        async def fetch_page(cursor: Optional[str]) -> Any:
+            return await self._execute_with_resilience(
+                lambda: self.client.query(
+                    function_name,
+                    {**args, "paginationOpts": {"numItems": page_size, "cursor": cursor}},
+                ),
+                function_name,
+            )
+
+        return iterate_pages(fetch_page, lambda record: record)
+
     async def _collect_deletion_plan(self, user_id: str) -> Dict[str, List[Any]]:
         """Phase 1: Collect all records to delete."""
         plan: Dict[str, Any] = {
@@ -666,36 +683,17 @@ class UsersAPI:
             "graph": [],
         }
 
-        # Collect conversations
-        conversations_result = await self._execute_with_resilience(
-            lambda: self.client.query(
-                "conversations:list", filter_none_values({"userId": user_id, "limit": 10000})
-            ),
-            "conversations:list",
-        )
-        # Handle both list format (legacy) and dict format (new API)
-        if isinstance(conversations_result, dict):
-            plan["conversations"] = conversations_result.get("conversations", [])
-        else:
-            plan["conversations"] = conversations_result if isinstance(conversations_result, list) else []
+        # Collect conversations (paginated, so large histories are not truncated)
+        plan["conversations"] = [
+            conv async for conv in self._iter_pages("conversations:listPage", {"userId": user_id})
+        ]
 
         # Collect immutable records
-        immutable = await self._execute_with_resilience(
-            lambda: self.client.query(
-                "immutable:list", filter_none_values({"userId": user_id, "limit": 10000})
-            ),
-            "immutable:list",
-        )
-        # Handle both list format (legacy) and dict format (new API with entries)
-        if isinstance(immutable, dict):
-            raw_entries = immutable.get("entries", [])
-        else:
-            raw_entries = immutable if isinstance(immutable, list) else []
-
         # Filter to only include valid dict entries with required fields (type, id)
         # Some API responses might include strings or malformed entries
         plan["immutable"] = [
-            entry for entry in raw_entries
+            entry
+            async for entry in self._iter_pages("immutable:listPage", {"userId": user_id})
             if isinstance(entry, dict) and entry.get("type") and entry.get("id")
         ]
 
@@ -720,20 +718,13 @@ class UsersAPI:
 
         # Collect facts (query only user's memory spaces, not ALL spaces)
         # This is an optimization to avoid O(n) queries where n = total spaces in DB
+        # Facts are streamed page by page; only the user's facts are kept
         all_facts = []
         for space_id in memory_space_ids_to_check:
             try:
-                facts = await self._execute_with_resilience(
-                    lambda sid=space_id: self.client.query(
-                        "facts:list",
-                        filter_none_values({"memorySpaceId": sid, "limit": 10000})
-                    ),
-                    "facts:list",
-                )
-                fact_list = facts if isinstance(facts, list) else facts.get("facts", [])
-                # Filter for this user
-                user_facts = [f for f in fact_list if f.get("userId") == user_id or f.get("sourceUserId") == user_id]
-                all_facts.extend(user_facts)
+                async for f in self._iter_pages("facts:listPage", {"memorySpaceId": space_id}):
+                    if f.get("userId") == user_id or f.get("sourceUserId") == user_id:
+                        all_facts.append(f)
             except:
                 pass  # Space might not have facts
         plan["facts"] = all_facts
@@ -1368,17 +1359,12 @@ class UsersAPI:
             # Include conversations if requested
             if include_conversations:
                 try:
-                    convos_result = await self.client.query(
-                        "conversations:list",
-                        filter_none_values({"userId": user.id}),
-                    )
-                    # Handle both array and paginated result formats
-                    convos = (
-                        convos_result
-                        if isinstance(convos_result, list)
-                        else convos_result.get("conversations", [])
-                    )
-                    user_data["conversations"] = convos
+                    user_data["conversations"] = [
+                        convo
+                        async for convo in self._iter_pages(
+                            "conversations:listPage", {"userId": user.id}
+                        )
+                    ]
                 except Exception:
                     # Skip if conversations unavailable
                     pass
@@ -1398,15 +1384,11 @@ class UsersAPI:
                         # Query memories from each memory space
                         for memory_space_id in memory_space_ids:
                             try:
-                                memories = await self.client.query(
-                                    "memories:list",
-                                    filter_none_values({
-                                        "memorySpaceId": memory_space_id,
-                                        "userId": user.id,
-                                    }),
-                                )
-                                if isinstance(memories, list):
-                                    all_memories.extend(memories)
+                                async for memory in self._iter_pages(
+                                    "memories:listPage",
+                                    {"memorySpaceId": memory_space_id, "userId": user.id},
+                                ):
+                                    all_memories.append(memory)
                             except Exception:
                                 # Skip unavailable memory spaces
                                 pass
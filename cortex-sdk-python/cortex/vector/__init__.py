@@ -4,13 +4,17 @@ Cortex SDK - Vector Memory API
 Layer 2: Searchable memory with embeddings and versioning
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, cast
 
+from .._pagination import iterate_pages
 from .._utils import convert_convex_response, filter_none_values
 from ..errors import CortexError, ErrorCode  # noqa: F401
 from ..types import (
     AuthContext,
+    ChunkDigestPageResult,
+    ChunkWatermark,
     DeleteMemoryOptions,
+    ListMemoriesPageResult,
     MemoryEntry,
     SearchOptions,
     SourceType,
@@ -578,6 +582,185 @@ class VectorAPI:
 
         return [MemoryEntry(**convert_convex_response(mem)) for mem in result]
 
+    async def list_page(
+        self,
+        memory_space_id: str,
+        cursor: Optional[str] = None,
+        page_size: int = 500,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+    ) -> ListMemoriesPageResult:
+        """
+        List one page of a memory space using cursor pagination.
+
+        Unlike list(), which returns at most ``limit`` memories, pages cover
+        the whole memory space (or the createdAt window) in creation order.
+        Pass ``continue_cursor`` from the previous page until ``is_done`` is
+        True.
+
+        Args:
+            memory_space_id: Memory space ID
+            cursor: Cursor from the previous page (None for the first page)
+            page_size: Maximum memories per page
+            created_after: Only memories created at or after this time (ms)
+            created_before: Only memories created at or before this time (ms)
+
+        Returns:
+            Page of memories with the cursor for the next page
+
+        Example:
+            >>> cursor = None
+            >>> while True:
+            ...     page = await cortex.vector.list_page('agent-1', cursor)
+            ...     process(page.memories)
+            ...     if page.is_done:
+            ...         break
+            ...     cursor = page.continue_cursor
+        """
+        validate_memory_space_id(memory_space_id)
+        validate_limit(page_size, "page_size")
+
+        result = await self._execute_with_resilience(
+            lambda: self.client.query(
+                "memories:listPage",
+                filter_none_values({
+                    "memorySpaceId": memory_space_id,
+                    "tenantId": self._tenant_id,
+                    "createdAfter": created_after,
+                    "createdBefore": created_before,
+                    "paginationOpts": {"numItems": page_size, "cursor": cursor},
+                }),
+            ),
+            "memories:listPage",
+        )
+
+        return ListMemoriesPageResult(
+            memories=[
+                MemoryEntry(**convert_convex_response(mem)) for mem in result["page"]
+            ],
+            continue_cursor=result.get("continueCursor"),
+            is_done=bool(result.get("isDone", True)),
+        )
+
+    def iter(
+        self,
+        memory_space_id: str,
+        user_id: Optional[str] = None,
+        participant_id: Optional[str] = None,
+        source_type: Optional[SourceType] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        page_size: int = 500,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[MemoryEntry]:
+        """
+        Iterate over every memory in a memory space using cursor pagination.
+
+        Memories are yielded in creation order. The next page is fetched
+        while the caller processes the current one, so at most two pages are
+        held in memory regardless of space size.
+
+        Args:
+            memory_space_id: Memory space ID
+            user_id: Filter by user ID
+            participant_id: Filter by participant ID
+            source_type: Filter by source type
+            created_after: Only memories created at or after this time (ms)
+            created_before: Only memories created at or before this time (ms)
+            page_size: Maximum memories scanned per page
+            limit: Stop after this many memories
+
+        Returns:
+            Async iterator of memory entries
+
+        Example:
+            >>> async for memory in cortex.vector.iter('agent-1', user_id='user-123'):
+            ...     process(memory)
+        """
+        validate_memory_space_id(memory_space_id)
+        validate_limit(page_size, "page_size")
+
+        if user_id is not None:
+            validate_user_id(user_id)
+
+        if source_type is not None:
+            validate_source_type(source_type)
+
+        if limit is not None:
+            validate_limit(limit)
+
+        args = filter_none_values({
+            "memorySpaceId": memory_space_id,
+            "tenantId": self._tenant_id,
+            "userId": user_id,
+            "participantId": participant_id,
+            "sourceType": source_type,
+            "createdAfter": created_after,
+            "createdBefore": created_before,
+        })
+
+        async def fetch_page(cursor: Optional[str]) -> Any:
+            return await self._execute_with_resilience(
+                lambda: self.client.query(
+                    "memories:listPage",
+                    {**args, "paginationOpts": {"numItems": page_size, "cursor": cursor}},
+                ),
+                "memories:listPage",
+            )
+
+        return iterate_pages(
+            fetch_page,
+            lambda mem: MemoryEntry(**convert_convex_response(mem)),
+            limit=limit,
+        )
+
+    async def chunk_digests(
+        self,
+        memory_space_id: str,
+        chunk_ms: int,
+        cursor: Optional[str] = None,
+        page_size: int = 500,
+    ) -> ChunkDigestPageResult:
+        """
+        Per-chunk watermarks for one page of a memory space.
+
+        Memories are bucketed by createdAt into ``chunk_ms`` windows; each
+        chunk reports its count, newest updatedAt and timestamp/version sums
+        without transferring the memories. A chunk can span pages, so
+        callers merge chunks with the same number.
+
+        Args:
+            memory_space_id: Memory space ID
+            chunk_ms: Chunk window in milliseconds
+            cursor: Cursor from the previous page (None for the first page)
+            page_size: Maximum memories scanned per page
+
+        Returns:
+            Chunk watermarks with the cursor for the next page
+        """
+        validate_memory_space_id(memory_space_id)
+        validate_limit(chunk_ms, "chunk_ms")
+        validate_limit(page_size, "page_size")
+
+        result = await self._execute_with_resilience(
+            lambda: self.client.query(
+                "memories:chunkDigests",
+                filter_none_values({
+                    "memorySpaceId": memory_space_id,
+                    "tenantId": self._tenant_id,
+                    "chunkMs": chunk_ms,
+                    "paginationOpts": {"numItems": page_size, "cursor": cursor},
+                }),
+            ),
+            "memories:chunkDigests",
+        )
+
+        return ChunkDigestPageResult(
+            chunks=[ChunkWatermark(**convert_convex_response(c)) for c in result["page"]],
+            continue_cursor=result.get("continueCursor"),
+            is_done=bool(result.get("isDone", True)),
+        )
+
     async def export(
         self,
         memory_space_id: str,
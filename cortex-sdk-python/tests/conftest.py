@@ -338,3 +338,6 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: Tests that take longer to run"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: Wall-clock benchmarks, deselected by default"
+    )
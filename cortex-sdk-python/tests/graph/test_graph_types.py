@@ -493,6 +493,34 @@ class TestTraversalConfig:
         assert config.direction == "OUTGOING"
         assert "KNOWS" in config.relationship_types
 
+    def test_bounded_traversal_defaults(self):
+        """Test traversal bounds are unset by default."""
+        config = TraversalConfig(
+            start_id="node-1",
+            relationship_types=[],
+            max_depth=2,
+        )
+        assert config.max_results is None
+        assert config.max_fan_out is None
+        assert config.exclude_labels is None
+        assert config.exclude_relationship_types is None
+
+    def test_bounded_traversal_config(self):
+        """Test hub-aware traversal options."""
+        config = TraversalConfig(
+            start_id="node-1",
+            relationship_types=[],
+            max_depth=2,
+            max_results=500,
+            max_fan_out=50,
+            exclude_labels=["User", "MemorySpace"],
+            exclude_relationship_types=["IN_SPACE"],
+        )
+        assert config.max_results == 500
+        assert config.max_fan_out == 50
+        assert "MemorySpace" in config.exclude_labels
+        assert config.exclude_relationship_types == ["IN_SPACE"]
+
 
 class TestShortestPathConfig:
     """Tests for ShortestPathConfig dataclass."""
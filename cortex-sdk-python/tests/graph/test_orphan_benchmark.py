@@ -0,0 +1,180 @@
+"""
+Orphan Detection Benchmark
+
+Benchmarks set-based detect_orphans() against per-node detect_orphan()
+calls on a synthetic graph shaped like a large conversation: one Fact
+mentioning many Entities, some of which are also mentioned by other Facts
+and some linked to each other.
+
+Runs only when a graph database is configured. The correctness check runs
+with the graph tests; the timing comparison only with ``-m benchmark``:
+    NEO4J_URI=bolt://localhost:7687 pytest tests/graph/test_orphan_benchmark.py -m benchmark -n 0 -s
+"""
+
+import os
+import random
+import time
+
+import pytest
+
+GRAPH_TESTING_ENABLED = bool(os.getenv("NEO4J_URI") or os.getenv("MEMGRAPH_URI"))
+
+if not GRAPH_TESTING_ENABLED:
+    pytest.skip("Graph database not configured (set NEO4J_URI or MEMGRAPH_URI)", allow_module_level=True)
+
+neo4j = pytest.importorskip("neo4j", reason="neo4j not installed (install with: pip install cortex-memory[graph])")
+
+from cortex.graph.adapters.cypher import CypherGraphAdapter
+from cortex.graph.orphan_detection import (
+    create_deletion_context,
+    detect_orphan,
+    detect_orphans,
+)
+from cortex.types import GraphConnectionConfig
+
+pytestmark = [pytest.mark.graph, pytest.mark.slow]
+
+BENCH_TAG = "orphan-bench"
+ENTITY_COUNT = int(os.getenv("ORPHAN_BENCH_ENTITIES", "500"))
+
+GRAPH_CONFIG = GraphConnectionConfig(
+    uri=os.getenv("NEO4J_URI") or os.getenv("MEMGRAPH_URI", "bolt://localhost:7687"),
+    username=os.getenv("NEO4J_USERNAME", "neo4j"),
+    password=os.getenv("NEO4J_PASSWORD", "cortex-dev-password"),
+)
+
+
+class CountingAdapter:
+    """Wraps an adapter and counts query round-trips."""
+
+    def __init__(self, adapter: CypherGraphAdapter) -> None:
+        self._adapter = adapter
+        self.queries = 0
+
+    def __getattr__(self, name):
+        return getattr(self._adapter, name)
+
+    async def query(self, cypher, params=None):
+        self.queries += 1
+        return await self._adapter.query(cypher, params)
+
+
+@pytest.fixture(scope="module")
+async def bench_graph():
+    """Load the synthetic graph once, return (adapter, fact_id, entity_ids)."""
+    adapter = CypherGraphAdapter()
+    await adapter.connect(GRAPH_CONFIG)
+    id_func = adapter._get_id_function()
+    rng = random.Random(7)
+
+    await adapter.query("MATCH (n {benchTag: $tag}) DETACH DELETE n", {"tag": BENCH_TAG})
+    await adapter.query(
+        """
+        CREATE (:Fact {benchTag: $tag, factId: 'deleted'})
+        CREATE (:Fact {benchTag: $tag, factId: 'other'})
+        WITH 1 AS _
+        UNWIND range(0, $count - 1) AS i
+        CREATE (:Entity {benchTag: $tag, idx: i})
+        """,
+        {"tag": BENCH_TAG, "count": ENTITY_COUNT},
+    )
+    await adapter.query(
+        """
+        MATCH (f:Fact {benchTag: $tag, factId: 'deleted'}), (e:Entity {benchTag: $tag})
+        CREATE (f)-[:MENTIONS]->(e)
+        """,
+        {"tag": BENCH_TAG},
+    )
+    # A third of the entities stay anchored by another fact
+    await adapter.query(
+        """
+        MATCH (f:Fact {benchTag: $tag, factId: 'other'}), (e:Entity {benchTag: $tag})
+        WHERE e.idx % 3 = 0
+        CREATE (f)-[:MENTIONS]->(e)
+        """,
+        {"tag": BENCH_TAG},
+    )
+    # Sparse entity-to-entity links create islands of varying size
+    links = [
+        [rng.randrange(ENTITY_COUNT), rng.randrange(ENTITY_COUNT)]
+        for _ in range(ENTITY_COUNT // 2)
+    ]
+    await adapter.query(
+        """
+        UNWIND $links AS l
+        MATCH (a:Entity {benchTag: $tag, idx: l[0]}), (b:Entity {benchTag: $tag, idx: l[1]})
+        CREATE (a)-[:RELATED_TO]->(b)
+        """,
+        {"tag": BENCH_TAG, "links": links},
+    )
+
+    ids = await adapter.query(
+        f"""
+        MATCH (f:Fact {{benchTag: $tag, factId: 'deleted'}})
+        MATCH (e:Entity {{benchTag: $tag}})
+        RETURN {id_func}(f) AS factId, collect({id_func}(e)) AS entityIds
+        """,
+        {"tag": BENCH_TAG},
+    )
+    record = ids.records[0]
+
+    yield adapter, str(record["factId"]), [str(e) for e in record["entityIds"]]
+
+    await adapter.query("MATCH (n {benchTag: $tag}) DETACH DELETE n", {"tag": BENCH_TAG})
+    await adapter.disconnect()
+
+
+def _deletion_context(fact_id):
+    ctx = create_deletion_context("benchmark")
+    ctx.deleted_node_ids.add(fact_id)
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_set_based_detection_matches_per_node(bench_graph):
+    """detect_orphans() agrees with detect_orphan() in fewer queries."""
+    adapter, fact_id, entity_ids = bench_graph
+    nodes = {entity_id: "Entity" for entity_id in entity_ids}
+    ctx = _deletion_context(fact_id)
+
+    per_node = CountingAdapter(adapter)
+    single_results = {
+        entity_id: await detect_orphan(entity_id, "Entity", ctx, per_node)
+        for entity_id in entity_ids
+    }
+    batched = CountingAdapter(adapter)
+    batch_results = await detect_orphans(nodes, ctx, batched)
+
+    assert batched.queries < per_node.queries
+    for entity_id in entity_ids:
+        assert batch_results[entity_id].is_orphan == single_results[entity_id].is_orphan
+        assert (
+            batch_results[entity_id].part_of_circular_island
+            == single_results[entity_id].part_of_circular_island
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_benchmark_orphan_detection(bench_graph):
+    """Set-based detection versus one detect_orphan() per candidate."""
+    adapter, fact_id, entity_ids = bench_graph
+    nodes = {entity_id: "Entity" for entity_id in entity_ids}
+    ctx = _deletion_context(fact_id)
+
+    per_node = CountingAdapter(adapter)
+    start = time.perf_counter()
+    for entity_id in entity_ids:
+        await detect_orphan(entity_id, "Entity", ctx, per_node)
+    per_node_ms = (time.perf_counter() - start) * 1000
+
+    batched = CountingAdapter(adapter)
+    start = time.perf_counter()
+    await detect_orphans(nodes, ctx, batched)
+    batched_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\n[orphan benchmark] candidates={len(entity_ids)}\n"
+        f"  per-node : {per_node.queries:6d} queries {per_node_ms:9.1f} ms\n"
+        f"  batched  : {batched.queries:6d} queries {batched_ms:9.1f} ms"
+    )
@@ -0,0 +1,177 @@
+"""
+Traversal Benchmark
+
+Benchmarks CypherGraphAdapter.traverse() on a synthetic power-law graph
+(preferential attachment), comparing the bounded BFS traversal against the
+variable-length path match it replaced. Starts from the highest-degree hub,
+which is the case that used to time out.
+
+Runs only when a graph database is configured. The correctness checks run
+with the graph tests; the timing comparison only with ``-m benchmark``:
+    NEO4J_URI=bolt://localhost:7687 pytest tests/graph/test_traversal_benchmark.py -m benchmark -n 0 -s
+"""
+
+import os
+import random
+import time
+
+import pytest
+
+GRAPH_TESTING_ENABLED = bool(os.getenv("NEO4J_URI") or os.getenv("MEMGRAPH_URI"))
+
+if not GRAPH_TESTING_ENABLED:
+    pytest.skip("Graph database not configured (set NEO4J_URI or MEMGRAPH_URI)", allow_module_level=True)
+
+neo4j = pytest.importorskip("neo4j", reason="neo4j not installed (install with: pip install cortex-memory[graph])")
+
+from cortex.graph.adapters.cypher import CypherGraphAdapter
+from cortex.types import GraphConnectionConfig, TraversalConfig
+
+pytestmark = [pytest.mark.graph, pytest.mark.slow]
+
+BENCH_LABEL = "BenchNode"
+BENCH_HUB_LABEL = "BenchHub"
+NODE_COUNT = int(os.getenv("TRAVERSAL_BENCH_NODES", "5000"))
+EDGES_PER_NODE = 3
+
+GRAPH_CONFIG = GraphConnectionConfig(
+    uri=os.getenv("NEO4J_URI") or os.getenv("MEMGRAPH_URI", "bolt://localhost:7687"),
+    username=os.getenv("NEO4J_USERNAME", "neo4j"),
+    password=os.getenv("NEO4J_PASSWORD", "cortex-dev-password"),
+)
+
+
+def generate_power_law_edges(node_count: int, edges_per_node: int, seed: int = 42):
+    """Barabási–Albert style preferential attachment edge list."""
+    rng = random.Random(seed)
+    edges = []
+    # Each endpoint appears once per incident edge, so sampling is degree-weighted
+    endpoints = list(range(edges_per_node))
+    for node in range(edges_per_node, node_count):
+        targets = set()
+        while len(targets) < edges_per_node:
+            targets.add(rng.choice(endpoints))
+        for target in targets:
+            edges.append((node, target))
+            endpoints.extend([node, target])
+    return edges
+
+
+@pytest.fixture(scope="module")
+async def bench_graph():
+    """Load the synthetic graph once per module, return (adapter, hub_id, hubs)."""
+    adapter = CypherGraphAdapter()
+    await adapter.connect(GRAPH_CONFIG)
+
+    await adapter.query(f"MATCH (n:{BENCH_LABEL}) DETACH DELETE n")
+    await adapter.query(
+        f"UNWIND range(0, $count - 1) AS i CREATE (:{BENCH_LABEL} {{idx: i}})",
+        {"count": NODE_COUNT},
+    )
+
+    edges = generate_power_law_edges(NODE_COUNT, EDGES_PER_NODE)
+    for i in range(0, len(edges), 5000):
+        await adapter.query(
+            f"""
+            UNWIND $edges AS e
+            MATCH (a:{BENCH_LABEL} {{idx: e[0]}}), (b:{BENCH_LABEL} {{idx: e[1]}})
+            CREATE (a)-[:LINKS]->(b)
+            """,
+            {"edges": [list(e) for e in edges[i:i + 5000]]},
+        )
+
+    # Label the top hubs so they can be excluded
+    degree: dict = {}
+    for a, b in edges:
+        degree[a] = degree.get(a, 0) + 1
+        degree[b] = degree.get(b, 0) + 1
+    hubs = sorted(degree, key=degree.get, reverse=True)[:10]
+    await adapter.query(
+        f"UNWIND $hubs AS h MATCH (n:{BENCH_LABEL} {{idx: h}}) SET n:{BENCH_HUB_LABEL}",
+        {"hubs": hubs},
+    )
+
+    hub_nodes = await adapter.find_nodes(BENCH_LABEL, {"idx": hubs[0]}, 1)
+
+    yield adapter, hub_nodes[0].id, set(hubs)
+
+    await adapter.query(f"MATCH (n:{BENCH_LABEL}) DETACH DELETE n")
+    await adapter.disconnect()
+
+
+async def _timed_traverse(adapter, config):
+    start = time.perf_counter()
+    nodes = await adapter.traverse(config)
+    return nodes, (time.perf_counter() - start) * 1000
+
+
+async def _legacy_traverse(adapter, hub_id):
+    """The variable-length path match the BFS traversal replaced."""
+    id_func = adapter._get_id_function()
+    return await adapter.query(
+        f"""
+        MATCH (start) WHERE {id_func}(start) = $startId
+        MATCH path = (start)-[*1..2]-(connected)
+        RETURN DISTINCT {id_func}(connected) as id
+        """,
+        {"startId": adapter._convert_id_for_query(hub_id)},
+    )
+
+
+UNBOUNDED = {"relationship_types": [], "max_depth": 2}
+BOUNDED = {
+    **UNBOUNDED,
+    "max_fan_out": 25,
+    "max_results": 200,
+    "exclude_labels": [BENCH_HUB_LABEL],
+}
+
+
+@pytest.mark.asyncio
+async def test_bfs_matches_variable_length_paths(bench_graph):
+    """BFS from the biggest hub reaches the same nodes as path matching."""
+    adapter, hub_id, _ = bench_graph
+
+    legacy = await _legacy_traverse(adapter, hub_id)
+    bfs_nodes = await adapter.traverse(TraversalConfig(start_id=hub_id, **UNBOUNDED))
+
+    # Same reachable set, minus the start node which cyclic paths can revisit
+    legacy_ids = {str(r["id"]) for r in legacy.records} - {hub_id}
+    assert {n.id for n in bfs_nodes} == legacy_ids
+    assert all(n.depth in (1, 2) for n in bfs_nodes)
+
+
+@pytest.mark.asyncio
+async def test_bounded_traversal_skips_hubs(bench_graph):
+    """Fan-out, result and label bounds hold from the biggest hub."""
+    adapter, hub_id, hubs = bench_graph
+
+    bounded_nodes = await adapter.traverse(TraversalConfig(start_id=hub_id, **BOUNDED))
+
+    assert len(bounded_nodes) <= 200
+    assert all(n.properties["idx"] not in hubs for n in bounded_nodes)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_benchmark_hub_traversal(bench_graph):
+    """Bounded BFS from the biggest hub versus variable-length path matching."""
+    adapter, hub_id, _ = bench_graph
+
+    start = time.perf_counter()
+    legacy = await _legacy_traverse(adapter, hub_id)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    bfs_nodes, bfs_ms = await _timed_traverse(
+        adapter, TraversalConfig(start_id=hub_id, **UNBOUNDED)
+    )
+    bounded_nodes, bounded_ms = await _timed_traverse(
+        adapter, TraversalConfig(start_id=hub_id, **BOUNDED)
+    )
+
+    print(
+        f"\n[traverse benchmark] nodes={NODE_COUNT} depth=2 from top hub\n"
+        f"  variable-length path : {legacy.count:6d} nodes {legacy_ms:9.1f} ms\n"
+        f"  BFS (unbounded)      : {len(bfs_nodes):6d} nodes {bfs_ms:9.1f} ms\n"
+        f"  BFS (bounded, no hub): {len(bounded_nodes):6d} nodes {bounded_ms:9.1f} ms"
+    )
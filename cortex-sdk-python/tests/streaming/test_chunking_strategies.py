@@ -5,15 +5,30 @@ Tests that validate ACTUAL chunks produced, not just "no errors".
 Verifies chunk content, sizes, overlaps, and boundaries.
 """
 
+import asyncio
+
 import pytest
 
 from cortex.memory.streaming.chunking_strategies import (
     ResponseChunker,
     estimate_optimal_chunk_size,
+    lexical_similarity,
     should_chunk_content,
 )
+from cortex.memory.streaming.tokenizer import HeuristicTokenCounter
 from cortex.memory.streaming_types import ChunkingConfig, ChunkStrategy
 
+PASTA = (
+    "Boil the pasta in salted water until the pasta is al dente. "
+    "Drain the pasta and keep a cup of the pasta water. "
+    "Toss the pasta with the sauce and a splash of pasta water. "
+)
+STARS = (
+    "Telescopes collect starlight with large mirrors. "
+    "Bigger telescope mirrors gather fainter starlight from distant galaxies. "
+    "Astronomers point telescopes at galaxies to study starlight."
+)
+
 
 class TestResponseChunker:
     """Test suite for ResponseChunker with actual chunk validation"""
@@ -75,27 +90,31 @@ class TestResponseChunker:
             assert current_end == next_start, f"Chunks {i} and {i+1} don't overlap correctly"
 
     @pytest.mark.asyncio
-    async def test_token_chunking_estimates_correctly(self):
+    async def test_token_chunking_cuts_on_token_boundaries(self):
         """
-        Test: Token chunking uses correct estimation (1 token ≈ 4 chars)
-        Validates: Chunk sizes match token limits
+        Test: Token chunking counts real tokens, not 4-char estimates
+        Validates: Every chunk holds exactly max tokens and chunks tile the content
         """
         chunker = ResponseChunker()
+        counter = HeuristicTokenCounter()
         content = "word " * 200  # 1000 chars total
 
         config = ChunkingConfig(
             strategy=ChunkStrategy.TOKEN,
-            max_chunk_size=100,  # 100 tokens = ~400 chars
+            max_chunk_size=100,
             overlap_size=0,
             preserve_boundaries=False,
+            token_counter=counter,
         )
 
         chunks = await chunker.chunk_content(content, config)
 
         # CRITICAL: Validate token-based sizing
-        for chunk in chunks:
-            # Each chunk should be ~400 chars (100 tokens × 4)
-            assert len(chunk.content) <= 400, f"Chunk exceeds token limit: {len(chunk.content)} chars"
+        assert "".join(c.content for c in chunks) == content
+        for chunk in chunks[:-1]:
+            assert counter.count(chunk.content) == 100
+            assert chunk.metadata["tokenCount"] == 100
+        assert counter.count(chunks[-1].content) <= 100
 
     @pytest.mark.asyncio
     async def test_sentence_chunking_preserves_boundaries(self):
@@ -253,5 +272,134 @@ class TestResponseChunker:
             assert chunk.metadata["totalChunks"] == len(chunks)
 
 
+class TopicEmbedder:
+    """generate_embedding stub: one axis per topic, tracking concurrent calls"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, text: str):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return [1.0, 0.1] if "pasta" in text else [0.1, 1.0]
+
+
+class TestSemanticChunking:
+    """Semantic chunks split where the topic shifts"""
+
+    @pytest.mark.asyncio
+    async def test_lexical_mode_splits_at_topic_shift(self):
+        """
+        Test: Without embeddings, word overlap finds the topic boundary
+        Validates: Two chunks, one per topic, covering the content exactly
+        """
+        chunker = ResponseChunker()
+        content = PASTA + STARS
+
+        chunks = await chunker.chunk_content(
+            content, ChunkingConfig(strategy=ChunkStrategy.SEMANTIC, max_chunk_size=10)
+        )
+
+        assert [c.content for c in chunks] == [PASTA, STARS]
+        assert chunks[1].start_offset == len(PASTA)
+        assert chunks[1].end_offset == len(content)
+        assert all(c.metadata["totalChunks"] == 2 for c in chunks)
+
+    @pytest.mark.asyncio
+    async def test_embedding_mode_batches_calls(self):
+        """
+        Test: Sentences are embedded in bounded concurrent batches
+        Validates: One call per sentence, at most batch_size in flight
+        """
+        chunker = ResponseChunker()
+        embed = TopicEmbedder()
+
+        chunks = await chunker.chunk_content(
+            PASTA + STARS,
+            ChunkingConfig(
+                strategy=ChunkStrategy.SEMANTIC,
+                max_chunk_size=10,
+                generate_embedding=embed,
+                embedding_batch_size=2,
+            ),
+        )
+
+        assert [c.content for c in chunks] == [PASTA, STARS]
+        assert embed.calls == 6
+        assert embed.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_embedding_function(self):
+        """
+        Test: A plain (non-async) embedding function works
+        Validates: Split at the explicit similarity threshold
+        """
+        chunker = ResponseChunker()
+
+        chunks = await chunker.chunk_content(
+            PASTA + STARS,
+            ChunkingConfig(
+                strategy=ChunkStrategy.SEMANTIC,
+                max_chunk_size=10,
+                generate_embedding=lambda text: [1.0, 0.0] if "pasta" in text else [0.0, 1.0],
+                similarity_threshold=0.5,
+            ),
+        )
+
+        assert [c.content for c in chunks] == [PASTA, STARS]
+
+    @pytest.mark.asyncio
+    async def test_max_and_min_chunk_sizes(self):
+        """
+        Test: Chunks stay within min/max sentence counts
+        Validates: Long topics are split, short topic runs are not
+        """
+        chunker = ResponseChunker()
+        content = PASTA * 3 + STARS
+
+        chunks = await chunker.chunk_content(
+            content,
+            ChunkingConfig(strategy=ChunkStrategy.SEMANTIC, max_chunk_size=4, min_chunk_size=2),
+        )
+
+        sentence_counts = [c.content.count(".") for c in chunks]
+        assert all(2 <= count <= 4 for count in sentence_counts)
+        assert "".join(c.content for c in chunks) == content
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_falls_back_to_lexical(self):
+        """
+        Test: A failing embedding function does not fail chunking
+        Validates: Lexical similarity still finds the boundary
+        """
+        chunker = ResponseChunker()
+
+        def broken(text):
+            raise RuntimeError("model offline")
+
+        chunks = await chunker.chunk_content(
+            PASTA + STARS,
+            ChunkingConfig(
+                strategy=ChunkStrategy.SEMANTIC, max_chunk_size=10, generate_embedding=broken
+            ),
+        )
+
+        assert [c.content for c in chunks] == [PASTA, STARS]
+
+    def test_lexical_similarity(self):
+        """
+        Test: Lexical similarity ignores stopwords and case
+        Validates: Shared content words score higher than unrelated text
+        """
+        assert lexical_similarity("The Pasta water", "pasta water") == pytest.approx(1.0)
+        assert lexical_similarity("the and with", "the and with") == 0.0
+        assert lexical_similarity(PASTA, STARS) < lexical_similarity(PASTA, PASTA[:60])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
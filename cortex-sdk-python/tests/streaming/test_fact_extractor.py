@@ -0,0 +1,166 @@
+"""
+Progressive Fact Extractor Tests
+
+Tests that extraction only sends the unprocessed window to the LLM, runs
+in the background without stalling the stream, and coalesces triggers
+while an extraction is in flight.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from cortex.memory.streaming.fact_extractor import (
+    ProgressiveFactExtractor,
+    ProgressiveFactExtractorConfig,
+)
+from cortex.memory.streaming.stream_processor import (
+    StreamProcessor,
+    create_stream_context,
+)
+from cortex.memory.streaming_types import StreamHooks
+
+
+class MockFactsAPI:
+    """Stores facts in memory"""
+
+    def __init__(self) -> None:
+        self.stored: List[Any] = []
+
+    async def store(self, params, options=None):
+        fact = SimpleNamespace(
+            fact_id=f"fact-{len(self.stored)}", confidence=params.confidence, tags=params.tags
+        )
+        self.stored.append(fact)
+        return fact
+
+
+class RecordingLLM:
+    """extract_facts stub that records the text it was given"""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.inputs: List[str] = []
+
+    async def __call__(self, user_message: str, content: str):
+        self.inputs.append(content)
+        await asyncio.sleep(self.delay)
+        return [{"fact": f"fact {len(self.inputs)}", "factType": "knowledge", "confidence": 80}]
+
+
+def make_extractor(threshold: int = 100, overlap: int = 10) -> ProgressiveFactExtractor:
+    return ProgressiveFactExtractor(
+        MockFactsAPI(),
+        "space-1",
+        "user-1",
+        config=ProgressiveFactExtractorConfig(
+            deduplication=False,
+            extraction_threshold=threshold,
+            context_overlap=overlap,
+        ),
+    )
+
+
+class TestIncrementalWindow:
+    """Only text after the last extraction point is sent"""
+
+    @pytest.mark.asyncio
+    async def test_window_with_overlap(self):
+        extractor = make_extractor(overlap=10)
+        llm = RecordingLLM()
+        content = "a" * 100 + "b" * 100 + "c" * 100
+
+        await extractor.extract_from_chunk(content[:100], 1, llm, "msg", "conv-1")
+        await extractor.extract_from_chunk(content[:200], 2, llm, "msg", "conv-1")
+        await extractor.extract_from_chunk(content, 3, llm, "msg", "conv-1")
+
+        assert llm.inputs == [
+            "a" * 100,
+            "a" * 10 + "b" * 100,
+            "b" * 10 + "c" * 100,
+        ]
+        assert extractor.last_extraction_point == 300
+
+    @pytest.mark.asyncio
+    async def test_total_llm_input_is_linear(self):
+        extractor = make_extractor(threshold=100, overlap=20)
+        llm = RecordingLLM()
+        content = "x" * 10_000
+
+        for end in range(100, len(content) + 1, 100):
+            await extractor.extract_from_chunk(content[:end], end, llm, "msg", "conv-1")
+
+        # 100 extractions: each sends its 100 new characters plus the overlap
+        assert sum(len(text) for text in llm.inputs) == 10_000 + 99 * 20
+
+
+class TestBackgroundExtraction:
+    """schedule_extraction never blocks and coalesces triggers"""
+
+    @pytest.mark.asyncio
+    async def test_triggers_coalesce_while_in_flight(self):
+        extractor = make_extractor(threshold=100)
+        llm = RecordingLLM(delay=0.05)
+
+        content = ""
+        for i in range(10):
+            content += "y" * 100
+            if extractor.should_extract(len(content)):
+                extractor.schedule_extraction(content, i + 1, llm, "msg", "conv-1")
+            await asyncio.sleep(0)
+
+        facts = await extractor.drain()
+
+        # The first trigger ran; the other nine collapsed into one follow-up
+        assert len(llm.inputs) == 2
+        assert extractor.coalesced_triggers == 8
+        assert llm.inputs[1].endswith("y" * 900)
+        assert extractor.last_extraction_point == 1000
+        assert [f.extracted_at_chunk for f in facts] == [1, 10]
+
+    @pytest.mark.asyncio
+    async def test_slow_llm_does_not_stall_stream(self):
+        extractor = make_extractor(threshold=50)
+        llm = RecordingLLM(delay=0.2)
+
+        def on_chunk(event):
+            if extractor.should_extract(event.accumulated_length):
+                extractor.schedule_extraction(event.accumulated, event.chunk_number, llm, "msg", "conv-1")
+
+        async def stream():
+            for i in range(40):
+                await asyncio.sleep(0)
+                yield "token " * 5
+
+        processor = StreamProcessor(
+            create_stream_context("space-1", "conv-1", "user-1", "User"),
+            StreamHooks(on_chunk=on_chunk),
+        )
+
+        start = time.perf_counter()
+        await processor.process_stream(stream())
+        stream_s = time.perf_counter() - start
+        facts = await extractor.drain()
+
+        assert stream_s < 0.2
+        assert len(facts) == len(llm.inputs) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_pending_work(self):
+        extractor = make_extractor(threshold=10)
+        llm = RecordingLLM(delay=1.0)
+
+        extractor.schedule_extraction("z" * 20, 1, llm, "msg", "conv-1")
+        extractor.schedule_extraction("z" * 40, 2, llm, "msg", "conv-1")
+        await asyncio.sleep(0)
+        await extractor.cancel()
+
+        assert len(llm.inputs) == 1
+        assert await extractor.drain() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
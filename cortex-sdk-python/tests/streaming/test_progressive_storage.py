@@ -11,8 +11,10 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from cortex.memory.streaming.progressive_storage_handler import (
+    FNV_OFFSET_BASIS,
     ProgressiveStorageHandler,
     calculate_optimal_update_interval,
+    content_checksum,
 )
 
 
@@ -254,5 +256,171 @@ class TestProgressiveStorageHandler:
         assert medium_interval == 3000, "Medium streams should update every 3s"
 
 
+class FakePartialMemoryStore:
+    """In-memory stand-in for the partial memory mutations"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.content = ""
+        self.checksum = None
+        self.calls = []
+
+    async def mutation(self, name, args):
+        await asyncio.sleep(self.latency)
+        self.calls.append((name, args))
+        if name == "memories:storePartialMemory":
+            self.content = args["content"]
+            return {"memoryId": "partial-mem-1"}
+        if name == "memories:updatePartialMemory":
+            self.content = args["content"]
+            self.checksum = content_checksum(self.content)
+            return {"success": True}
+        if name == "memories:appendPartialMemory":
+            length = len(self.content.encode("utf-16-le")) // 2
+            if length != args["offset"] or self.checksum != args["baseChecksum"]:
+                return {"applied": False}
+            self.content += args["delta"]
+            self.checksum = content_checksum(args["delta"], self.checksum)
+            return {"applied": True}
+        return {"success": True}
+
+    def names(self):
+        return [name.split(":")[1] for name, _ in self.calls]
+
+
+async def make_handler(store, **kwargs):
+    handler = ProgressiveStorageHandler(store, "test-space", "test-conv", "test-user", **kwargs)
+    await handler.initialize_partial_memory(user_message="Test")
+    store.calls.clear()
+    return handler
+
+
+class TestDeltaUpdates:
+    """Updates after the first send only the new suffix"""
+
+    def test_checksum_is_fnv1a_over_utf16(self):
+        assert content_checksum("") == FNV_OFFSET_BASIS
+        assert content_checksum("a") == 0xE40C292C
+        assert content_checksum("lo", content_checksum("hel")) == content_checksum("hello")
+        # Astral characters are two UTF-16 code units, as in JavaScript
+        expected = FNV_OFFSET_BASIS
+        for unit in (0xD83D, 0xDE00):
+            expected = ((expected ^ unit) * 0x01000193) & 0xFFFFFFFF
+        assert content_checksum("😀") == expected
+
+    @pytest.mark.asyncio
+    async def test_appends_only_new_suffix(self):
+        store = FakePartialMemoryStore()
+        handler = await make_handler(store)
+
+        for content in ["Hello", "Hello wor", "Hello world 😀", "Hello world 😀 done"]:
+            assert await handler.update_partial_content(content, chunk_number=1, force=True)
+
+        assert store.names() == ["updatePartialMemory"] + ["appendPartialMemory"] * 3
+        assert [args.get("delta") for _, args in store.calls[1:]] == [" wor", "ld 😀", " done"]
+        assert store.calls[3][1]["offset"] == len("Hello world ") + 2
+        assert store.content == "Hello world 😀 done"
+        assert [u.full_rewrite for u in handler.get_update_history()] == [True, False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_offset_mismatch_falls_back_to_rewrite(self):
+        store = FakePartialMemoryStore()
+        handler = await make_handler(store)
+
+        await handler.update_partial_content("Hello", chunk_number=1, force=True)
+        # Another writer changed the content on the server
+        store.content = "Hellx"
+        store.checksum = content_checksum("Hellx")
+        await handler.update_partial_content("Hello world", chunk_number=2, force=True)
+
+        assert store.names() == ["updatePartialMemory", "appendPartialMemory", "updatePartialMemory"]
+        assert store.content == "Hello world"
+
+        await handler.update_partial_content("Hello world!", chunk_number=3, force=True)
+        assert store.names()[-1] == "appendPartialMemory"
+        assert store.content == "Hello world!"
+
+    @pytest.mark.asyncio
+    async def test_non_extending_content_is_rewritten(self):
+        store = FakePartialMemoryStore()
+        handler = await make_handler(store)
+
+        await handler.update_partial_content("Draft one", chunk_number=1, force=True)
+        await handler.update_partial_content("Draft two", chunk_number=2, force=True)
+
+        assert store.names() == ["updatePartialMemory", "updatePartialMemory"]
+        assert store.content == "Draft two"
+
+    @pytest.mark.asyncio
+    async def test_failed_update_forces_rewrite_next_time(self):
+        store = FakePartialMemoryStore()
+        handler = await make_handler(store)
+        await handler.update_partial_content("Hello", chunk_number=1, force=True)
+
+        original = store.mutation
+
+        async def failing(name, args):
+            raise RuntimeError("network down")
+
+        store.mutation = failing
+        assert await handler.update_partial_content("Hello world", chunk_number=2, force=True) is False
+        store.mutation = original
+
+        await handler.update_partial_content("Hello world!", chunk_number=3, force=True)
+        assert store.names()[-1] == "updatePartialMemory"
+        assert store.content == "Hello world!"
+
+    @pytest.mark.asyncio
+    async def test_bytes_sent_for_40kb_response(self):
+        """40 KB streamed with 40 updates: deltas send each byte once"""
+        store = FakePartialMemoryStore()
+        handler = await make_handler(store)
+
+        body = "".join(f"token{i} " for i in range(6000))[:40_000]
+        step = len(body) // 40
+        for end in range(step, len(body) + 1, step):
+            await handler.update_partial_content(body[:end], chunk_number=end, force=True)
+
+        sent = sum(u.sent_length for u in handler.get_update_history())
+        full_rewrites = sum(u.content_length for u in handler.get_update_history())
+
+        assert store.content == body
+        assert sent == len(body)
+        assert full_rewrites > 20 * sent
+
+
+class TestAdaptiveInterval:
+    """The update interval follows observed mutation latency"""
+
+    @pytest.mark.asyncio
+    async def test_slow_mutations_stretch_interval(self):
+        store = FakePartialMemoryStore(latency=0.1)
+        handler = await make_handler(store, update_interval=1000)
+
+        await handler.update_partial_content("Hello", chunk_number=1, force=True)
+
+        # ~100 ms per mutation -> spend at most 1/20 of the time storing
+        assert 1800 <= handler.update_interval <= 4000
+        assert handler.mutation_latency_ms is not None and handler.mutation_latency_ms >= 100
+
+    @pytest.mark.asyncio
+    async def test_fast_mutations_use_minimum(self):
+        store = FakePartialMemoryStore()
+        handler = await make_handler(store, update_interval=3000, min_update_interval=500)
+
+        await handler.update_partial_content("Hello", chunk_number=1, force=True)
+
+        assert handler.update_interval == 500
+
+    @pytest.mark.asyncio
+    async def test_fixed_interval_when_disabled(self):
+        store = FakePartialMemoryStore(latency=0.05)
+        handler = await make_handler(store, update_interval=3000, adaptive_interval=False)
+
+        await handler.update_partial_content("Hello", chunk_number=1, force=True)
+
+        assert handler.update_interval == 3000
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,234 @@
+"""
+Resume Token Tests
+
+Tests that resume tokens checkpoint into the persisted partial memory
+instead of copying the streamed text, that tokens are deleted once a
+resumed stream succeeds, and that expired tokens are swept.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+import pytest
+
+from cortex.memory import MemoryAPI
+from cortex.memory.streaming.error_recovery import (
+    RESUME_TOKEN_NAMESPACE,
+    ResumableStreamError,
+    StreamErrorRecovery,
+)
+from cortex.memory.streaming_types import (
+    FailureStrategy,
+    ResumeContext,
+    StreamingOptions,
+)
+from tests.streaming.test_stream_finalization import FakeConvexClient, stream_params
+
+STREAMED = ["Résumé ", "tokens 🚀 ", "point at the partial memory. " * 20]
+
+
+class MutableStoreClient(FakeConvexClient):
+    """FakeConvexClient with the mutable-store functions resume tokens use"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.purges: list = []
+
+    async def mutation(self, name: str, args: Dict[str, Any]) -> Any:
+        if name == "mutable:set":
+            self.calls.append(name)
+            self.rows[args["key"]] = {**args, "updatedAt": int(time.time() * 1000)}
+            return self.rows[args["key"]]
+        if name == "mutable:deleteKey":
+            self.calls.append(name)
+            return {"deleted": self.rows.pop(args["key"], None) is not None}
+        if name == "mutable:purgeMany":
+            self.calls.append(name)
+            self.purges.append(args)
+            keys = [
+                key
+                for key, row in self.rows.items()
+                if key.startswith(args.get("keyPrefix", ""))
+                and row["updatedAt"] < args["updatedBefore"]
+            ]
+            for key in keys:
+                del self.rows[key]
+            return {"deleted": len(keys), "namespace": args["namespace"], "keys": keys}
+        return await super().mutation(name, args)
+
+    async def query(self, name: str, args: Dict[str, Any]) -> Any:
+        if name == "mutable:get":
+            return self.rows.get(args["key"])
+        return await super().query(name, args)
+
+
+async def interrupted_stream():
+    for chunk in STREAMED:
+        await asyncio.sleep(0)
+        yield chunk
+    raise ConnectionError("ECONNRESET")
+
+
+async def interrupt(client: MutableStoreClient, **option_overrides: Any) -> str:
+    options = {
+        "store_partial_response": True,
+        "partial_response_interval": 1,
+        "partial_failure_handling": FailureStrategy.STORE_PARTIAL,
+        "generate_resume_token": True,
+        **option_overrides,
+    }
+    with pytest.raises(ResumableStreamError) as excinfo:
+        await MemoryAPI(client).remember_stream(
+            stream_params(responseStream=interrupted_stream()), StreamingOptions(**options)
+        )
+    return excinfo.value.resume_token
+
+
+class TestResumeCheckpoints:
+    """Tokens reference the partial memory by offset and checksum"""
+
+    @pytest.mark.asyncio
+    async def test_token_stores_checkpoint_not_content(self):
+        client = MutableStoreClient()
+        token = await interrupt(client)
+        streamed = "".join(STREAMED)
+
+        value = client.rows[token]["value"]
+        assert client.rows[token]["namespace"] == RESUME_TOKEN_NAMESPACE
+        assert "accumulatedContent" not in value
+        assert value["contentOffset"] == len(streamed.encode("utf-16-le")) // 2
+        assert value["partialMemoryId"] == "mem-partial-1"
+
+        # The failure flushed everything streamed into the partial memory
+        assert client.memories["mem-partial-1"]["content"] == streamed
+
+        context = await StreamErrorRecovery(client).validate_resume_token(token)
+        assert context is not None
+        assert context.accumulated_content == streamed
+        assert context.last_processed_chunk == len(STREAMED)
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_is_a_prefix_of_the_partial_memory(self):
+        client = MutableStoreClient()
+        token = await interrupt(client)
+        client.memories["mem-partial-1"]["content"] += " (appended later)"
+
+        context = await StreamErrorRecovery(client).validate_resume_token(token)
+        assert context is not None
+        assert context.accumulated_content == "".join(STREAMED)
+
+    @pytest.mark.asyncio
+    async def test_rewritten_partial_memory_is_rejected(self):
+        client = MutableStoreClient()
+        token = await interrupt(client)
+        client.memories["mem-partial-1"]["content"] = "x" * 1000
+
+        assert await StreamErrorRecovery(client).validate_resume_token(token) is None
+
+    @pytest.mark.asyncio
+    async def test_without_partial_memory_content_is_kept_inline(self):
+        client = MutableStoreClient()
+        recovery = StreamErrorRecovery(client)
+
+        token = await recovery.generate_resume_token(
+            ResumeContext(
+                resume_token="",
+                last_processed_chunk=2,
+                accumulated_content="only copy",
+                partial_memory_id="",
+                facts_extracted=[],
+                timestamp=0,
+                checksum=recovery._calculate_checksum("only copy"),
+            )
+        )
+
+        assert client.rows[token]["value"]["accumulatedContent"] == "only copy"
+        context = await recovery.validate_resume_token(token)
+        assert context is not None and context.accumulated_content == "only copy"
+
+
+class TestResumeTokenCleanup:
+    """Tokens are deleted on success and swept after the TTL"""
+
+    @pytest.mark.asyncio
+    async def test_successful_stream_deletes_its_resume_token(self):
+        client = MutableStoreClient()
+        token = await interrupt(client)
+        assert token in client.rows
+
+        await MemoryAPI(client).remember_stream(
+            stream_params(), StreamingOptions(resume_token=token)
+        )
+
+        assert token not in client.rows
+        assert client.calls.count("mutable:deleteKey") == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_purges_only_expired_tokens(self):
+        client = MutableStoreClient()
+        recovery = StreamErrorRecovery(client)
+        fresh = await interrupt(client)
+        client.rows["resume_old"] = {"updatedAt": 0, "value": {}}
+
+        assert await recovery.sweep_expired_resume_tokens() == 1
+        assert set(client.rows) == {fresh}
+
+        purge = client.purges[0]
+        assert purge["namespace"] == RESUME_TOKEN_NAMESPACE
+        assert purge["keyPrefix"] == "resume_"
+        assert purge["updatedBefore"] <= int(time.time() * 1000) - recovery.resume_token_ttl
+
+    @pytest.mark.asyncio
+    async def test_sweeper_runs_periodically(self):
+        client = MutableStoreClient()
+        sweeper = StreamErrorRecovery(client).start_resume_token_sweeper(interval_ms=10)
+
+        await asyncio.sleep(0.035)
+        sweeper.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await sweeper
+
+        assert len(client.purges) >= 2
+
+
+class TestResumableExit:
+    """A resumable failure still stops background work"""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_fact_extraction_is_cancelled(self):
+        started = asyncio.Event()
+        cancelled: list = []
+
+        async def slow_extract(user_message: str, content: str):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(content)
+                raise
+            return []
+
+        async def stream():
+            for chunk in STREAMED:
+                yield chunk
+            await asyncio.wait_for(started.wait(), 1)
+            raise ConnectionError("ECONNRESET")
+
+        with pytest.raises(ResumableStreamError):
+            await MemoryAPI(MutableStoreClient()).remember_stream(
+                stream_params(responseStream=stream(), extractFacts=slow_extract),
+                StreamingOptions(
+                    progressive_fact_extraction=True,
+                    fact_extraction_threshold=10,
+                    partial_failure_handling=FailureStrategy.STORE_PARTIAL,
+                    generate_resume_token=True,
+                ),
+            )
+
+        assert len(cancelled) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
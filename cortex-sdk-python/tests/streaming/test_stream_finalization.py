@@ -0,0 +1,334 @@
+"""
+Stream Finalization Tests
+
+Tests that remember_stream() promotes the partial memory in place instead of
+storing a second agent memory, embeds the full response once, and only sends
+text progressive extraction has not covered for final fact extraction.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+
+from cortex.memory import MemoryAPI
+
+# Each chunk is longer than the extractor's context overlap
+RESPONSE_CHUNKS = [
+    sentence * 8
+    for sentence in (
+        "Paris is the capital of France. ",
+        "It has been the capital for centuries. ",
+        "The Eiffel Tower was completed in 1889. ",
+        "The city has about two million residents. ",
+    )
+]
+FULL_RESPONSE = "".join(RESPONSE_CHUNKS)
+
+
+class FakeConvexClient:
+    """In-memory stand-in for the Convex functions remember_stream() uses"""
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+        self.memories: Dict[str, Dict[str, Any]] = {}
+        self.facts: List[Dict[str, Any]] = []
+        self.messages: List[Dict[str, Any]] = []
+
+    def _memory(self, memory_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "_id": f"doc-{memory_id}",
+            "memoryId": memory_id,
+            "memorySpaceId": args.get("memorySpaceId", "space-1"),
+            "content": args.get("content", ""),
+            "contentType": "raw",
+            "sourceType": "conversation",
+            "sourceTimestamp": 0,
+            "importance": args.get("importance", 50),
+            "tags": list(args.get("tags", [])),
+            "version": 1,
+            "previousVersions": [],
+            "createdAt": 0,
+            "updatedAt": 0,
+            "accessCount": 0,
+            "userId": args.get("userId"),
+            "conversationRef": args.get("conversationRef")
+            or {"conversationId": args.get("conversationId", "conv-1"), "messageIds": []},
+        }
+
+    async def mutation(self, name: str, args: Dict[str, Any]) -> Any:
+        self.calls.append(name)
+
+        if name == "memories:storePartialMemory":
+            memory_id = "mem-partial-1"
+            self.memories[memory_id] = {**self._memory(memory_id, args), "isPartial": True}
+            return {"memoryId": memory_id, "_id": f"doc-{memory_id}"}
+
+        if name == "memories:updatePartialMemory":
+            self.memories[args["memoryId"]]["content"] = args["content"]
+            return {"success": True, "contentLength": len(args["content"]), "checksum": 0}
+
+        if name == "memories:appendPartialMemory":
+            return {"applied": False}
+
+        if name == "memories:finalizePartialMemory":
+            memory = self.memories[args["memoryId"]]
+            memory.update(
+                content=args["content"],
+                embedding=args.get("embedding"),
+                isPartial=False,
+                tags=[t for t in memory["tags"] if t not in ("streaming", "partial")],
+            )
+            if "messageIds" in args:
+                memory["conversationRef"]["messageIds"] = args["messageIds"]
+                memory["agentId"] = args.get("agentId")
+                memory["messageRole"] = args.get("messageRole")
+            final = {k: v for k, v in memory.items() if k not in ("isPartial", "partialMetadata")}
+            return {"success": True, "memory": final}
+
+        if name == "memories:store":
+            memory_id = f"mem-{len(self.memories)}"
+            self.memories[memory_id] = self._memory(memory_id, args)
+            return dict(self.memories[memory_id])
+
+        if name == "conversations:addMessage":
+            self.messages.append(args["message"])
+            return {
+                "_id": "doc-conv-1",
+                "conversationId": args["conversationId"],
+                "memorySpaceId": "space-1",
+                "type": "user-agent",
+                "participants": {},
+                "messages": list(self.messages),
+                "messageCount": len(self.messages),
+                "metadata": None,
+                "createdAt": 0,
+                "updatedAt": 0,
+            }
+
+        if name == "facts:store":
+            fact = {
+                "_id": f"doc-fact-{len(self.facts)}",
+                "factId": f"fact-{len(self.facts)}",
+                "memorySpaceId": args["memorySpaceId"],
+                "fact": args["fact"],
+                "factType": args["factType"],
+                "confidence": args["confidence"],
+                "sourceType": args["sourceType"],
+                "tags": args.get("tags", []),
+                "createdAt": 0,
+                "updatedAt": 0,
+                "version": 1,
+            }
+            self.facts.append(fact)
+            return fact
+
+        return {}
+
+    async def query(self, name: str, args: Dict[str, Any]) -> Any:
+        if name == "conversations:get":
+            return {
+                "_id": "doc-conv-1",
+                "conversationId": args["conversationId"],
+                "memorySpaceId": "space-1",
+                "type": "user-agent",
+                "participants": {},
+                "messages": [],
+                "messageCount": 0,
+                "metadata": None,
+                "createdAt": 0,
+                "updatedAt": 0,
+            }
+        if name == "memories:get":
+            return self.memories.get(args["memoryId"])
+        if name in ("memorySpaces:get", "agents:exists", "immutable:get"):
+            return {"exists": True}
+        if name == "facts:list":
+            return []
+        return None
+
+
+class EmbeddingRecorder:
+    """generate_embedding stub that records what it embedded"""
+
+    def __init__(self) -> None:
+        self.inputs: List[str] = []
+
+    async def __call__(self, text: str) -> List[float]:
+        self.inputs.append(text)
+        return [0.1, 0.2, 0.3]
+
+
+class FactRecorder:
+    """extract_facts stub that returns one fact per call"""
+
+    def __init__(self) -> None:
+        self.inputs: List[str] = []
+
+    async def __call__(self, user_message: str, content: str) -> List[Dict[str, Any]]:
+        self.inputs.append(content)
+        return [
+            {
+                "fact": f"Fact number {len(self.inputs)}",
+                "factType": "knowledge",
+                "confidence": 80,
+            }
+        ]
+
+
+async def response_stream() -> AsyncIterator[str]:
+    for chunk in RESPONSE_CHUNKS:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+def stream_params(**overrides: Any) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "memorySpaceId": "space-1",
+        "conversationId": "conv-1",
+        "userMessage": "Tell me about Paris",
+        "responseStream": response_stream(),
+        "userId": "user-1",
+        "userName": "Alex",
+        "agentId": "agent-1",
+        "factDeduplication": False,
+    }
+    params.update(overrides)
+    return params
+
+
+async def remember(
+    client: FakeConvexClient,
+    options: Optional[Dict[str, Any]] = None,
+    **overrides: Any,
+) -> Any:
+    return await MemoryAPI(client).remember_stream(stream_params(**overrides), options)
+
+
+class TestPartialMemoryPromotion:
+    """The partial memory becomes the agent memory"""
+
+    @pytest.mark.asyncio
+    async def test_promotes_partial_memory_in_place(self):
+        client = FakeConvexClient()
+        embed = EmbeddingRecorder()
+
+        result = await remember(
+            client,
+            {"store_partial_response": True, "partial_response_interval": 0},
+            generateEmbedding=embed,
+        )
+
+        # Only the user memory is stored; the agent memory is the promoted one
+        assert client.calls.count("memories:store") == 1
+        assert client.calls.count("memories:finalizePartialMemory") == 1
+        assert len(client.memories) == 2
+
+        agent_memory = result.memories[-1]
+        assert agent_memory.memory_id == "mem-partial-1"
+        assert agent_memory.content == FULL_RESPONSE
+        assert agent_memory.message_role == "agent"
+        assert agent_memory.agent_id == "agent-1"
+        assert "partial" not in agent_memory.tags
+
+        agent_message_id = result.conversation["messageIds"][1]
+        assert client.memories["mem-partial-1"]["conversationRef"]["messageIds"] == [
+            agent_message_id
+        ]
+
+    @pytest.mark.asyncio
+    async def test_full_response_is_embedded_once(self):
+        client = FakeConvexClient()
+        embed = EmbeddingRecorder()
+
+        await remember(
+            client,
+            {"store_partial_response": True, "partial_response_interval": 0},
+            generateEmbedding=embed,
+        )
+
+        assert embed.inputs.count(FULL_RESPONSE) == 1
+        assert client.memories["mem-partial-1"]["embedding"] == [0.1, 0.2, 0.3]
+
+    @pytest.mark.asyncio
+    async def test_without_progressive_storage_stores_both_memories(self):
+        client = FakeConvexClient()
+        embed = EmbeddingRecorder()
+
+        result = await remember(client, generateEmbedding=embed)
+
+        assert client.calls.count("memories:store") == 2
+        assert "memories:finalizePartialMemory" not in client.calls
+        assert [m.message_role for m in result.memories] == [None, None]
+        assert embed.inputs.count(FULL_RESPONSE) == 1
+
+    @pytest.mark.asyncio
+    async def test_skipped_vector_layer_still_finalizes(self):
+        client = FakeConvexClient()
+
+        result = await remember(
+            client,
+            {"store_partial_response": True, "partial_response_interval": 0},
+            skipLayers=["vector"],
+        )
+
+        assert result.memories == []
+        assert "memories:store" not in client.calls
+        assert client.memories["mem-partial-1"]["isPartial"] is False
+        assert client.memories["mem-partial-1"]["content"] == FULL_RESPONSE
+
+
+class TestProgressiveFactReuse:
+    """Final extraction only covers text the stream has not"""
+
+    @pytest.mark.asyncio
+    async def test_final_pass_sends_only_the_tail(self):
+        client = FakeConvexClient()
+        extract = FactRecorder()
+        covered = len(FULL_RESPONSE) - len(RESPONSE_CHUNKS[-1])
+
+        result = await remember(
+            client,
+            {
+                "store_partial_response": True,
+                "partial_response_interval": 0,
+                "progressive_fact_extraction": True,
+                "fact_extraction_threshold": covered,
+            },
+            extractFacts=extract,
+        )
+
+        # One progressive extraction, then a final pass over the last chunk
+        assert len(result.progressive_processing.facts_extracted_during_stream) == 1
+        assert len(extract.inputs) == 2
+        assert extract.inputs[0] == FULL_RESPONSE[:covered]
+        assert extract.inputs[1].endswith(RESPONSE_CHUNKS[-1])
+        assert len(extract.inputs[1]) < len(FULL_RESPONSE)
+
+        # Facts stored during the stream are part of the result
+        assert {f.fact_id for f in result.facts} == {f["factId"] for f in client.facts}
+        assert len(result.facts) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_final_pass_when_stream_covered_everything(self):
+        client = FakeConvexClient()
+        extract = FactRecorder()
+
+        result = await remember(
+            client,
+            {
+                "store_partial_response": True,
+                "partial_response_interval": 0,
+                "progressive_fact_extraction": True,
+                "fact_extraction_threshold": 30,
+            },
+            extractFacts=extract,
+        )
+
+        progressive = result.progressive_processing.facts_extracted_during_stream
+        assert len(extract.inputs) == len(progressive)
+        assert {f.fact_id for f in result.facts} == {f.fact_id for f in progressive}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -6,6 +6,7 @@ Verifies timing, throughput, and performance calculations.
 """
 
 import asyncio
+import random
 
 import pytest
 
@@ -216,6 +217,33 @@ class TestMetricsCollector:
         assert snapshot.partial_updates == 0
         assert len(collector.chunk_sizes) == 0
 
+    def test_running_aggregates_match_raw_chunks(self):
+        """
+        Test: Running aggregates equal statistics over the raw chunk lists
+        Validates: O(1) snapshot without re-summing every chunk
+        """
+        collector = MetricsCollector()
+        rng = random.Random(5)
+        for _ in range(1001):
+            collector.record_chunk(rng.randint(1, 40))
+
+        sizes = collector.chunk_sizes
+        mean = sum(sizes) / len(sizes)
+        std_dev = (sum((s - mean) ** 2 for s in sizes) / len(sizes)) ** 0.5
+        delays = [b - a for a, b in zip(collector.chunk_timestamps, collector.chunk_timestamps[1:])]
+
+        snapshot = collector.get_snapshot()
+        stats = collector.get_chunk_stats()
+        timing = collector.get_timing_stats()
+
+        assert snapshot.total_bytes == sum(sizes)
+        assert snapshot.total_chunks == len(sizes)
+        assert stats["median"] == sorted(sizes)[len(sizes) // 2]
+        assert stats["min"] == min(sizes) and stats["max"] == max(sizes)
+        assert abs(stats["std_dev"] - std_dev) < 1e-9
+        assert timing["average_inter_chunk_delay"] == pytest.approx(sum(delays) / len(delays))
+        assert timing["min_delay"] == min(delays) and timing["max_delay"] == max(delays)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
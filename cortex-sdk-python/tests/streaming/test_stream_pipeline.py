@@ -0,0 +1,204 @@
+"""
+Stream Pipeline Tests
+
+Tests that chunks reach the caller before any stage, that slow stages
+consume from bounded queues without stalling the stream, and that the
+block/drop/coalesce policies and queue metrics behave as documented.
+"""
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from cortex.memory import MemoryAPI
+from cortex.memory.streaming import StreamPipeline
+from cortex.memory.streaming_types import (
+    BackpressurePolicy,
+    ChunkEvent,
+    StreamingOptions,
+)
+from tests.streaming.test_stream_finalization import FakeConvexClient, stream_params
+
+
+def make_event(number: int, text: str = "") -> ChunkEvent:
+    accumulated = text or f"chunk {number} "
+    return ChunkEvent(
+        chunk=f"chunk {number} ",
+        chunk_number=number,
+        timestamp=int(time.time() * 1000),
+        estimated_tokens=number,
+        accumulated_length=len(accumulated),
+        _source=lambda: accumulated,
+    )
+
+
+class SlowStage:
+    """Stage handler that records chunk numbers after a delay"""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.seen: List[int] = []
+
+    async def __call__(self, event: ChunkEvent) -> None:
+        await asyncio.sleep(self.delay)
+        self.seen.append(event.chunk_number)
+
+
+class TestStreamPipeline:
+    """Fan-out order, queue bounds and policies"""
+
+    @pytest.mark.asyncio
+    async def test_caller_sees_chunk_before_stages(self):
+        order: List[str] = []
+        pipeline = StreamPipeline(pass_through=lambda e: order.append(f"caller-{e.chunk_number}"))
+        pipeline.add_stage("storage", lambda e: order.append(f"storage-{e.chunk_number}"))
+
+        await pipeline.publish(make_event(1))
+        assert order == ["caller-1"]
+
+        await pipeline.close()
+        assert order == ["caller-1", "storage-1"]
+
+    @pytest.mark.asyncio
+    async def test_slow_stage_does_not_block_producer(self):
+        stage = SlowStage(delay=0.05)
+        pipeline = StreamPipeline(queue_size=4)
+        pipeline.add_stage("storage", stage)
+
+        start = time.perf_counter()
+        for number in range(1, 21):
+            await pipeline.publish(make_event(number))
+        publish_s = time.perf_counter() - start
+
+        await pipeline.close()
+        metrics = pipeline.get_metrics().stages["storage"]
+
+        assert publish_s < 0.05
+        # The first event went straight to the consumer; later ones coalesced
+        assert stage.seen[-1] == 20
+        assert metrics.coalesced == 20 - len(stage.seen)
+        assert metrics.max_queue_depth == 4
+        assert metrics.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_discards_new_chunks(self):
+        stage = SlowStage(delay=0.05)
+        pipeline = StreamPipeline(queue_size=2, policy=BackpressurePolicy.DROP)
+        pipeline.add_stage("facts", stage)
+
+        for number in range(1, 11):
+            await pipeline.publish(make_event(number))
+        await pipeline.close()
+
+        metrics = pipeline.get_metrics().stages["facts"]
+        # The consumer only starts once the producer yields
+        assert stage.seen == [1, 2]
+        assert metrics.dropped == 8
+        assert metrics.processed == 2
+
+    @pytest.mark.asyncio
+    async def test_block_policy_applies_backpressure(self):
+        stage = SlowStage(delay=0.01)
+        pipeline = StreamPipeline(queue_size=1, stage_policies={"graph": "block"})
+        pipeline.add_stage("graph", stage)
+
+        for number in range(1, 6):
+            await pipeline.publish(make_event(number))
+        await pipeline.close()
+
+        metrics = pipeline.get_metrics()
+        assert stage.seen == [1, 2, 3, 4, 5]
+        assert metrics.stages["graph"].policy == BackpressurePolicy.BLOCK
+        assert metrics.producer_blocked_ms > 0
+
+    @pytest.mark.asyncio
+    async def test_when_filter_runs_on_producer(self):
+        stage = SlowStage(delay=0)
+        pipeline = StreamPipeline()
+        pipeline.add_stage("facts", stage, when=lambda e: e.chunk_number % 2 == 0)
+
+        for number in range(1, 7):
+            await pipeline.publish(make_event(number))
+        await pipeline.close()
+
+        assert stage.seen == [2, 4, 6]
+        assert pipeline.get_metrics().stages["facts"].enqueued == 3
+
+    @pytest.mark.asyncio
+    async def test_cancel_discards_queued_work(self):
+        stage = SlowStage(delay=1.0)
+        pipeline = StreamPipeline()
+        pipeline.add_stage("storage", stage)
+
+        for number in range(1, 4):
+            await pipeline.publish(make_event(number))
+        await asyncio.sleep(0)
+        await pipeline.cancel()
+
+        assert stage.seen == []
+        assert pipeline.get_metrics().stages["storage"].queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_stage_errors_are_counted(self):
+        def failing(event: ChunkEvent) -> None:
+            raise RuntimeError("boom")
+
+        pipeline = StreamPipeline()
+        pipeline.add_stage("graph", failing)
+        await pipeline.publish(make_event(1))
+        await pipeline.close()
+
+        assert pipeline.get_metrics().stages["graph"].errors == 1
+
+
+class SlowStorageClient(FakeConvexClient):
+    """Partial memory writes take ``latency`` seconds"""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+
+    async def mutation(self, name, args):
+        if name in ("memories:updatePartialMemory", "memories:appendPartialMemory"):
+            await asyncio.sleep(self.latency)
+        return await super().mutation(name, args)
+
+
+class TestRememberStreamPipeline:
+    """remember_stream() runs storage behind the pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_slow_storage_does_not_delay_chunks(self):
+        client = SlowStorageClient(latency=0.05)
+        arrivals: List[float] = []
+
+        async def stream():
+            for _ in range(20):
+                await asyncio.sleep(0.002)
+                yield "token " * 10
+
+        start = time.perf_counter()
+        result = await MemoryAPI(client).remember_stream(
+            stream_params(responseStream=stream()),
+            StreamingOptions(
+                store_partial_response=True,
+                partial_response_interval=1,
+                hooks={"onChunk": lambda e: arrivals.append(time.perf_counter() - start)},
+            ),
+        )
+
+        # Inline, the chunk after each 50 ms write would arrive 50 ms late
+        assert len(arrivals) == 20
+        assert max(b - a for a, b in zip(arrivals, arrivals[1:])) < 0.04
+
+        metrics = result.pipeline_metrics
+        assert set(metrics.stages) == {"storage"}
+        assert metrics.stages["storage"].processed >= 1
+        assert metrics.added_time_to_first_token_ms < 50
+        assert client.memories["mem-partial-1"]["content"] == result.full_response
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -6,15 +6,17 @@ Verifies chunk accumulation, hook invocation, and context updates.
 """
 
 import asyncio
+import time
 
 import pytest
 
 from cortex.memory.streaming.stream_metrics import MetricsCollector
 from cortex.memory.streaming.stream_processor import (
     StreamProcessor,
+    TextAccumulator,
     create_stream_context,
 )
-from cortex.memory.streaming_types import StreamHooks
+from cortex.memory.streaming_types import ChunkEvent, StreamHooks
 
 
 async def create_simple_stream():
@@ -251,5 +253,140 @@ class TestStreamProcessor:
         assert processor_metrics is metrics_collector
 
 
+def make_context():
+    return create_stream_context(
+        memory_space_id="test-space",
+        conversation_id="test-conv",
+        user_id="test-user",
+        user_name="Test User",
+    )
+
+
+async def create_token_stream(count: int):
+    """Token-sized chunks without delays"""
+    for i in range(count):
+        yield f"tok{i % 10} "
+
+
+class TestLinearAccumulation:
+    """Accumulated text is joined lazily, only when read"""
+
+    def test_text_accumulator(self):
+        accumulator = TextAccumulator()
+        for chunk in ["Hello", " ", "World"]:
+            accumulator.append(chunk)
+
+        assert len(accumulator) == 11
+        assert accumulator.text == "Hello World"
+
+        snapshot = accumulator.snapshot()
+        accumulator.append("!")
+        assert snapshot() == "Hello World"
+        assert str(accumulator) == "Hello World!"
+
+    def test_chunk_event_reads_source_on_access(self):
+        reads = []
+        event = ChunkEvent(
+            chunk="b",
+            chunk_number=2,
+            timestamp=0,
+            estimated_tokens=0,
+            accumulated_length=2,
+            _source=lambda: reads.append(1) or "ab",
+        )
+        assert "ab" not in repr(event)
+        assert reads == []
+        assert event.accumulated == "ab"
+        assert event.accumulated_length == 2
+
+    @pytest.mark.asyncio
+    async def test_chunk_events_see_their_own_prefix(self):
+        """Events read after the stream ends still show the text at their chunk"""
+        events = []
+        processor = StreamProcessor(make_context(), StreamHooks(on_chunk=events.append))
+
+        await processor.process_stream(create_simple_stream())
+
+        assert [e.accumulated for e in events] == ["Hello", "Hello ", "Hello World", "Hello World!"]
+        assert [e.accumulated_length for e in events] == [5, 6, 11, 12]
+
+    @pytest.mark.asyncio
+    async def test_text_not_joined_when_unread(self):
+        joins = []
+
+        class CountingAccumulator(TextAccumulator):
+            @property
+            def text(self) -> str:
+                joins.append(len(self))
+                return super().text
+
+        processor = StreamProcessor(make_context(), StreamHooks(on_chunk=lambda e: e.chunk))
+        processor.accumulator = CountingAccumulator()
+
+        result = await processor.process_stream(create_token_stream(1000))
+
+        assert len(result) == len(processor.accumulator)
+        # Once to sync the context at completion, once for the return value
+        assert len(joins) <= 2
+
+    @pytest.mark.asyncio
+    async def test_context_synced_on_error(self):
+        async def failing_stream():
+            yield "partial "
+            yield "content"
+            raise RuntimeError("connection lost")
+
+        context = make_context()
+        processor = StreamProcessor(context)
+
+        with pytest.raises(RuntimeError):
+            await processor.process_stream(failing_stream())
+
+        assert context.accumulated_text == "partial content"
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_benchmark_10k_and_100k_chunks(self):
+        """Lazy accumulation versus the previous concatenate-and-sum loop"""
+
+        def legacy(count: int) -> float:
+            # Previous per-chunk work: concatenate, copy into the context,
+            # and sum every chunk size for each of three snapshots
+            context = make_context()
+            accumulated = ""
+            sizes = []
+            start = time.perf_counter()
+            for i in range(count):
+                chunk = f"tok{i % 10} "
+                accumulated += chunk
+                sizes.append(len(chunk))
+                context.accumulated_text = accumulated
+                for _ in range(3):
+                    sum(sizes)
+                ChunkEvent(chunk, i + 1, 0, sum(sizes) // 4, len(accumulated), lambda: accumulated)
+            return time.perf_counter() - start
+
+        async def current(count: int) -> float:
+            processor = StreamProcessor(make_context(), StreamHooks(on_chunk=lambda e: e.chunk))
+            start = time.perf_counter()
+            await processor.process_stream(create_token_stream(count))
+            return time.perf_counter() - start
+
+        legacy_10k = legacy(10_000)
+        current_10k = await current(10_000)
+        current_100k = await current(100_000)
+
+        print(
+            "\n[stream processor benchmark]\n"
+            f"  legacy  10k chunks : {legacy_10k * 1000:8.1f} ms\n"
+            f"  current 10k chunks : {current_10k * 1000:8.1f} ms\n"
+            f"  current 100k chunks: {current_100k * 1000:8.1f} ms"
+        )
+
+        assert current_10k < legacy_10k
+        # Linear: 10x the chunks must stay well under the quadratic 100x
+        assert current_100k < current_10k * 30
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,159 @@
+"""
+Stream Tee Tests
+
+Tests that a teed stream is read once and replayed to every branch, and
+that remember_stream_tee() hands chunks to the caller without waiting on
+memory persistence.
+"""
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from cortex.memory import MemoryAPI
+from cortex.memory.stream_utils import StreamTee
+from cortex.memory.streaming_types import EnhancedRememberStreamResult, StreamingOptions
+from tests.streaming.test_stream_finalization import FakeConvexClient, stream_params
+
+
+async def numbers(count: int, delay: float = 0.0):
+    for i in range(count):
+        await asyncio.sleep(delay)
+        yield i
+
+
+class SlowSetupClient(FakeConvexClient):
+    """Every query and mutation takes ``latency`` seconds"""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+        self.events: List[str] = []
+
+    async def query(self, name, args):
+        await asyncio.sleep(self.latency)
+        self.events.append(name)
+        return await super().query(name, args)
+
+    async def mutation(self, name, args):
+        await asyncio.sleep(self.latency)
+        return await super().mutation(name, args)
+
+
+class TestStreamTee:
+    """One read of the source, replayed to every branch"""
+
+    @pytest.mark.asyncio
+    async def test_every_branch_sees_every_item(self):
+        reads: List[int] = []
+
+        async def source():
+            for i in range(5):
+                reads.append(i)
+                yield i
+
+        tee = StreamTee(source(), branches=3)
+        results = await asyncio.gather(*[_collect(branch) for branch in tee.branches])
+
+        assert results == [[0, 1, 2, 3, 4]] * 3
+        assert reads == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_slow_branch_does_not_delay_fast_branch(self):
+        tee = StreamTee(numbers(10, delay=0.001))
+        fast, slow = tee.branches
+
+        async def slow_consumer():
+            items = []
+            async for item in slow:
+                await asyncio.sleep(0.02)
+                items.append(item)
+            return items
+
+        slow_task = asyncio.ensure_future(slow_consumer())
+        start = time.perf_counter()
+        assert await _collect(fast) == list(range(10))
+        fast_s = time.perf_counter() - start
+
+        assert await slow_task == list(range(10))
+        assert fast_s < 0.1
+
+    @pytest.mark.asyncio
+    async def test_source_error_reaches_every_branch(self):
+        async def failing():
+            yield 1
+            raise ValueError("stream broke")
+
+        tee = StreamTee(failing())
+        for branch in tee.branches:
+            seen = []
+            with pytest.raises(ValueError, match="stream broke"):
+                async for item in branch:
+                    seen.append(item)
+            assert seen == [1]
+
+
+class TestRememberStreamTee:
+    """The caller receives chunks while Cortex persists a copy"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_arrive_before_persistence_setup(self):
+        client = SlowSetupClient(latency=0.05)
+        chunks = ["Hello ", "from ", "the ", "stream."]
+
+        async def llm_stream():
+            for chunk in chunks:
+                yield chunk
+
+        tee = MemoryAPI(client).remember_stream_tee(
+            stream_params(responseStream=llm_stream()),
+            StreamingOptions(store_partial_response=True),
+        )
+
+        received: List[str] = []
+        async for chunk in tee:
+            client.events.append("caller-chunk")
+            received.append(chunk)
+        result = await tee.result
+
+        # remember_stream() only reads after its 50 ms conversation lookup
+        assert client.events[: len(chunks)] == ["caller-chunk"] * len(chunks)
+        assert client.events[len(chunks)] == "conversations:get"
+        assert received == chunks
+        assert isinstance(result, EnhancedRememberStreamResult)
+        assert result.full_response == "".join(chunks)
+        assert client.memories["mem-partial-1"]["content"] == result.full_response
+
+    @pytest.mark.asyncio
+    async def test_persistence_errors_surface_from_result(self):
+        async def llm_stream():
+            yield "still delivered"
+
+        tee = MemoryAPI(FakeConvexClient()).remember_stream_tee(
+            stream_params(responseStream=llm_stream(), userName=None)
+        )
+
+        assert await _collect(tee) == ["still delivered"]
+        with pytest.raises(Exception, match="user_name is required"):
+            await tee.result
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_persistence(self):
+        tee = MemoryAPI(SlowSetupClient(latency=1.0)).remember_stream_tee(
+            stream_params(responseStream=numbers(3, delay=1.0))
+        )
+        await asyncio.sleep(0)
+        await tee.aclose()
+
+        assert tee.result.done()  # type: ignore[attr-defined]
+        assert tee.result.cancelled()  # type: ignore[attr-defined]
+
+
+async def _collect(iterable) -> List:
+    return [item async for item in iterable]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
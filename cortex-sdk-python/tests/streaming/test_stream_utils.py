@@ -0,0 +1,212 @@
+"""
+Stream Utility Tests
+
+Tests RollingContextWindow and AsyncQueue behaviour, including the bounded
+queue's backpressure, with micro-benchmarks (``-m benchmark``) against the
+previous list-based implementations.
+"""
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from cortex.memory.stream_utils import AsyncQueue, RollingContextWindow
+
+
+class TestRollingContextWindow:
+    """Keeps the most recent chunks within max_size characters"""
+
+    def test_trims_oldest_chunks(self):
+        window = RollingContextWindow(max_size=10)
+        for chunk in ["aaaa", "bbbb", "cccc"]:
+            window.add(chunk)
+
+        assert window.get_context() == "bbbbcccc"
+        assert window.get_size() == 8
+
+    def test_keeps_a_single_oversized_chunk(self):
+        window = RollingContextWindow(max_size=3)
+        window.add("ab")
+        window.add("too long")
+
+        assert window.get_context() == "too long"
+        assert window.get_size() == 8
+
+    def test_context_is_refreshed_after_add_and_clear(self):
+        window = RollingContextWindow(max_size=100)
+        window.add("one ")
+        assert window.get_context() == "one "
+        window.add("two")
+        assert window.get_context() == "one two"
+
+        window.clear()
+        assert window.get_context() == ""
+        assert window.get_size() == 0
+
+    def test_long_stream_matches_list_trim(self):
+        """Same window as trimming a list until its join fits"""
+        window = RollingContextWindow(max_size=50)
+        legacy: List[str] = []
+        for i in range(2000):
+            chunk = f"tok{i % 7} " * (i % 4 + 1)
+            window.add(chunk)
+            legacy.append(chunk)
+            while len("".join(legacy)) > 50 and len(legacy) > 1:
+                legacy.pop(0)
+
+            assert window.get_context() == "".join(legacy)
+            assert window.get_size() == len("".join(legacy))
+
+    @pytest.mark.benchmark
+    def test_benchmark_long_stream(self):
+        """Deque with a running total versus the previous join-per-trim loop"""
+
+        def legacy(count: int, max_size: int) -> float:
+            # Previous add(): join the whole window on every trim check
+            window: List[str] = []
+            start = time.perf_counter()
+            for i in range(count):
+                window.append(f"tok{i % 10} ")
+                while len("".join(window)) > max_size and len(window) > 1:
+                    window.pop(0)
+            return time.perf_counter() - start
+
+        def current(count: int, max_size: int) -> float:
+            window = RollingContextWindow(max_size=max_size)
+            start = time.perf_counter()
+            for i in range(count):
+                window.add(f"tok{i % 10} ")
+            return time.perf_counter() - start
+
+        legacy_10k = legacy(10_000, 5_000)
+        current_10k = current(10_000, 5_000)
+        current_100k = current(100_000, 5_000)
+
+        print(
+            "\n[rolling window benchmark] max_size=5000\n"
+            f"  legacy  10k chunks : {legacy_10k * 1000:8.1f} ms\n"
+            f"  current 10k chunks : {current_10k * 1000:8.1f} ms\n"
+            f"  current 100k chunks: {current_100k * 1000:8.1f} ms"
+        )
+
+        assert current_10k < legacy_10k
+        # Independent of window size: 10x the chunks stays near 10x the time
+        assert current_100k < current_10k * 30
+
+
+class TestAsyncQueue:
+    """FIFO queue with optional processor and bound"""
+
+    @pytest.mark.asyncio
+    async def test_fifo_order(self):
+        queue: AsyncQueue[int] = AsyncQueue()
+        for i in range(5):
+            await queue.enqueue(i)
+
+        assert queue.size() == 5
+        assert [queue.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert queue.dequeue() is None
+        assert queue.is_empty()
+
+    @pytest.mark.asyncio
+    async def test_processor_drains_queue(self):
+        seen: List[int] = []
+
+        async def processor(item: int) -> None:
+            await asyncio.sleep(0)
+            seen.append(item)
+
+        queue: AsyncQueue[int] = AsyncQueue(processor)
+        for i in range(1, 4):
+            await queue.enqueue(i)
+
+        assert seen == [1, 2, 3]
+        assert queue.is_empty()
+        assert queue.processing is False
+
+    @pytest.mark.asyncio
+    async def test_processor_errors_do_not_stop_processing(self):
+        seen: List[int] = []
+
+        def processor(item: int) -> None:
+            if item == 2:
+                raise ValueError("bad item")
+            seen.append(item)
+
+        queue: AsyncQueue[int] = AsyncQueue(processor)
+        for i in range(1, 4):
+            await queue.enqueue(i)
+
+        assert seen == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_applies_backpressure(self):
+        queue: AsyncQueue[int] = AsyncQueue(max_size=2)
+        await queue.enqueue(1)
+        await queue.enqueue(2)
+        assert queue.is_full()
+
+        producer = asyncio.ensure_future(queue.enqueue(3))
+        await asyncio.sleep(0.01)
+        assert not producer.done()
+
+        assert await queue.get() == 1
+        await asyncio.wait_for(producer, timeout=1)
+        assert [queue.dequeue(), queue.dequeue()] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_clear(self):
+        queue: AsyncQueue[str] = AsyncQueue(max_size=3)
+        for item in "abc":
+            await queue.enqueue(item)
+        queue.clear()
+
+        assert queue.size() == 0
+        await asyncio.wait_for(queue.enqueue("d"), timeout=1)
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_benchmark_drain(self):
+        """asyncio.Queue versus the previous list.pop(0) queue"""
+
+        def legacy(count: int) -> float:
+            # Previous dequeue(): list.pop(0) shifts every remaining item
+            items: List[int] = []
+            start = time.perf_counter()
+            for i in range(count):
+                items.append(i)
+            while items:
+                items.pop(0)
+            return time.perf_counter() - start
+
+        async def current(count: int) -> float:
+            queue: AsyncQueue[int] = AsyncQueue()
+            start = time.perf_counter()
+            for i in range(count):
+                await queue.enqueue(i)
+            while queue.dequeue() is not None:
+                pass
+            return time.perf_counter() - start
+
+        legacy_50k = legacy(50_000)
+        current_20k = await current(20_000)
+        current_50k = await current(50_000)
+        current_200k = await current(200_000)
+
+        print(
+            "\n[async queue benchmark]\n"
+            f"  legacy   50k items : {legacy_50k * 1000:8.1f} ms\n"
+            f"  current  20k items : {current_20k * 1000:8.1f} ms\n"
+            f"  current  50k items : {current_50k * 1000:8.1f} ms\n"
+            f"  current 200k items : {current_200k * 1000:8.1f} ms"
+        )
+
+        assert current_50k < legacy_50k
+        # Linear: 10x the items must stay well under the quadratic 100x
+        assert current_200k < current_20k * 30
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,165 @@
+"""
+Token Counter Tests
+
+Tests the heuristic and tiktoken-backed token counters, the incremental
+stream counter, and token-accurate chunking and metrics.
+"""
+
+import random
+
+import pytest
+
+from cortex.memory.streaming.chunking_strategies import (
+    ResponseChunker,
+    estimate_optimal_chunk_size,
+)
+from cortex.memory.streaming.stream_metrics import MetricsCollector
+from cortex.memory.streaming.tokenizer import (
+    HeuristicTokenCounter,
+    IncrementalTokenCounter,
+    TiktokenCounter,
+    get_token_counter,
+)
+from cortex.memory.streaming_types import ChunkingConfig, ChunkStrategy
+
+PROSE = "The quick brown fox jumps over the lazy dog near the river bank. " * 20
+CODE = "def add(a_1, b_2):\n    return {'sum': a_1 + b_2, 'ok': True}\n" * 20
+CJK = "東京は日本の首都であり、人口が最も多い都市です。" * 20
+
+
+class CharacterEncoding:
+    """tiktoken-shaped stand-in: one token per character"""
+
+    name = "characters"
+
+    def encode(self, text, disallowed_special=()):
+        return [ord(c) for c in text]
+
+    def decode_with_offsets(self, tokens):
+        return "".join(map(chr, tokens)), list(range(len(tokens)))
+
+
+class TestHeuristicTokenCounter:
+    """Regex approximation of BPE boundaries"""
+
+    def test_offsets_tile_the_text(self):
+        counter = HeuristicTokenCounter()
+        for text in (PROSE, CODE, CJK, "  spaced  out  ", "naïve café 🚀"):
+            offsets = counter.token_offsets(text)
+            assert offsets[0] == 0
+            assert offsets == sorted(set(offsets))
+            assert counter.count(text) == len(offsets)
+
+    def test_words_take_their_leading_space(self):
+        counter = HeuristicTokenCounter()
+        text = "Hello world, again"
+        offsets = counter.token_offsets(text)
+        pieces = [text[a:b] for a, b in zip(offsets, offsets[1:] + [len(text)])]
+        assert pieces == ["Hello", " world", ",", " again"]
+
+    def test_code_and_cjk_are_denser_than_prose(self):
+        counter = HeuristicTokenCounter()
+
+        def chars_per_token(text: str) -> float:
+            return len(text) / counter.count(text)
+
+        assert chars_per_token(PROSE) > 4
+        assert chars_per_token(CODE) < 3
+        assert chars_per_token(CJK) == pytest.approx(1.0)
+
+
+class TestTiktokenCounter:
+    """BPE-backed counter, exercised with a stand-in encoding"""
+
+    def test_uses_encoding_offsets(self):
+        counter = TiktokenCounter(CharacterEncoding())
+        assert counter.name == "tiktoken:characters"
+        assert counter.count("abc") == 3
+        assert counter.token_offsets("abc") == [0, 1, 2]
+
+    def test_default_counter_is_cached(self):
+        assert get_token_counter() is get_token_counter()
+
+
+class TestIncrementalTokenCounter:
+    """Streamed counts match counting the whole text"""
+
+    @pytest.mark.parametrize("text", [PROSE, CODE, CJK])
+    def test_matches_full_count_for_any_split(self, text):
+        counter = HeuristicTokenCounter()
+        rng = random.Random(7)
+        incremental = IncrementalTokenCounter(counter)
+
+        position = 0
+        while position < len(text):
+            size = rng.randint(1, 12)
+            incremental.add(text[position : position + size])
+            position += size
+
+        assert incremental.total == counter.count(text)
+
+    def test_work_per_chunk_is_bounded(self):
+        class Recording(HeuristicTokenCounter):
+            def __init__(self):
+                self.longest = 0
+
+            def token_offsets(self, text):
+                self.longest = max(self.longest, len(text))
+                return super().token_offsets(text)
+
+        counter = Recording()
+        incremental = IncrementalTokenCounter(counter)
+        for _ in range(2000):
+            incremental.add("streamed token ")
+
+        # Only the chunk and a short tail are ever re-tokenized
+        assert counter.longest < 50
+
+
+class TestTokenAwareConsumers:
+    """Chunking and metrics use real token counts"""
+
+    @pytest.mark.asyncio
+    async def test_token_chunks_fit_the_limit_for_code_and_cjk(self):
+        counter = HeuristicTokenCounter()
+        chunker = ResponseChunker()
+
+        for text in (CODE, CJK):
+            chunks = await chunker.chunk_content(
+                text,
+                ChunkingConfig(
+                    strategy=ChunkStrategy.TOKEN,
+                    max_chunk_size=64,
+                    overlap_size=8,
+                    token_counter=counter,
+                ),
+            )
+            assert all(counter.count(c.content) <= 64 for c in chunks)
+            # Consecutive chunks share exactly the overlap tokens
+            for first, second in zip(chunks, chunks[1:]):
+                overlap = text[second.start_offset : first.end_offset]
+                assert first.content.endswith(overlap)
+                assert counter.count(overlap) == 8
+
+    def test_fixed_size_estimate_uses_measured_density(self):
+        counter = HeuristicTokenCounter()
+        assert estimate_optimal_chunk_size(len(CJK), ChunkStrategy.FIXED) == 2000
+        assert estimate_optimal_chunk_size(
+            len(CJK), ChunkStrategy.FIXED, sample=CJK, token_counter=counter
+        ) == 500
+
+    def test_metrics_count_tokens_from_text(self):
+        collector = MetricsCollector(HeuristicTokenCounter())
+        for piece in (CJK[i : i + 10] for i in range(0, len(CJK), 10)):
+            collector.record_chunk(len(piece), piece)
+
+        snapshot = collector.get_snapshot()
+        assert snapshot.estimated_tokens == len(CJK)
+        assert snapshot.estimated_cost == pytest.approx(len(CJK) / 1000 * 0.06)
+
+        # A 4-chars-per-token estimate would undercount CJK fourfold
+        assert snapshot.estimated_tokens > 3 * (len(CJK) // 4)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -51,6 +51,18 @@ class MockConvexClient:
             # Return facts matching subject
             subject = args.get("subject", "").lower()
             return [f for f in self.facts if f.get("subject", "").lower() == subject]
+        if "queryBySlot" in method:
+            # Only facts stored with this slot key, like the by_slot index
+            return [
+                f for f in self.facts
+                if f.get("normalizedSubject") == args["normalizedSubject"]
+                and f.get("predicateClass") == args["predicateClass"]
+            ]
+        if "hasUnslotted" in method:
+            return any(
+                f.get("subject") and f.get("predicate") and not f.get("normalizedSubject")
+                for f in self.facts
+            )
         return self.facts
 
     async def mutation(self, method: str, args: dict):
@@ -381,6 +393,47 @@ class TestReviseOperation:
                result.pipeline.get("slot_matching").executed is False or \
                result.action == "ADD"
 
+    async def test_does_not_mutate_caller_fact(self) -> None:
+        """The caller's fact keeps its text and gets no embedding attached."""
+        existing_fact = {
+            "factId": "fact-existing",
+            "fact": "User likes blue",
+            "subject": "user-123",
+            "predicate": "favorite color",
+            "object": "blue",
+            "confidence": 80,
+            "supersededBy": None,
+        }
+        client = MockConvexClient(facts=[existing_fact])
+        llm_client = MockLLMClient(
+            response='{"action": "UPDATE", "targetFactId": "fact-existing", "reason": "Refined", "mergedFact": "User likes blue and purple", "confidence": 90}'
+        )
+
+        async def embed(text: str):
+            return [1.0, 0.0]
+
+        config = BeliefRevisionConfig(
+            semantic_matching=SemanticMatchingConfigOptions(generate_embedding=embed),
+        )
+        service = BeliefRevisionService(client, llm_client, config)
+        fact = ConflictCandidate(
+            fact="User likes purple",
+            confidence=90,
+            subject="user-123",
+            predicate="favorite color",
+            object="purple",
+        )
+
+        result = await service.revise(ReviseParams(memory_space_id="space-1", fact=fact))
+
+        assert result.action == "UPDATE"
+        assert fact.fact == "User likes purple"
+        assert fact.embedding is None
+        method, args = client.mutations[-1]
+        assert method == "facts:updateInPlace"
+        assert args["fact"] == "User likes blue and purple"
+        assert "embedding" not in args  # Pre-merge embedding is not reused
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Check Conflicts Tests
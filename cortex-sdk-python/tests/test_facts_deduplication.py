@@ -512,6 +512,75 @@ async def test_remember_with_deduplication_disabled(ctx, cortex_client, scoped_c
     assert len(facts) == 2
 
 
+# ============================================================================
+# Integration Tests - facts:semanticSearch scope
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_scoped_to_user_when_others_outrank(
+    ctx, cortex_client, scoped_cleanup
+):
+    """
+    Test that other users' closer facts don't crowd the user's fact out of top-k.
+
+    The user and fact type filter runs inside the vector index, so the
+    result no longer depends on how many other users' facts score higher.
+    """
+    memory_space_id = ctx.memory_space_id("semantic-scope")
+    user_id = ctx.user_id("scope-target")
+    query = [1.0] + [0.0] * 1535
+    closer = list(query)
+    farther = [1.0, 0.5] + [0.0] * 1534
+
+    for i in range(12):
+        await cortex_client.facts.store(
+            StoreFactParams(
+                memory_space_id=memory_space_id,
+                user_id=ctx.user_id(f"scope-other-{i}"),
+                fact="User prefers dark mode",
+                fact_type="preference",
+                confidence=80,
+                source_type="conversation",
+                embedding=closer,
+            )
+        )
+    target = await cortex_client.facts.store(
+        StoreFactParams(
+            memory_space_id=memory_space_id,
+            user_id=user_id,
+            fact="User likes dark themes",
+            fact_type="preference",
+            confidence=80,
+            source_type="conversation",
+            embedding=farther,
+        )
+    )
+
+    scoped = await cortex_client.client.action(
+        "facts:semanticSearch",
+        {
+            "memorySpaceId": memory_space_id,
+            "embedding": query,
+            "userId": user_id,
+            "factType": "preference",
+            "limit": 1,
+        },
+    )
+    unscoped = await cortex_client.client.action(
+        "facts:semanticSearch",
+        {
+            "memorySpaceId": memory_space_id,
+            "embedding": query,
+            "factType": "preference",
+            "limit": 1,
+        },
+    )
+
+    assert [hit["factId"] for hit in scoped] == [target.fact_id]
+    assert unscoped[0]["userId"] != user_id
+
+
 # ============================================================================
 # Real-World Scenario Tests
 # ============================================================================
@@ -12,6 +12,7 @@ from cortex.facts.history import (
     ActionCounts,
     ActivitySummary,
     ChangeFilter,
+    DailyActivity,
     FactChangeEvent,
     FactChangePipeline,
     FactHistoryService,
@@ -479,6 +480,110 @@ class TestFactHistoryServiceActivitySummary:
         assert summary.unique_facts_modified == 75
         assert summary.active_participants == 10
 
+    async def test_uniques_skipped_by_default(self) -> None:
+        """Should serve rollup counts only unless uniques are requested."""
+        client = MockClient(query_response={"totalEvents": 3, "actionCounts": {"CREATE": 3}})
+        service = FactHistoryService(client)
+
+        summary = await service.get_activity_summary("space-1", 24)
+
+        assert client.last_query[1]["includeUniques"] is False
+        assert summary.total_events == 3
+        assert summary.unique_facts_modified == 0
+
+    async def test_include_uniques(self) -> None:
+        """Should pass includeUniques through to the query."""
+        client = MockClient(query_response={"totalEvents": 3, "uniqueFactsModified": 2})
+        service = FactHistoryService(client)
+
+        summary = await service.get_activity_summary("space-1", 24, include_uniques=True)
+
+        assert client.last_query[1]["includeUniques"] is True
+        assert summary.unique_facts_modified == 2
+
+
+@pytest.mark.asyncio
+class TestFactHistoryServiceDailyActivity:
+    """Tests for FactHistoryService.get_daily_activity method."""
+
+    async def test_get_daily_activity(self) -> None:
+        """Should parse rollup rows."""
+        client = MockClient(query_response=[
+            {"day": 86400000, "totalEvents": 4, "actionCounts": {"CREATE": 3, "UPDATE": 1, "SUPERSEDE": 0, "DELETE": 0}},
+            {"day": 172800000, "totalEvents": 1, "actionCounts": {"CREATE": 0, "UPDATE": 0, "SUPERSEDE": 1, "DELETE": 0}},
+        ])
+        service = FactHistoryService(client)
+
+        days = await service.get_daily_activity("space-1", days=7)
+
+        assert client.last_query == ("factHistory:getDailyActivity", {"memorySpaceId": "space-1", "days": 7})
+        assert days == [
+            DailyActivity(day=86400000, total_events=4, action_counts=ActionCounts(CREATE=3, UPDATE=1)),
+            DailyActivity(day=172800000, total_events=1, action_counts=ActionCounts(SUPERSEDE=1)),
+        ]
+
+
+class PagedMutationClient(MockClient):
+    """Mock client that returns a sequence of mutation pages."""
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = list(pages)
+        self.mutations = []
+
+    async def mutation(self, method: str, args: dict):
+        self.mutations.append((method, args))
+        return self.pages.pop(0)
+
+
+@pytest.mark.asyncio
+class TestFactHistoryServiceCompaction:
+    """Tests for compaction and rollup rebuild."""
+
+    async def test_compact_follows_cursor(self) -> None:
+        """Should page through old events and sum deletions."""
+        client = PagedMutationClient([
+            {"deleted": 7, "isDone": False, "continueCursor": "c1"},
+            {"deleted": 2, "isDone": True, "continueCursor": "c2"},
+        ])
+        service = FactHistoryService(client)
+
+        older_than = datetime(2024, 1, 1)
+        result = await service.compact("space-1", older_than, page_size=100)
+
+        assert result == {"deleted": 9}
+        assert [m[0] for m in client.mutations] == ["factHistory:compactEvents"] * 2
+        assert [m[1]["paginationOpts"]["cursor"] for m in client.mutations] == [None, "c1"]
+        assert client.mutations[0][1]["olderThan"] == int(older_than.timestamp() * 1000)
+
+    async def test_rebuild_rollups_threads_start_time(self) -> None:
+        """Should pass the rebuild start time back with each cursor."""
+        client = PagedMutationClient([
+            {"counted": 500, "rebuildStartedAt": 1000, "isDone": False, "continueCursor": "c1"},
+            {"counted": 20, "rebuildStartedAt": 1000, "isDone": True, "continueCursor": ""},
+        ])
+        service = FactHistoryService(client)
+
+        result = await service.rebuild_rollups("space-1")
+
+        assert result == {"counted": 520}
+        assert "rebuildStartedAt" not in client.mutations[0][1]
+        assert client.mutations[1][1]["rebuildStartedAt"] == 1000
+        assert client.mutations[1][1]["paginationOpts"]["cursor"] == "c1"
+
+    async def test_parse_compacted_event(self) -> None:
+        """Should expose how many events a compacted UPDATE replaced."""
+        client = MockClient(query_response=[
+            {"eventId": "evt-1", "factId": "fact-1", "memorySpaceId": "space-1",
+             "action": "UPDATE", "timestamp": 1, "oldValue": "a", "newValue": "d", "compacted": 2},
+        ])
+        service = FactHistoryService(client)
+
+        events = await service.get_history("fact-1")
+
+        assert events[0].compacted == 2
+        assert events[0].old_value == "a"
+
 
 @pytest.mark.asyncio
 class TestFactHistoryServiceDeletion:
@@ -4,15 +4,21 @@ Unit tests for Cortex SDK - Slot Matching
 Tests predicate classification, slot extraction, and SlotMatchingService.
 """
 
+import random
+import time
+from typing import Dict, List
+
 import pytest
 
 from cortex.facts.slot_matching import (
     DEFAULT_PREDICATE_CLASSES,
+    PredicateClassifier,
     SlotMatch,
     SlotMatchingConfig,
     SlotMatchingService,
     classify_predicate,
     extract_slot,
+    merge_predicate_classes,
     normalize_predicate,
     normalize_subject,
 )
@@ -393,5 +399,289 @@ class TestSlotMatchingServiceAsync:
         assert result.slot is None
 
 
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# PredicateClassifier Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def scan_classify(predicate: str, classes: Dict[str, List[str]]) -> str:
+    """Reference classifier: test every pattern of every class in order."""
+    if not predicate:
+        return "unknown"
+    normalized = normalize_predicate(predicate)
+    for class_name, patterns in classes.items():
+        for pattern in patterns:
+            if pattern.lower() in normalized:
+                return class_name
+    return normalized
+
+
+def random_predicates(count: int, seed: int = 7) -> List[str]:
+    """Predicates mixing known patterns, partial words and filler."""
+    rng = random.Random(seed)
+    patterns = [p for ps in DEFAULT_PREDICATE_CLASSES.values() for p in ps]
+    filler = "user really the and has been working remotely for years old recalled singles".split()
+    predicates = []
+    for _ in range(count):
+        words = rng.sample(filler, rng.randint(1, 4))
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randint(0, len(words)), rng.choice(patterns))
+        predicates.append(" ".join(words).title() if rng.random() < 0.2 else " ".join(words))
+    return predicates
+
+
+class TestPredicateClassifier:
+    """Tests for the compiled PredicateClassifier."""
+
+    def test_matches_pattern_scan(self) -> None:
+        """Should agree with the pattern-by-pattern scan."""
+        classifier = PredicateClassifier(DEFAULT_PREDICATE_CLASSES, cache_size=0)
+
+        for predicate in random_predicates(5000):
+            assert classifier.classify(predicate) == scan_classify(
+                predicate, DEFAULT_PREDICATE_CLASSES
+            ), predicate
+
+    def test_class_order_wins_over_text_position(self) -> None:
+        """Earlier classes win even when their pattern appears later in the text."""
+        # "location" is listed before "employment"
+        assert classify_predicate("works at a place and lives in Paris") == "location"
+
+    def test_overlapping_and_prefix_patterns(self) -> None:
+        """Should find patterns that overlap or are prefixes of other patterns."""
+        classes = {"first": ["ab"], "second": ["abc"], "third": ["bcd"]}
+        classifier = PredicateClassifier(classes)
+
+        assert classifier.classify("abcd") == "first"
+        assert classifier.classify("xbcd") == "third"
+        assert PredicateClassifier({"a": ["bcd"], "b": ["abc"]}).classify("abcd") == "a"
+
+    def test_custom_classes_merge(self) -> None:
+        """Custom patterns extend default classes with higher priority."""
+        custom = {"favorite_color": ["loves the color"], "crypto": ["owns bitcoin"]}
+        merged = merge_predicate_classes(custom)
+        classifier = PredicateClassifier(merged)
+
+        assert merged["favorite_color"][0] == "loves the color"
+        assert classifier.classify("loves the color") == "favorite_color"
+        assert classifier.classify("owns bitcoin") == "crypto"
+        for predicate in random_predicates(500):
+            assert classifier.classify(predicate) == scan_classify(predicate, merged)
+
+    def test_extract_slot_memoized_per_service(self) -> None:
+        """Repeated (subject, predicate) pairs are served from the cache."""
+        class MockClient:
+            pass
+
+        service = SlotMatchingService(MockClient())
+        for _ in range(3):
+            assert service.get_slot("User", "lives in") == SlotMatch("user", "location")
+
+        info = service._slot_key.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    @pytest.mark.benchmark
+    def test_benchmark_100k_predicates(self) -> None:
+        """Compiled classifier versus the per-pattern scan over 100k predicates."""
+        predicates = random_predicates(100_000, seed=11)
+
+        start = time.perf_counter()
+        expected = [scan_classify(p, DEFAULT_PREDICATE_CLASSES) for p in predicates]
+        scan_s = time.perf_counter() - start
+
+        compiled = PredicateClassifier(DEFAULT_PREDICATE_CLASSES, cache_size=0)
+        start = time.perf_counter()
+        actual = [compiled.classify(p) for p in predicates]
+        compiled_s = time.perf_counter() - start
+
+        # Realistic workload: a limited vocabulary of predicates repeats
+        vocabulary = predicates[:2000]
+        repeated = [vocabulary[i % len(vocabulary)] for i in range(100_000)]
+        memoized = PredicateClassifier(DEFAULT_PREDICATE_CLASSES)
+        start = time.perf_counter()
+        for predicate in repeated:
+            memoized.classify(predicate)
+        memoized_s = time.perf_counter() - start
+
+        print(
+            f"\n[predicate classifier benchmark] {len(predicates)} predicates\n"
+            f"  pattern scan : {scan_s * 1000:8.1f} ms\n"
+            f"  compiled     : {compiled_s * 1000:8.1f} ms\n"
+            f"  memoized     : {memoized_s * 1000:8.1f} ms (2k distinct)"
+        )
+
+        assert actual == expected
+        assert compiled_s < scan_s
+        assert memoized_s < compiled_s
+
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Persisted Slot Key Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def stored_fact(fact_id: str, subject: str, predicate: str, **extra) -> Dict:
+    return {
+        "_id": f"doc-{fact_id}",
+        "factId": fact_id,
+        "memorySpaceId": "space-1",
+        "fact": f"{subject} {predicate}",
+        "factType": "preference",
+        "subject": subject,
+        "predicate": predicate,
+        "confidence": 80,
+        "sourceType": "conversation",
+        "tags": [],
+        "createdAt": 1,
+        "updatedAt": 1,
+        "version": 1,
+        **extra,
+    }
+
+
+@pytest.mark.asyncio
+class TestPersistedSlotKeys:
+    """Tests for slot keys stored on facts and the indexed lookup."""
+
+    async def test_find_slot_conflicts_uses_slot_index(self) -> None:
+        """Should look up the slot directly instead of scanning the subject."""
+        calls = []
+
+        class MockClient:
+            async def query(self, name, args):
+                calls.append((name, args))
+                if name == "facts:hasUnslotted":
+                    return False
+                return [stored_fact("fact-1", "User", "favorite color")]
+
+        service = SlotMatchingService(MockClient())
+        result = await service.find_slot_conflicts(
+            {"subject": " USER ", "predicate": "Preferred Colour"},
+            "space-1",
+            "user-1",
+        )
+
+        assert result.has_conflict is True
+        assert [name for name, _ in calls] == ["facts:queryBySlot", "facts:hasUnslotted"]
+        assert calls[0][1] == {
+            "memorySpaceId": "space-1",
+            "normalizedSubject": "user",
+            "predicateClass": "favorite_color",
+            "userId": "user-1",
+            "limit": 100,
+        }
+
+        # A fully slotted space is remembered
+        await service.find_slot_conflicts(
+            {"subject": "User", "predicate": "favorite color"}, "space-1"
+        )
+        assert [name for name, _ in calls].count("facts:hasUnslotted") == 1
+
+    async def test_unslotted_facts_found_by_subject_scan(self) -> None:
+        """Facts stored without slot keys are found until they are backfilled."""
+        legacy = {**stored_fact("fact-1", "User", "favorite color"), "normalizedSubject": None, "predicateClass": None}
+
+        class MockClient:
+            async def query(self, name, args):
+                if name == "facts:queryBySlot":
+                    return []
+                if name == "facts:hasUnslotted":
+                    return True
+                return [legacy, stored_fact("fact-2", "User", "lives in")]
+
+        service = SlotMatchingService(MockClient())
+        result = await service.find_slot_conflicts(
+            {"subject": "User", "predicate": "favorite color"}, "space-1"
+        )
+
+        assert [f["factId"] for f in result.conflicting_facts] == ["fact-1"]
+
+    async def test_falls_back_to_subject_scan(self) -> None:
+        """Should classify subject facts client-side without a slot index."""
+        class MockClient:
+            async def query(self, name, args):
+                if name == "facts:queryBySlot":
+                    raise RuntimeError("Could not find public function")
+                return [
+                    stored_fact("fact-1", "User", "favorite color"),
+                    stored_fact("fact-2", "User", "lives in"),
+                ]
+
+        service = SlotMatchingService(MockClient())
+        result = await service.find_slot_conflicts(
+            {"subject": "User", "predicate": "favorite color"}, "space-1"
+        )
+
+        assert [f["factId"] for f in result.conflicting_facts] == ["fact-1"]
+
+    async def test_store_persists_slot_key(self) -> None:
+        """FactsAPI.store should write the computed slot key."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from cortex.facts import FactsAPI
+        from cortex.types import StoreFactParams
+
+        client = MagicMock()
+        client.mutation = AsyncMock(return_value=stored_fact("fact-1", "User", "lives in"))
+
+        await FactsAPI(client).store(
+            StoreFactParams(
+                memory_space_id="space-1",
+                fact="User lives in Paris",
+                fact_type="identity",
+                subject="User",
+                predicate="Lives in",
+                object="Paris",
+                confidence=90,
+                source_type="conversation",
+            )
+        )
+
+        args = client.mutation.await_args.args[1]
+        assert args["normalizedSubject"] == "user"
+        assert args["predicateClass"] == "location"
+
+    async def test_backfill_slots(self) -> None:
+        """Should write slot keys only for facts missing them, page by page."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from cortex.facts import FactsAPI
+
+        pages = [
+            {
+                "page": [
+                    stored_fact("fact-1", "User", "lives in"),
+                    stored_fact(
+                        "fact-2", "User", "works at",
+                        normalizedSubject="user", predicateClass="employment",
+                    ),
+                ],
+                "isDone": False,
+                "continueCursor": "c1",
+            },
+            {
+                "page": [stored_fact("fact-3", "Alice", "favorite color", supersededBy="fact-4")],
+                "isDone": True,
+                "continueCursor": None,
+            },
+        ]
+        client = MagicMock()
+        client.query = AsyncMock(side_effect=pages)
+        client.mutation = AsyncMock(side_effect=lambda name, args: {"updated": len(args["items"])})
+
+        updated = await FactsAPI(client).backfill_slots("space-1", page_size=2)
+
+        assert updated == 2
+        items = [item for call in client.mutation.await_args_list for item in call.args[1]["items"]]
+        assert items == [
+            {"factId": "fact-1", "normalizedSubject": "user", "predicateClass": "location"},
+            {"factId": "fact-3", "normalizedSubject": "alice", "predicateClass": "favorite_color"},
+        ]
+        assert client.query.await_args_list[0].args[1]["includeSuperseded"] is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
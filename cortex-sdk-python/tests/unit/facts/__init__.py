@@ -0,0 +1 @@
+"""Facts unit tests package."""
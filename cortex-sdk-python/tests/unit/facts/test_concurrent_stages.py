@@ -0,0 +1,216 @@
+"""
+Unit Tests: Concurrent Belief Revision Stages
+
+Tests for BeliefRevisionConfig.concurrent_stages: all candidate lookups
+start at once, lower-priority stages are cancelled after a hit, and the
+pipeline report matches the sequential waterfall. Also covers the
+concurrent slot + semantic checks of check_conflicts.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from cortex.facts.belief_revision import (
+    BeliefRevisionConfig,
+    BeliefRevisionService,
+    ConflictCandidate,
+    ReviseParams,
+)
+from cortex.facts.slot_matching import SlotConflictResult
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Test Fixtures
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class MockConvexClient:
+    """Convex client mock that stores facts."""
+
+    def __init__(self) -> None:
+        self.mutations: List[Any] = []
+
+    async def query(self, method: str, args: Dict[str, Any]):
+        return []
+
+    async def mutation(self, method: str, args: Dict[str, Any]):
+        self.mutations.append((method, args))
+        return {"factId": "fact-new", **args}
+
+
+class StageRecorder:
+    """Replaces the three lookups with delayed stubs that record their lifecycle."""
+
+    def __init__(self, service: BeliefRevisionService, hits: Dict[str, List[Any]], delay: float = 0.05):
+        self.started: List[str] = []
+        self.cancelled: List[str] = []
+        self.hits = hits
+        self.delay = delay
+
+        async def slot(params, shared=None):
+            facts = await self._run("slot")
+            return SlotConflictResult(has_conflict=bool(facts), conflicting_facts=facts)
+
+        async def semantic(params):
+            return [{"fact": f, "score": 0.9} for f in await self._run("semantic")]
+
+        async def subject_type(params, shared=None):
+            return await self._run("subject_type")
+
+        service._find_slot_conflicts = slot  # type: ignore[method-assign]
+        service._find_semantic_conflicts = semantic  # type: ignore[method-assign]
+        service._find_subject_type_conflicts = subject_type  # type: ignore[method-assign]
+
+    async def _run(self, name: str) -> List[Any]:
+        self.started.append(name)
+        try:
+            # Lower-priority stages take longer, so cancellation is observable
+            await asyncio.sleep(self.delay * (len(self.started)))
+        except asyncio.CancelledError:
+            self.cancelled.append(name)
+            raise
+        return self.hits.get(name, [])
+
+
+def existing(fact_id: str) -> Dict[str, Any]:
+    return {"factId": fact_id, "fact": "User likes blue", "subject": "user", "confidence": 80}
+
+
+def make_params() -> ReviseParams:
+    return ReviseParams(
+        memory_space_id="space-1",
+        fact=ConflictCandidate(
+            fact="User prefers purple",
+            confidence=90,
+            fact_type="preference",
+            subject="user",
+            predicate="favorite color",
+            object="purple",
+        ),
+    )
+
+
+def make_service(concurrent: bool) -> BeliefRevisionService:
+    return BeliefRevisionService(
+        MockConvexClient(),
+        config=BeliefRevisionConfig(concurrent_stages=concurrent),
+    )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# revise
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestConcurrentStages:
+    """Tests for concurrent candidate stages in revise."""
+
+    @pytest.mark.asyncio
+    async def test_slot_hit_cancels_lower_stages(self):
+        service = make_service(concurrent=True)
+        recorder = StageRecorder(service, {"slot": [existing("fact-slot")]})
+
+        result = await service.revise(make_params())
+        await asyncio.sleep(0)
+
+        assert recorder.started == ["slot", "semantic", "subject_type"]
+        assert sorted(recorder.cancelled) == ["semantic", "subject_type"]
+        assert list(result.pipeline) == ["slot_matching", "llm_resolution"]
+        assert result.pipeline["slot_matching"].fact_ids == ["fact-slot"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_runs_one_stage_at_a_time(self):
+        service = make_service(concurrent=False)
+        recorder = StageRecorder(service, {"slot": [existing("fact-slot")]})
+
+        await service.revise(make_params())
+
+        assert recorder.started == ["slot"]
+        assert recorder.cancelled == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "hits",
+        [
+            {},
+            {"semantic": [existing("fact-semantic")]},
+            {"subject_type": [existing("fact-subject")]},
+            {"semantic": [existing("fact-semantic")], "subject_type": [existing("fact-subject")]},
+        ],
+    )
+    async def test_pipeline_matches_sequential(self, hits):
+        reports = []
+        for concurrent in (False, True):
+            service = make_service(concurrent)
+            StageRecorder(service, hits, delay=0.001)
+            result = await service.revise(make_params())
+            reports.append((
+                result.action,
+                {name: (stage.matched, stage.fact_ids) for name, stage in result.pipeline.items()
+                 if name != "llm_resolution"},
+            ))
+
+        assert reports[0] == reports[1]
+
+    @pytest.mark.asyncio
+    async def test_skipped_stage_failure_is_ignored(self):
+        service = make_service(concurrent=True)
+        StageRecorder(service, {"slot": [existing("fact-slot")]}, delay=0)
+
+        async def failing(params):
+            raise RuntimeError("embedding service down")
+
+        service._find_semantic_conflicts = failing  # type: ignore[method-assign]
+
+        result = await service.revise(make_params())
+
+        assert result.pipeline["slot_matching"].matched is True
+
+    @pytest.mark.asyncio
+    async def test_config_can_be_enabled_later(self):
+        service = make_service(concurrent=False)
+        service.update_config(BeliefRevisionConfig(concurrent_stages=True))
+        recorder = StageRecorder(service, {"slot": [existing("fact-slot")]})
+
+        await service.revise(make_params())
+
+        assert recorder.started == ["slot", "semantic", "subject_type"]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# check_conflicts
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestCheckConflictsConcurrency:
+    """check_conflicts runs its slot and semantic checks together."""
+
+    @pytest.mark.asyncio
+    async def test_slot_and_semantic_overlap(self):
+        service = make_service(concurrent=False)
+        in_flight: List[str] = []
+        overlapped = []
+
+        async def track(name: str, value: Any) -> Any:
+            in_flight.append(name)
+            await asyncio.sleep(0.01)
+            overlapped.append(len(in_flight) == 2)
+            return value
+
+        async def slot(params, shared=None):
+            return await track(
+                "slot", SlotConflictResult(has_conflict=True, conflicting_facts=[existing("fact-slot")])
+            )
+
+        async def semantic(params):
+            return await track("semantic", [{"fact": existing("fact-semantic"), "score": 0.8}])
+
+        service._find_slot_conflicts = slot  # type: ignore[method-assign]
+        service._find_semantic_conflicts = semantic  # type: ignore[method-assign]
+
+        result = await service.check_conflicts(make_params())
+
+        assert overlapped == [True, True]
+        assert [f["factId"] for f in result.slot_conflicts] == ["fact-slot"]
+        assert [c.fact["factId"] for c in result.semantic_conflicts] == ["fact-semantic"]
@@ -0,0 +1,282 @@
+"""
+Unit Tests: Embedding Cache and Vectorized Semantic Deduplication
+
+Tests for EmbeddingCache, cosine_similarities and the cached semantic path
+of FactDeduplicationService, plus a per-fact cost benchmark against the
+previous embed-every-candidate loop.
+"""
+
+import time
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cortex.facts.deduplication import (
+    DeduplicationConfig,
+    FactCandidate,
+    FactDeduplicationService,
+    cosine_similarity,
+)
+from cortex.facts.embedding_cache import EmbeddingCache, cosine_similarities
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Test Fixtures
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class CountingEmbedder:
+    """Deterministic bag-of-letters embedder that counts calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.batch_calls = 0
+
+    @staticmethod
+    def vector(text: str) -> List[float]:
+        vec = [0.0] * 26
+        for ch in text.lower():
+            if "a" <= ch <= "z":
+                vec[ord(ch) - ord("a")] += 1.0
+        return vec
+
+    async def embed(self, text: str) -> List[float]:
+        self.calls += 1
+        return self.vector(text)
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.batch_calls += 1
+        return [self.vector(t) for t in texts]
+
+
+def make_fact(i: int, text: str) -> Dict[str, Any]:
+    return {
+        "_id": f"doc-{i}",
+        "factId": f"fact-{i}",
+        "memorySpaceId": "space-1",
+        "fact": text,
+        "factType": "preference",
+        "confidence": 80,
+        "sourceType": "conversation",
+        "tags": [],
+        "createdAt": 1,
+        "updatedAt": 1,
+        "version": 1,
+    }
+
+
+def make_client(facts: List[Dict[str, Any]]) -> MagicMock:
+    client = MagicMock()
+
+    async def query(name: str, args: Dict[str, Any]):
+        if name == "facts:list":
+            return facts[: args.get("limit", len(facts))]
+        # Backend without vector search: exercise the list-and-embed fallback
+        raise RuntimeError(f"Could not find public function for '{name}'")
+
+    client.query = AsyncMock(side_effect=query)
+    return client
+
+
+EXISTING = [make_fact(99, "User prefers dark mode")]
+EXISTING += [make_fact(i, f"User enjoys hobby number {i} quite a lot") for i in range(60)]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# EmbeddingCache
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestEmbeddingCache:
+    """Tests for the LRU/TTL embedding cache."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_generated(self):
+        embedder = CountingEmbedder()
+        cache = EmbeddingCache()
+
+        await cache.get_many(["a", "b", "a"], generate_embedding=embedder.embed)
+        assert embedder.calls == 2
+
+        await cache.get_many(["a", "b", "c"], generate_embedding=embedder.embed)
+        assert embedder.calls == 3
+        assert cache.stats.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_function_used_once_for_misses(self):
+        embedder = CountingEmbedder()
+        cache = EmbeddingCache()
+
+        vectors = await cache.get_many(
+            ["abc", "xyz", "abc"],
+            generate_embedding=embedder.embed,
+            generate_embeddings=embedder.embed_batch,
+        )
+
+        assert embedder.batch_calls == 1
+        assert embedder.calls == 0
+        assert vectors[0] == vectors[2] == CountingEmbedder.vector("abc")
+
+    def test_lru_eviction(self):
+        cache = EmbeddingCache(max_entries=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        assert cache.get("a") == [1.0]  # a becomes most recent
+        cache.put("c", [3.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        import cortex.facts.embedding_cache as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        cache = EmbeddingCache(ttl_seconds=10)
+        cache.put("a", [1.0])
+
+        now[0] += 11
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+
+    @pytest.mark.asyncio
+    async def test_namespaced_by_model(self):
+        embedder = CountingEmbedder()
+        cache = EmbeddingCache()
+
+        await cache.get_many(["a"], generate_embedding=embedder.embed, model="model-a")
+        await cache.get_many(["a"], generate_embedding=embedder.embed, model="model-b")
+
+        assert embedder.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_same_model_shared_across_functions(self):
+        """Recreated closures/wrappers for one model still hit the cache."""
+        first, second = CountingEmbedder(), CountingEmbedder()
+        cache = EmbeddingCache()
+
+        await cache.get_many(["a"], generate_embedding=first.embed, model="model-a")
+        await cache.get_many(["a"], generate_embedding=lambda t: second.embed(t), model="model-a")
+
+        assert (first.calls, second.calls) == (1, 0)
+
+    def test_facts_api_shares_one_cache(self):
+        from cortex.facts import FactsAPI
+
+        cache = EmbeddingCache()
+        facts = FactsAPI(MagicMock(), embedding_cache=cache)
+        facts.configure_belief_revision()
+
+        assert facts._dedup_service.embedding_cache is cache
+        assert facts._belief_revision_service._dedup_service.embedding_cache is cache
+
+
+class TestCosineSimilarities:
+    """Tests for vectorized similarity."""
+
+    def test_matches_pairwise_similarity(self):
+        query = [1.0, 2.0, 3.0]
+        candidates = [[1.0, 2.0, 3.0], [3.0, 2.0, 1.0], [0.0, 0.0, 0.0], [-1.0, -2.0, -3.0]]
+
+        scores = cosine_similarities(query, candidates)
+
+        for candidate, score in zip(candidates, scores):
+            assert score == pytest.approx(cosine_similarity(query, candidate))
+
+    def test_dimension_mismatch(self):
+        with pytest.raises(ValueError):
+            cosine_similarities([1.0, 2.0], [[1.0]])
+
+    def test_empty_candidates(self):
+        assert cosine_similarities([1.0], []) == []
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Semantic Deduplication
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestCachedSemanticMatch:
+    """Tests for the cached semantic path of FactDeduplicationService."""
+
+    @pytest.mark.asyncio
+    async def test_finds_best_match(self):
+        embedder = CountingEmbedder()
+        service = FactDeduplicationService(make_client(EXISTING))
+
+        match = await service._find_semantic_match(
+            FactCandidate(fact="User prefers the dark mode", fact_type="preference", confidence=90),
+            "space-1",
+            embedder.embed,
+            0.9,
+        )
+
+        assert match is not None
+        assert match["fact"].fact_id == "fact-99"
+
+    @pytest.mark.asyncio
+    async def test_existing_facts_embedded_once(self):
+        embedder = CountingEmbedder()
+        service = FactDeduplicationService(make_client(EXISTING))
+        config = DeduplicationConfig(strategy="semantic", generate_embedding=embedder.embed)
+
+        for i in range(5):
+            await service._find_semantic_match(
+                FactCandidate(fact=f"new fact {i}", fact_type="preference", confidence=90),
+                "space-1",
+                config.generate_embedding,
+                0.99,
+            )
+
+        # 50 existing facts (limit) once + 1 candidate per check
+        assert embedder.calls == 50 + 5
+
+
+class TestDedupBenchmark:
+    """Per-fact semantic dedup cost before/after caching."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_benchmark_dedup_cost_per_fact(self):
+        checks = 20
+        latency = 0.001
+
+        class SlowEmbedder(CountingEmbedder):
+            async def embed(self, text: str) -> List[float]:
+                import asyncio
+
+                await asyncio.sleep(latency)
+                return await super().embed(text)
+
+        # Previous behaviour: embed candidate and every listed fact, pairwise loop
+        legacy = SlowEmbedder()
+        facts = EXISTING[:50]
+        start = time.perf_counter()
+        for i in range(checks):
+            candidate = await legacy.embed(f"new fact {i}")
+            for fact in facts:
+                cosine_similarity(candidate, await legacy.embed(fact["fact"]))
+        legacy_ms = (time.perf_counter() - start) * 1000
+
+        cached = SlowEmbedder()
+        service = FactDeduplicationService(make_client(EXISTING))
+        start = time.perf_counter()
+        for i in range(checks):
+            await service._find_semantic_match(
+                FactCandidate(fact=f"new fact {i}", fact_type="preference", confidence=90),
+                "space-1",
+                cached.embed,
+                0.99,
+            )
+        cached_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"\n[dedup benchmark] {checks} checks x {len(facts)} existing facts\n"
+            f"  before: {legacy.calls / checks:6.1f} embeddings/fact {legacy_ms / checks:7.2f} ms/fact\n"
+            f"  after : {cached.calls / checks:6.1f} embeddings/fact {cached_ms / checks:7.2f} ms/fact"
+        )
+
+        assert legacy.calls == checks * 51
+        assert cached.calls == 50 + checks
+        assert cached_ms < legacy_ms
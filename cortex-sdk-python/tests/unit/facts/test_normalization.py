@@ -0,0 +1,167 @@
+"""
+Unit Tests: Fact Text Normalization
+
+Tests for the shared normalization helpers, checked against the regex
+implementations they replaced, plus a benchmark on a synthetic corpus of
+extracted facts.
+"""
+
+import random
+import re
+import time
+from typing import List, Optional
+
+import pytest
+
+from cortex.facts import normalization
+from cortex.facts.normalization import (
+    clear_normalization_caches,
+    fact_key,
+    normalize_fact_text,
+    normalize_predicate,
+    normalize_subject,
+)
+from cortex.memory.streaming.fact_extractor import ProgressiveFactExtractor
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Reference Implementations
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def regex_fact_text(text: str) -> str:
+    result = text.lower().strip()
+    result = re.sub(r"[.,!?;:'\"]+", "", result)
+    result = re.sub(r"\b(the|a|an|is|are|was|were|be|been|being)\b", "", result, flags=re.IGNORECASE)
+    result = re.sub(r"\s+", " ", result)
+    return result.strip()
+
+
+def regex_subject(subject: Optional[str]) -> str:
+    if not subject:
+        return ""
+    return re.sub(r"\s+", " ", subject.lower().strip())
+
+
+def regex_predicate(predicate: Optional[str]) -> str:
+    if not predicate:
+        return ""
+    normalized = re.sub(r"\s+", " ", predicate.lower().strip())
+    return re.sub(r"[.,!?;:'\"]+", "", normalized)
+
+
+SUBJECTS = ["User", "the user", "Alice", "Bob Smith", "user's sister", "My  manager", "Team Lead"]
+PREDICATES = [
+    "lives in", "works at", "favorite color", "prefers", "is allergic to",
+    "has a", "was born in", "likes", "Speaks", "Is Married To", "owns a",
+]
+OBJECTS = [
+    "Paris", "Acme Corp.", "blue", "dark mode!", "peanuts", "a golden retriever",
+    "1990", "the beach", "Spanish; French", "\"Star Wars\"", "an old Volvo",
+]
+
+
+def extracted_facts(count: int, seed: int = 7) -> List[str]:
+    """Sentences shaped like LLM-extracted facts."""
+    rng = random.Random(seed)
+    facts = []
+    for _ in range(count):
+        fact = f"{rng.choice(SUBJECTS)} {rng.choice(PREDICATES)} {rng.choice(OBJECTS)}"
+        if rng.random() < 0.3:
+            fact = fact.upper() if rng.random() < 0.2 else fact.capitalize()
+        if rng.random() < 0.5:
+            fact += rng.choice([".", "!", " .", "  "])
+        facts.append(fact)
+    return facts
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Behaviour
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestNormalization:
+    """The single-pass helpers match the regex versions."""
+
+    def test_fact_text_matches_regex(self):
+        for fact in extracted_facts(2000):
+            assert normalize_fact_text(fact) == regex_fact_text(fact), fact
+
+    @pytest.mark.parametrize("subject", SUBJECTS + ["", None, "  ALICE\t\n Doe ", "user_id:456"])
+    def test_subject_matches_regex(self, subject):
+        assert normalize_subject(subject) == regex_subject(subject)
+
+    @pytest.mark.parametrize(
+        "predicate", PREDICATES + ["", None, "What's your name?", "a . b", "  Hello,\tWorld! "]
+    )
+    def test_predicate_matches_regex(self, predicate):
+        assert normalize_predicate(predicate) == regex_predicate(predicate)
+
+    def test_stopwords_are_whole_tokens(self):
+        assert normalize_fact_text("Anna is being thebest") == "anna thebest"
+        assert normalize_fact_text("THE user IS a Vegetarian.") == "user vegetarian"
+
+    def test_results_are_memoized(self):
+        clear_normalization_caches()
+        for _ in range(3):
+            normalize_fact_text("User likes blue")
+
+        info = normalize_fact_text.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_fact_key(self):
+        assert fact_key("The user likes Blue.") == "user likes blue"
+        assert fact_key("User likes blue", subject="  The User ") == "the user::user likes blue"
+
+    def test_extractor_keys_ignore_punctuation_and_case(self):
+        extractor = ProgressiveFactExtractor.__new__(ProgressiveFactExtractor)
+
+        assert extractor._generate_fact_key("User likes blue.", "User") == extractor._generate_fact_key(
+            "the user likes BLUE", "user"
+        )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Benchmark
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestNormalizationBenchmark:
+    """Regex helpers versus the single-pass and memoized helpers."""
+
+    @pytest.mark.benchmark
+    def test_benchmark_50k_facts(self):
+        facts = extracted_facts(50_000, seed=3)
+        subjects = [f.split(" ", 2)[0] for f in facts]
+        predicates = [PREDICATES[i % len(PREDICATES)] for i in range(len(facts))]
+
+        def run(fact_fn, subject_fn, predicate_fn) -> float:
+            start = time.perf_counter()
+            for fact, subject, predicate in zip(facts, subjects, predicates):
+                fact_fn(fact)
+                subject_fn(subject)
+                predicate_fn(predicate)
+            return time.perf_counter() - start
+
+        regex_s = run(regex_fact_text, regex_subject, regex_predicate)
+
+        clear_normalization_caches()
+        uncached_s = run(
+            normalization.normalize_fact_text.__wrapped__,
+            normalization._normalize_subject.__wrapped__,
+            normalization._normalize_predicate.__wrapped__,
+        )
+
+        clear_normalization_caches()
+        memoized_s = run(normalize_fact_text, normalize_subject, normalize_predicate)
+        distinct = len(set(facts))
+
+        print(
+            f"\n[normalization benchmark] {len(facts)} facts ({distinct} distinct)\n"
+            f"  regex       : {regex_s * 1000:8.1f} ms\n"
+            f"  single-pass : {uncached_s * 1000:8.1f} ms\n"
+            f"  memoized    : {memoized_s * 1000:8.1f} ms"
+        )
+
+        assert uncached_s < regex_s
+        assert memoized_s < regex_s
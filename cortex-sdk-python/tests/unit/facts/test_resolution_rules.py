@@ -0,0 +1,280 @@
+"""
+Unit Tests: Conflict Resolution Fast Paths
+
+Tests for the deterministic resolution rules, the LLM decision cache and
+the resolution metrics reported by BeliefRevisionService.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from cortex.facts.belief_revision import (
+    BeliefRevisionConfig,
+    BeliefRevisionService,
+    ConflictCandidate,
+    LLMResolutionConfigOptions,
+    ReviseParams,
+    SemanticMatchingConfigOptions,
+)
+from cortex.facts.resolution_rules import ConflictDecisionCache, ResolutionRuleEngine
+from cortex.facts.slot_matching import extract_slot
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Test Fixtures
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def stored(fact_id: str, text: str, predicate: str, obj: str, **extra: Any) -> Dict[str, Any]:
+    return {
+        "factId": fact_id,
+        "fact": text,
+        "factType": "identity",
+        "subject": "user",
+        "predicate": predicate,
+        "object": obj,
+        "confidence": 90,
+        "version": 1,
+        "createdAt": 1_000,
+        **extra,
+    }
+
+
+def candidate(text: str, predicate: str, obj: str, confidence: int = 90) -> ConflictCandidate:
+    return ConflictCandidate(
+        fact=text,
+        confidence=confidence,
+        fact_type="identity",
+        subject="user",
+        predicate=predicate,
+        object=obj,
+    )
+
+
+class MockConvexClient:
+    """Returns ``facts`` for every slot/subject lookup."""
+
+    def __init__(self, facts: List[Dict[str, Any]]):
+        self.facts = facts
+        self.mutations: List[Any] = []
+
+    async def query(self, method: str, args: Dict[str, Any]):
+        if method == "facts:queryBySlot":
+            return [
+                f for f in self.facts
+                if (f.get("normalizedSubject"), f.get("predicateClass"))
+                == (args["normalizedSubject"], args["predicateClass"])
+            ]
+        if method == "facts:hasUnslotted":
+            return any(not f.get("normalizedSubject") for f in self.facts)
+        if method in ("facts:queryBySubject", "facts:list"):
+            return self.facts
+        return []
+
+    async def mutation(self, method: str, args: Dict[str, Any]):
+        self.mutations.append((method, args))
+        return {"factId": f"fact-new-{len(self.mutations)}", **args}
+
+
+class MockLLMClient:
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    async def complete(self, *, system: str, prompt: str, model=None, response_format=None):
+        self.calls += 1
+        return self.response
+
+
+def make_service(
+    facts: List[Dict[str, Any]],
+    llm: Optional[MockLLMClient] = None,
+    **llm_options: Any,
+) -> BeliefRevisionService:
+    return BeliefRevisionService(
+        MockConvexClient(facts),
+        llm,
+        config=BeliefRevisionConfig(
+            semantic_matching=SemanticMatchingConfigOptions(enabled=False),
+            llm_resolution=LLMResolutionConfigOptions(**llm_options),
+        ),
+    )
+
+
+def revise_params(fact: ConflictCandidate) -> ReviseParams:
+    return ReviseParams(memory_space_id="space-1", fact=fact)
+
+
+ENGINE = ResolutionRuleEngine(lambda subject, predicate: extract_slot(subject, predicate))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Rule Engine
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestResolutionRuleEngine:
+    """Tests for ResolutionRuleEngine.decide."""
+
+    def test_identical_text_is_duplicate(self):
+        decision, rule = ENGINE.decide(
+            candidate("The user lives in Paris.", "lives in", "Paris"),
+            [stored("f1", "User lives in Paris", "lives in", "Paris")],
+        )
+        assert rule == "identical_text"
+        assert decision is not None
+        assert decision.action == "NONE"
+        assert decision.target_fact_id == "f1"
+
+    def test_identical_text_with_higher_confidence_updates(self):
+        decision, _ = ENGINE.decide(
+            candidate("User lives in Paris", "lives in", "Paris", confidence=99),
+            [stored("f1", "User lives in Paris", "lives in", "Paris")],
+        )
+        assert decision is not None
+        assert decision.action == "UPDATE"
+
+    def test_same_object_is_none(self):
+        decision, rule = ENGINE.decide(
+            candidate("User resides in paris", "resides in", "paris"),
+            [stored("f1", "User lives in Paris", "lives in", "Paris")],
+        )
+        assert rule == "same_object"
+        assert decision is not None
+        assert decision.action == "NONE"
+
+    def test_single_valued_slot_supersedes_newest(self):
+        decision, rule = ENGINE.decide(
+            candidate("User lives in Berlin", "lives in", "Berlin"),
+            [
+                stored("f1", "User lives in Paris", "lives in", "Paris", createdAt=1_000),
+                stored("f2", "User lives in Rome", "lives in", "Rome", createdAt=2_000),
+            ],
+            now=3_000,
+        )
+        assert rule == "single_valued_slot"
+        assert decision is not None
+        assert decision.action == "SUPERSEDE"
+        assert decision.target_fact_id == "f2"
+
+    def test_multi_valued_slot_needs_llm(self):
+        decision, rule = ENGINE.decide(
+            candidate("User speaks German", "speaks", "German"),
+            [stored("f1", "User speaks French", "speaks", "French")],
+        )
+        assert decision is None
+        assert rule is None
+
+    def test_newer_stored_fact_needs_llm(self):
+        decision, _ = ENGINE.decide(
+            candidate("User lives in Berlin", "lives in", "Berlin"),
+            [stored("f1", "User lives in Paris", "lives in", "Paris", createdAt=5_000)],
+            now=3_000,
+        )
+        assert decision is None
+
+    def test_unstored_candidate_needs_llm(self):
+        batch_fact = stored("batch-0", "User lives in Paris", "lives in", "Paris")
+        del batch_fact["createdAt"]
+        decision, _ = ENGINE.decide(
+            candidate("User lives in Berlin", "lives in", "Berlin"),
+            [batch_fact],
+        )
+        assert decision is None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Decision Cache
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestConflictDecisionCache:
+    """Tests for ConflictDecisionCache keys."""
+
+    def test_key_ignores_candidate_order(self):
+        new = candidate("User speaks German", "speaks", "German")
+        a = stored("f1", "User speaks French", "speaks", "French")
+        b = stored("f2", "User speaks Dutch", "speaks", "Dutch")
+        assert ConflictDecisionCache.key(new, [a, b]) == ConflictDecisionCache.key(new, [b, a])
+
+    def test_key_changes_with_candidate_version(self):
+        new = candidate("User speaks German", "speaks", "German")
+        a = stored("f1", "User speaks French", "speaks", "French")
+        assert ConflictDecisionCache.key(new, [a]) != ConflictDecisionCache.key(new, [{**a, "version": 2}])
+
+    def test_lru_eviction(self):
+        cache = ConflictDecisionCache(max_entries=1)
+        decision, _ = ENGINE.decide(
+            candidate("User lives in Paris", "lives in", "Paris"),
+            [stored("f1", "User lives in Paris", "lives in", "Paris")],
+        )
+        assert decision is not None
+        cache.put("a", decision)
+        cache.put("b", decision)
+        assert cache.get("a") is None
+        assert cache.get("b") is decision
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# BeliefRevisionService Integration
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+LLM_ADD = '{"action": "ADD", "targetFactId": null, "reason": "Different language", "mergedFact": null, "confidence": 80}'
+
+
+class TestResolutionFastPaths:
+    """Tests for rules, cache and metrics in BeliefRevisionService."""
+
+    @pytest.mark.asyncio
+    async def test_rule_decides_without_llm(self):
+        llm = MockLLMClient(LLM_ADD)
+        service = make_service([stored("f1", "User lives in Paris", "lives in", "Paris")], llm)
+
+        result = await service.revise(revise_params(candidate("User lives in Berlin", "lives in", "Berlin")))
+
+        assert result.action == "SUPERSEDE"
+        assert result.pipeline["llm_resolution"].source == "rules"
+        assert llm.calls == 0
+        metrics = service.get_resolution_metrics()
+        assert metrics.rules == 1
+        assert metrics.rule_hits == {"single_valued_slot": 1}
+
+    @pytest.mark.asyncio
+    async def test_llm_decision_is_cached(self):
+        llm = MockLLMClient(LLM_ADD)
+        service = make_service([stored("f1", "User speaks French", "speaks", "French")], llm)
+        params = candidate("User speaks German", "speaks", "German")
+
+        first = await service.revise(revise_params(params))
+        second = await service.revise(revise_params(candidate("User speaks German", "speaks", "German")))
+
+        assert first.pipeline["llm_resolution"].source == "llm"
+        assert second.pipeline["llm_resolution"].source == "cache"
+        assert llm.calls == 1
+        metrics = service.get_resolution_metrics()
+        assert (metrics.llm, metrics.cache_hits, metrics.llm_calls, metrics.total) == (1, 1, 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_rules_and_cache_can_be_disabled(self):
+        llm = MockLLMClient(LLM_ADD)
+        service = make_service(
+            [stored("f1", "User lives in Paris", "lives in", "Paris")],
+            llm,
+            fast_path_rules=False,
+            cache_size=0,
+        )
+
+        for _ in range(2):
+            result = await service.revise(revise_params(candidate("User lives in Berlin", "lives in", "Berlin")))
+            assert result.pipeline["llm_resolution"].source == "llm"
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_defaults_counted_without_llm(self):
+        service = make_service([stored("f1", "User speaks French", "speaks", "French")])
+
+        result = await service.revise(revise_params(candidate("User speaks German", "speaks", "German")))
+
+        assert result.pipeline["llm_resolution"].source == "default"
+        assert service.get_resolution_metrics().defaults == 1
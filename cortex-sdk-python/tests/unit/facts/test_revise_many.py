@@ -0,0 +1,300 @@
+"""
+Unit Tests: Batched Belief Revision
+
+Tests for BeliefRevisionService.revise_many: shared candidate lookups,
+intra-batch candidates, the consolidated LLM prompt, the batched
+facts:applyRevisions write and its per-fact fallback.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from cortex.facts.belief_revision import (
+    BeliefRevisionConfig,
+    BeliefRevisionService,
+    ConflictCandidate,
+    PartialRevisionError,
+    ReviseParams,
+    SemanticMatchingConfigOptions,
+)
+from cortex.facts.conflict_prompts import (
+    build_batch_conflict_resolution_prompt,
+    parse_batch_conflict_decisions,
+)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Test Fixtures
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class MockConvexClient:
+    """Convex client mock with slot/subject lookups and applyRevisions."""
+
+    def __init__(
+        self,
+        facts: Optional[List[Dict[str, Any]]] = None,
+        batch_write: bool = True,
+        max_stores: Optional[int] = None,
+    ):
+        self.facts = facts or []
+        self.batch_write = batch_write
+        self.max_stores = max_stores
+        self.queries: List[Any] = []
+        self.mutations: List[Any] = []
+        self._next_id = 0
+
+    async def query(self, method: str, args: Dict[str, Any]):
+        self.queries.append((method, args))
+        if method in ("facts:queryBySlot", "facts:queryBySubject"):
+            subject = (args.get("subject") or args.get("normalizedSubject") or "").lower()
+            return [f for f in self.facts if f.get("subject", "").lower() == subject]
+        return []
+
+    async def mutation(self, method: str, args: Dict[str, Any]):
+        self.mutations.append((method, args))
+        if method == "facts:applyRevisions":
+            if not self.batch_write:
+                raise RuntimeError("Could not find public function for 'facts:applyRevisions'")
+            return [
+                {"fact": self._stored(op["fact"]), "superseded": []}
+                for op in args["ops"]
+            ]
+        if method == "facts:store":
+            if self.max_stores is not None and self._next_id >= self.max_stores:
+                raise RuntimeError("write failed")
+            return self._stored(args)
+        if method == "facts:updateInPlace":
+            return {"factId": args["factId"], "fact": args["fact"]}
+        return {}
+
+    def _stored(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        self._next_id += 1
+        return {"factId": f"fact-new-{self._next_id}", **args}
+
+
+class MockLLMClient:
+    """LLM mock returning a fixed response and recording calls."""
+
+    def __init__(self, response: str):
+        self.response = response
+        self.calls: List[Dict[str, Any]] = []
+
+    async def complete(self, *, system: str, prompt: str, model=None, response_format=None):
+        self.calls.append({"system": system, "prompt": prompt})
+        return self.response
+
+
+EXISTING = {
+    "factId": "fact-old",
+    "fact": "User lives in Paris",
+    "factType": "identity",
+    "subject": "user",
+    "predicate": "lives in",
+    "object": "Paris",
+    "confidence": 90,
+}
+
+
+def make_params(text: str, predicate: str, obj: str, fact_type: str = "identity") -> ReviseParams:
+    return ReviseParams(
+        memory_space_id="space-1",
+        user_id="user-1",
+        fact=ConflictCandidate(
+            fact=text,
+            fact_type=fact_type,
+            subject="user",
+            predicate=predicate,
+            object=obj,
+            confidence=90,
+        ),
+    )
+
+
+def make_service(client: MockConvexClient, llm: Optional[MockLLMClient] = None) -> BeliefRevisionService:
+    return BeliefRevisionService(
+        client,
+        llm,
+        config=BeliefRevisionConfig(
+            semantic_matching=SemanticMatchingConfigOptions(enabled=False),
+        ),
+    )
+
+
+def batch_response(*decisions: Dict[str, Any]) -> str:
+    return json.dumps({"decisions": list(decisions)})
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# revise_many
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestReviseMany:
+    """Tests for BeliefRevisionService.revise_many."""
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        service = make_service(MockConvexClient())
+        assert await service.revise_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_one_llm_call_and_one_write_for_batch(self):
+        client = MockConvexClient(facts=[EXISTING])
+        llm = MockLLMClient(batch_response(
+            {"index": 1, "action": "SUPERSEDE", "targetFactId": "fact-old", "reason": "Moved", "confidence": 90},
+            {"index": 2, "action": "ADD", "targetFactId": None, "reason": "New", "confidence": 80},
+        ))
+        service = make_service(client, llm)
+
+        results = await service.revise_many([
+            make_params("User lives in Berlin", "lives in", "Berlin"),
+            make_params("User is named Sam", "is named", "Sam"),
+        ])
+
+        assert len(llm.calls) == 1
+        assert "New Fact 1" in llm.calls[0]["prompt"]
+        assert "New Fact 2" in llm.calls[0]["prompt"]
+
+        writes = [m for m in client.mutations if m[0] == "facts:applyRevisions"]
+        assert len(writes) == 1
+        assert [m[0] for m in client.mutations] == ["facts:applyRevisions"]
+        ops = writes[0][1]["ops"]
+        assert ops[0]["action"] == "SUPERSEDE"
+        assert ops[0]["targetFactId"] == "fact-old"
+        assert ops[1]["action"] == "ADD"
+
+        assert [r.action for r in results] == ["SUPERSEDE", "ADD"]
+        assert results[0].pipeline["llm_resolution"].executed
+
+    @pytest.mark.asyncio
+    async def test_identical_lookups_are_shared(self):
+        client = MockConvexClient()
+        service = make_service(client)
+
+        await service.revise_many([
+            make_params("User likes tea", "likes", "tea", fact_type="preference"),
+            make_params("User likes coffee", "likes", "coffee", fact_type="preference"),
+            make_params("User likes cocoa", "likes", "cocoa", fact_type="preference"),
+        ])
+
+        slot_queries = [q for q in client.queries if q[0] == "facts:queryBySlot"]
+        assert len(slot_queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_earlier_batch_fact_is_candidate(self):
+        client = MockConvexClient()
+        llm = MockLLMClient(batch_response(
+            {"index": 1, "action": "SUPERSEDE", "targetFactId": "batch-0", "reason": "Corrected", "confidence": 90},
+        ))
+        service = make_service(client, llm)
+
+        results = await service.revise_many([
+            make_params("User lives in Paris", "lives in", "Paris"),
+            make_params("User lives in Berlin", "lives in", "Berlin"),
+        ])
+
+        assert "batch_matching" not in results[0].pipeline
+        assert results[1].pipeline["batch_matching"].fact_ids == ["batch-0"]
+        ops = client.mutations[-1][1]["ops"]
+        assert ops[0]["action"] == "ADD"
+        assert ops[1]["action"] == "SUPERSEDE"
+        assert ops[1]["targetOp"] == 0
+        assert "targetFactId" not in ops[1]
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_entry_falls_back_per_fact(self):
+        client = MockConvexClient(facts=[EXISTING])
+        llm = MockLLMClient(batch_response(
+            {"index": 1, "action": "SUPERSEDE", "targetFactId": "missing", "reason": "?", "confidence": 50},
+        ))
+        service = make_service(client, llm)
+
+        results = await service.revise_many([
+            make_params("User lives in Berlin", "lives in", "Berlin"),
+            make_params("User lives in Rome", "lives in", "Rome"),
+        ])
+
+        assert len(results) == 2
+        assert all(r.action in ("ADD", "UPDATE", "SUPERSEDE", "NONE") for r in results)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_sequential_writes(self):
+        client = MockConvexClient(batch_write=False)
+        service = make_service(client)
+
+        results = await service.revise_many([
+            make_params("User likes tea", "likes", "tea", fact_type="preference"),
+            make_params("User works at Acme", "works at", "Acme", fact_type="relationship"),
+        ])
+
+        methods = [m[0] for m in client.mutations]
+        assert methods[0] == "facts:applyRevisions"
+        assert methods.count("facts:store") == 2
+        assert all(r.fact["factId"].startswith("fact-new-") for r in results)
+
+    @pytest.mark.asyncio
+    async def test_partial_sequential_write_reports_written_facts(self):
+        client = MockConvexClient(batch_write=False, max_stores=1)
+        service = make_service(client)
+
+        with pytest.raises(PartialRevisionError) as raised:
+            await service.revise_many([
+                make_params("User likes tea", "likes", "tea", fact_type="preference"),
+                make_params("User works at Acme", "works at", "Acme", fact_type="relationship"),
+                make_params("User is named Sam", "is named", "Sam"),
+            ])
+
+        results = raised.value.results
+        assert results[0] is not None
+        assert results[0].fact["factId"] == "fact-new-1"
+        assert results[1:] == [None, None]
+        # Stops at the first failure: later facts may target earlier ones
+        assert [m[0] for m in client.mutations].count("facts:store") == 2
+
+    @pytest.mark.asyncio
+    async def test_mixed_memory_spaces_use_revise(self):
+        client = MockConvexClient()
+        service = make_service(client)
+        other = make_params("User likes tea", "likes", "tea", fact_type="preference")
+        other.memory_space_id = "space-2"
+
+        await service.revise_many([make_params("User likes coffee", "likes", "coffee"), other])
+
+        assert "facts:applyRevisions" not in [m[0] for m in client.mutations]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Batch Prompt Helpers
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestBatchPrompt:
+    """Tests for the batch prompt builder and parser."""
+
+    def test_prompt_numbers_each_fact(self):
+        items = [
+            (make_params("User lives in Berlin", "lives in", "Berlin").fact, [EXISTING]),
+            (make_params("User likes tea", "likes", "tea").fact, [EXISTING]),
+        ]
+        prompt = build_batch_conflict_resolution_prompt(items)
+
+        assert "New Fact 1" in prompt.user
+        assert "New Fact 2" in prompt.user
+        assert prompt.user.count("## Your Task") == 1
+        assert "decisions" in prompt.system
+
+    def test_parse_orders_by_index_and_marks_missing(self):
+        response = "Here you go: " + batch_response(
+            {"index": 2, "action": "NONE", "targetFactId": "fact-old", "reason": "Dup", "confidence": 95},
+        )
+        decisions = parse_batch_conflict_decisions(response, 2)
+
+        assert decisions[0] is None
+        assert decisions[1] is not None
+        assert decisions[1].action == "NONE"
+
+    def test_parse_rejects_missing_array(self):
+        with pytest.raises(ValueError):
+            parse_batch_conflict_decisions('{"action": "ADD"}', 1)
@@ -0,0 +1,211 @@
+"""
+Unit Tests: Server-side Semantic Deduplication
+
+Tests for the facts:semanticSearch path of FactDeduplicationService, its
+fallback to client-side scoring, embedding reuse on store, and
+FactsAPI.backfill_embeddings.
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cortex.facts import FactsAPI, StoreFactWithDedupOptions
+from cortex.facts.deduplication import (
+    DeduplicationConfig,
+    FactCandidate,
+    FactDeduplicationService,
+)
+from cortex.types import StoreFactParams
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Test Fixtures
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+async def embed(text: str) -> List[float]:
+    return [float(len(text)), 1.0, 0.0]
+
+
+def make_fact(i: int, text: str, embedding: Any = None) -> Dict[str, Any]:
+    fact = {
+        "_id": f"doc-{i}",
+        "factId": f"fact-{i}",
+        "memorySpaceId": "space-1",
+        "fact": text,
+        "factType": "preference",
+        "confidence": 80,
+        "sourceType": "conversation",
+        "tags": [],
+        "createdAt": 1,
+        "updatedAt": 1,
+        "version": 1,
+    }
+    if embedding is not None:
+        fact["embedding"] = embedding
+    return fact
+
+
+def make_client(search_results: List[Dict[str, Any]]) -> MagicMock:
+    client = MagicMock()
+    client.action = AsyncMock(return_value=search_results)
+    client.query = AsyncMock(return_value=[])
+    client.mutation = AsyncMock(side_effect=lambda name, args: {**make_fact(1, args["fact"]), **args})
+    return client
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Server-side Vector Search
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestServerSideSemanticMatch:
+    """Tests for the facts:semanticSearch path."""
+
+    @pytest.mark.asyncio
+    async def test_single_vector_query_with_filters(self):
+        client = make_client([{**make_fact(7, "User likes tea"), "_score": 0.93}])
+        service = FactDeduplicationService(client)
+
+        match = await service._find_semantic_match(
+            FactCandidate(fact="User enjoys tea", fact_type="preference", confidence=90),
+            "space-1",
+            embed,
+            0.85,
+            "user-1",
+        )
+
+        assert match is not None
+        assert match["fact"].fact_id == "fact-7"
+        assert match["score"] == pytest.approx(0.93)
+        client.action.assert_awaited_once()
+        client.query.assert_not_awaited()
+        name, args = client.action.await_args.args
+        assert name == "facts:semanticSearch"
+        assert args["memorySpaceId"] == "space-1"
+        assert args["userId"] == "user-1"
+        assert args["factType"] == "preference"
+        assert args["minScore"] == 0.85
+        assert args["limit"] == FactDeduplicationService.SEMANTIC_TOP_K
+        assert args["embedding"] == await embed("User enjoys tea")
+
+    @pytest.mark.asyncio
+    async def test_below_threshold_is_not_a_match(self):
+        service = FactDeduplicationService(
+            make_client([{**make_fact(7, "User likes tea"), "_score": 0.5}])
+        )
+
+        match = await service._find_semantic_match(
+            FactCandidate(fact="User enjoys tea", fact_type="preference", confidence=90),
+            "space-1",
+            embed,
+            0.85,
+        )
+
+        assert match is None
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_listing_without_vector_search(self):
+        client = MagicMock()
+        client.action = AsyncMock(side_effect=RuntimeError("Could not find public function"))
+        client.query = AsyncMock(
+            return_value=[make_fact(3, "User enjoys tea", embedding=await embed("User enjoys tea"))]
+        )
+        embedder = AsyncMock(side_effect=embed)
+        service = FactDeduplicationService(client)
+
+        match = await service._find_semantic_match(
+            FactCandidate(fact="User enjoys tea", fact_type="preference", confidence=90),
+            "space-1",
+            embedder,
+            0.99,
+        )
+
+        assert match is not None
+        assert match["fact"].fact_id == "fact-3"
+        # Stored embedding is reused; only the candidate is embedded
+        assert embedder.await_count == 1
+        name, args = client.query.await_args.args
+        assert name == "facts:list"
+        assert args["includeEmbedding"] is True
+
+    @pytest.mark.asyncio
+    async def test_find_duplicate_returns_candidate_embedding(self):
+        service = FactDeduplicationService(make_client([]))
+
+        result = await service.find_duplicate(
+            FactCandidate(fact="User enjoys tea", fact_type="preference", confidence=90),
+            "space-1",
+            DeduplicationConfig(strategy="semantic", generate_embedding=embed),
+        )
+
+        assert result.is_duplicate is False
+        assert result.candidate_embedding == await embed("User enjoys tea")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# FactsAPI Integration
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestFactsApiEmbeddings:
+    """Tests for embedding persistence and backfill in FactsAPI."""
+
+    @pytest.mark.asyncio
+    async def test_store_with_dedup_persists_embedding(self):
+        client = make_client([])
+        facts = FactsAPI(client)
+
+        await facts.store_with_dedup(
+            StoreFactParams(
+                memory_space_id="space-1",
+                fact="User enjoys tea",
+                fact_type="preference",
+                confidence=90,
+                source_type="conversation",
+            ),
+            StoreFactWithDedupOptions(
+                deduplication=DeduplicationConfig(strategy="semantic", generate_embedding=embed)
+            ),
+        )
+
+        name, args = client.mutation.await_args.args
+        assert name == "facts:store"
+        assert args["embedding"] == await embed("User enjoys tea")
+
+    @pytest.mark.asyncio
+    async def test_backfill_embeddings_skips_embedded_facts(self):
+        pages = [
+            {
+                "page": [make_fact(1, "a"), make_fact(2, "bb", embedding=[1.0, 1.0, 0.0])],
+                "isDone": False,
+                "continueCursor": "c1",
+            },
+            {"page": [make_fact(3, "ccc")], "isDone": True, "continueCursor": None},
+        ]
+        client = MagicMock()
+        client.query = AsyncMock(side_effect=pages)
+        client.mutation = AsyncMock(side_effect=lambda name, args: {"updated": len(args.get("items", []))})
+        batch = AsyncMock(side_effect=lambda texts: [[float(len(t)), 1.0, 0.0] for t in texts])
+
+        updated = await FactsAPI(client).backfill_embeddings(
+            "space-1", generate_embeddings=batch, page_size=2
+        )
+
+        assert updated == 2
+        assert batch.await_count == 2
+        calls = [call.args for call in client.mutation.await_args_list]
+        written = [
+            item["factId"]
+            for name, args in calls
+            if name == "facts:setEmbeddings"
+            for item in args["items"]
+        ]
+        assert written == ["fact-1", "fact-3"]
+        # Already embedded but stored before scope keys: keyed, not re-embedded
+        assert [args["factIds"] for name, args in calls if name == "facts:setScopeKeys"] == [
+            ["fact-2"]
+        ]
+        assert client.query.await_args_list[1].args[1]["paginationOpts"]["cursor"] == "c1"
+        assert all(call.args[1]["includeEmbedding"] for call in client.query.await_args_list)
@@ -0,0 +1,764 @@
+"""
+Unit Tests: Batch Graph Sync
+
+Tests for paginated, concurrent and resumable initial_graph_sync using
+mocked Cortex APIs and a recording graph adapter.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cortex.graph.batch_sync import initial_graph_sync, reconcile_graph
+from cortex.types import (
+    BatchSyncLimits,
+    BatchSyncOptions,
+    ChunkDigestPageResult,
+    ChunkWatermark,
+    FactRecord,
+    GraphReconcileOptions,
+    ListFactsPageResult,
+    ListMemoriesPageResult,
+    ListMemorySpacesResult,
+    MemoryEntry,
+)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Test Fixtures
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def make_memory(space_id: str, i: int) -> MemoryEntry:
+    return MemoryEntry(
+        _id=f"doc-{space_id}-{i}",
+        memory_id=f"mem-{space_id}-{i}",
+        memory_space_id=space_id,
+        content=f"memory {i}",
+        content_type="raw",
+        source_type="conversation",
+        source_timestamp=1000 + i,
+        importance=50,
+        tags=[],
+        version=1,
+        previous_versions=[],
+        created_at=1000 + i,
+        updated_at=1000 + i,
+        access_count=0,
+        user_id="user-1",
+        conversation_ref={"conversation_id": "conv-1", "message_ids": ["m1"]},
+    )
+
+
+def make_fact(space_id: str, i: int) -> FactRecord:
+    return FactRecord(
+        _id=f"doc-fact-{space_id}-{i}",
+        fact_id=f"fact-{space_id}-{i}",
+        memory_space_id=space_id,
+        fact=f"User likes thing {i}",
+        fact_type="preference",
+        confidence=90,
+        source_type="conversation",
+        tags=[],
+        created_at=1000 + i,
+        updated_at=1000 + i,
+        version=1,
+        subject="User",
+        predicate="likes",
+        object=f"thing {i}",
+    )
+
+
+class RecordingAdapter:
+    """Graph adapter that records batched queries."""
+
+    def __init__(
+        self,
+        fail_on: Optional[str] = None,
+        nodes: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> None:
+        self.queries: List[Dict[str, Any]] = []
+        self.fail_on = fail_on
+        # label -> [{"id", "memorySpaceId", "updatedAt", "version"}] for scans
+        self.nodes = nodes or {}
+
+    async def query(self, cypher: str, params: Optional[Dict[str, Any]] = None):
+        if self.fail_on and self.fail_on in cypher:
+            raise RuntimeError("batch write failed")
+        params = params or {}
+        self.queries.append({"cypher": cypher, "params": params})
+
+        label = "Memory" if ":Memory" in cypher else "Fact"
+        if "AS id" in cypher and "$after" in cypher:
+            records = sorted(
+                (
+                    n for n in self.nodes.get(label, [])
+                    if n["memorySpaceId"] == params["memorySpaceId"]
+                    and params["createdAfter"] <= n["createdAt"] <= params["createdBefore"]
+                    and n["id"] > params["after"]
+                ),
+                key=lambda n: n["id"],
+            )[: params["limit"]]
+            return SimpleNamespace(records=records, count=len(records))
+
+        if "AS createdOffsetSum" in cypher:
+            records = watermarks(
+                [n for n in self.nodes.get(label, []) if n["memorySpaceId"] == params["memorySpaceId"]],
+                params["chunkMs"],
+            )
+            return SimpleNamespace(records=records, count=len(records))
+
+        return SimpleNamespace(records=[], count=0)
+
+    async def query_batch(self, cypher: str, rows: List[Dict[str, Any]], params=None):
+        return await self.query(cypher, {**(params or {}), "rows": rows})
+
+    def rows_for(self, fragment: str) -> List[List[Any]]:
+        return [
+            row
+            for q in self.queries
+            if fragment in q["cypher"]
+            for row in q["params"].get("rows", [])
+        ]
+
+
+class FakeBoltSession:
+    """Neo4j session stand-in: records statements and, like the server,
+    rejects UNWIND rows that are not maps (``row.key`` cannot resolve)."""
+
+    def __init__(self, runs: List[Any]) -> None:
+        self.runs = runs
+
+    async def run(self, cypher: str, params: Dict[str, Any]):
+        if "UNWIND $rows" in cypher and not all(isinstance(r, dict) for r in params["rows"]):
+            raise TypeError("Type mismatch: expected Map but was String")
+        self.runs.append((cypher, params))
+        counters = SimpleNamespace(
+            nodes_created=0, nodes_deleted=0, relationships_created=0,
+            relationships_deleted=0, properties_set=0, labels_added=0,
+        )
+        return SimpleNamespace(
+            data=AsyncMock(return_value=[]),
+            consume=AsyncMock(return_value=SimpleNamespace(counters=counters)),
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+def make_cypher_adapter(monkeypatch) -> Any:
+    """A real CypherGraphAdapter (real parameter serialization) on a fake driver."""
+    import cortex.graph.adapters.cypher as cypher
+
+    monkeypatch.setattr(cypher, "HAS_NEO4J", True)
+    adapter = cypher.CypherGraphAdapter()
+    adapter.runs = []
+    adapter._driver = SimpleNamespace(session=lambda **_: FakeBoltSession(adapter.runs))
+    return adapter
+
+
+def unwind_rows(adapter: Any, fragment: str) -> List[Dict[str, Any]]:
+    return [
+        row
+        for cypher, params in adapter.runs
+        if cypher.startswith("UNWIND $rows") and fragment in cypher
+        for row in params["rows"]
+    ]
+
+
+def watermarks(nodes: List[Dict[str, Any]], chunk_ms: int) -> List[Dict[str, Any]]:
+    """Per-chunk watermarks as computed by the graph and Convex."""
+    chunks: Dict[int, Dict[str, Any]] = {}
+    for n in nodes:
+        chunk = n["createdAt"] // chunk_ms
+        entry = chunks.setdefault(chunk, {
+            "chunk": chunk, "count": 0, "maxUpdatedAt": 0, "updatedOffsetSum": 0,
+            "versionSum": 0, "createdOffsetSum": 0,
+        })
+        entry["count"] += 1
+        entry["maxUpdatedAt"] = max(entry["maxUpdatedAt"], n["updatedAt"])
+        entry["updatedOffsetSum"] += n["updatedAt"] - n["createdAt"]
+        entry["versionSum"] += n["version"]
+        entry["createdOffsetSum"] += n["createdAt"] - chunk * chunk_ms
+    return list(chunks.values())
+
+
+def digest_page(entities: List[Any], chunk_ms: int) -> ChunkDigestPageResult:
+    nodes = [
+        {"createdAt": e.created_at, "updatedAt": e.updated_at, "version": e.version}
+        for e in entities
+    ]
+    return ChunkDigestPageResult(
+        chunks=[
+            ChunkWatermark(
+                chunk=c["chunk"],
+                count=c["count"],
+                max_updated_at=c["maxUpdatedAt"],
+                updated_offset_sum=c["updatedOffsetSum"],
+                version_sum=c["versionSum"],
+                created_offset_sum=c["createdOffsetSum"],
+            )
+            for c in watermarks(nodes, chunk_ms)
+        ],
+        continue_cursor=None,
+        is_done=True,
+    )
+
+
+def in_window(entities: List[Any], created_after: Optional[int], created_before: Optional[int]) -> List[Any]:
+    return [
+        e for e in entities
+        if (created_after is None or e.created_at >= created_after)
+        and (created_before is None or e.created_at <= created_before)
+    ]
+
+
+def make_cortex(spaces: Dict[str, int], facts_per_space: int = 0, page_size: int = 2):
+    """Mock Cortex with cursor-paginated vector/facts APIs."""
+    cortex = MagicMock()
+    calls: List[Any] = []
+
+    cortex.memory_spaces.list = AsyncMock(return_value=ListMemorySpacesResult(
+        spaces=[SimpleNamespace(memory_space_id=s) for s in spaces],
+        total=len(spaces),
+        has_more=False,
+        offset=0,
+    ))
+
+    async def memory_page(space_id, cursor, size, created_after=None, created_before=None):
+        calls.append(("memories", space_id, cursor))
+        memories = in_window(
+            [make_memory(space_id, i) for i in range(spaces[space_id])], created_after, created_before
+        )
+        start = int(cursor or 0)
+        end = min(start + size, len(memories))
+        return ListMemoriesPageResult(
+            memories=memories[start:end],
+            continue_cursor=str(end),
+            is_done=end >= len(memories),
+        )
+
+    async def fact_page(space_id, cursor, size, include_superseded=False,
+                        created_after=None, created_before=None):
+        calls.append(("facts", space_id, cursor))
+        facts = in_window(
+            [make_fact(space_id, i) for i in range(facts_per_space)], created_after, created_before
+        )
+        start = int(cursor or 0)
+        end = min(start + size, len(facts))
+        return ListFactsPageResult(
+            facts=facts[start:end],
+            continue_cursor=str(end),
+            is_done=end >= len(facts),
+        )
+
+    async def memory_digests(space_id, chunk_ms, cursor=None, size=500):
+        calls.append(("memory-digests", space_id, cursor))
+        return digest_page([make_memory(space_id, i) for i in range(spaces[space_id])], chunk_ms)
+
+    async def fact_digests(space_id, chunk_ms, cursor=None, size=500, include_superseded=False):
+        calls.append(("fact-digests", space_id, cursor))
+        return digest_page([make_fact(space_id, i) for i in range(facts_per_space)], chunk_ms)
+
+    cortex.vector.list_page = AsyncMock(side_effect=memory_page)
+    cortex.vector.chunk_digests = AsyncMock(side_effect=memory_digests)
+    cortex.vector.count = AsyncMock(side_effect=lambda s: spaces[s])
+    cortex.facts.list_page = AsyncMock(side_effect=fact_page)
+    cortex.facts.chunk_digests = AsyncMock(side_effect=fact_digests)
+    cortex.facts.count = AsyncMock(return_value=facts_per_space)
+    cortex.users.list = AsyncMock(return_value=SimpleNamespace(users=[]))
+    cortex.agents.list = AsyncMock(return_value=[])
+    cortex.calls = calls
+    return cortex
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Pagination and Batching
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestInitialGraphSync:
+    """Tests for paginated batch sync."""
+
+    @pytest.mark.asyncio
+    async def test_syncs_every_memory_across_pages(self):
+        """All memories are synced, not limit // number of spaces."""
+        cortex = make_cortex({"space-a": 5, "space-b": 1}, facts_per_space=3)
+        adapter = RecordingAdapter()
+
+        result = await initial_graph_sync(
+            cortex, adapter,
+            BatchSyncOptions(limits=BatchSyncLimits(memories=None, facts=None), page_size=2),
+        )
+
+        assert result.memories.synced == 6
+        assert result.facts.synced == 6
+        assert result.errors == []
+        memory_ids = [row["key"] for row in adapter.rows_for("MERGE (n:Memory")]
+        assert len(set(memory_ids)) == 6
+        # space-a needs three pages (2 + 2 + 1)
+        assert [c for c in cortex.calls if c[:2] == ("memories", "space-a")] == [
+            ("memories", "space-a", None),
+            ("memories", "space-a", "2"),
+            ("memories", "space-a", "4"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_page_written_with_unwind_batches(self):
+        """One node statement per page instead of one query per entity."""
+        cortex = make_cortex({"space-a": 4})
+        adapter = RecordingAdapter()
+
+        await initial_graph_sync(cortex, adapter, BatchSyncOptions(page_size=4))
+
+        node_queries = [q for q in adapter.queries if "MERGE (n:Memory" in q["cypher"]]
+        assert len(node_queries) == 1
+        assert node_queries[0]["cypher"].startswith("UNWIND $rows")
+        assert len(adapter.rows_for("[r:RELATES_TO]")) == 4
+        assert adapter.rows_for("[r:REFERENCES]")[0]["target"] == "conv-1"
+
+    @pytest.mark.asyncio
+    async def test_fact_relations_grouped_by_type(self):
+        """Typed entity edges are written per relationship type."""
+        cortex = make_cortex({"space-a": 0}, facts_per_space=3)
+        adapter = RecordingAdapter()
+
+        await initial_graph_sync(cortex, adapter, BatchSyncOptions(page_size=10))
+
+        likes = [q for q in adapter.queries if "[r:LIKES" in q["cypher"]]
+        assert len(likes) == 1
+        assert len(likes[0]["params"]["rows"]) == 3
+        assert len(adapter.rows_for("[r:MENTIONS]")) == 6
+
+    @pytest.mark.asyncio
+    async def test_global_limit_respected(self):
+        """Limits cap the total synced across spaces."""
+        cortex = make_cortex({"space-a": 5, "space-b": 5})
+        adapter = RecordingAdapter()
+
+        result = await initial_graph_sync(
+            cortex, adapter,
+            BatchSyncOptions(limits=BatchSyncLimits(memories=3), page_size=2, concurrency=1),
+        )
+
+        assert result.memories.synced == 3
+
+    @pytest.mark.asyncio
+    async def test_enriched_entity_type_written(self):
+        """Enriched entities keep their type in entityType (not the full value)."""
+        cortex = make_cortex({"space-a": 0}, facts_per_space=1)
+        fact = make_fact("space-a", 0)
+        fact.entities = [{"name": "Alex", "type": "preferred_name", "full_value": "Alexander Johnson"}]
+        cortex.facts.list_page = AsyncMock(return_value=ListFactsPageResult(
+            facts=[fact], continue_cursor=None, is_done=True,
+        ))
+        adapter = RecordingAdapter()
+
+        await initial_graph_sync(cortex, adapter, BatchSyncOptions(page_size=10))
+
+        entities = {row["key"]: row["props"] for row in adapter.rows_for("MERGE (n:Entity")}
+        assert entities["Alex"]["entityType"] == "preferred_name"
+        assert entities["Alex"]["fullValue"] == "Alexander Johnson"
+        mention = next(r for r in adapter.rows_for("[r:MENTIONS]") if r["target"] == "Alex")
+        assert mention["props"]["role"] == "preferred_name"
+
+    @pytest.mark.asyncio
+    async def test_batch_and_per_entity_share_edge_specs(self):
+        """The legacy typed edge has the same properties on both sync paths."""
+        from cortex.graph import fact_edges
+
+        cortex = make_cortex({"space-a": 0}, facts_per_space=1)
+        adapter = RecordingAdapter()
+
+        await initial_graph_sync(cortex, adapter, BatchSyncOptions(page_size=10))
+
+        [row] = adapter.rows_for("[r:LIKES")
+        fact_dict = {
+            "factId": "fact-space-a-0", "memorySpaceId": "space-a", "subject": "User",
+            "predicate": "likes", "object": "thing 0", "confidence": 90, "createdAt": 1000,
+        }
+        [spec] = [e for e in fact_edges(fact_dict, 0) if e.type == "LIKES"]
+        assert row["props"] == spec.properties
+        assert "category" not in row["props"]
+
+    @pytest.mark.asyncio
+    async def test_per_entity_sync_uses_edge_specs(self):
+        """sync_fact_relationships writes the spec'd nodes and edges."""
+        from cortex.graph import fact_edges, sync_fact_relationships
+
+        adapter = MagicMock()
+        merged: List[Any] = []
+
+        async def merge_node(node, match):
+            merged.append(node)
+            return f"node-{node.properties['name']}"
+
+        adapter.merge_node = AsyncMock(side_effect=merge_node)
+        adapter.find_nodes = AsyncMock(return_value=[SimpleNamespace(id="space-node")])
+        adapter.create_edge = AsyncMock(return_value="edge")
+        fact_dict = {
+            "factId": "f1", "memorySpaceId": "space-a", "subject": "User",
+            "predicate": "likes", "object": "tea", "confidence": 90, "createdAt": 1000,
+            "entities": [{"name": "User", "type": "person", "fullValue": "User One"}],
+        }
+
+        await sync_fact_relationships(fact_dict, "fact-node", adapter)
+
+        assert [n.properties["name"] for n in merged] == ["User", "tea"]
+        assert merged[0].properties["entityType"] == "person"
+        edges = [call.args[0] for call in adapter.create_edge.call_args_list]
+        assert [e.type for e in edges] == [e.type for e in fact_edges(fact_dict, 0)]
+        likes = next(e for e in edges if e.type == "LIKES")
+        assert (likes.from_node, likes.to_node) == ("node-User", "node-tea")
+
+    @pytest.mark.asyncio
+    async def test_global_limit_respected_concurrently(self):
+        """Concurrent space workers never overshoot the global limit."""
+        cortex = make_cortex({f"space-{i}": 5 for i in range(4)})
+        adapter = RecordingAdapter()
+
+        result = await initial_graph_sync(
+            cortex, adapter,
+            BatchSyncOptions(limits=BatchSyncLimits(memories=3), page_size=2, concurrency=4),
+        )
+
+        assert result.memories.synced == 3
+        assert len(adapter.rows_for("MERGE (n:Memory")) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_per_entity(self, monkeypatch):
+        """A failed batch write retries entities one by one and reports errors."""
+        import cortex.graph.batch_sync as batch_sync
+
+        async def failing_sync(memory, adapter):
+            raise RuntimeError(f"cannot sync {memory['memoryId']}")
+
+        monkeypatch.setattr(batch_sync, "sync_memory_to_graph", failing_sync)
+        cortex = make_cortex({"space-a": 2})
+        adapter = RecordingAdapter(fail_on="MERGE (n:Memory")
+
+        result = await initial_graph_sync(cortex, adapter, BatchSyncOptions(page_size=2))
+
+        assert result.memories.failed == 2
+        assert result.memories.synced == 0
+        assert {e.entity_id for e in result.errors} == {"mem-space-a-0", "mem-space-a-1"}
+
+    @pytest.mark.asyncio
+    async def test_cypher_adapter_receives_rows_as_maps(self, monkeypatch):
+        """Through CypherGraphAdapter serialization, pages are written by UNWIND."""
+        cortex = make_cortex({"space-a": 3}, facts_per_space=2)
+        adapter = make_cypher_adapter(monkeypatch)
+
+        result = await initial_graph_sync(cortex, adapter, BatchSyncOptions(page_size=10))
+
+        assert result.errors == []
+        assert (result.memories.synced, result.facts.synced) == (3, 2)
+        rows = unwind_rows(adapter, "MERGE (n:Memory")
+        assert [row["key"] for row in rows] == [f"mem-space-a-{i}" for i in range(3)]
+        assert rows[0]["props"]["tags"] == []
+        assert rows[0]["props"]["memorySpaceId"] == "space-a"
+        assert len(unwind_rows(adapter, "[r:LIKES {factId: row.props.factId}]")) == 2
+        # Nothing fell back to per-entity merge_node statements
+        assert all(cypher.startswith("UNWIND $rows") for cypher, _ in adapter.runs)
+
+    def test_cypher_adapter_serializes_only_nested_row_values(self, monkeypatch):
+        """Row values stay maps; maps nested inside them become JSON."""
+        adapter = make_cypher_adapter(monkeypatch)
+
+        row = adapter._serialize_row({
+            "key": "mem-1",
+            "props": {"tags": ["a"], "metadata": {"source": "chat"}},
+        })
+
+        assert row == {"key": "mem-1", "props": {"tags": ["a"], "metadata": '{"source": "chat"}'}}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Checkpointing and Progress
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestCheckpointAndProgress:
+    """Tests for resumable sync and throughput reporting."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self, tmp_path):
+        """Completed spaces are skipped and cursors resume mid-space."""
+        checkpoint_path = tmp_path / "sync.json"
+        checkpoint_path.write_text(json.dumps({
+            "memory_cursors": {"space-a": "4"},
+            "completed_memory_spaces": ["space-b"],
+            "memories_synced": 9,
+        }))
+        cortex = make_cortex({"space-a": 5, "space-b": 5})
+        adapter = RecordingAdapter()
+
+        result = await initial_graph_sync(
+            cortex, adapter,
+            BatchSyncOptions(page_size=2, checkpoint_path=str(checkpoint_path)),
+        )
+
+        assert result.memories.synced == 1
+        memory_calls = [c for c in cortex.calls if c[0] == "memories"]
+        assert memory_calls == [("memories", "space-a", "4")]
+        # Finished sync removes the checkpoint
+        assert not checkpoint_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_saved_after_each_page(self, tmp_path):
+        """A space that fails mid-way leaves its last cursor on disk."""
+        checkpoint_path = tmp_path / "sync.json"
+        cortex = make_cortex({"space-a": 6})
+        adapter = RecordingAdapter()
+        original = cortex.vector.list_page.side_effect
+        seen = {"pages": 0}
+
+        async def fail_on_third_page(space_id, cursor, size):
+            seen["pages"] += 1
+            if seen["pages"] == 3:
+                raise RuntimeError("connection lost")
+            return await original(space_id, cursor, size)
+
+        cortex.vector.list_page.side_effect = fail_on_third_page
+
+        result = await initial_graph_sync(
+            cortex, adapter,
+            BatchSyncOptions(page_size=2, checkpoint_path=str(checkpoint_path)),
+        )
+
+        assert result.memories.synced == 4
+        saved = json.loads(checkpoint_path.read_text())
+        assert saved["memory_cursors"] == {"space-a": "4"}
+        assert saved["memories_synced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_ids_checkpointed_and_retried(self, tmp_path, monkeypatch):
+        """Failed writes are kept in the checkpoint and retried on resume."""
+        import cortex.graph.batch_sync as batch_sync
+
+        async def sync_memory(memory, adapter):
+            if memory["memoryId"] == "mem-space-a-1":
+                raise RuntimeError("constraint violated")
+            return memory["memoryId"]
+
+        monkeypatch.setattr(batch_sync, "sync_memory_to_graph", sync_memory)
+        checkpoint_path = tmp_path / "sync.json"
+        cortex = make_cortex({"space-a": 4})
+        options = BatchSyncOptions(
+            page_size=2, sync_relationships=False, checkpoint_path=str(checkpoint_path)
+        )
+
+        result = await initial_graph_sync(
+            cortex, RecordingAdapter(fail_on="MERGE (n:Memory"), options
+        )
+
+        assert (result.memories.synced, result.memories.failed) == (3, 1)
+        saved = json.loads(checkpoint_path.read_text())
+        assert saved["failed_memory_ids"] == {"space-a": ["mem-space-a-1"]}
+        assert saved["completed_memory_spaces"] == ["space-a"]
+
+        # Resume: only the failed memory is fetched again and written
+        cortex.calls.clear()
+        cortex.vector.get = AsyncMock(
+            side_effect=lambda space_id, memory_id: make_memory(space_id, int(memory_id[-1]))
+        )
+        adapter = RecordingAdapter()
+
+        result = await initial_graph_sync(cortex, adapter, options)
+
+        assert (result.memories.synced, result.memories.failed) == (1, 0)
+        assert [row["key"] for row in adapter.rows_for("MERGE (n:Memory")] == ["mem-space-a-1"]
+        assert [c for c in cortex.calls if c[0] == "memories"] == []
+        assert not checkpoint_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_progress_reports_throughput_and_eta(self):
+        """on_progress_report gets totals and rates; on_progress keeps its signature."""
+        cortex = make_cortex({"space-a": 4})
+        reports = []
+        legacy = []
+
+        await initial_graph_sync(
+            cortex, RecordingAdapter(),
+            BatchSyncOptions(
+                page_size=2,
+                on_progress=lambda entity, current, total: legacy.append((entity, current, total)),
+                on_progress_report=reports.append,
+            ),
+        )
+
+        memory_reports = [r for r in reports if r.entity_type == "Memories"]
+        assert [r.processed for r in memory_reports] == [2, 4]
+        assert memory_reports[-1].total == 4
+        assert memory_reports[-1].eta_seconds == 0
+        assert memory_reports[-1].items_per_second > 0
+        assert ("Memories", 4, 4) in legacy
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Incremental Reconciliation
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def graph_memory(space_id: str, i: int, updated_at: Optional[int] = None) -> Dict[str, Any]:
+    return {
+        "id": f"mem-{space_id}-{i}",
+        "memorySpaceId": space_id,
+        "createdAt": 1000 + i,
+        "updatedAt": 1000 + i if updated_at is None else updated_at,
+        "version": 1,
+    }
+
+
+class TestReconcileGraph:
+    """Tests for diff-based graph reconciliation."""
+
+    @pytest.mark.asyncio
+    async def test_in_sync_space_writes_nothing(self):
+        """Matching checksums produce no writes."""
+        cortex = make_cortex({"space-a": 3})
+        adapter = RecordingAdapter(nodes={"Memory": [graph_memory("space-a", i) for i in range(3)]})
+
+        result = await reconcile_graph(
+            cortex, adapter, GraphReconcileOptions(entity_types=["memories"], page_size=2)
+        )
+
+        report = result.reports[0]
+        assert report.in_sync
+        assert report.cortex_checksum == report.graph_checksum
+        assert result.synced == 0
+        assert adapter.rows_for("MERGE (n:Memory") == []
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_drift(self):
+        """Missing, changed and extraneous entities are reported without writes."""
+        cortex = make_cortex({"space-a": 3})
+        adapter = RecordingAdapter(nodes={"Memory": [
+            graph_memory("space-a", 0),
+            graph_memory("space-a", 1, updated_at=1),
+            graph_memory("space-a", 9),
+        ]})
+
+        result = await reconcile_graph(
+            cortex, adapter,
+            GraphReconcileOptions(dry_run=True, entity_types=["memories"], page_size=2),
+        )
+
+        report = result.reports[0]
+        assert not report.in_sync
+        assert report.missing == ["mem-space-a-2"]
+        assert report.changed == ["mem-space-a-1"]
+        assert report.extraneous == ["mem-space-a-9"]
+        assert result.dry_run
+        assert adapter.rows_for("MERGE (n:Memory") == []
+
+    @pytest.mark.asyncio
+    async def test_syncs_only_drifted_entities(self, monkeypatch):
+        """Only missing/changed entities are written and extraneous ones deleted."""
+        import cortex.graph.batch_sync as batch_sync
+
+        deleted = []
+
+        async def fake_delete(memory_id, adapter):
+            deleted.append(memory_id)
+
+        monkeypatch.setattr(batch_sync, "delete_memory_from_graph", fake_delete)
+        cortex = make_cortex({"space-a": 3})
+        adapter = RecordingAdapter(nodes={"Memory": [
+            graph_memory("space-a", 0),
+            graph_memory("space-a", 1, updated_at=1),
+            graph_memory("space-a", 9),
+        ]})
+
+        result = await reconcile_graph(
+            cortex, adapter, GraphReconcileOptions(entity_types=["memories"], page_size=10)
+        )
+
+        written = sorted(row["key"] for row in adapter.rows_for("MERGE (n:Memory"))
+        assert written == ["mem-space-a-1", "mem-space-a-2"]
+        assert deleted == ["mem-space-a-9"]
+        assert result.synced == 2
+        assert result.deleted == 1
+
+    @pytest.mark.asyncio
+    async def test_only_differing_chunks_are_fetched(self):
+        """Chunks with matching watermarks are never read entity by entity."""
+        cortex = make_cortex({"space-a": 6})
+        nodes = [graph_memory("space-a", i) for i in range(6)]
+        nodes[4] = graph_memory("space-a", 4, updated_at=1)
+        adapter = RecordingAdapter(nodes={"Memory": nodes})
+
+        result = await reconcile_graph(
+            cortex, adapter,
+            GraphReconcileOptions(entity_types=["memories"], page_size=10, chunk_ms=2),
+        )
+
+        report = result.reports[0]
+        assert (report.chunks, report.chunks_differing) == (3, 1)
+        assert report.changed == ["mem-space-a-4"]
+        windows = [
+            (c.kwargs["created_after"], c.kwargs["created_before"])
+            for c in cortex.vector.list_page.call_args_list
+        ]
+        assert windows == [(1004, 1005)]
+        scans = [q for q in adapter.queries if "$after" in q["cypher"]]
+        assert [(q["params"]["createdAfter"], q["params"]["createdBefore"]) for q in scans] == [(1004, 1005)]
+
+    @pytest.mark.asyncio
+    async def test_chunk_only_in_graph_is_extraneous(self):
+        """A chunk with no Cortex entities reports its graph nodes as extraneous."""
+        cortex = make_cortex({"space-a": 2})
+        adapter = RecordingAdapter(nodes={"Memory": [
+            graph_memory("space-a", 0),
+            graph_memory("space-a", 1),
+            graph_memory("space-a", 50),
+        ]})
+
+        result = await reconcile_graph(
+            cortex, adapter,
+            GraphReconcileOptions(dry_run=True, entity_types=["memories"], chunk_ms=10),
+        )
+
+        report = result.reports[0]
+        assert report.extraneous == ["mem-space-a-50"]
+        assert report.missing == report.changed == []
+        assert (report.cortex_count, report.graph_count) == (2, 3)
+
+    @pytest.mark.asyncio
+    async def test_superseded_policy_shared_by_sync_and_reconcile(self):
+        """Counting, bulk sync and reconcile all include superseded facts."""
+        cortex = make_cortex({"space-a": 0}, facts_per_space=2)
+
+        await initial_graph_sync(cortex, RecordingAdapter(), BatchSyncOptions(page_size=10))
+        await reconcile_graph(
+            cortex, RecordingAdapter(), GraphReconcileOptions(entity_types=["facts"])
+        )
+
+        count_filter = cortex.facts.count.call_args.args[0]
+        assert count_filter.include_superseded is True
+        assert all(
+            c.kwargs["include_superseded"] is True
+            for c in cortex.facts.list_page.call_args_list + cortex.facts.chunk_digests.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_drift_written_through_cypher_adapter_in_batches(self, monkeypatch):
+        """Reconcile writes reach CypherGraphAdapter as UNWIND rows of maps."""
+        cortex = make_cortex({"space-a": 3}, facts_per_space=2)
+        adapter = make_cypher_adapter(monkeypatch)
+
+        result = await reconcile_graph(cortex, adapter, GraphReconcileOptions(page_size=10))
+
+        assert result.errors == []
+        assert result.synced == 5
+        assert [row["key"] for row in unwind_rows(adapter, "MERGE (n:Memory")] == [
+            f"mem-space-a-{i}" for i in range(3)
+        ]
+        assert [row["key"] for row in unwind_rows(adapter, "MERGE (n:Fact")] == [
+            "fact-space-a-0", "fact-space-a-1",
+        ]
+        # Every write was batched; the rest are the watermark and chunk scans
+        writes = [cypher for cypher, _ in adapter.runs if "MERGE" in cypher]
+        assert writes and all(cypher.startswith("UNWIND $rows") for cypher in writes)
@@ -0,0 +1,270 @@
+"""
+Unit Tests: Graph Orphan Detection
+
+Tests for set-based orphan detection and cascading deletes using an
+in-memory graph adapter that answers the orphan detection queries.
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from cortex.graph.orphan_detection import (
+    create_deletion_context,
+    delete_with_orphan_cleanup,
+    detect_orphan,
+    detect_orphans,
+)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Test Fixtures
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class InMemoryGraph:
+    """Minimal graph adapter answering the orphan detection query shapes."""
+
+    def __init__(self, labels: Dict[str, str], edges: List[Tuple[str, str]]) -> None:
+        self.labels = dict(labels)
+        self.edges: Set[Tuple[str, str]] = set(edges)
+        self.queries: List[str] = []
+
+    def _result(self, records: List[Dict[str, Any]]):
+        return SimpleNamespace(records=records, count=len(records))
+
+    async def query(self, cypher: str, params: Optional[Dict[str, Any]] = None):
+        params = params or {}
+        self.queries.append(cypher)
+
+        if "collect([" in cypher:
+            records = []
+            for node_id in params["nodeIds"]:
+                if node_id not in self.labels:
+                    continue
+                refs = [[a, self.labels[a]] for a, b in self.edges if b == node_id]
+                records.append({"nodeId": node_id, "refs": refs or [[None, None]]})
+            return self._result(records)
+
+        if "--(neighbor)" in cypher:
+            records = [
+                {"nodeId": n, "neighborId": other, "neighborLabel": self.labels[other]}
+                for n in params["frontier"]
+                for a, b in self.edges
+                for other in ([b] if a == n else [a] if b == n else [])
+            ]
+            return self._result(records)
+
+        if "->(referenced)" in cypher:
+            records = [
+                {"refId": b, "refLabel": self.labels[b]}
+                for n in params["nodeIds"]
+                for a, b in self.edges
+                if a == n
+            ]
+            return self._result(records)
+
+        if "DETACH DELETE" in cypher:
+            deleted = [n for n in params["nodeIds"] if n in self.labels]
+            for node_id in deleted:
+                self._remove(node_id)
+            return self._result([{"deletedId": n} for n in deleted])
+
+        raise AssertionError(f"Unexpected query: {cypher}")
+
+    async def delete_node(self, node_id: str, detach: bool = True) -> None:
+        self._remove(node_id)
+
+    def _remove(self, node_id: str) -> None:
+        self.labels.pop(node_id, None)
+        self.edges = {(a, b) for a, b in self.edges if node_id not in (a, b)}
+
+
+def fact_graph(entity_count: int) -> InMemoryGraph:
+    """One fact mentioning many entities, half also mentioned by another fact."""
+    labels = {"fact-1": "Fact", "fact-2": "Fact", "conv-1": "Conversation"}
+    edges = [("fact-1", "conv-1")]
+    for i in range(entity_count):
+        labels[f"e{i}"] = "Entity"
+        edges.append(("fact-1", f"e{i}"))
+        if i % 2 == 0:
+            edges.append(("fact-2", f"e{i}"))
+    return InMemoryGraph(labels, edges)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# detect_orphans
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestDetectOrphans:
+    """Tests for batched orphan detection."""
+
+    @pytest.mark.asyncio
+    async def test_matches_per_node_detection(self):
+        """Batched results equal detect_orphan() for every node."""
+        graph = fact_graph(20)
+        ctx = create_deletion_context("Delete fact-1")
+        ctx.deleted_node_ids.add("fact-1")
+        nodes = {f"e{i}": "Entity" for i in range(20)}
+        nodes["conv-1"] = "Conversation"
+
+        batched = await detect_orphans(nodes, ctx, graph)
+        for node_id, label in nodes.items():
+            single = await detect_orphan(node_id, label, ctx, graph)
+            assert batched[node_id].is_orphan == single.is_orphan
+            assert batched[node_id].reason == single.reason
+            assert batched[node_id].referenced_by == single.referenced_by
+
+        assert batched["e0"].is_orphan is False
+        assert batched["e0"].referenced_by == ["fact-2"]
+        assert batched["e1"].is_orphan is True
+        assert batched["conv-1"].is_orphan is True
+
+    @pytest.mark.asyncio
+    async def test_query_count_independent_of_candidates(self):
+        """One reference query plus one query per BFS level, not per node."""
+        graph = fact_graph(200)
+        ctx = create_deletion_context("Delete fact-1")
+        ctx.deleted_node_ids.add("fact-1")
+
+        await detect_orphans({f"e{i}": "Entity" for i in range(200)}, ctx, graph)
+
+        assert len(graph.queries) <= 3
+
+    @pytest.mark.asyncio
+    async def test_rules_skip_queries(self):
+        """never_delete / explicit_only nodes are resolved without queries."""
+        graph = InMemoryGraph({"u": "User", "m": "Memory"}, [])
+        ctx = create_deletion_context("test")
+
+        results = await detect_orphans({"u": "User", "m": "Memory"}, ctx, graph)
+
+        assert results["u"].reason == "Never delete rule"
+        assert results["m"].reason == "Explicit delete only"
+        assert graph.queries == []
+
+    @pytest.mark.asyncio
+    async def test_non_anchor_references_are_orphans(self):
+        """Nodes referenced only by non-anchor types are orphans."""
+        graph = InMemoryGraph({"a": "Entity", "b": "Entity"}, [("b", "a")])
+        ctx = create_deletion_context("test")
+
+        results = await detect_orphans({"a": "Entity"}, ctx, graph)
+
+        assert results["a"].is_orphan is True
+        assert results["a"].reason == "No anchor references"
+        assert results["a"].referenced_by == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_circular_island(self):
+        """Entities only referencing each other form one shared island."""
+        graph = InMemoryGraph(
+            {"f": "Fact", "a": "Entity", "b": "Entity"},
+            [("f", "a"), ("a", "b"), ("b", "a")],
+        )
+        ctx = create_deletion_context("test")
+        ctx.deleted_node_ids.add("f")
+
+        # a is referenced by b (non-anchor); check b's island from its own side
+        results = await detect_orphans({"a": "Entity"}, ctx, graph)
+        assert results["a"].reason == "No anchor references"
+
+        graph.edges.discard(("b", "a"))
+        results = await detect_orphans({"a": "Entity"}, ctx, graph)
+        assert results["a"].part_of_circular_island is True
+        assert sorted(results["a"].island_nodes) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_island_reaching_anchor_is_not_island(self):
+        """An anchor anywhere within the explored component prevents an island."""
+        graph = InMemoryGraph(
+            {"a": "Entity", "b": "Entity", "c": "Entity", "m": "Memory"},
+            [("a", "b"), ("b", "c"), ("c", "m")],
+        )
+        ctx = create_deletion_context("test")
+
+        results = await detect_orphans({"a": "Entity"}, ctx, graph)
+
+        assert results["a"].is_orphan is True
+        assert results["a"].part_of_circular_island is False
+        assert results["a"].reason == "No references"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# delete_with_orphan_cleanup
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestDeleteWithOrphanCleanup:
+    """Tests for batched cascading deletes."""
+
+    @pytest.mark.asyncio
+    async def test_cascade_keeps_anchored_nodes(self):
+        """Only entities no longer mentioned by a fact are deleted."""
+        graph = fact_graph(10)
+        ctx = create_deletion_context("Delete fact-1")
+
+        result = await delete_with_orphan_cleanup("fact-1", "Fact", ctx, graph)
+
+        deleted = set(result.deleted_nodes)
+        assert "fact-1" in deleted
+        assert "conv-1" in deleted
+        assert {f"e{i}" for i in range(1, 10, 2)} <= deleted
+        assert not {f"e{i}" for i in range(0, 10, 2)} & deleted
+        assert "fact-2" in graph.labels
+
+    @pytest.mark.asyncio
+    async def test_cascade_query_count_is_bounded(self):
+        """Hundreds of entities are cleaned up in a handful of statements."""
+        graph = fact_graph(300)
+        ctx = create_deletion_context("Delete fact-1")
+
+        result = await delete_with_orphan_cleanup("fact-1", "Fact", ctx, graph)
+
+        assert len(result.deleted_nodes) == 1 + 1 + 150
+        assert len(graph.queries) <= 8
+
+    @pytest.mark.asyncio
+    async def test_cascade_through_single_orphans(self):
+        """Nodes reachable only through the deleted node are removed."""
+        graph = InMemoryGraph(
+            {"m": "Memory", "c": "Conversation", "e": "Entity"},
+            [("m", "c"), ("c", "e")],
+        )
+        ctx = create_deletion_context("test")
+
+        result = await delete_with_orphan_cleanup("m", "Memory", ctx, graph)
+
+        assert set(result.deleted_nodes) == {"m", "c", "e"}
+
+    @pytest.mark.asyncio
+    async def test_reports_only_deleted_nodes(self):
+        """Nodes that no longer exist are not reported as deleted."""
+        graph = InMemoryGraph({"c": "Conversation"}, [])
+        ctx = create_deletion_context("test")
+
+        result = await delete_with_orphan_cleanup("m", "Memory", ctx, graph)
+
+        assert result.deleted_nodes == []
+
+    @pytest.mark.asyncio
+    async def test_delete_failure_propagates(self):
+        """A failing delete statement is raised, not reported as deleted."""
+        graph = InMemoryGraph(
+            {"m": "Memory", "c": "Conversation"},
+            [("m", "c")],
+        )
+        original = graph.query
+
+        async def failing_query(cypher: str, params: Optional[Dict[str, Any]] = None):
+            if "DETACH DELETE" in cypher and "c" in (params or {}).get("nodeIds", []):
+                raise RuntimeError("delete failed")
+            return await original(cypher, params)
+
+        graph.query = failing_query  # type: ignore[method-assign]
+        ctx = create_deletion_context("test")
+
+        with pytest.raises(RuntimeError):
+            await delete_with_orphan_cleanup("m", "Memory", ctx, graph)
+        assert "c" in graph.labels
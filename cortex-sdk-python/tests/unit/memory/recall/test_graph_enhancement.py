@@ -40,6 +40,12 @@ class MockFactRecord:
     entities: Optional[List[Any]] = None
 
 
+@dataclass
+class MockQueryResult:
+    """Mock GraphQueryResult for testing."""
+    records: List[dict] = field(default_factory=list)
+
+
 @dataclass
 class MockGraphNode:
     """Mock GraphNode for testing."""
@@ -54,9 +60,12 @@ class MockGraphNode:
 
 from cortex.memory.recall.graph_enhancement import (
     GraphExpansionConfig,
+    build_batched_expansion_query,
     extract_entities_from_results,
     expand_via_graph,
+    expand_via_graph_batched,
     fetch_related_memories,
+    fetch_related_memories_batched,
     fetch_related_facts,
     perform_graph_expansion,
 )
@@ -302,6 +311,83 @@ class TestExpandViaGraph:
         assert mock_adapter.find_nodes.call_count == 10
 
 
+class TestExpandViaGraphBatched:
+    """Tests for single-query multi-source graph expansion."""
+
+    @pytest.mark.asyncio
+    async def test_batched_single_query_for_all_seeds(self):
+        """Batched expansion issues one query regardless of seed count."""
+        mock_adapter = AsyncMock()
+        mock_adapter.is_connected = AsyncMock(return_value=True)
+        mock_adapter.query = AsyncMock(
+            return_value=MockQueryResult(
+                records=[{"name": "related-1"}, {"name": "related-2"}]
+            )
+        )
+
+        config = GraphExpansionConfig()
+        seeds = [f"entity-{i}" for i in range(5)]
+
+        result = await expand_via_graph_batched(seeds, mock_adapter, config)
+
+        assert result == ["related-1", "related-2"]
+        assert mock_adapter.query.call_count == 1
+        mock_adapter.find_nodes.assert_not_called()
+        mock_adapter.traverse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batched_passes_caps_as_params(self):
+        """Batched expansion limits seeds and passes fan-out caps."""
+        mock_adapter = AsyncMock()
+        mock_adapter.is_connected = AsyncMock(return_value=True)
+        mock_adapter.query = AsyncMock(return_value=MockQueryResult())
+
+        config = GraphExpansionConfig(max_fan_out=7, max_frontier=50, max_discovered=30)
+        seeds = [f"entity-{i}" for i in range(20)]
+
+        await expand_via_graph_batched(seeds, mock_adapter, config)
+
+        params = mock_adapter.query.call_args[0][1]
+        assert params["names"] == seeds[:10]
+        assert params["fanOut"] == 7
+        assert params["frontierLimit"] == 50
+        assert params["resultLimit"] == 30
+
+    @pytest.mark.asyncio
+    async def test_batched_excludes_seed_entities(self):
+        """Batched expansion never returns the seeds themselves."""
+        mock_adapter = AsyncMock()
+        mock_adapter.is_connected = AsyncMock(return_value=True)
+        mock_adapter.query = AsyncMock(
+            return_value=MockQueryResult(
+                records=[{"name": "entity-1"}, {"name": "related-1"}, {"name": "related-1"}]
+            )
+        )
+
+        result = await expand_via_graph_batched(
+            ["entity-1"], mock_adapter, GraphExpansionConfig()
+        )
+
+        assert result == ["related-1"]
+
+    def test_query_unrolls_one_level_per_depth(self):
+        """Query contains one bounded expansion step per depth."""
+        query = build_batched_expansion_query(GraphExpansionConfig(max_depth=3))
+
+        assert query.count("OPTIONAL MATCH") == 3
+        assert "$fanOut" in query
+        assert "$frontierLimit" in query
+        assert "*1.." not in query  # no variable-length path enumeration
+
+    def test_query_filters_relationship_types(self):
+        """Query restricts expansion to requested relationship types."""
+        query = build_batched_expansion_query(
+            GraphExpansionConfig(max_depth=1, relationship_types=["KNOWS", "WORKS-AT"])
+        )
+
+        assert "[:KNOWS|WORKS_AT]" in query
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Fetch Related Tests
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -364,6 +450,59 @@ class TestFetchRelated:
 
         assert len(result) <= 5
 
+    @pytest.mark.asyncio
+    async def test_fetch_memories_batched_single_search(self):
+        """Batched fetch issues one search for all entities."""
+        mock_vector = AsyncMock()
+        mock_vector.search = AsyncMock(
+            return_value=[
+                MockMemoryEntry(memory_id="m1", content="Alice"),
+                MockMemoryEntry(memory_id="m2", content="TechCorp"),
+            ]
+        )
+
+        processed = {"m1"}
+        result = await fetch_related_memories_batched(
+            ["Alice", "TechCorp", "New York"], "space-1", mock_vector, processed, 10
+        )
+
+        assert [m.memory_id for m in result] == ["m2"]
+        assert mock_vector.search.call_count == 1
+        assert mock_vector.search.call_args[0][1] == "Alice TechCorp New York"
+        assert mock_vector.search.call_args[0][2].min_score == 0.5
+        assert "m2" in processed
+
+    @pytest.mark.asyncio
+    async def test_fetch_memories_batched_chunks_without_dropping_entities(self):
+        """Batched fetch splits long entity lists into bounded queries."""
+        mock_vector = AsyncMock()
+        mock_vector.search = AsyncMock(return_value=[])
+        entities = [f"Entity {i}" for i in range(12)]
+
+        await fetch_related_memories_batched(entities, "space-1", mock_vector, set(), 10)
+
+        queries = [c[0][1] for c in mock_vector.search.call_args_list]
+        assert len(queries) == 2
+        assert all(len(q.split()) <= 16 for q in queries)
+        assert " ".join(queries) == " ".join(entities)
+
+    @pytest.mark.asyncio
+    async def test_fetch_memories_batched_ranks_whole_names_first(self):
+        """Memories mentioning a full multi-word entity rank first."""
+        mock_vector = AsyncMock()
+        mock_vector.search = AsyncMock(
+            return_value=[
+                MockMemoryEntry(memory_id="m1", content="New shoes"),
+                MockMemoryEntry(memory_id="m2", content="Moved to New York"),
+            ]
+        )
+
+        result = await fetch_related_memories_batched(
+            ["New York"], "space-1", mock_vector, set(), 10
+        )
+
+        assert [m.memory_id for m in result] == ["m2", "m1"]
+
     @pytest.mark.asyncio
     async def test_fetch_facts_empty_entities(self):
         """Fetch facts returns empty when no entities."""
@@ -452,3 +591,60 @@ class TestPerformGraphExpansion:
 
         assert "m1" in result.processed_ids
         assert "f1" in result.processed_ids
+
+    @pytest.mark.asyncio
+    async def test_expansion_uses_batched_round_trips(self):
+        """Expansion uses one graph query and one memory search."""
+        mock_adapter = AsyncMock()
+        mock_adapter.is_connected = AsyncMock(return_value=True)
+        mock_adapter.query = AsyncMock(
+            return_value=MockQueryResult(records=[{"name": "related-1"}])
+        )
+        mock_vector = AsyncMock()
+        mock_vector.search = AsyncMock(return_value=[])
+        mock_facts = AsyncMock()
+        mock_facts.query_by_subject = AsyncMock(return_value=[])
+        mock_facts.search = AsyncMock(return_value=[])
+
+        facts = [
+            MockFactRecord(fact_id=f"f{i}", fact="Test", subject=f"entity-{i}")
+            for i in range(10)
+        ]
+
+        result = await perform_graph_expansion(
+            [], facts, "space-1", mock_adapter, mock_vector, mock_facts,
+            GraphExpansionConfig(),
+        )
+
+        assert result.discovered_entities == ["related-1"]
+        assert mock_adapter.query.call_count == 1
+        mock_adapter.find_nodes.assert_not_called()
+        assert mock_vector.search.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expansion_falls_back_to_per_entity_traversal(self):
+        """Expansion falls back to traverse() when the batched query fails."""
+        mock_adapter = AsyncMock()
+        mock_adapter.is_connected = AsyncMock(return_value=True)
+        mock_adapter.query = AsyncMock(side_effect=Exception("unsupported"))
+        mock_adapter.find_nodes = AsyncMock(
+            return_value=[MockGraphNode(id="n1", label="Entity", properties={"name": "entity-1"})]
+        )
+        mock_adapter.traverse = AsyncMock(
+            return_value=[MockGraphNode(id="n2", label="Entity", properties={"name": "related-1"})]
+        )
+        mock_vector = AsyncMock()
+        mock_vector.search = AsyncMock(return_value=[])
+        mock_facts = AsyncMock()
+        mock_facts.query_by_subject = AsyncMock(return_value=[])
+        mock_facts.search = AsyncMock(return_value=[])
+
+        facts = [MockFactRecord(fact_id="f1", fact="Test", subject="entity-1")]
+
+        result = await perform_graph_expansion(
+            [], facts, "space-1", mock_adapter, mock_vector, mock_facts,
+            GraphExpansionConfig(),
+        )
+
+        assert result.discovered_entities == ["related-1"]
+        mock_adapter.traverse.assert_called()
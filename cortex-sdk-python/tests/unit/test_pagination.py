@@ -0,0 +1,319 @@
+"""
+Unit Tests: Streaming Iterators
+
+Tests for the cursor pagination helper (bounded prefetch, early stop,
+cancellation), the iter() methods of the facts, vector, conversations,
+contexts and immutable APIs, and the memory bulk paths built on them.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from cortex._pagination import iterate_pages
+from cortex.contexts import ContextsAPI
+from cortex.conversations import ConversationsAPI
+from cortex.facts import FactsAPI, FactsValidationError
+from cortex.immutable import ImmutableAPI
+from cortex.memory import MemoryAPI
+from cortex.types import (
+    AuthContext,
+    ListConversationsFilter,
+    ListFactsFilter,
+    ListImmutableFilter,
+)
+from cortex.vector import VectorAPI
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Test Fixtures
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class PagingClient:
+    """Convex client mock serving listPage queries from in-memory tables."""
+
+    def __init__(self, tables: Dict[str, List[Dict[str, Any]]]) -> None:
+        self.tables = tables
+        self.queries: List[Tuple[str, Dict[str, Any]]] = []
+        self.mutations: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def query(self, name: str, args: Dict[str, Any]) -> Any:
+        self.queries.append((name, args))
+        opts = args["paginationOpts"]
+        start = int(opts["cursor"] or 0)
+        end = start + opts["numItems"]
+        rows = self.tables.get(name, [])
+        return {
+            "page": rows[start:end],
+            "continueCursor": str(end),
+            "isDone": end >= len(rows),
+        }
+
+    async def mutation(self, name: str, args: Dict[str, Any]) -> Any:
+        self.mutations.append((name, args))
+        if name == "facts:deleteFact":
+            return {"deleted": True, "factId": args["factId"]}
+        return {"deleted": 0, "memoryIds": []}
+
+    def calls(self, name: str) -> List[Dict[str, Any]]:
+        return [args for called, args in self.queries if called == name]
+
+
+def make_fact(i: int, memory_id: Optional[str] = None, conversation_id: Optional[str] = None) -> Dict[str, Any]:
+    fact: Dict[str, Any] = {
+        "_id": f"doc-{i}",
+        "factId": f"fact-{i}",
+        "memorySpaceId": "space-1",
+        "fact": f"Fact {i}",
+        "factType": "preference",
+        "confidence": 80,
+        "sourceType": "conversation",
+        "tags": [],
+        "createdAt": i,
+        "updatedAt": i,
+        "version": 1,
+    }
+    if memory_id or conversation_id:
+        fact["sourceRef"] = {"memoryId": memory_id, "conversationId": conversation_id}
+    return fact
+
+
+def make_memory(memory_id: str, conversation_id: Optional[str] = None) -> Dict[str, Any]:
+    memory: Dict[str, Any] = {
+        "_id": f"doc-{memory_id}",
+        "memoryId": memory_id,
+        "memorySpaceId": "space-1",
+        "content": "content",
+        "contentType": "raw",
+        "sourceType": "conversation",
+        "sourceTimestamp": 1,
+        "importance": 50,
+        "tags": [],
+        "version": 1,
+        "previousVersions": [],
+        "createdAt": 1,
+        "updatedAt": 1,
+        "accessCount": 0,
+    }
+    if conversation_id:
+        memory["conversationRef"] = {"conversationId": conversation_id, "messageIds": []}
+    return memory
+
+
+def page_fetcher(pages: List[List[int]], log: List[str], delay: float = 0.0):
+    async def fetch(cursor: Optional[str]) -> Dict[str, Any]:
+        index = int(cursor or 0)
+        log.append(f"fetch:{index}")
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log.append(f"cancelled:{index}")
+            raise
+        log.append(f"done:{index}")
+        done = index + 1 >= len(pages)
+        return {"page": pages[index], "continueCursor": str(index + 1), "isDone": done}
+
+    return fetch
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# iterate_pages
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestIteratePages:
+    """Tests for the cursor pagination helper."""
+
+    @pytest.mark.asyncio
+    async def test_yields_every_item_across_pages(self):
+        log: List[str] = []
+        items = [item async for item in iterate_pages(page_fetcher([[1, 2], [3], [4, 5]], log), lambda x: x * 10)]
+
+        assert items == [10, 20, 30, 40, 50]
+        assert [entry for entry in log if entry.startswith("fetch")] == ["fetch:0", "fetch:1", "fetch:2"]
+
+    @pytest.mark.asyncio
+    async def test_prefetches_one_page_ahead(self):
+        log: List[str] = []
+        iterator = iterate_pages(page_fetcher([[1, 2], [3, 4], [5]], log), lambda x: x)
+
+        first = await iterator.__anext__()
+        await asyncio.sleep(0)
+
+        # The next page is in flight while the caller holds the first item,
+        # but never more than one page ahead
+        assert first == 1
+        assert [entry for entry in log if entry.startswith("fetch")] == ["fetch:0", "fetch:1"]
+        await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_limit_stops_early_and_cancels_prefetch(self):
+        log: List[str] = []
+        fetch = page_fetcher([[1, 2], [3, 4]], log, delay=0.01)
+
+        items = [item async for item in iterate_pages(fetch, lambda x: x, limit=1)]
+        await asyncio.sleep(0.05)
+
+        assert items == [1]
+        assert "done:1" not in log
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_prefetch(self):
+        log: List[str] = []
+        iterator = iterate_pages(page_fetcher([[1, 2], [3, 4]], log, delay=0.05), lambda x: x)
+
+        await iterator.__anext__()
+        await asyncio.sleep(0)
+        await iterator.aclose()
+        await asyncio.sleep(0)
+
+        assert log == ["fetch:0", "done:0", "fetch:1", "cancelled:1"]
+
+    @pytest.mark.asyncio
+    async def test_empty_and_zero_limit(self):
+        log: List[str] = []
+
+        assert [i async for i in iterate_pages(page_fetcher([[]], log), lambda x: x)] == []
+        assert [i async for i in iterate_pages(page_fetcher([[1]], log), lambda x: x, limit=0)] == []
+        assert log == ["fetch:0", "done:0"]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# API iterators
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestApiIterators:
+    """Tests for the iter() methods of the layer APIs."""
+
+    @pytest.mark.asyncio
+    async def test_facts_iter_pages_with_filters(self):
+        client = PagingClient({"facts:listPage": [make_fact(i) for i in range(5)]})
+        facts = FactsAPI(client, auth_context=AuthContext(user_id="u", tenant_id="tenant-1"))
+
+        records = [
+            fact
+            async for fact in facts.iter(
+                ListFactsFilter(memory_space_id="space-1", user_id="user-1", limit=4), page_size=2
+            )
+        ]
+
+        assert [r.fact_id for r in records] == ["fact-0", "fact-1", "fact-2", "fact-3"]
+        calls = client.calls("facts:listPage")
+        assert calls[0]["userId"] == "user-1"
+        assert calls[0]["tenantId"] == "tenant-1"
+        assert "limit" not in calls[0]
+        assert [c["paginationOpts"] for c in calls] == [
+            {"numItems": 2, "cursor": None},
+            {"numItems": 2, "cursor": "2"},
+        ]
+
+    def test_facts_iter_rejects_sorting(self):
+        facts = FactsAPI(PagingClient({}))
+
+        with pytest.raises(FactsValidationError) as exc_info:
+            facts.iter(ListFactsFilter(memory_space_id="space-1", sort_by="confidence"))
+
+        assert exc_info.value.field == "sort_by"
+
+    @pytest.mark.asyncio
+    async def test_vector_iter(self):
+        client = PagingClient({"memories:listPage": [make_memory("mem-1"), make_memory("mem-2")]})
+
+        memories = [m async for m in VectorAPI(client).iter("space-1", user_id="user-1", page_size=1)]
+
+        assert [m.memory_id for m in memories] == ["mem-1", "mem-2"]
+        assert client.calls("memories:listPage")[0]["userId"] == "user-1"
+
+    @pytest.mark.asyncio
+    async def test_conversations_iter(self):
+        conversation = {
+            "_id": "doc-1",
+            "conversationId": "conv-1",
+            "memorySpaceId": "space-1",
+            "type": "user-agent",
+            "participants": {"userId": "user-1"},
+            "messages": [],
+            "messageCount": 0,
+            "metadata": {},
+            "createdAt": 1,
+            "updatedAt": 1,
+        }
+        client = PagingClient({"conversations:listPage": [conversation]})
+
+        conversations = [
+            c
+            async for c in ConversationsAPI(client).iter(
+                ListConversationsFilter(memory_space_id="space-1", message_count=0, include_messages=False)
+            )
+        ]
+
+        assert [c.conversation_id for c in conversations] == ["conv-1"]
+        call = client.calls("conversations:listPage")[0]
+        assert call["messageCountMin"] == 0 and call["messageCountMax"] == 0
+        assert call["includeMessages"] is False
+
+    @pytest.mark.asyncio
+    async def test_contexts_iter(self):
+        context = {"contextId": "ctx-1", "memorySpaceId": "space-1", "purpose": "p", "status": "active",
+                   "depth": 0, "rootId": "ctx-1", "createdAt": 1, "updatedAt": 1}
+        client = PagingClient({"contexts:listPage": [context]})
+
+        contexts = [c async for c in ContextsAPI(client).iter(memory_space_id="space-1", status="active")]
+
+        assert [c.id for c in contexts] == ["ctx-1"]
+        assert client.calls("contexts:listPage")[0]["status"] == "active"
+
+    @pytest.mark.asyncio
+    async def test_immutable_iter(self):
+        record = {"_id": "doc-1", "type": "kb-article", "id": "a-1", "data": {}, "version": 1,
+                  "previousVersions": [], "createdAt": 1, "updatedAt": 1}
+        client = PagingClient({"immutable:listPage": [record] * 3})
+
+        records = [r async for r in ImmutableAPI(client).iter(ListImmutableFilter(type="kb-article", limit=2))]
+
+        assert len(records) == 2
+        assert client.calls("immutable:listPage")[0]["type"] == "kb-article"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Memory bulk paths
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TestMemoryBulkPaths:
+    """memory.delete_many streams memories and facts instead of loading them."""
+
+    @pytest.mark.asyncio
+    async def test_delete_many_cascades_in_one_pass(self):
+        client = PagingClient({
+            "memories:listPage": [make_memory("mem-1", "conv-1"), make_memory("mem-2")],
+            "facts:listPage": [
+                make_fact(1, memory_id="mem-1"),
+                make_fact(2, conversation_id="conv-1"),
+                make_fact(3, memory_id="mem-2"),
+                make_fact(4, memory_id="mem-other"),
+                make_fact(5),
+            ],
+        })
+        memory = MemoryAPI(client)
+
+        result = await memory.delete_many("space-1", {"user_id": "user-1"})
+
+        assert sorted(result.fact_ids) == ["fact-1", "fact-2", "fact-3"]
+        assert result.facts_deleted == 3
+        # One scan of the space's facts for all memories
+        assert len(client.calls("facts:listPage")) == 1
+        # The memories scan uses the same filters as the delete
+        assert client.calls("memories:listPage")[0]["userId"] == "user-1"
+        assert not client.calls("facts:list")
+
+    @pytest.mark.asyncio
+    async def test_delete_many_without_matches_skips_fact_scan(self):
+        client = PagingClient({"facts:listPage": [make_fact(1, memory_id="mem-1")]})
+
+        result = await MemoryAPI(client).delete_many("space-1", {"user_id": "user-1"})
+
+        assert result.facts_deleted == 0
+        assert not client.calls("facts:listPage")